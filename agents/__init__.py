@@ -1,6 +1,33 @@
 """Agent system package."""
 from pathlib import Path
 
+from agents.prompt_registry import RenderedPrompt, get_prompt_registry
+
+PROMPTS_DIR = Path(__file__).parent.parent / "Prompts"
+
+
+def load_agent_prompt(agent: str) -> RenderedPrompt:
+    """
+    Load an agent system prompt through the shared prompt registry.
+
+    The files are read once and re-read only when one of them changes.
+
+    Args:
+        agent: Agent name (NEXUS, CORTEX, or FRONTIER)
+
+    Returns:
+        Rendered prompt with its content hash
+    """
+    shared_path = PROMPTS_DIR / "SHARED_CONTEXT.md"
+    agent_path = PROMPTS_DIR / f"{agent}_v1.1.md"
+
+    def render() -> str:
+        shared = shared_path.read_text()
+        agent_specific = agent_path.read_text()
+        return f"{shared}\n\n---\n\n{agent_specific}"
+
+    return get_prompt_registry().get(f"agent:{agent}", (shared_path, agent_path), render)
+
 
 def load_agent_context(agent: str) -> str:
     """
@@ -16,9 +43,4 @@ def load_agent_context(agent: str) -> str:
         >>> nexus_prompt = load_agent_context("NEXUS")
         >>> # Use nexus_prompt as system message for LLM
     """
-    prompts_dir = Path(__file__).parent.parent / "Prompts"
-
-    shared = (prompts_dir / "SHARED_CONTEXT.md").read_text()
-    agent_specific = (prompts_dir / f"{agent}_v1.1.md").read_text()
-
-    return f"{shared}\n\n---\n\n{agent_specific}"
+    return load_agent_prompt(agent).text
@@ -1,10 +1,11 @@
 """Base agent class with LLM interface."""
 import os
-import requests
 from typing import Dict, Any, Optional, List
 from pathlib import Path
 from dotenv import load_dotenv
 
+from milton_orchestrator.llm_transport import LLMConnectionError, get_llm_transport
+
 from agents.memory_hooks import (
     build_memory_context,
     record_memory,
@@ -56,27 +57,16 @@ class BaseAgent:
         Raises:
             RuntimeError: If LLM call fails
         """
-        url = f"{self.llm_url}/v1/chat/completions"
-        api_key = (
-            os.getenv("LLM_API_KEY")
-            or os.getenv("VLLM_API_KEY")
-            or os.getenv("OLLAMA_API_KEY")
-        )
-        headers = {"Authorization": f"Bearer {api_key}"} if api_key else {}
-
-        payload = {
-            "model": self.model_name,
-            "messages": messages,
-            "max_tokens": max_tokens,
-            "temperature": temperature,
-        }
-
         try:
-            response = requests.post(url, json=payload, timeout=120, headers=headers)
-            response.raise_for_status()
-            data = response.json()
-            return data["choices"][0]["message"]["content"]
-        except requests.exceptions.ConnectionError:
+            return get_llm_transport().chat_text(
+                messages,
+                base_url=self.llm_url,
+                model=self.model_name,
+                max_tokens=max_tokens,
+                temperature=temperature,
+                caller=self.agent_name,
+            )
+        except LLMConnectionError:
             raise RuntimeError(
                 f"Cannot connect to LLM at {self.llm_url}. "
                 "Is vLLM server running? Start with: python scripts/start_vllm.py"
@@ -2,7 +2,6 @@
 CORTEX - Execution Agent
 Handles task execution, code generation, and overnight job processing.
 """
-import requests
 from typing import Dict, Any, Optional, List, Union
 import os
 import json
@@ -11,6 +10,7 @@ from datetime import datetime
 from dotenv import load_dotenv
 import logging
 
+from milton_orchestrator.llm_transport import get_llm_transport
 from agents.memory_hooks import (
     MemoryContextHook,
     build_memory_context,
@@ -134,14 +134,6 @@ class CORTEX:
         Returns:
             Model response
         """
-        url = f"{self.model_url}/v1/chat/completions"
-        api_key = (
-            os.getenv("LLM_API_KEY")
-            or os.getenv("VLLM_API_KEY")
-            or os.getenv("OLLAMA_API_KEY")
-        )
-        headers = {"Authorization": f"Bearer {api_key}"} if api_key else {}
-
         messages = []
 
         if system_prompt:
@@ -154,16 +146,10 @@ class CORTEX:
 
         messages.append({"role": "user", "content": prompt})
 
-        payload = {
-            "model": self.model_name,
-            "messages": messages,
-            "max_tokens": max_tokens,
-            "temperature": 0.7,
-        }
-        
+        extra = {}
         # Add adapter provenance metadata if adapter loaded
         if self.adapter_info:
-            payload["metadata"] = {
+            extra["metadata"] = {
                 "adapter": self.adapter_info.name,
                 "adapter_version": self.adapter_info.version,
                 "adapter_quality": self.adapter_info.quality_score,
@@ -171,10 +157,15 @@ class CORTEX:
             }
 
         try:
-            response = requests.post(url, json=payload, timeout=120, headers=headers)
-            response.raise_for_status()
-            data = response.json()
-            reply = data["choices"][0]["message"]["content"]
+            reply = get_llm_transport().chat_text(
+                messages,
+                base_url=self.model_url,
+                model=self.model_name,
+                max_tokens=max_tokens,
+                temperature=0.7,
+                caller="CORTEX",
+                **extra,
+            )
             record_memory(
                 "CORTEX",
                 prompt,
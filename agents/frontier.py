@@ -2,7 +2,6 @@
 FRONTIER - Discovery Agent
 Monitors research feeds, discovers papers, and generates research briefs.
 """
-import requests
 from typing import Dict, Any, Optional, List, Tuple
 import os
 import json
@@ -11,6 +10,7 @@ from dotenv import load_dotenv
 import logging
 import sys
 
+from milton_orchestrator.llm_transport import get_llm_transport
 from milton_orchestrator.state_paths import resolve_state_dir
 
 # Add parent directory to path for imports
@@ -95,14 +95,6 @@ class FRONTIER:
         self, prompt: str, system_prompt: Optional[str] = None, max_tokens: int = 2000
     ) -> str:
         """Call vLLM API for inference."""
-        url = f"{self.model_url}/v1/chat/completions"
-        api_key = (
-            os.getenv("LLM_API_KEY")
-            or os.getenv("VLLM_API_KEY")
-            or os.getenv("OLLAMA_API_KEY")
-        )
-        headers = {"Authorization": f"Bearer {api_key}"} if api_key else {}
-
         messages = []
 
         if system_prompt:
@@ -114,18 +106,15 @@ class FRONTIER:
 
         messages.append({"role": "user", "content": prompt})
 
-        payload = {
-            "model": self.model_name,
-            "messages": messages,
-            "max_tokens": max_tokens,
-            "temperature": 0.7,
-        }
-
         try:
-            response = requests.post(url, json=payload, timeout=120, headers=headers)
-            response.raise_for_status()
-            data = response.json()
-            reply = data["choices"][0]["message"]["content"]
+            reply = get_llm_transport().chat_text(
+                messages,
+                base_url=self.model_url,
+                model=self.model_name,
+                max_tokens=max_tokens,
+                temperature=0.7,
+                caller="FRONTIER",
+            )
             record_memory(
                 "FRONTIER",
                 prompt,
@@ -13,6 +13,10 @@ from typing import List, Optional, Tuple
 
 logger = logging.getLogger(__name__)
 
+# Relationships shown per matched entity
+MAX_OUTGOING_PER_ENTITY = 10
+MAX_INCOMING_PER_ENTITY = 5
+
 
 @dataclass(frozen=True)
 class KGContextPacket:
@@ -104,39 +108,19 @@ def build_kg_context(query: str, top_k: int = 5) -> KGContextPacket:
         return KGContextPacket()
     
     try:
-        from memory.kg.api import search_entities, neighbors
+        from memory.kg.api import match_entities, traverse
         from memory.kg.schema import Entity
         
-        # Extract potential entity names from query
-        # Simple approach: look for capitalized words and common nouns
+        # Extract potential entity names from query: every word of 3+
+        # characters plus the full query, resolved in one indexed lookup
         query_lower = query.lower()
-        query_words = query.strip().split()
+        query_words = [word for word in query.strip().split() if len(word) >= 3]
         
-        # Search for entities matching query terms
         all_matches: List[Tuple[Entity, float]] = []  # (entity, score)
-        
-        # Try to match individual words
-        for word in query_words:
-            if len(word) < 3:  # Skip very short words
-                continue
-            matches = search_entities(name=word, limit=10)
-            for entity in matches:
-                # Simple scoring: how well the entity name matches
-                name_lower = entity.name.lower()
-                if name_lower == query_lower:
-                    score = 1.0
-                elif word.lower() in name_lower:
-                    score = 0.8
-                elif any(w.lower() in name_lower for w in query_words):
-                    score = 0.6
-                else:
-                    score = 0.4
-                all_matches.append((entity, score))
-        
-        # Also try full query as entity name
-        full_matches = search_entities(name=query, limit=5)
-        for entity in full_matches:
-            all_matches.append((entity, 1.0))
+        for entity, score in match_entities(query_words + [query], limit=max(top_k * 4, 20)):
+            if query_lower.strip() and query_lower.strip() in entity.name.lower():
+                score = 1.0  # Name contains the whole query
+            all_matches.append((entity, score))
         
         if not all_matches:
             logger.debug("No KG entities found for query")
@@ -156,59 +140,57 @@ def build_kg_context(query: str, top_k: int = 5) -> KGContextPacket:
         # Build entity list
         entity_list = [(e.name, e.type) for e in top_entities]
         
-        # Expand 1-hop neighborhood
+        # Expand the 1-hop neighborhood of all top entities in one traversal,
+        # following at most the edges per entity that the packet can use
         max_edges = _get_max_edges()
         relationship_list = []
         edge_count = 0
         
+        try:
+            neighborhood = traverse(
+                [e.id for e in top_entities],
+                depth=1,
+                direction="both",
+                max_edges_per_node=min(MAX_OUTGOING_PER_ENTITY, max_edges),
+            )
+        except Exception as e:
+            logger.debug(f"Failed to expand KG neighborhood: {e}")
+            neighborhood = None
+        
         for entity in top_entities:
-            if edge_count >= max_edges:
+            if neighborhood is None or edge_count >= max_edges:
                 break
             
-            # Get outgoing relationships
-            try:
-                outgoing = neighbors(entity.id, direction="outgoing", limit=10)
-                for edge, target_entity in outgoing:
-                    if edge_count >= max_edges:
-                        break
-                    
-                    # Extract evidence ID from edge evidence if available
-                    evidence_id = ""
-                    if edge.evidence and isinstance(edge.evidence, dict):
-                        evidence_id = edge.evidence.get("memory_id", "")
-                    
-                    relationship_list.append((
-                        entity.name,
-                        edge.predicate,
-                        target_entity.name,
-                        evidence_id
-                    ))
-                    edge_count += 1
-            except Exception as e:
-                logger.debug(f"Failed to get outgoing edges for {entity.name}: {e}")
+            # Outgoing relationships
+            for edge, target_entity in neighborhood.outgoing(entity.id)[:MAX_OUTGOING_PER_ENTITY]:
+                if edge_count >= max_edges:
+                    break
+                
+                # Extract evidence ID from edge evidence if available
+                evidence_id = edge.evidence.get("memory_id", "")
+                
+                relationship_list.append((
+                    entity.name,
+                    edge.predicate,
+                    target_entity.name,
+                    evidence_id
+                ))
+                edge_count += 1
             
-            # Get incoming relationships
-            if edge_count < max_edges:
-                try:
-                    incoming = neighbors(entity.id, direction="incoming", limit=5)
-                    for edge, source_entity in incoming:
-                        if edge_count >= max_edges:
-                            break
-                        
-                        # Extract evidence ID
-                        evidence_id = ""
-                        if edge.evidence and isinstance(edge.evidence, dict):
-                            evidence_id = edge.evidence.get("memory_id", "")
-                        
-                        relationship_list.append((
-                            source_entity.name,
-                            edge.predicate,
-                            entity.name,
-                            evidence_id
-                        ))
-                        edge_count += 1
-                except Exception as e:
-                    logger.debug(f"Failed to get incoming edges for {entity.name}: {e}")
+            # Incoming relationships
+            for edge, source_entity in neighborhood.incoming(entity.id)[:MAX_INCOMING_PER_ENTITY]:
+                if edge_count >= max_edges:
+                    break
+                
+                evidence_id = edge.evidence.get("memory_id", "")
+                
+                relationship_list.append((
+                    source_entity.name,
+                    edge.predicate,
+                    entity.name,
+                    evidence_id
+                ))
+                edge_count += 1
         
         # Apply character limit
         max_chars = _get_max_chars()
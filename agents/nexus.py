@@ -2,13 +2,13 @@
 NEXUS - Orchestration Hub
 Coordinates between agents, generates briefings, and routes requests.
 """
-import requests
 from dataclasses import dataclass, field
 from datetime import datetime
+import json
 import logging
 import os
 import re
-from typing import Any, Dict, Optional, List
+from typing import Any, Dict, Iterable, Iterator, Optional, List, Union
 
 from dotenv import load_dotenv
 
@@ -40,6 +40,7 @@ from agents.contracts import (
 from memory.retrieve import query_relevant, query_relevant_hybrid
 from memory.status import record_retrieval
 from memory.schema import MemoryItem
+from milton_orchestrator.llm_transport import get_llm_transport
 from milton_orchestrator.state_paths import resolve_state_dir
 from phd_context import (
     get_phd_context,
@@ -408,16 +409,13 @@ class NEXUS:
         system_prompt: Optional[str] = None,
         max_tokens: int = 2000,
         context_packet: Optional[ContextPacket] = None,
-    ) -> str:
-        """Call vLLM API for inference."""
-        url = f"{self.model_url}/v1/chat/completions"
-        api_key = (
-            os.getenv("LLM_API_KEY")
-            or os.getenv("VLLM_API_KEY")
-            or os.getenv("OLLAMA_API_KEY")
-        )
-        headers = {"Authorization": f"Bearer {api_key}"} if api_key else {}
+        stream: bool = False,
+    ) -> Union[str, Iterator[str]]:
+        """Call vLLM API for inference.
 
+        With ``stream=True`` the request uses vLLM's SSE mode and an iterator
+        of content deltas is returned instead of the full text.
+        """
         messages = []
 
         if system_prompt:
@@ -428,17 +426,26 @@ class NEXUS:
 
         messages.append({"role": "user", "content": prompt})
 
-        payload = {
-            "model": self.model_name,
-            "messages": messages,
-            "max_tokens": max_tokens,
-            "temperature": 0.7,
-        }
+        transport = get_llm_transport()
+        if stream:
+            url = f"{self.model_url.rstrip('/')}/v1/chat/completions"
+            payload = transport.chat_payload(
+                messages, model=self.model_name, max_tokens=max_tokens, temperature=0.7, stream=True
+            )
+            return self._stream_llm(url, payload)
+
+        return transport.chat_text(
+            messages,
+            base_url=self.model_url,
+            model=self.model_name,
+            max_tokens=max_tokens,
+            temperature=0.7,
+            caller="NEXUS",
+        )
 
-        response = requests.post(url, json=payload, timeout=120, headers=headers)
-        response.raise_for_status()
-        data = response.json()
-        return data["choices"][0]["message"]["content"]
+    def _stream_llm(self, url: str, payload: Dict[str, Any]) -> Iterator[str]:
+        with get_llm_transport().stream(url, payload, caller="NEXUS") as response:
+            yield from _iter_sse_deltas(response.iter_lines())
 
     def _register_default_tools(self) -> None:
         self.register_tool(
@@ -1116,7 +1123,8 @@ class NEXUS:
         message: str,
         use_web: Optional[bool] = None,
         one_way_mode: bool = False,
-    ) -> str:
+        stream: bool = False,
+    ) -> Union[str, Iterator[str]]:
         """
         Answer a user message.
 
@@ -1124,9 +1132,11 @@ class NEXUS:
             message: User's message
             use_web: Whether to use web lookup (None = auto-detect)
             one_way_mode: If True, enforce one-way channel mode (no clarification questions)
+            stream: If True, return an iterator of text deltas as the model
+                generates them
 
         Returns:
-            Response text
+            Response text, or an iterator of deltas when ``stream`` is True
         """
         # Build system prompt with optional one-way mode injection
         system_prompt = self.system_prompt
@@ -1134,7 +1144,15 @@ class NEXUS:
             system_prompt = f"{self.system_prompt}\n\n{ONE_WAY_PHONE_MODE_PROMPT}"
             logger.info("One-way phone mode enabled - clarification questions disabled")
 
-        if self._should_use_web_lookup(message, use_web):
+        use_web_lookup = self._should_use_web_lookup(message, use_web)
+
+        # The one-way post-guard needs the whole response before anything is sent
+        if stream and not one_way_mode:
+            if use_web_lookup:
+                return self._stream_with_web_lookup(message, system_prompt=system_prompt)
+            return self._call_llm(message, system_prompt=system_prompt, stream=True)
+
+        if use_web_lookup:
             response = self._answer_with_web_lookup(message, system_prompt=system_prompt)
         else:
             response = self._call_llm(message, system_prompt=system_prompt)
@@ -1144,6 +1162,8 @@ class NEXUS:
             logger.warning("Post-guard triggered: rewriting clarification-seeking response")
             response = rewrite_to_one_way_format(response, message)
 
+        if stream:
+            return iter([response])
         return response
 
     def answer_with_web_lookup(self, message: str) -> str:
@@ -1152,11 +1172,19 @@ class NEXUS:
 
     def _answer_with_web_lookup(self, message: str, system_prompt: str) -> str:
         """Internal web lookup implementation with configurable system prompt."""
+        return "".join(self._web_lookup(message, system_prompt, stream=False))
+
+    def _stream_with_web_lookup(self, message: str, system_prompt: str) -> Iterator[str]:
+        """Streaming variant of ``_answer_with_web_lookup``."""
+        return self._web_lookup(message, system_prompt, stream=True)
+
+    def _web_lookup(self, message: str, system_prompt: str, stream: bool) -> Iterator[str]:
         results = self.web_search.search(
             message, max_results=self.web_lookup_max_results
         )
         if not results:
-            return self._call_llm(message, system_prompt=system_prompt)
+            yield from self._llm_deltas(message, system_prompt, stream)
+            return
 
         sources_block = "\n".join(
             f"[{i}] {item['title']} - {item['url']}"
@@ -1169,12 +1197,44 @@ class NEXUS:
             "claim, say you couldn't verify it.\n\n"
             f"Question: {message}\n\nSources:\n{sources_block}"
         )
-        response = self._call_llm(prompt, system_prompt=system_prompt)
+        if not stream:
+            response = self._call_llm(prompt, system_prompt=system_prompt)
+            if "Sources:" not in response:
+                response = f"{response.strip()}\n\nSources:\n{sources_block}"
+            yield response
+            return
+
+        streamed = []
+        for delta in self._call_llm(prompt, system_prompt=system_prompt, stream=True):
+            streamed.append(delta)
+            yield delta
+        if "Sources:" not in "".join(streamed):
+            yield f"\n\nSources:\n{sources_block}"
+
+    def _llm_deltas(self, prompt: str, system_prompt: str, stream: bool) -> Iterator[str]:
+        if stream:
+            yield from self._call_llm(prompt, system_prompt=system_prompt, stream=True)
+        else:
+            yield self._call_llm(prompt, system_prompt=system_prompt)
 
-        if "Sources:" not in response:
-            response = f"{response.strip()}\n\nSources:\n{sources_block}"
-        return response
 
+def _iter_sse_deltas(lines: Iterable[str]) -> Iterator[str]:
+    """Yield ``delta.content`` from OpenAI-style ``data:`` SSE lines."""
+    for line in lines:
+        if not line or not line.startswith("data:"):
+            continue
+        data = line[5:].strip()
+        if data == "[DONE]":
+            return
+        try:
+            chunk = json.loads(data)
+        except json.JSONDecodeError:
+            logger.debug("Skipping malformed SSE chunk: %s", data[:100])
+            continue
+        for choice in chunk.get("choices") or []:
+            content = (choice.get("delta") or {}).get("content")
+            if content:
+                yield content
 
 if __name__ == "__main__":
     # Simple test
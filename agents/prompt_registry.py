@@ -0,0 +1,137 @@
+"""Shared registry of rendered prompt files with mtime-based hot reload.
+
+Prompt loaders (agent prompts from ``Prompts/``, the gateway system prompt)
+used to open and read their files on every call. The registry renders each
+prompt once and serves the cached string until one of its source files
+changes (mtime, size or existence), checked at most once per
+``MILTON_PROMPT_RELOAD_INTERVAL_S`` seconds (default 1.0; 0 checks on every
+call). Each rendered prompt carries a SHA-256 of its text, which stays the
+same for as long as the rendered text does.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import logging
+import threading
+import time
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Callable, Optional, Sequence
+
+from milton_orchestrator.env import env_float
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_RELOAD_INTERVAL_S = 1.0
+
+# (mtime_ns, size) per source file; None when the file does not exist
+_Signature = tuple[Optional[tuple[int, int]], ...]
+
+
+@dataclass(frozen=True)
+class RenderedPrompt:
+    text: str
+    sha256: str
+    sources: tuple[str, ...]
+    loaded_at: float
+
+    def __str__(self) -> str:
+        return self.text
+
+
+@dataclass
+class _Entry:
+    prompt: RenderedPrompt
+    signature: _Signature
+    checked_at: float
+
+
+def content_hash(text: str) -> str:
+    return hashlib.sha256(text.encode("utf-8")).hexdigest()
+
+
+def _signature(paths: Sequence[Path]) -> _Signature:
+    signature = []
+    for path in paths:
+        try:
+            stat = path.stat()
+        except OSError:
+            signature.append(None)
+        else:
+            signature.append((stat.st_mtime_ns, stat.st_size))
+    return tuple(signature)
+
+
+class PromptRegistry:
+    """Caches rendered prompts keyed by name and invalidates on file change."""
+
+    def __init__(self, reload_interval: Optional[float] = None) -> None:
+        if reload_interval is None:
+            reload_interval = env_float("MILTON_PROMPT_RELOAD_INTERVAL_S", DEFAULT_RELOAD_INTERVAL_S)
+        self.reload_interval = max(reload_interval, 0.0)
+        self._entries: dict[str, _Entry] = {}
+        self._lock = threading.Lock()
+        self.loads = 0
+
+    def get(
+        self,
+        name: str,
+        paths: Sequence[Path],
+        render: Callable[[], str],
+    ) -> RenderedPrompt:
+        """Return the cached prompt ``name``, re-rendering it if ``paths`` changed.
+
+        ``render`` reads the files itself; exceptions it raises propagate and
+        nothing is cached, so the next call retries.
+        """
+        paths = tuple(Path(p) for p in paths)
+        now = time.monotonic()
+        with self._lock:
+            entry = self._entries.get(name)
+            if entry is not None and now - entry.checked_at < self.reload_interval:
+                return entry.prompt
+            signature = _signature(paths)
+            if entry is not None and entry.signature == signature:
+                entry.checked_at = now
+                return entry.prompt
+
+            text = render()
+            prompt = RenderedPrompt(
+                text=text,
+                sha256=content_hash(text),
+                sources=tuple(str(p) for p in paths),
+                loaded_at=time.time(),
+            )
+            self._entries[name] = _Entry(prompt=prompt, signature=signature, checked_at=now)
+            self.loads += 1
+        action = "Reloaded" if entry is not None else "Loaded"
+        logger.info(f"{action} prompt {name!r} ({len(text)} chars, sha256={prompt.sha256[:12]})")
+        return prompt
+
+    def invalidate(self, name: Optional[str] = None) -> None:
+        """Drop one cached prompt, or all of them."""
+        with self._lock:
+            if name is None:
+                self._entries.clear()
+            else:
+                self._entries.pop(name, None)
+
+    def stats(self) -> dict[str, dict[str, object]]:
+        with self._lock:
+            return {
+                name: {
+                    "sha256": entry.prompt.sha256,
+                    "chars": len(entry.prompt.text),
+                    "sources": list(entry.prompt.sources),
+                    "loaded_at": entry.prompt.loaded_at,
+                }
+                for name, entry in self._entries.items()
+            }
+
+
+_REGISTRY = PromptRegistry()
+
+
+def get_prompt_registry() -> PromptRegistry:
+    return _REGISTRY
@@ -2,13 +2,16 @@
 
 from __future__ import annotations
 
+import atexit
 import json
 import logging
 import os
+import threading
+import time
 from dataclasses import dataclass
 from datetime import datetime, timezone
 from pathlib import Path
-from typing import Any, Optional
+from typing import Any, Iterator, Optional
 
 import requests
 
@@ -17,7 +20,10 @@ try:
 except Exception:  # pragma: no cover - optional in tests
     weaviate = None
 
+from milton_orchestrator.env import env_float
+
 from .init_db import get_client
+from .jsonl_index import get_jsonl_index
 from .schema import MemoryItem, ProjectMemory, UserProfile
 
 logger = logging.getLogger(__name__)
@@ -25,6 +31,8 @@ logger = logging.getLogger(__name__)
 SHORT_TERM_FILE = "short_term.jsonl"
 LONG_TERM_FILE = "long_term.jsonl"
 WEAVIATE_FETCH_LIMIT = 2000
+DEFAULT_HEALTH_INTERVAL_SECONDS = 30.0
+CLIENT_CLOSE_GRACE_SECONDS = 30.0  # queries still running on a retired client
 
 
 @dataclass
@@ -64,13 +72,6 @@ def _read_jsonl(path: Path) -> list[dict[str, Any]]:
     return records
 
 
-def _write_jsonl(path: Path, records: list[dict[str, Any]]) -> None:
-    content = "\n".join(json.dumps(record, sort_keys=True) for record in records)
-    if content:
-        content += "\n"
-    path.write_text(content)
-
-
 def _append_jsonl(path: Path, record: dict[str, Any]) -> None:
     with path.open("a", encoding="utf-8") as handle:
         handle.write(json.dumps(record, sort_keys=True))
@@ -166,47 +167,33 @@ class JsonlBackend:
     def __init__(self, repo_root: Path):
         self.repo_root = repo_root
         self.short_path, self.long_path = memory_paths(repo_root)
+        self._short_index = get_jsonl_index(self.short_path)
 
     def append_short_term(self, item: MemoryItem) -> str:
         ensure_memory_dir(self.repo_root)
-        record = {"record_type": "memory_item", "data": item.model_dump(mode="json")}
-        _append_jsonl(self.short_path, record)
-        return item.id
+        return self._short_index.append(item)
 
     def list_short_term(self) -> list[MemoryItem]:
-        records = _read_jsonl(self.short_path)
-        items: list[MemoryItem] = []
-        for record in records:
-            if record.get("record_type") != "memory_item":
-                continue
-            data = record.get("data", {})
-            try:
-                items.append(MemoryItem.model_validate(data))
-            except Exception:
-                continue
-        return items
+        return self._short_index.items()
+
+    def list_short_term_since(self, cutoff: datetime) -> list[MemoryItem]:
+        return self._short_index.since(cutoff)
+
+    def get_short_term(self, memory_id: str) -> Optional[MemoryItem]:
+        return self._short_index.get(memory_id)
+
+    def get_short_term_many(self, memory_ids) -> dict[str, MemoryItem]:
+        return self._short_index.get_many(memory_ids)
+
+    def iter_short_term_newest(self) -> Iterator[MemoryItem]:
+        return self._short_index.newest_first()
+
+    def score_short_term(self, text: str) -> dict[str, float]:
+        """Normalized BM25 text scores for items sharing a term with ``text``."""
+        return self._short_index.lexical_scores(text)
 
     def delete_short_term_before(self, cutoff: datetime) -> int:
-        records = _read_jsonl(self.short_path)
-        kept: list[dict[str, Any]] = []
-        removed = 0
-        for record in records:
-            if record.get("record_type") != "memory_item":
-                kept.append(record)
-                continue
-            try:
-                item = MemoryItem.model_validate(record.get("data", {}))
-            except Exception:
-                kept.append(record)
-                continue
-            if item.ts < cutoff:
-                removed += 1
-                continue
-            kept.append(record)
-        if removed:
-            ensure_memory_dir(self.repo_root)
-            _write_jsonl(self.short_path, kept)
-        return removed
+        return self._short_index.delete_before(cutoff)
 
     def get_user_profile(self) -> Optional[UserProfile]:
         records = _read_jsonl(self.long_path)
@@ -408,6 +395,309 @@ class WeaviateBackend:
         return projects
 
 
+class BackendManager:
+    """Process-wide owner of the memory backend for long-lived services.
+
+    Probes Weaviate once, keeps a single client open and hands out a shared
+    ``WeaviateBackend`` (which callers may ``close()`` freely - it does not own
+    the client). A daemon thread re-probes every ``health_interval`` seconds and
+    switches between Weaviate and JSONL as health changes.
+
+    Probes and connects run outside ``_state_lock`` (one at a time, under
+    ``_connect_lock``), so callers that only read the cached state never wait
+    on network I/O. A client retired by a failed probe is closed after
+    ``close_grace`` seconds, letting queries already running on it finish.
+    """
+
+    _instance: Optional[BackendManager] = None
+    _lock = threading.Lock()
+
+    def __init__(
+        self,
+        health_interval: Optional[float] = None,
+        close_grace: float = CLIENT_CLOSE_GRACE_SECONDS,
+    ):
+        if health_interval is None:
+            health_interval = env_float(
+                "MILTON_MEMORY_HEALTH_INTERVAL", DEFAULT_HEALTH_INTERVAL_SECONDS
+            )
+        self.health_interval = max(float(health_interval), 1.0)
+        self.close_grace = max(float(close_grace), 0.0)
+        self._state_lock = threading.RLock()
+        self._connect_lock = threading.Lock()
+        self._retired: list[tuple[threading.Timer, Any]] = []
+        self._healthy: Optional[bool] = None
+        self._client: Any = None
+        self._weaviate_backend: Optional[WeaviateBackend] = None
+        self._jsonl_backends: dict[Path, JsonlBackend] = {}
+        self._stop = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+        self._stats = {
+            "probes": 0,
+            "probe_ms_total": 0.0,
+            "probes_avoided": 0,
+            "connects": 0,
+            "connect_ms_total": 0.0,
+            "connects_avoided": 0,
+            "switches": 0,
+        }
+
+    @classmethod
+    def get_instance(cls) -> BackendManager:
+        """Get singleton instance."""
+        if cls._instance is None:
+            with cls._lock:
+                if cls._instance is None:
+                    cls._instance = cls()
+        return cls._instance
+
+    @classmethod
+    def reset_instance(cls) -> None:
+        """Shut down and drop the singleton (useful for testing)."""
+        with cls._lock:
+            if cls._instance is not None:
+                cls._instance.shutdown()
+            cls._instance = None
+
+    def get_backend(self, repo_root: Path) -> JsonlBackend | WeaviateBackend:
+        """Return the shared backend for the current health state."""
+        if _should_try_weaviate(repo_root) and weaviate is not None:
+            with self._state_lock:
+                healthy = self._healthy
+                if healthy is not None:
+                    self._stats["probes_avoided"] += 1
+            if healthy is None:
+                with self._connect_lock:
+                    healthy = self._healthy
+                    if healthy is None:
+                        healthy = self._probe()
+                self._ensure_health_thread()
+            if healthy:
+                backend = self._get_weaviate_backend()
+                if backend is not None:
+                    return backend
+        return self._get_jsonl_backend(repo_root)
+
+    def get_client(self) -> Any:
+        """Return the pooled Weaviate client, or None when unhealthy."""
+        with self._state_lock:
+            if not self._healthy:
+                return None
+        backend = self._get_weaviate_backend()
+        return backend.client if backend is not None else None
+
+    def check_health(self) -> bool:
+        """Probe Weaviate now and switch backends if health changed."""
+        with self._connect_lock:
+            healthy = self._probe()
+        self._ensure_health_thread()
+        return healthy
+
+    def _probe(self) -> bool:
+        started = time.perf_counter()
+        healthy = probe_weaviate()
+        elapsed_ms = (time.perf_counter() - started) * 1000.0
+        with self._state_lock:
+            self._stats["probes"] += 1
+            self._stats["probe_ms_total"] += elapsed_ms
+            previous = self._healthy
+            self._healthy = healthy
+            if previous is not None and previous != healthy:
+                self._stats["switches"] += 1
+                logger.warning(
+                    "Memory backend switched to %s (Weaviate %s)",
+                    "weaviate" if healthy else "jsonl",
+                    "reachable" if healthy else "unreachable",
+                )
+            if not healthy:
+                self._retire_client()
+        return healthy
+
+    def status(self, repo_root: Optional[Path] = None) -> BackendStatus:
+        """Return backend status from the cached health state (no probe)."""
+        root = repo_root or repo_root_from_file()
+        with self._state_lock:
+            if self._healthy is None:
+                return backend_status(root)
+            self._stats["probes_avoided"] += 1
+            healthy = self._healthy
+        if not _should_try_weaviate(root):
+            return BackendStatus(
+                mode="jsonl",
+                degraded=False,
+                detail="Weaviate not configured; using local JSONL",
+                weaviate_available=False,
+            )
+        if healthy:
+            return BackendStatus(
+                mode="weaviate",
+                degraded=False,
+                detail="Weaviate reachable (shared client)",
+                weaviate_available=True,
+            )
+        return BackendStatus(
+            mode="jsonl",
+            degraded=True,
+            detail="Weaviate unavailable; using local JSONL",
+            weaviate_available=False,
+        )
+
+    def stats(self) -> dict[str, Any]:
+        """Return probe/connect counters and the estimated time saved."""
+        with self._state_lock:
+            stats = dict(self._stats)
+            healthy = self._healthy
+        avg_probe = stats["probe_ms_total"] / stats["probes"] if stats["probes"] else 0.0
+        avg_connect = (
+            stats["connect_ms_total"] / stats["connects"] if stats["connects"] else 0.0
+        )
+        stats["avg_probe_ms"] = round(avg_probe, 3)
+        stats["avg_connect_ms"] = round(avg_connect, 3)
+        stats["saved_ms"] = round(
+            stats["probes_avoided"] * avg_probe + stats["connects_avoided"] * avg_connect, 3
+        )
+        stats["probe_ms_total"] = round(stats["probe_ms_total"], 3)
+        stats["connect_ms_total"] = round(stats["connect_ms_total"], 3)
+        stats["weaviate_healthy"] = healthy
+        stats["health_interval_seconds"] = self.health_interval
+        return stats
+
+    def shutdown(self) -> None:
+        """Stop the health thread and close the pooled client."""
+        self._stop.set()
+        thread = self._thread
+        if thread is not None and thread.is_alive() and thread is not threading.current_thread():
+            thread.join(timeout=5)
+        self._thread = None
+        with self._state_lock:
+            client = self._client
+            self._client = None
+            self._weaviate_backend = None
+            self._healthy = None
+            self._jsonl_backends.clear()
+            retired, self._retired = self._retired, []
+        for timer, old_client in retired:
+            timer.cancel()
+            _close_quietly(old_client)
+        _close_quietly(client)
+
+    def _get_weaviate_backend(self) -> Optional[WeaviateBackend]:
+        with self._state_lock:
+            if self._weaviate_backend is not None:
+                self._stats["connects_avoided"] += 1
+                return self._weaviate_backend
+        with self._connect_lock:
+            with self._state_lock:
+                if self._weaviate_backend is not None:
+                    return self._weaviate_backend  # connected while we waited
+                if not self._healthy:
+                    return None
+            started = time.perf_counter()
+            try:
+                client = get_client()
+            except Exception as exc:
+                logger.warning(f"Failed to connect to Weaviate; using JSONL: {exc}")
+                with self._state_lock:
+                    self._healthy = False
+                return None
+            with self._state_lock:
+                self._stats["connects"] += 1
+                self._stats["connect_ms_total"] += (time.perf_counter() - started) * 1000.0
+                self._client = client
+                self._weaviate_backend = WeaviateBackend(client)  # shared; never owns the client
+                return self._weaviate_backend
+
+    def _get_jsonl_backend(self, repo_root: Path) -> JsonlBackend:
+        with self._state_lock:
+            backend = self._jsonl_backends.get(repo_root)
+            if backend is None:
+                backend = JsonlBackend(repo_root)
+                self._jsonl_backends[repo_root] = backend
+            return backend
+
+    def _retire_client(self) -> None:
+        """Drop the shared client now and close it once in-flight queries had time to finish."""
+        client = self._client
+        self._client = None
+        self._weaviate_backend = None
+        if client is None:
+            return
+        timer = threading.Timer(self.close_grace, self._close_retired, args=(client,))
+        timer.daemon = True
+        self._retired.append((timer, client))
+        timer.start()
+
+    def _close_retired(self, client: Any) -> None:
+        with self._state_lock:
+            self._retired = [(t, c) for t, c in self._retired if c is not client]
+        _close_quietly(client)
+
+    def _ensure_health_thread(self) -> None:
+        if self._thread is not None and self._thread.is_alive():
+            return
+        self._stop.clear()
+        self._thread = threading.Thread(
+            target=self._health_loop, name="memory-backend-health", daemon=True
+        )
+        self._thread.start()
+
+    def _health_loop(self) -> None:
+        while not self._stop.wait(self.health_interval):
+            try:
+                self.check_health()
+            except Exception as exc:  # pragma: no cover - defensive
+                logger.debug(f"Memory backend health check failed: {exc}")
+
+
+def _close_quietly(client: Any) -> None:
+    if client is None:
+        return
+    try:
+        client.close()
+    except Exception:
+        pass
+
+
+_shared_backend_enabled = False
+
+
+def enable_shared_backend(enabled: bool = True) -> None:
+    """Route ``get_backend()`` through the process-wide ``BackendManager``.
+
+    Intended for long-lived services (gateway, API server). Can also be enabled
+    with ``MILTON_MEMORY_SHARED_BACKEND=1``.
+    """
+    global _shared_backend_enabled
+    _shared_backend_enabled = enabled
+    if not enabled:
+        BackendManager.reset_instance()
+
+
+def shared_backend_enabled() -> bool:
+    if _shared_backend_enabled:
+        return True
+    value = os.getenv("MILTON_MEMORY_SHARED_BACKEND", "")
+    return value.lower() in ("1", "true", "yes", "on")
+
+
+def get_backend_manager() -> Optional[BackendManager]:
+    """Return the shared manager when enabled, else None."""
+    if not shared_backend_enabled():
+        return None
+    return BackendManager.get_instance()
+
+
+def shared_weaviate_client() -> Any:
+    """Return the pooled Weaviate client if the shared backend is active."""
+    manager = get_backend_manager()
+    if manager is None:
+        return None
+    return manager.get_client()
+
+
+atexit.register(lambda: BackendManager._instance and BackendManager._instance.shutdown())
+
+
 def get_backend(
     repo_root: Optional[Path] = None, client: Optional[Any] = None
 ) -> JsonlBackend | WeaviateBackend:
@@ -419,6 +709,10 @@ def get_backend(
     if forced == "jsonl":
         return JsonlBackend(root)
 
+    manager = get_backend_manager()
+    if manager is not None:
+        return manager.get_backend(root)
+
     should_try = _should_try_weaviate(root)
     if should_try and probe_weaviate():
         if weaviate is None:
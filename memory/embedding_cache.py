@@ -0,0 +1,258 @@
+"""Single-file SQLite store for cached embedding vectors.
+
+Replaces the one-``.npy``-file-per-text layout: vectors live as float32 blobs
+in one table keyed by the same sha256 cache key, so a batch of lookups is one
+``SELECT ... IN`` and the stats are a ``COUNT`` instead of a directory glob.
+Entries carry a last-access stamp and the least recently used rows are evicted
+once the table grows past ``max_entries``. Hits only buffer their access time;
+the stamps are written in one batch every ``ACCESS_FLUSH_SECONDS`` (or
+``ACCESS_FLUSH_BATCH`` keys, or before an eviction), so a read stays a read;
+stamps still buffered when a process exits without ``close`` are lost, which
+only affects eviction order.
+The row count is tracked in memory and re-counted only when another process
+has written to the file.
+"""
+
+from __future__ import annotations
+
+import logging
+import sqlite3
+import threading
+import time
+from pathlib import Path
+from typing import Iterable, Mapping, Optional
+
+import numpy as np
+
+logger = logging.getLogger(__name__)
+
+CACHE_DB_NAME = "embeddings.sqlite3"
+DEFAULT_MAX_ENTRIES = 200_000
+_SQL_VARIABLE_CHUNK = 500
+ACCESS_FLUSH_SECONDS = 5.0
+ACCESS_FLUSH_BATCH = 1024
+
+
+class EmbeddingCache:
+    """Key -> float32 vector table with LRU eviction and hit/miss counters."""
+
+    def __init__(self, db_path: Path, max_entries: int = DEFAULT_MAX_ENTRIES):
+        self.db_path = Path(db_path)
+        self.db_path.parent.mkdir(parents=True, exist_ok=True)
+        self.max_entries = max_entries
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(self.db_path, check_same_thread=False)
+        self._init_db()
+        self._pending_access: dict[str, float] = {}
+        self._last_flush = time.monotonic()
+        self._data_version = self._conn.execute("PRAGMA data_version").fetchone()[0]
+        self._count = self._conn.execute("SELECT COUNT(*) FROM embeddings").fetchone()[0]
+
+    def _init_db(self) -> None:
+        with self._conn:
+            self._conn.execute("PRAGMA journal_mode=WAL")
+            self._conn.execute("PRAGMA synchronous=NORMAL")
+            self._conn.execute(
+                """
+                CREATE TABLE IF NOT EXISTS embeddings (
+                    key TEXT PRIMARY KEY,
+                    dim INTEGER NOT NULL,
+                    vector BLOB NOT NULL,
+                    last_access REAL NOT NULL
+                )
+                """
+            )
+            self._conn.execute(
+                """
+                CREATE INDEX IF NOT EXISTS idx_embeddings_last_access
+                ON embeddings(last_access)
+                """
+            )
+
+    # ------------------------------------------------------------------
+    # Reads
+    # ------------------------------------------------------------------
+
+    def get(self, key: str) -> Optional[np.ndarray]:
+        return self.get_many([key]).get(key)
+
+    def get_many(self, keys: Iterable[str]) -> dict[str, np.ndarray]:
+        """Return cached vectors for ``keys``; missing keys are left out."""
+        keys = list(dict.fromkeys(keys))
+        if not keys:
+            return {}
+        found: dict[str, np.ndarray] = {}
+        with self._lock:
+            for start in range(0, len(keys), _SQL_VARIABLE_CHUNK):
+                chunk = keys[start : start + _SQL_VARIABLE_CHUNK]
+                placeholders = ",".join("?" * len(chunk))
+                rows = self._conn.execute(
+                    f"SELECT key, dim, vector FROM embeddings WHERE key IN ({placeholders})",
+                    chunk,
+                ).fetchall()
+                for key, dim, blob in rows:
+                    vector = np.frombuffer(blob, dtype=np.float32)
+                    if vector.shape != (dim,):
+                        continue
+                    found[key] = vector.copy()
+            if found:
+                now = time.time()
+                self._pending_access.update(dict.fromkeys(found, now))
+                if (
+                    len(self._pending_access) >= ACCESS_FLUSH_BATCH
+                    or time.monotonic() - self._last_flush >= ACCESS_FLUSH_SECONDS
+                ):
+                    self._flush_access()
+            self.hits += len(found)
+            self.misses += len(keys) - len(found)
+        return found
+
+    def __len__(self) -> int:
+        with self._lock:
+            return self._conn.execute("SELECT COUNT(*) FROM embeddings").fetchone()[0]
+
+    def stats(self) -> dict:
+        with self._lock:
+            count, size = self._conn.execute(
+                "SELECT COUNT(*), COALESCE(SUM(LENGTH(vector)), 0) FROM embeddings"
+            ).fetchone()
+            lookups = self.hits + self.misses
+            return {
+                "count": count,
+                "size_bytes": size,
+                "max_entries": self.max_entries,
+                "hits": self.hits,
+                "misses": self.misses,
+                "hit_rate": round(self.hits / lookups, 4) if lookups else 0.0,
+                "evictions": self.evictions,
+            }
+
+    # ------------------------------------------------------------------
+    # Writes
+    # ------------------------------------------------------------------
+
+    def put(self, key: str, vector: np.ndarray) -> None:
+        self.put_many({key: vector})
+
+    def put_many(self, vectors: Mapping[str, np.ndarray]) -> int:
+        """Insert or replace vectors; returns rows written."""
+        if not vectors:
+            return 0
+        now = time.time()
+        rows = []
+        for key, vector in vectors.items():
+            array = np.asarray(vector, dtype=np.float32).reshape(-1)
+            rows.append((key, int(array.shape[0]), array.tobytes(), now))
+        keys = list(vectors)
+        with self._lock:
+            self._sync_count()
+            existing = 0
+            for start in range(0, len(keys), _SQL_VARIABLE_CHUNK):
+                chunk = keys[start : start + _SQL_VARIABLE_CHUNK]
+                placeholders = ",".join("?" * len(chunk))
+                existing += self._conn.execute(
+                    f"SELECT COUNT(*) FROM embeddings WHERE key IN ({placeholders})", chunk
+                ).fetchone()[0]
+            with self._conn:
+                self._conn.executemany(
+                    "INSERT OR REPLACE INTO embeddings (key, dim, vector, last_access) "
+                    "VALUES (?, ?, ?, ?)",
+                    rows,
+                )
+            self._count += len(rows) - existing
+            self._evict()
+        return len(rows)
+
+    def clear(self) -> int:
+        with self._lock:
+            with self._conn:
+                cursor = self._conn.execute("DELETE FROM embeddings")
+            self._pending_access.clear()
+            self._count = 0
+            self.hits = self.misses = self.evictions = 0
+            return cursor.rowcount
+
+    def flush(self) -> None:
+        """Write buffered last-access stamps."""
+        with self._lock:
+            self._flush_access()
+
+    def close(self) -> None:
+        with self._lock:
+            self._flush_access()
+            self._conn.close()
+
+    def _flush_access(self) -> None:
+        self._last_flush = time.monotonic()
+        if not self._pending_access:
+            return
+        pending, self._pending_access = self._pending_access, {}
+        with self._conn:
+            self._conn.executemany(
+                "UPDATE embeddings SET last_access = ? WHERE key = ?",
+                [(stamp, key) for key, stamp in pending.items()],
+            )
+
+    def _sync_count(self) -> None:
+        """Re-count rows if another connection has written since we last looked."""
+        version = self._conn.execute("PRAGMA data_version").fetchone()[0]
+        if version != self._data_version:
+            self._data_version = version
+            self._count = self._conn.execute("SELECT COUNT(*) FROM embeddings").fetchone()[0]
+
+    def _evict(self) -> None:
+        if self.max_entries <= 0:
+            return
+        excess = self._count - self.max_entries
+        if excess <= 0:
+            return
+        # Eviction order must see the buffered hits
+        self._flush_access()
+        with self._conn:
+            self._conn.execute(
+                """
+                DELETE FROM embeddings WHERE key IN (
+                    SELECT key FROM embeddings ORDER BY last_access ASC LIMIT ?
+                )
+                """,
+                (excess,),
+            )
+        self._count -= excess
+        self.evictions += excess
+        logger.debug(f"Evicted {excess} least recently used embeddings")
+
+    # ------------------------------------------------------------------
+    # Migration
+    # ------------------------------------------------------------------
+
+    def import_npy_dir(self, directory: Path) -> int:
+        """Move legacy ``<key>.npy`` cache files into the table."""
+        imported = 0
+        batch: dict[str, np.ndarray] = {}
+        paths: list[Path] = []
+
+        def _commit() -> int:
+            # Files are removed only once their vectors are committed
+            written = self.put_many(batch)
+            for path in paths:
+                path.unlink(missing_ok=True)
+            batch.clear()
+            paths.clear()
+            return written
+
+        for path in directory.glob("*.npy"):
+            try:
+                batch[path.stem] = np.load(path)
+            except Exception as e:
+                logger.warning(f"Skipping legacy cache file {path.name}: {e}")
+                continue
+            paths.append(path)
+            if len(batch) >= _SQL_VARIABLE_CHUNK:
+                imported += _commit()
+        imported += _commit()
+        if imported:
+            logger.info(f"Imported {imported} legacy .npy embeddings into {self.db_path.name}")
+        return imported
@@ -0,0 +1,244 @@
+"""In-process micro-batching service for embedding requests.
+
+Concurrent callers (gateway requests, indexing jobs, evaluation) each used to
+run their own ``model.encode``. The service queues requests, lets a short
+window collect whatever else arrives (or until ``max_batch`` texts are
+pending), drops duplicate texts and makes one ``embed_batch`` call, which in
+turn serves cached vectors and encodes only the misses. Callers get a
+``concurrent.futures.Future`` (``submit``), a blocking result (``embed``) or
+an awaitable (``aembed``).
+
+Configuration:
+    MILTON_EMBEDDING_BATCH_WINDOW_MS: collection window (default 5)
+    MILTON_EMBEDDING_MAX_BATCH: texts per encode call (default 64)
+"""
+
+from __future__ import annotations
+
+import asyncio
+import atexit
+import logging
+import queue
+import threading
+import time
+from concurrent.futures import Future
+from typing import Callable, Optional, Sequence
+
+import numpy as np
+
+from milton_orchestrator.env import env_float, env_int
+
+from . import embeddings
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_WINDOW_MS = 5.0
+DEFAULT_MAX_BATCH = 64
+
+BatchEncoder = Callable[[list[str]], list[Optional[np.ndarray]]]
+
+
+def _default_encoder(texts: list[str]) -> list[Optional[np.ndarray]]:
+    # Looked up at call time so the cache/model wiring stays in one place
+    return embeddings.embed_batch(texts, batch_size=max(len(texts), 1))
+
+
+class EmbeddingService:
+    """Collects concurrent embedding requests into deduplicated batches."""
+
+    def __init__(
+        self,
+        *,
+        window_ms: Optional[float] = None,
+        max_batch: Optional[int] = None,
+        encoder: Optional[BatchEncoder] = None,
+    ):
+        if window_ms is None:
+            window_ms = env_float("MILTON_EMBEDDING_BATCH_WINDOW_MS", DEFAULT_WINDOW_MS)
+        if max_batch is None:
+            max_batch = env_int("MILTON_EMBEDDING_MAX_BATCH", DEFAULT_MAX_BATCH)
+        self.window = max(window_ms, 0.0) / 1000.0
+        self.max_batch = max(max_batch, 1)
+        self._encoder = encoder or _default_encoder
+        self._queue: "queue.Queue[Optional[tuple[str, Future]]]" = queue.Queue()
+        self._lock = threading.Lock()
+        self._thread: Optional[threading.Thread] = None
+        self._closed = False
+        self._stats = {
+            "requests": 0,
+            "batches": 0,
+            "texts_encoded": 0,
+            "duplicates": 0,
+            "failures": 0,
+            "batch_ms_total": 0.0,
+        }
+
+    # ------------------------------------------------------------------
+    # Public API
+    # ------------------------------------------------------------------
+
+    def submit(self, text: str) -> Future:
+        """Queue ``text``; the future resolves to a vector or ``None``."""
+        future: Future = Future()
+        if not text or not text.strip():
+            future.set_result(None)
+            return future
+        with self._lock:
+            if self._closed:
+                raise RuntimeError("Embedding service is shut down")
+            self._ensure_worker()
+            self._stats["requests"] += 1
+            # Queued under the lock so it always lands ahead of the shutdown sentinel
+            self._queue.put((text, future))
+        return future
+
+    def submit_many(self, texts: Sequence[str]) -> list[Future]:
+        return [self.submit(text) for text in texts]
+
+    def embed(self, text: str, timeout: Optional[float] = None) -> Optional[np.ndarray]:
+        return self.submit(text).result(timeout)
+
+    def embed_many(
+        self, texts: Sequence[str], timeout: Optional[float] = None
+    ) -> list[Optional[np.ndarray]]:
+        return [future.result(timeout) for future in self.submit_many(texts)]
+
+    async def aembed(self, text: str) -> Optional[np.ndarray]:
+        return await asyncio.wrap_future(self.submit(text))
+
+    async def aembed_many(self, texts: Sequence[str]) -> list[Optional[np.ndarray]]:
+        return list(
+            await asyncio.gather(*(asyncio.wrap_future(f) for f in self.submit_many(texts)))
+        )
+
+    def stats(self) -> dict:
+        with self._lock:
+            stats = dict(self._stats)
+        total_ms = stats.pop("batch_ms_total")
+        stats["avg_batch_ms"] = round(total_ms / stats["batches"], 2) if stats["batches"] else 0.0
+        stats["avg_batch_size"] = (
+            round(stats["texts_encoded"] / stats["batches"], 2) if stats["batches"] else 0.0
+        )
+        stats["pending"] = self._queue.qsize()
+        stats["window_ms"] = self.window * 1000.0
+        stats["max_batch"] = self.max_batch
+        return stats
+
+    def shutdown(self, timeout: Optional[float] = 5.0) -> None:
+        """Finish queued work and stop the worker thread."""
+        with self._lock:
+            if self._closed:
+                return
+            self._closed = True
+            thread = self._thread
+        if thread is not None:
+            self._queue.put(None)
+            thread.join(timeout)
+
+    # ------------------------------------------------------------------
+    # Worker
+    # ------------------------------------------------------------------
+
+    def _ensure_worker(self) -> None:
+        if self._thread is None or not self._thread.is_alive():
+            self._thread = threading.Thread(
+                target=self._run, name="embedding-batcher", daemon=True
+            )
+            self._thread.start()
+
+    def _run(self) -> None:
+        while True:
+            first = self._queue.get()
+            if first is None:
+                return
+            batch = [first]
+            stop = self._collect(batch)
+            self._process(batch)
+            if stop:
+                return
+
+    def _collect(self, batch: list[tuple[str, Future]]) -> bool:
+        """Gather requests until the window closes or the batch is full."""
+        deadline = time.monotonic() + self.window
+        distinct = {batch[0][0]}
+        while len(distinct) < self.max_batch:
+            remaining = deadline - time.monotonic()
+            try:
+                entry = self._queue.get(timeout=remaining) if remaining > 0 else self._queue.get_nowait()
+            except queue.Empty:
+                return False
+            if entry is None:
+                return True
+            batch.append(entry)
+            distinct.add(entry[0])
+        return False
+
+    def _process(self, batch: list[tuple[str, Future]]) -> None:
+        waiting: dict[str, list[Future]] = {}
+        for text, future in batch:
+            if future.set_running_or_notify_cancel():
+                waiting.setdefault(text, []).append(future)
+        if not waiting:
+            return
+        texts = list(waiting)
+        started = time.perf_counter()
+        try:
+            vectors = self._encoder(texts)
+        except Exception as exc:
+            logger.error(f"Embedding batch of {len(texts)} failed: {exc}", exc_info=True)
+            with self._lock:
+                self._stats["failures"] += 1
+            for futures in waiting.values():
+                for future in futures:
+                    future.set_exception(exc)
+            return
+        elapsed_ms = (time.perf_counter() - started) * 1000.0
+        with self._lock:
+            self._stats["batches"] += 1
+            self._stats["texts_encoded"] += len(texts)
+            self._stats["duplicates"] += sum(len(f) for f in waiting.values()) - len(texts)
+            self._stats["batch_ms_total"] += elapsed_ms
+        for text, vector in zip(texts, vectors):
+            for future in waiting[text]:
+                future.set_result(vector)
+
+
+_service: Optional[EmbeddingService] = None
+_service_lock = threading.Lock()
+
+
+def get_embedding_service() -> EmbeddingService:
+    """Return the process-wide embedding service, starting it on first use."""
+    global _service
+    with _service_lock:
+        if _service is None:
+            _service = EmbeddingService()
+        return _service
+
+
+def shutdown_embedding_service() -> None:
+    global _service
+    with _service_lock:
+        service, _service = _service, None
+    if service is not None:
+        service.shutdown()
+
+
+atexit.register(shutdown_embedding_service)
+
+
+def embedding_service_stats() -> Optional[dict]:
+    """Stats of the running service, or ``None`` if it was never used."""
+    with _service_lock:
+        service = _service
+    return service.stats() if service is not None else None
+
+
+def embed_text(text: str, timeout: Optional[float] = None) -> Optional[np.ndarray]:
+    """Embed one text through the shared service (coalesced with other callers)."""
+    return get_embedding_service().embed(text, timeout)
+
+
+def embed_texts(texts: Sequence[str], timeout: Optional[float] = None) -> list[Optional[np.ndarray]]:
+    """Embed several texts through the shared service."""
+    return get_embedding_service().embed_many(texts, timeout)
@@ -4,6 +4,10 @@ Semantic Embeddings for Milton Memory
 Local-first embedding generation using sentence-transformers.
 Supports caching and graceful degradation when model unavailable.
 
+Cached vectors live in a single SQLite file (``memory.embedding_cache``)
+under ``EMBEDDING_CACHE_DIR``; both ``embed`` and ``embed_batch`` consult it
+and only encode texts that miss.
+
 Requirements:
     pip install sentence-transformers
 
@@ -14,13 +18,18 @@ from __future__ import annotations
 
 import logging
 import os
+import threading
 from pathlib import Path
 from typing import Optional, List
 import hashlib
-import json
 
 import numpy as np
 
+try:
+    from .embedding_cache import CACHE_DB_NAME, DEFAULT_MAX_ENTRIES, EmbeddingCache
+except ImportError:  # pragma: no cover - direct script execution
+    from embedding_cache import CACHE_DB_NAME, DEFAULT_MAX_ENTRIES, EmbeddingCache
+
 logger = logging.getLogger(__name__)
 
 # Default embedding model (small and fast)
@@ -35,12 +44,47 @@ EMBEDDING_CACHE_DIR = STATE_DIR / "embeddings_cache"
 _MODEL = None
 _MODEL_LOADED = False
 
+# Shared cache store (opened lazily, reopened if EMBEDDING_CACHE_DIR changes)
+_CACHE: Optional[EmbeddingCache] = None
+_CACHE_LOCK = threading.Lock()
+
+
+def _cache_key(text: str, model_name: str, normalize: bool = True) -> str:
+    """Get cache key for text embedding (same hash as the old .npy names)."""
+    suffix = "" if normalize else ":raw"
+    return hashlib.sha256(f"{model_name}:{text}{suffix}".encode()).hexdigest()
+
+
+def _cache_max_entries() -> int:
+    try:
+        return int(os.getenv("MILTON_EMBEDDING_CACHE_MAX_ENTRIES", str(DEFAULT_MAX_ENTRIES)))
+    except ValueError:
+        return DEFAULT_MAX_ENTRIES
+
+
+def get_embedding_cache() -> Optional[EmbeddingCache]:
+    """
+    Return the shared embedding cache, importing legacy .npy files once.
 
-def _get_cache_path(text: str, model_name: str) -> Path:
-    """Get cache file path for text embedding."""
-    # Create hash of text + model for cache key
-    cache_key = hashlib.sha256(f"{model_name}:{text}".encode()).hexdigest()
-    return EMBEDDING_CACHE_DIR / f"{cache_key}.npy"
+    Returns:
+        EmbeddingCache instance or None if the cache cannot be opened
+    """
+    global _CACHE
+
+    db_path = EMBEDDING_CACHE_DIR / CACHE_DB_NAME
+    with _CACHE_LOCK:
+        if _CACHE is not None and _CACHE.db_path == db_path:
+            return _CACHE
+        try:
+            cache = EmbeddingCache(db_path, max_entries=_cache_max_entries())
+            cache.import_npy_dir(EMBEDDING_CACHE_DIR)
+        except Exception as e:
+            logger.warning(f"Embedding cache unavailable: {e}")
+            return None
+        if _CACHE is not None:
+            _CACHE.close()
+        _CACHE = cache
+        return _CACHE
 
 
 def _load_model(model_name: str = DEFAULT_MODEL):
@@ -120,15 +164,16 @@ def embed(
         return None
 
     # Check cache first
-    if use_cache:
-        cache_path = _get_cache_path(text, model_name)
-        if cache_path.exists():
-            try:
-                vector = np.load(cache_path)
-                logger.debug(f"Loaded embedding from cache: {cache_path.name}")
+    cache = get_embedding_cache() if use_cache else None
+    cache_key = _cache_key(text, model_name, normalize)
+    if cache is not None:
+        try:
+            vector = cache.get(cache_key)
+            if vector is not None:
+                logger.debug(f"Loaded embedding from cache: {cache_key[:12]}")
                 return vector
-            except Exception as e:
-                logger.warning(f"Failed to load cached embedding: {e}")
+        except Exception as e:
+            logger.warning(f"Failed to load cached embedding: {e}")
 
     # Load model
     model = _load_model(model_name)
@@ -150,11 +195,10 @@ def embed(
             return None
 
         # Save to cache
-        if use_cache:
+        if cache is not None:
             try:
-                cache_path.parent.mkdir(parents=True, exist_ok=True)
-                np.save(cache_path, vector)
-                logger.debug(f"Saved embedding to cache: {cache_path.name}")
+                cache.put(cache_key, vector)
+                logger.debug(f"Saved embedding to cache: {cache_key[:12]}")
             except Exception as e:
                 logger.warning(f"Failed to cache embedding: {e}")
 
@@ -171,17 +215,22 @@ def embed_batch(
     model_name: str = DEFAULT_MODEL,
     batch_size: int = 32,
     normalize: bool = True,
-    show_progress: bool = False
+    show_progress: bool = False,
+    use_cache: bool = True
 ) -> List[Optional[np.ndarray]]:
     """
     Generate embeddings for multiple texts (batched for efficiency).
 
+    Cached texts are served from the cache; only the misses (deduplicated)
+    are sent to the model.
+
     Args:
         texts: List of input texts
         model_name: Embedding model to use
         batch_size: Batch size for processing
         normalize: Whether to L2-normalize embeddings
         show_progress: Whether to show progress bar
+        use_cache: Whether to use cached embeddings
 
     Returns:
         List of embedding vectors (or None for failed embeddings)
@@ -193,35 +242,55 @@ def embed_batch(
     if not texts:
         return []
 
-    # Load model
-    model = _load_model(model_name)
-    if model is None:
-        logger.warning("Embedding model not available, returning None for all texts")
-        return [None] * len(texts)
-
-    try:
-        # Generate embeddings in batches
-        vectors = model.encode(
-            texts,
-            batch_size=batch_size,
-            normalize_embeddings=normalize,
-            show_progress_bar=show_progress
-        )
-
-        # Verify shapes and convert to list
-        result = []
-        for i, vector in enumerate(vectors):
-            if vector.shape != (EMBEDDING_DIM,):
-                logger.warning(f"Unexpected embedding shape for text {i}: {vector.shape}")
-                result.append(None)
-            else:
-                result.append(vector)
+    keys = [_cache_key(text, model_name, normalize) for text in texts]
+    cache = get_embedding_cache() if use_cache else None
+    cached: dict = {}
+    if cache is not None:
+        try:
+            cached = cache.get_many(keys)
+        except Exception as e:
+            logger.warning(f"Failed to load cached embeddings: {e}")
+
+    # Texts still to encode, deduplicated by cache key
+    pending: dict = {}
+    for key, text in zip(keys, texts):
+        if key not in cached and key not in pending:
+            pending[key] = text
+
+    if pending:
+        # Load model
+        model = _load_model(model_name)
+        if model is None:
+            logger.warning("Embedding model not available, returning None for uncached texts")
+        else:
+            try:
+                # Generate embeddings in batches
+                vectors = model.encode(
+                    list(pending.values()),
+                    batch_size=batch_size,
+                    normalize_embeddings=normalize,
+                    show_progress_bar=show_progress
+                )
+
+                # Verify shapes
+                fresh = {}
+                for key, vector in zip(pending, vectors):
+                    if vector.shape != (EMBEDDING_DIM,):
+                        logger.warning(f"Unexpected embedding shape for {key[:12]}: {vector.shape}")
+                    else:
+                        fresh[key] = vector
+                cached.update(fresh)
+
+                if cache is not None and fresh:
+                    try:
+                        cache.put_many(fresh)
+                    except Exception as e:
+                        logger.warning(f"Failed to cache batch embeddings: {e}")
 
-        return result
+            except Exception as e:
+                logger.error(f"Failed to generate batch embeddings: {e}", exc_info=True)
 
-    except Exception as e:
-        logger.error(f"Failed to generate batch embeddings: {e}", exc_info=True)
-        return [None] * len(texts)
+    return [cached.get(key) for key in keys]
 
 
 def cosine_similarity(vec1: np.ndarray, vec2: np.ndarray) -> float:
@@ -261,12 +330,17 @@ def clear_cache() -> int:
     Clear the embeddings cache.
 
     Returns:
-        Number of cache files deleted
+        Number of cached embeddings deleted
     """
     if not EMBEDDING_CACHE_DIR.exists():
         return 0
 
     count = 0
+    cache = get_embedding_cache()
+    if cache is not None:
+        count += cache.clear()
+
+    # Legacy one-file-per-embedding layout
     for cache_file in EMBEDDING_CACHE_DIR.glob("*.npy"):
         try:
             cache_file.unlink()
@@ -293,14 +367,19 @@ def get_cache_stats() -> dict:
             "size_mb": 0.0
         }
 
-    cache_files = list(EMBEDDING_CACHE_DIR.glob("*.npy"))
-    total_size = sum(f.stat().st_size for f in cache_files)
+    cache = get_embedding_cache()
+    stats = cache.stats() if cache is not None else {"count": 0, "size_bytes": 0}
 
     return {
         "cache_dir": str(EMBEDDING_CACHE_DIR),
         "exists": True,
-        "count": len(cache_files),
-        "size_mb": round(total_size / (1024 * 1024), 2)
+        "count": stats["count"],
+        "size_mb": round(stats["size_bytes"] / (1024 * 1024), 2),
+        "hits": stats.get("hits", 0),
+        "misses": stats.get("misses", 0),
+        "hit_rate": stats.get("hit_rate", 0.0),
+        "evictions": stats.get("evictions", 0),
+        "max_entries": stats.get("max_entries", 0),
     }
 
 
@@ -1,11 +1,12 @@
 """
 Batch Indexing for Semantic Embeddings
 
-Generates and indexes embeddings for existing memory items in Weaviate.
+Generates and indexes embeddings for existing memory items in Weaviate, or in
+the local vector index used by JSONL-mode hybrid retrieval (--local).
 Supports incremental indexing, dry-run mode, and progress reporting.
 
 Usage:
-    python memory/index_embeddings.py [--dry-run] [--batch-size 32] [--force]
+    python memory/index_embeddings.py [--dry-run] [--batch-size 32] [--force] [--local]
 """
 from __future__ import annotations
 
@@ -21,13 +22,17 @@ import sys
 if __name__ == "__main__" and __package__ is None:
     # Add parent directory to path for direct execution
     sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
-    from memory.backends import get_backend
-    from memory.embeddings import embed_batch, is_available, EMBEDDING_DIM
+    from memory.backends import get_backend, repo_root_from_file
+    from memory.embedding_service import embed_texts
+    from memory.embeddings import is_available, EMBEDDING_DIM
     from memory.init_db import get_client
+    from memory.vector_index import get_vector_index
 else:
-    from .backends import get_backend
-    from .embeddings import embed_batch, is_available, EMBEDDING_DIM
+    from .backends import get_backend, repo_root_from_file
+    from .embedding_service import embed_texts
+    from .embeddings import is_available, EMBEDDING_DIM
     from .init_db import get_client
+    from .vector_index import get_vector_index
 
 logger = logging.getLogger(__name__)
 
@@ -143,11 +148,7 @@ def index_embeddings(
             # Generate embeddings
             print(f"  Processing batch {i//batch_size + 1}/{(len(items_to_process) + batch_size - 1) // batch_size}...", end=" ")
 
-            vectors = embed_batch(
-                texts,
-                batch_size=batch_size,
-                show_progress=False
-            )
+            vectors = embed_texts(texts)
 
             # Update items with vectors
             success_count = 0
@@ -181,6 +182,59 @@ def index_embeddings(
         client.close()
 
 
+def index_local_embeddings(
+    *,
+    batch_size: int = 32,
+    dry_run: bool = False,
+    force: bool = False,
+    repo_root: Optional[Path] = None
+) -> Tuple[int, int]:
+    """
+    Backfill the local vector index from short-term memory.
+
+    Args:
+        batch_size: Number of items to process per batch
+        dry_run: If True, only show what would be done
+        force: If True, re-embed items that are already indexed
+        repo_root: Repository root path
+
+    Returns:
+        Tuple of (items_processed, items_updated)
+    """
+    import numpy as np
+
+    if not is_available():
+        print("❌ Embeddings not available")
+        print("   Install with: pip install sentence-transformers")
+        return (0, 0)
+
+    root = repo_root or repo_root_from_file()
+    backend = get_backend(repo_root=root)
+    index = get_vector_index(root)
+    items = backend.list_short_term()
+    removed = index.retain({item.id for item in items})
+    known = set() if force else index.ids()
+    items_to_process = [item for item in items if item.id not in known]
+
+    print(f"Found {len(items)} memory items ({removed} stale vectors removed)")
+    print(f"Items to process: {len(items_to_process)}")
+    if dry_run or not items_to_process:
+        return (len(items_to_process), 0)
+
+    items_updated = 0
+    for i in range(0, len(items_to_process), batch_size):
+        batch = items_to_process[i:i+batch_size]
+        vectors = embed_texts([item.content for item in batch])
+        pairs = [(item.id, vector) for item, vector in zip(batch, vectors) if vector is not None]
+        if pairs:
+            items_updated += index.add_many(
+                [memory_id for memory_id, _ in pairs], np.stack([v for _, v in pairs])
+            )
+
+    print(f"\n✅ Local indexing complete: {items_updated}/{len(items_to_process)} items")
+    return (len(items_to_process), items_updated)
+
+
 def show_stats(repo_root: Optional[Path] = None):
     """
     Show embedding indexing statistics.
@@ -239,6 +293,11 @@ def main():
         action="store_true",
         help="Regenerate embeddings even if they already exist"
     )
+    parser.add_argument(
+        "--local",
+        action="store_true",
+        help="Index into the local vector store instead of Weaviate"
+    )
     parser.add_argument(
         "--stats",
         action="store_true",
@@ -257,6 +316,12 @@ def main():
 
     if args.stats:
         show_stats()
+    elif args.local:
+        index_local_embeddings(
+            batch_size=args.batch_size,
+            dry_run=args.dry_run,
+            force=args.force
+        )
     else:
         processed, updated = index_embeddings(
             batch_size=args.batch_size,
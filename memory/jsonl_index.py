@@ -0,0 +1,353 @@
+"""Append-only JSONL engine with an in-memory index for short-term memory.
+
+The file is only ever appended to. Deletions append a tombstone record and are
+folded into the index immediately; the file is rewritten by a background
+compaction once dead records outnumber live ones.
+
+The index keeps parsed ``MemoryItem`` objects keyed by id, a timestamp-sorted
+list, a tag map and a BM25 inverted index (``memory.lexical_index``). Each
+read stats the file and parses only the bytes appended since the last read
+(tracked by offset, inode, mtime and a short tail fingerprint), so
+steady-state queries cost one ``stat`` instead of a full parse.
+
+Appends and compaction take an exclusive ``flock`` on a sibling ``.lock``
+file, so a compaction in one process never drops records another process
+is appending.
+"""
+
+from __future__ import annotations
+
+import bisect
+import json
+import logging
+import os
+import threading
+from contextlib import contextmanager
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Any, Iterator, Optional
+
+try:
+    import fcntl  # type: ignore
+except Exception:  # pragma: no cover - platform dependent
+    fcntl = None
+
+from .lexical_index import LexicalIndex, document_text
+from .schema import MemoryItem
+
+logger = logging.getLogger(__name__)
+
+MEMORY_RECORD = "memory_item"
+TOMBSTONE_RECORD = "tombstone"
+COMPACT_MIN_DEAD_RECORDS = 500
+_TAIL_FINGERPRINT_BYTES = 64
+
+
+def _encode(record: dict[str, Any]) -> bytes:
+    return (json.dumps(record, sort_keys=True) + "\n").encode("utf-8")
+
+
+class JsonlIndex:
+    """Parsed, incrementally refreshed view of one short-term JSONL file."""
+
+    def __init__(self, path: Path, compact_min_dead: int = COMPACT_MIN_DEAD_RECORDS):
+        self.path = path
+        self.compact_min_dead = compact_min_dead
+        self._lock = threading.RLock()
+        self._compact_thread: Optional[threading.Thread] = None
+        self._reset()
+
+    def _reset(self) -> None:
+        self._items: dict[str, MemoryItem] = {}
+        self._by_ts: list[tuple[datetime, str]] = []
+        self._by_tag: dict[str, set[str]] = {}
+        self._lexical = LexicalIndex()
+        self._other: list[dict[str, Any]] = []
+        self._dead = 0
+        self._offset = 0
+        self._inode: Optional[int] = None
+        self._mtime_ns: Optional[int] = None
+        self._tail = b""
+
+    # ------------------------------------------------------------------
+    # Reads
+    # ------------------------------------------------------------------
+
+    def items(self) -> list[MemoryItem]:
+        """Return live items in append order."""
+        with self._lock:
+            self.refresh()
+            return list(self._items.values())
+
+    def get(self, memory_id: str) -> Optional[MemoryItem]:
+        with self._lock:
+            self.refresh()
+            return self._items.get(memory_id)
+
+    def since(self, cutoff: datetime) -> list[MemoryItem]:
+        """Return live items with ``ts >= cutoff``, oldest first."""
+        with self._lock:
+            self.refresh()
+            start = bisect.bisect_left(self._by_ts, (cutoff, ""))
+            return [self._items[memory_id] for _ts, memory_id in self._by_ts[start:]]
+
+    def with_tag(self, tag: str) -> list[MemoryItem]:
+        with self._lock:
+            self.refresh()
+            ids = self._by_tag.get(tag.strip().lower(), set())
+            return [self._items[memory_id] for memory_id in ids]
+
+    def get_many(self, memory_ids) -> dict[str, MemoryItem]:
+        with self._lock:
+            self.refresh()
+            items = self._items
+            return {memory_id: items[memory_id] for memory_id in memory_ids if memory_id in items}
+
+    def newest_first(self) -> Iterator[MemoryItem]:
+        """Yield live items ordered by timestamp, newest first.
+
+        Iterates a snapshot of the timestamp order, so callers can stop early
+        without materializing the whole list.
+        """
+        with self._lock:
+            self.refresh()
+            order = self._by_ts[:]
+            items = self._items
+        for _ts, memory_id in reversed(order):
+            item = items.get(memory_id)
+            if item is not None:
+                yield item
+
+    def lexical_scores(self, query: str) -> dict[str, float]:
+        """Return normalized BM25 scores for items matching any query term."""
+        with self._lock:
+            self.refresh()
+            return self._lexical.normalized_scores(query)
+
+    def stats(self) -> dict[str, int]:
+        with self._lock:
+            return {
+                "live": len(self._items),
+                "dead": self._dead,
+                "offset": self._offset,
+            }
+
+    def refresh(self) -> None:
+        """Fold any bytes appended since the last read into the index."""
+        with self._lock:
+            try:
+                stat = os.stat(self.path)
+            except FileNotFoundError:
+                if self._offset or self._items:
+                    self._reset()
+                return
+
+            if stat.st_ino != self._inode or stat.st_size < self._offset:
+                self._reset()
+            elif stat.st_size == self._offset:
+                if stat.st_mtime_ns == self._mtime_ns:
+                    return
+                # Same size but touched: only a rewrite can do that
+                self._reset()
+            elif not self._tail_matches():
+                self._reset()
+
+            self._read_from_offset()
+            self._inode = stat.st_ino
+            self._mtime_ns = stat.st_mtime_ns
+
+    def _tail_matches(self) -> bool:
+        if not self._tail:
+            return self._offset == 0
+        try:
+            with self.path.open("rb") as handle:
+                handle.seek(self._offset - len(self._tail))
+                return handle.read(len(self._tail)) == self._tail
+        except OSError:
+            return False
+
+    def _read_from_offset(self) -> None:
+        with self.path.open("rb") as handle:
+            handle.seek(self._offset)
+            data = handle.read()
+        end = data.rfind(b"\n")
+        if end < 0:
+            return  # Partial trailing write; pick it up next time
+        chunk = data[: end + 1]
+        for raw in chunk.splitlines():
+            raw = raw.strip()
+            if not raw:
+                continue
+            try:
+                record = json.loads(raw)
+            except json.JSONDecodeError:
+                self._dead += 1
+                continue
+            self._apply(record)
+        self._offset += len(chunk)
+        consumed_tail = chunk[-_TAIL_FINGERPRINT_BYTES:]
+        if len(consumed_tail) < _TAIL_FINGERPRINT_BYTES and self._tail:
+            consumed_tail = (self._tail + consumed_tail)[-_TAIL_FINGERPRINT_BYTES:]
+        self._tail = consumed_tail
+
+    def _apply(self, record: dict[str, Any]) -> None:
+        record_type = record.get("record_type")
+        if record_type == MEMORY_RECORD:
+            try:
+                item = MemoryItem.model_validate(record.get("data", {}))
+            except Exception:
+                self._dead += 1
+                return
+            if item.id in self._items:
+                self._unindex(item.id)
+                self._dead += 1
+            self._index(item)
+        elif record_type == TOMBSTONE_RECORD:
+            self._dead += 1
+            for memory_id in record.get("data", {}).get("ids", []):
+                if memory_id in self._items:
+                    self._unindex(memory_id)
+                    self._dead += 1
+        else:
+            self._other.append(record)
+
+    def _index(self, item: MemoryItem) -> None:
+        self._items[item.id] = item
+        bisect.insort(self._by_ts, (item.ts, item.id))
+        for tag in item.tags:
+            self._by_tag.setdefault(tag, set()).add(item.id)
+        self._lexical.add(item.id, document_text(item.content, item.tags))
+
+    def _unindex(self, memory_id: str) -> None:
+        item = self._items.pop(memory_id)
+        self._lexical.remove(memory_id)
+        pos = bisect.bisect_left(self._by_ts, (item.ts, item.id))
+        if pos < len(self._by_ts) and self._by_ts[pos] == (item.ts, item.id):
+            del self._by_ts[pos]
+        for tag in item.tags:
+            ids = self._by_tag.get(tag)
+            if ids is not None:
+                ids.discard(memory_id)
+                if not ids:
+                    del self._by_tag[tag]
+
+    # ------------------------------------------------------------------
+    # Writes
+    # ------------------------------------------------------------------
+
+    def append(self, item: MemoryItem) -> str:
+        record = {"record_type": MEMORY_RECORD, "data": item.model_dump(mode="json")}
+        with self._lock:
+            self._append_record(record)
+            self.refresh()
+        return item.id
+
+    def delete_before(self, cutoff: datetime) -> int:
+        """Tombstone every item older than ``cutoff``; returns the count."""
+        with self._lock:
+            self.refresh()
+            end = bisect.bisect_left(self._by_ts, (cutoff, ""))
+            ids = [memory_id for _ts, memory_id in self._by_ts[:end]]
+            if not ids:
+                return 0
+            self._append_record(
+                {
+                    "record_type": TOMBSTONE_RECORD,
+                    "data": {"ids": ids, "ts": datetime.now(timezone.utc).isoformat()},
+                }
+            )
+            self.refresh()
+            self._maybe_schedule_compaction()
+            return len(ids)
+
+    def _append_record(self, record: dict[str, Any]) -> None:
+        with self._file_lock():
+            with self.path.open("ab") as handle:
+                handle.write(_encode(record))
+
+    @contextmanager
+    def _file_lock(self) -> Iterator[None]:
+        """Exclusive cross-process lock shared by appends and compaction."""
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        with self.path.with_name(self.path.name + ".lock").open("a+") as handle:
+            if fcntl is not None:
+                fcntl.flock(handle.fileno(), fcntl.LOCK_EX)
+            try:
+                yield
+            finally:
+                if fcntl is not None:
+                    fcntl.flock(handle.fileno(), fcntl.LOCK_UN)
+
+    # ------------------------------------------------------------------
+    # Compaction
+    # ------------------------------------------------------------------
+
+    def needs_compaction(self) -> bool:
+        with self._lock:
+            return self._dead >= self.compact_min_dead and self._dead > len(self._items)
+
+    def _maybe_schedule_compaction(self) -> None:
+        if not self.needs_compaction():
+            return
+        if self._compact_thread is not None and self._compact_thread.is_alive():
+            return
+        self._compact_thread = threading.Thread(
+            target=self._compact_quietly, name="memory-jsonl-compact", daemon=True
+        )
+        self._compact_thread.start()
+
+    def _compact_quietly(self) -> None:
+        try:
+            self.compact()
+        except Exception as exc:
+            logger.warning(f"JSONL compaction failed for {self.path}: {exc}")
+
+    def compact(self) -> int:
+        """Rewrite the file with live records only; returns records dropped."""
+        with self._lock, self._file_lock():
+            self.refresh()
+            if not self.path.exists():
+                return 0
+            dropped = self._dead
+            snapshot_offset = self._offset
+            tmp_path = self.path.with_name(self.path.name + ".compact")
+            with tmp_path.open("wb") as handle:
+                for record in self._other:
+                    handle.write(_encode(record))
+                for item in self._items.values():
+                    handle.write(
+                        _encode({"record_type": MEMORY_RECORD, "data": item.model_dump(mode="json")})
+                    )
+                # Carry over complete records appended since the refresh; a
+                # torn line from a crashed writer is dropped
+                with self.path.open("rb") as source:
+                    source.seek(snapshot_offset)
+                    pending = source.read()
+                handle.write(pending[: pending.rfind(b"\n") + 1])
+                handle.flush()
+                os.fsync(handle.fileno())
+            os.replace(tmp_path, self.path)
+            self._reset()
+            self.refresh()
+            logger.debug(f"Compacted {self.path}: dropped {dropped} dead records")
+            return dropped
+
+    def wait_for_compaction(self, timeout: Optional[float] = None) -> None:
+        thread = self._compact_thread
+        if thread is not None:
+            thread.join(timeout)
+
+
+_indexes: dict[Path, JsonlIndex] = {}
+_indexes_lock = threading.Lock()
+
+
+def get_jsonl_index(path: Path) -> JsonlIndex:
+    """Return the process-wide index for ``path``."""
+    key = Path(os.path.abspath(path))
+    with _indexes_lock:
+        index = _indexes.get(key)
+        if index is None:
+            index = JsonlIndex(key)
+            _indexes[key] = index
+        return index
@@ -28,12 +28,17 @@ from .api import (
     export_snapshot,
     get_entity,
     import_snapshot,
+    match_entities,
     neighbors,
     search_entities,
+    traverse,
     upsert_edge,
+    upsert_edges_bulk,
+    upsert_entities_bulk,
     upsert_entity,
 )
 from .schema import Edge, Entity
+from .traverse import Traversal, TraversedEdge
 
 __all__ = [
     "Entity",
@@ -41,8 +46,14 @@ __all__ = [
     "upsert_entity",
     "get_entity",
     "search_entities",
+    "match_entities",
     "upsert_edge",
+    "upsert_entities_bulk",
+    "upsert_edges_bulk",
     "neighbors",
+    "traverse",
+    "Traversal",
+    "TraversedEdge",
     "export_snapshot",
     "import_snapshot",
 ]
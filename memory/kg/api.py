@@ -6,22 +6,32 @@ All functions work locally without requiring Weaviate or other services.
 
 from __future__ import annotations
 
+import threading
 from pathlib import Path
-from typing import Any, Optional
+from typing import Any, Iterable, Optional
 
 from .schema import Edge, Entity
 from .store import KnowledgeGraphStore
+from .traverse import Traversal
 
 # Module-level store instance (lazily initialized)
 _store: Optional[KnowledgeGraphStore] = None
+_store_lock = threading.Lock()
 
 
 def _get_store(db_path: Optional[Path] = None) -> KnowledgeGraphStore:
-    """Get or create the module-level store instance."""
+    """Get or create the module-level store instance.
+    
+    The store holds a persistent connection, so it is only replaced when a
+    different ``db_path`` is requested. The replaced store is not closed
+    here: another thread may still be using it, and its connection is
+    closed once the last caller drops it.
+    """
     global _store
-    if _store is None or db_path is not None:
-        _store = KnowledgeGraphStore(db_path=db_path)
-    return _store
+    with _store_lock:
+        if _store is None or (db_path is not None and Path(db_path) != _store.db_path):
+            _store = KnowledgeGraphStore(db_path=db_path)
+        return _store
 
 
 def upsert_entity(
@@ -61,6 +71,38 @@ def upsert_entity(
     return entity.id
 
 
+def upsert_entities_bulk(
+    entities: list[dict[str, Any]],
+    db_path: Optional[Path] = None
+) -> list[str]:
+    """Create or update many entities in a single transaction.
+    
+    Args:
+        entities: Dicts with ``type``, ``name`` and optional ``metadata`` /
+            ``entity_id`` (same meaning as the ``upsert_entity`` arguments)
+        db_path: Optional custom database path (for testing)
+    
+    Returns:
+        Entity IDs, one per input dict
+    
+    Example:
+        >>> ids = upsert_entities_bulk([
+        ...     {"type": "project", "name": "Milton"},
+        ...     {"type": "tool", "name": "SQLite"},
+        ... ])
+    """
+    store = _get_store(db_path)
+    return store.upsert_entities_bulk(
+        {
+            "entity_type": entity["type"],
+            "name": entity["name"],
+            "metadata": entity.get("metadata"),
+            "entity_id": entity.get("entity_id"),
+        }
+        for entity in entities
+    )
+
+
 def get_entity(entity_id: str, db_path: Optional[Path] = None) -> Optional[Entity]:
     """Get an entity by ID.
     
@@ -100,6 +142,33 @@ def search_entities(
     return store.search_entities(name=name, entity_type=type, limit=limit)
 
 
+def match_entities(
+    query_tokens: list[str],
+    type: Optional[str] = None,
+    limit: int = 20,
+    db_path: Optional[Path] = None
+) -> list[tuple[Entity, float]]:
+    """Resolve all query terms to ranked entities in one indexed query.
+    
+    Args:
+        query_tokens: Query words/phrases (each matched as a substring of
+            entity names and aliases; tokens under 3 characters are ignored)
+        type: Optional type filter
+        limit: Maximum results
+        db_path: Optional custom database path (for testing)
+    
+    Returns:
+        List of (Entity, score) tuples, best first (1.0 exact name match,
+        0.8 name contains a term, 0.6 alias match)
+    
+    Example:
+        >>> for entity, score in match_entities(["milton", "python"]):
+        ...     print(entity.name, score)
+    """
+    store = _get_store(db_path)
+    return store.match_entities(query_tokens, entity_type=type, limit=limit)
+
+
 def upsert_edge(
     subject_id: str,
     predicate: str,
@@ -143,6 +212,27 @@ def upsert_edge(
     return edge.id
 
 
+def upsert_edges_bulk(
+    edges: list[dict[str, Any]],
+    db_path: Optional[Path] = None
+) -> list[str]:
+    """Create or update many edges in a single transaction.
+    
+    Args:
+        edges: Dicts with ``subject_id``, ``predicate``, ``object_id`` and
+            optional ``weight`` / ``evidence``
+        db_path: Optional custom database path (for testing)
+    
+    Returns:
+        Edge IDs, one per input dict
+    
+    Raises:
+        ValueError: If any weight is outside 0.0-1.0 (nothing is written)
+    """
+    store = _get_store(db_path)
+    return store.upsert_edges_bulk(edges)
+
+
 def neighbors(
     entity_id: str,
     direction: str = "outgoing",
@@ -176,6 +266,51 @@ def neighbors(
     )
 
 
+def traverse(
+    seed_ids: Iterable[str],
+    depth: int = 1,
+    direction: str = "both",
+    predicates: Optional[Iterable[str]] = None,
+    min_weight: float = 0.0,
+    max_edges: Optional[int] = None,
+    max_edges_per_node: Optional[int] = None,
+    db_path: Optional[Path] = None
+) -> Traversal:
+    """Expand the graph breadth-first from several entities at once.
+    
+    One batched query per hop replaces a ``neighbors`` call per entity and
+    direction; edge evidence is parsed only when read.
+    
+    Args:
+        seed_ids: Entity IDs to start from
+        depth: Number of hops to expand
+        direction: "outgoing", "incoming" or "both"
+        predicates: Optional predicates to follow
+        min_weight: Skip edges lighter than this
+        max_edges: Stop once this many edges have been collected
+        max_edges_per_node: Follow at most this many edges per node and direction
+        db_path: Optional custom database path (for testing)
+    
+    Returns:
+        Traversal with ``entities`` (by ID) and ``edges`` in hop order
+    
+    Example:
+        >>> result = traverse([milton_id], depth=2, predicates=["uses"])
+        >>> for edge, entity in result.outgoing(milton_id):
+        ...     print(f"{edge.predicate} -> {entity.name}")
+    """
+    store = _get_store(db_path)
+    return store.traverse(
+        seed_ids=seed_ids,
+        depth=depth,
+        direction=direction,
+        predicates=predicates,
+        min_weight=min_weight,
+        max_edges=max_edges,
+        max_edges_per_node=max_edges_per_node
+    )
+
+
 def export_snapshot(db_path: Optional[Path] = None) -> dict[str, Any]:
     """Export entire graph to JSON-serializable dict.
     
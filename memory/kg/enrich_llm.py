@@ -10,7 +10,12 @@ import logging
 import os
 from typing import Any, Dict, List, Optional, Tuple
 
-import requests
+from milton_orchestrator.llm_transport import (
+    LLMConnectionError,
+    LLMTimeoutError,
+    get_llm_transport,
+    resolve_api_key,
+)
 
 logger = logging.getLogger(__name__)
 
@@ -36,11 +41,7 @@ def _get_llm_config() -> Dict[str, Any]:
     return {
         "url": os.getenv("LLM_API_URL", "http://localhost:8000"),
         "model": os.getenv("LLM_MODEL", "meta-llama/Llama-3.1-8B-Instruct"),
-        "api_key": (
-            os.getenv("LLM_API_KEY")
-            or os.getenv("VLLM_API_KEY")
-            or os.getenv("OLLAMA_API_KEY")
-        ),
+        "api_key": resolve_api_key(),
         "timeout": 30,  # Shorter timeout for enrichment
     }
 
@@ -91,28 +92,21 @@ def _call_llm(messages: List[Dict[str, str]], config: Dict[str, Any]) -> str:
     Raises:
         RuntimeError: If LLM call fails
     """
-    url = f"{config['url']}/v1/chat/completions"
-    headers = {}
-    if config["api_key"]:
-        headers["Authorization"] = f"Bearer {config['api_key']}"
-    
-    payload = {
-        "model": config["model"],
-        "messages": messages,
-        "max_tokens": 1500,  # Reasonable limit for JSON output
-        "temperature": 0.3,  # Lower temperature for structured output
-    }
-    
+    transport = get_llm_transport()
     try:
-        response = requests.post(
-            url, json=payload, timeout=config["timeout"], headers=headers
+        return transport.chat_text(
+            messages,
+            base_url=config["url"],
+            model=config["model"],
+            headers=transport.headers(config["api_key"]),
+            max_tokens=1500,  # Reasonable limit for JSON output
+            temperature=0.3,  # Lower temperature for structured output
+            timeout=config["timeout"],
+            caller="kg_enrich",
         )
-        response.raise_for_status()
-        data = response.json()
-        return data["choices"][0]["message"]["content"]
-    except requests.exceptions.ConnectionError as e:
+    except LLMConnectionError as e:
         raise RuntimeError(f"Cannot connect to LLM at {config['url']}: {e}")
-    except requests.exceptions.Timeout:
+    except LLMTimeoutError:
         raise RuntimeError(f"LLM request timed out after {config['timeout']}s")
     except Exception as e:
         raise RuntimeError(f"LLM call failed: {e}")
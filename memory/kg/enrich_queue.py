@@ -0,0 +1,364 @@
+"""Durable background queue for knowledge-graph enrichment.
+
+``add_memory`` used to run entity extraction, the optional LLM enrichment
+call and the KG upserts inline. It now appends a row to this queue and
+returns; a small pool of worker threads claims rows in batches, runs the
+enrichment processor and deletes them. Rows live in SQLite
+(``STATE_DIR/kg_enrich_queue.sqlite``), so anything not yet processed when the
+process exits is picked up again on the next start. A claim is a lease: rows
+claimed by a worker that died are reclaimed once the lease expires. A
+failed job is retried after a backoff of ``retry_backoff`` seconds times
+its attempt count (its lease is set to expire then), so a transient
+outage such as the LLM enrichment endpoint being down does not use up
+every attempt at once.
+
+Idle workers wake on an in-process ``enqueue`` and, every ``poll_seconds``,
+check ``PRAGMA data_version`` so rows committed by other processes are
+claimed within a poll interval rather than a lease period. ``drain`` gives
+a short-lived process a bounded window to finish its own jobs on exit;
+whatever is left stays queued for the next worker.
+
+Backpressure: once ``max_pending`` rows are waiting, ``enqueue`` blocks for
+up to ``enqueue_timeout`` seconds for the workers to catch up before
+appending anyway (and counting the overflow).
+"""
+
+from __future__ import annotations
+
+import heapq
+import json
+import logging
+import sqlite3
+import threading
+import time
+from pathlib import Path
+from typing import Any, Callable, Optional
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_WORKERS = 2
+DEFAULT_BATCH_SIZE = 16
+DEFAULT_MAX_PENDING = 10_000
+DEFAULT_ENQUEUE_TIMEOUT = 1.0
+DEFAULT_LEASE_SECONDS = 300.0
+DEFAULT_POLL_SECONDS = 1.0
+DEFAULT_RETRY_BACKOFF_SECONDS = 30.0
+MAX_ATTEMPTS = 3
+
+_SQLITE_HAS_RETURNING = sqlite3.sqlite_version_info >= (3, 35, 0)
+
+Processor = Callable[[dict[str, Any], str], None]
+
+
+class EnrichmentQueue:
+    """SQLite-backed work queue drained by a pool of worker threads."""
+
+    def __init__(
+        self,
+        db_path: Path,
+        processor: Processor,
+        *,
+        workers: int = DEFAULT_WORKERS,
+        batch_size: int = DEFAULT_BATCH_SIZE,
+        max_pending: int = DEFAULT_MAX_PENDING,
+        enqueue_timeout: float = DEFAULT_ENQUEUE_TIMEOUT,
+        lease_seconds: float = DEFAULT_LEASE_SECONDS,
+        poll_seconds: float = DEFAULT_POLL_SECONDS,
+        retry_backoff: float = DEFAULT_RETRY_BACKOFF_SECONDS,
+        autostart: bool = True,
+    ):
+        self.db_path = Path(db_path)
+        self.db_path.parent.mkdir(parents=True, exist_ok=True)
+        self.processor = processor
+        self.workers = max(workers, 1)
+        self.batch_size = max(batch_size, 1)
+        self.max_pending = max_pending
+        self.enqueue_timeout = enqueue_timeout
+        self.lease_seconds = lease_seconds
+        self.poll_seconds = max(min(poll_seconds, lease_seconds), 0.01)
+        self.retry_backoff = max(retry_backoff, 0.0)
+        self.autostart = autostart
+
+        self._lock = threading.Lock()
+        self._work = threading.Condition(self._lock)
+        self._room = threading.Condition(self._lock)
+        self._threads: list[threading.Thread] = []
+        self._stopping = False
+        self._in_flight = 0
+        self._data_version = 0
+        self._last_claim = time.monotonic()
+        self._retry_due: list[float] = []  # monotonic times backed-off rows become claimable
+        self._stats = {
+            "enqueued": 0,
+            "processed": 0,
+            "failed": 0,
+            "retried": 0,
+            "overflow": 0,
+            "lag_total_s": 0.0,
+            "last_lag_s": 0.0,
+        }
+        self._conn = sqlite3.connect(self.db_path, check_same_thread=False, timeout=30)
+        self._init_db()
+        # Running count of pending rows, so enqueue's backpressure check does
+        # not scan the table; resynced when another process commits.
+        self._pending = self._count_locked()
+
+    def _init_db(self) -> None:
+        with self._conn:
+            self._conn.execute("PRAGMA journal_mode=WAL")
+            self._conn.execute(
+                """
+                CREATE TABLE IF NOT EXISTS enrich_queue (
+                    id INTEGER PRIMARY KEY AUTOINCREMENT,
+                    memory_id TEXT NOT NULL,
+                    payload TEXT NOT NULL,
+                    enqueued_at REAL NOT NULL,
+                    attempts INTEGER NOT NULL DEFAULT 0,
+                    claimed_at REAL,
+                    last_error TEXT
+                )
+                """
+            )
+            self._conn.execute(
+                """
+                CREATE INDEX IF NOT EXISTS idx_enrich_queue_claimed
+                ON enrich_queue(claimed_at, id)
+                """
+            )
+
+    # ------------------------------------------------------------------
+    # Producer side
+    # ------------------------------------------------------------------
+
+    def enqueue(self, memory_id: str, payload: dict[str, Any]) -> int:
+        """Persist one enrichment job and wake a worker; returns the row id."""
+        data = json.dumps(payload, sort_keys=True, default=str)
+        with self._lock:
+            if self.max_pending > 0 and self._depth_locked() >= self.max_pending:
+                deadline = time.monotonic() + self.enqueue_timeout
+                while self._depth_locked() >= self.max_pending:
+                    remaining = deadline - time.monotonic()
+                    if remaining <= 0:
+                        self._stats["overflow"] += 1
+                        logger.warning(
+                            f"KG enrichment queue over {self.max_pending} pending; enqueuing anyway"
+                        )
+                        break
+                    self._room.wait(remaining)
+            with self._conn:
+                cursor = self._conn.execute(
+                    "INSERT INTO enrich_queue (memory_id, payload, enqueued_at) VALUES (?, ?, ?)",
+                    (memory_id, data, time.time()),
+                )
+            self._pending += 1
+            self._stats["enqueued"] += 1
+            if self.autostart:
+                self._ensure_workers()
+            self._work.notify()
+            return int(cursor.lastrowid)
+
+    # ------------------------------------------------------------------
+    # Introspection
+    # ------------------------------------------------------------------
+
+    def depth(self) -> int:
+        with self._lock:
+            return self._depth_locked()
+
+    def _depth_locked(self) -> int:
+        return self._pending
+
+    def _count_locked(self) -> int:
+        return self._conn.execute("SELECT COUNT(*) FROM enrich_queue").fetchone()[0]
+
+    def stats(self) -> dict[str, Any]:
+        """Queue depth, in-flight count and enrichment lag (seconds)."""
+        with self._lock:
+            depth, oldest = self._conn.execute(
+                "SELECT COUNT(*), MIN(enqueued_at) FROM enrich_queue"
+            ).fetchone()
+            stats = dict(self._stats)
+            in_flight = self._in_flight
+            alive = sum(1 for thread in self._threads if thread.is_alive())
+        lag_total = stats.pop("lag_total_s")
+        done = stats["processed"] + stats["failed"]
+        stats.update(
+            {
+                "depth": depth,
+                "in_flight": in_flight,
+                "workers": alive,
+                "oldest_pending_age_s": round(time.time() - oldest, 3) if oldest else 0.0,
+                "avg_lag_s": round(lag_total / done, 3) if done else 0.0,
+                "last_lag_s": round(stats["last_lag_s"], 3),
+            }
+        )
+        return stats
+
+    def wait_idle(self, timeout: Optional[float] = None) -> bool:
+        """Block until nothing is pending or in flight; returns False on timeout."""
+        deadline = None if timeout is None else time.monotonic() + timeout
+        with self._lock:
+            if self._depth_locked():
+                self._ensure_workers()
+                self._work.notify_all()
+            while self._depth_locked() or self._in_flight:
+                remaining = None if deadline is None else deadline - time.monotonic()
+                if remaining is not None and remaining <= 0:
+                    return False
+                self._room.wait(0.05 if remaining is None else min(remaining, 0.05))
+            return True
+
+    # ------------------------------------------------------------------
+    # Workers
+    # ------------------------------------------------------------------
+
+    def start(self) -> None:
+        """Start workers (e.g. at service startup to resume pending rows)."""
+        with self._lock:
+            self._ensure_workers()
+            self._work.notify_all()
+
+    def stop(self, timeout: Optional[float] = 5.0) -> None:
+        """Stop workers after their current batch; pending rows stay queued."""
+        with self._lock:
+            self._stopping = True
+            self._work.notify_all()
+            threads = list(self._threads)
+        for thread in threads:
+            thread.join(timeout)
+        with self._lock:
+            self._threads = [thread for thread in self._threads if thread.is_alive()]
+            self._stopping = False
+
+    def drain(self, timeout: float) -> bool:
+        """Process pending rows for up to ``timeout`` seconds, then stop workers.
+        
+        Returns True if the queue was empty when the workers stopped.
+        """
+        idle = self.wait_idle(timeout=timeout)
+        self.stop()
+        return idle
+
+    def close(self) -> None:
+        self.stop()
+        with self._lock:
+            self._conn.close()
+
+    def _ensure_workers(self) -> None:
+        if self._stopping:
+            return
+        self._threads = [thread for thread in self._threads if thread.is_alive()]
+        while len(self._threads) < self.workers:
+            thread = threading.Thread(
+                target=self._run, name=f"kg-enrich-{len(self._threads)}", daemon=True
+            )
+            self._threads.append(thread)
+            thread.start()
+
+    def _run(self) -> None:
+        while True:
+            with self._lock:
+                batch = self._claim_locked()
+                while not batch:
+                    if self._stopping:
+                        return
+                    notified = self._work.wait(self.poll_seconds)
+                    if self._stopping:
+                        return
+                    if notified or self._external_work_locked():
+                        batch = self._claim_locked()
+                self._in_flight += len(batch)
+            try:
+                self._process(batch)
+            finally:
+                with self._lock:
+                    self._in_flight -= len(batch)
+                    self._room.notify_all()
+
+    def _external_work_locked(self) -> bool:
+        """True if another connection committed, a retry is due or a lease may have expired."""
+        version = self._conn.execute("PRAGMA data_version").fetchone()[0]
+        changed = version != self._data_version
+        self._data_version = version
+        if changed:
+            self._pending = self._count_locked()
+        now = time.monotonic()
+        retry_due = False
+        while self._retry_due and self._retry_due[0] <= now:
+            heapq.heappop(self._retry_due)
+            retry_due = True
+        return changed or retry_due or now - self._last_claim >= self.lease_seconds
+
+    def _claim_locked(self) -> list[tuple[int, str, str, float, int]]:
+        now = time.time()
+        self._last_claim = time.monotonic()
+        claim_sql = """
+            UPDATE enrich_queue SET claimed_at = ?
+            WHERE id IN (
+                SELECT id FROM enrich_queue
+                WHERE claimed_at IS NULL OR claimed_at < ?
+                ORDER BY id LIMIT ?
+            )
+        """
+        params = (now, now - self.lease_seconds, self.batch_size)
+        with self._conn:
+            if _SQLITE_HAS_RETURNING:
+                return self._conn.execute(
+                    claim_sql + " RETURNING id, memory_id, payload, enqueued_at, attempts",
+                    params,
+                ).fetchall()
+            # SQLite < 3.35: read the claimed rows back in the same transaction
+            self._conn.execute(claim_sql, params)
+            return self._conn.execute(
+                """SELECT id, memory_id, payload, enqueued_at, attempts
+                   FROM enrich_queue WHERE claimed_at = ? ORDER BY id""",
+                (now,),
+            ).fetchall()
+
+    def _process(self, batch: list[tuple[int, str, str, float, int]]) -> None:
+        done: list[int] = []
+        retry: list[tuple[float, str, int]] = []
+        retry_at: list[float] = []
+        dropped = 0
+        lags: list[float] = []
+        for row_id, memory_id, payload, enqueued_at, attempts in batch:
+            try:
+                self.processor(json.loads(payload), memory_id)
+                done.append(row_id)
+                lags.append(time.time() - enqueued_at)
+            except Exception as exc:
+                if attempts + 1 >= MAX_ATTEMPTS:
+                    logger.warning(f"Dropping KG enrichment for memory {memory_id}: {exc}")
+                    done.append(row_id)
+                    dropped += 1
+                else:
+                    # Let the lease expire after the backoff instead of retrying at once
+                    delay = self.retry_backoff * (attempts + 1)
+                    logger.debug(
+                        f"KG enrichment for memory {memory_id} failed, retrying in {delay:.0f}s: {exc}"
+                    )
+                    retry.append((time.time() + delay - self.lease_seconds, str(exc)[:500], row_id))
+                    retry_at.append(time.monotonic() + delay)
+
+        with self._lock:
+            with self._conn:
+                if done:
+                    self._conn.executemany(
+                        "DELETE FROM enrich_queue WHERE id = ?", [(row_id,) for row_id in done]
+                    )
+                if retry:
+                    self._conn.executemany(
+                        """UPDATE enrich_queue
+                           SET attempts = attempts + 1, claimed_at = ?, last_error = ?
+                           WHERE id = ?""",
+                        retry,
+                    )
+            self._pending = max(self._pending - len(done), 0)
+            self._stats["processed"] += len(lags)
+            self._stats["failed"] += dropped
+            self._stats["retried"] += len(retry)
+            self._stats["lag_total_s"] += sum(lags)
+            if lags:
+                self._stats["last_lag_s"] = lags[-1]
+            for due in retry_at:
+                heapq.heappush(self._retry_due, due)
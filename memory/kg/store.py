@@ -2,26 +2,95 @@
 
 Implements local-first storage with automatic fallback to JSON if SQLite fails.
 Uses state_paths conventions from Milton's memory system.
+
+Each store keeps one WAL-mode connection for its lifetime (guarded by a lock)
+instead of connecting per call, and offers bulk upserts that write a whole
+batch of entities or edges in a single transaction.
+
+Entity names and aliases are mirrored into an FTS5 table with the trigram
+tokenizer (kept in sync by triggers), so substring name search and
+``match_entities`` use an index instead of scanning with ``LIKE '%...%'``.
+Builds of SQLite without FTS5 trigram support fall back to ``LIKE``.
+
+``traverse`` does breadth-first k-hop expansion with one batched query per
+hop, backed by an in-memory adjacency cache that is invalidated on edge
+upserts from this store and dropped when another connection commits
+(``PRAGMA data_version``). Size it with MILTON_KG_ADJACENCY_CACHE_NODES
+(default 4096 entities, 0 disables).
 """
 
 from __future__ import annotations
 
 import json
 import logging
+import re
 import sqlite3
+import threading
 from datetime import datetime, timezone
 from pathlib import Path
-from typing import Any, Optional
+from typing import Any, Iterable, Optional
+from uuid import uuid4
 
+from milton_orchestrator.env import env_int
 from milton_orchestrator.state_paths import resolve_state_dir
 
 from .schema import Edge, Entity, _normalize_name
+from .traverse import (
+    DEFAULT_ADJACENCY_CACHE_NODES,
+    AdjacencyCache,
+    EdgeRow,
+    TraversedEdge,
+    Traversal,
+    filter_rows,
+)
 
 logger = logging.getLogger(__name__)
 
 # Schema version for migrations
 SCHEMA_VERSION = 1
 
+# Stay well below SQLite's bound-parameter limit in IN (...) lookups
+_SQL_VARIABLE_CHUNK = 500
+
+# Trigram FTS needs at least three characters to match anything
+MIN_MATCH_TOKEN_CHARS = 3
+_TOKEN_EDGE_RE = re.compile(r"^\W+|\W+$")
+
+_FTS_TRIGGERS = (
+    """
+    CREATE TRIGGER IF NOT EXISTS entities_fts_insert AFTER INSERT ON entities BEGIN
+        INSERT INTO entities_fts(rowid, name, aliases)
+        VALUES (new.rowid, new.normalized_name, lower(COALESCE(json_extract(new.metadata_json, '$.aliases'), '')));
+    END
+    """,
+    """
+    CREATE TRIGGER IF NOT EXISTS entities_fts_delete AFTER DELETE ON entities BEGIN
+        DELETE FROM entities_fts WHERE rowid = old.rowid;
+    END
+    """,
+    """
+    CREATE TRIGGER IF NOT EXISTS entities_fts_update AFTER UPDATE ON entities BEGIN
+        DELETE FROM entities_fts WHERE rowid = old.rowid;
+        INSERT INTO entities_fts(rowid, name, aliases)
+        VALUES (new.rowid, new.normalized_name, lower(COALESCE(json_extract(new.metadata_json, '$.aliases'), '')));
+    END
+    """,
+)
+
+
+def _adjacency_cache_nodes() -> int:
+    return env_int("MILTON_KG_ADJACENCY_CACHE_NODES", DEFAULT_ADJACENCY_CACHE_NODES)
+
+
+def _normalize_token(token: str) -> str:
+    """Lowercase a query token and strip surrounding punctuation."""
+    return _TOKEN_EDGE_RE.sub("", _normalize_name(token))
+
+
+def _fts_phrase(token: str) -> str:
+    """Quote a token as an FTS5 string (substring match under trigram)."""
+    return '"' + token.replace('"', '""') + '"'
+
 
 def _serialize_dict(data: dict[str, Any]) -> str:
     """Serialize dict to JSON string."""
@@ -56,11 +125,17 @@ class KnowledgeGraphStore:
     Auto-creates database and tables on initialization.
     """
     
-    def __init__(self, db_path: Optional[Path] = None):
+    def __init__(
+        self,
+        db_path: Optional[Path] = None,
+        adjacency_cache_nodes: Optional[int] = None
+    ):
         """Initialize store with optional custom path.
         
         Args:
             db_path: Custom database path. If None, uses STATE_DIR/kg.sqlite
+            adjacency_cache_nodes: Entities whose edges ``traverse`` keeps in
+                memory (None reads MILTON_KG_ADJACENCY_CACHE_NODES, 0 disables)
         """
         if db_path is None:
             state_dir = resolve_state_dir()
@@ -72,12 +147,30 @@ class KnowledgeGraphStore:
             db_path.parent.mkdir(parents=True, exist_ok=True)
         
         self.db_path = db_path
+        self._lock = threading.RLock()
+        self._conn = sqlite3.connect(self.db_path, check_same_thread=False, timeout=30)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA synchronous=NORMAL")
+        # INSERT OR REPLACE must fire the delete trigger that syncs entities_fts
+        self._conn.execute("PRAGMA recursive_triggers=ON")
+        self.fts_enabled = False
+        if adjacency_cache_nodes is None:
+            adjacency_cache_nodes = _adjacency_cache_nodes()
+        self.adjacency_cache = (
+            AdjacencyCache(adjacency_cache_nodes) if adjacency_cache_nodes > 0 else None
+        )
+        self._data_version: Optional[int] = None
         self._ensure_schema()
     
+    def close(self) -> None:
+        """Close the underlying connection."""
+        with self._lock:
+            self._conn.close()
+    
     def _ensure_schema(self) -> None:
         """Create tables and indexes if they don't exist."""
-        conn = sqlite3.connect(self.db_path)
-        try:
+        with self._lock:
+            conn = self._conn
             cursor = conn.cursor()
             
             # Entities table
@@ -121,6 +214,10 @@ class KnowledgeGraphStore:
                 CREATE INDEX IF NOT EXISTS idx_edges_object 
                 ON edges(object_id)
             """)
+            cursor.execute("""
+                CREATE INDEX IF NOT EXISTS idx_edges_triple
+                ON edges(subject_id, predicate, object_id)
+            """)
             
             # Schema version tracking
             cursor.execute("""
@@ -135,8 +232,33 @@ class KnowledgeGraphStore:
             )
             
             conn.commit()
-        finally:
-            conn.close()
+        
+        self._ensure_fts()
+    
+    def _ensure_fts(self) -> None:
+        """Create the trigram name index, backfilling it on first creation."""
+        with self._lock, self._conn as conn:
+            exists = conn.execute(
+                "SELECT 1 FROM sqlite_master WHERE type = 'table' AND name = 'entities_fts'"
+            ).fetchone()
+            try:
+                conn.execute(
+                    """CREATE VIRTUAL TABLE IF NOT EXISTS entities_fts
+                       USING fts5(name, aliases, tokenize='trigram')"""
+                )
+                for trigger in _FTS_TRIGGERS:
+                    conn.execute(trigger)
+            except sqlite3.OperationalError as exc:
+                logger.info(f"KG entity FTS index unavailable, using LIKE search: {exc}")
+                return
+            if not exists:
+                conn.execute(
+                    """INSERT INTO entities_fts(rowid, name, aliases)
+                       SELECT rowid, normalized_name,
+                              lower(COALESCE(json_extract(metadata_json, '$.aliases'), ''))
+                       FROM entities"""
+                )
+        self.fts_enabled = True
     
     def upsert_entity(
         self,
@@ -160,8 +282,7 @@ class KnowledgeGraphStore:
             The created or updated Entity
         """
         normalized = _normalize_name(name)
-        conn = sqlite3.connect(self.db_path)
-        try:
+        with self._lock, self._conn as conn:
             cursor = conn.cursor()
             
             # Check for existing entity
@@ -184,7 +305,6 @@ class KnowledgeGraphStore:
                        WHERE id = ?""",
                     (name, metadata_json, now, existing_id)
                 )
-                conn.commit()
                 return Entity(
                     id=existing_id,
                     type=entity_type,
@@ -195,7 +315,6 @@ class KnowledgeGraphStore:
                 )
             else:
                 # Insert new
-                from uuid import uuid4
                 eid = entity_id or str(uuid4())
                 cursor.execute(
                     """INSERT INTO entities 
@@ -203,7 +322,6 @@ class KnowledgeGraphStore:
                        VALUES (?, ?, ?, ?, ?, ?, ?)""",
                     (eid, entity_type, name, normalized, metadata_json, now, now)
                 )
-                conn.commit()
                 return Entity(
                     id=eid,
                     type=entity_type,
@@ -212,8 +330,6 @@ class KnowledgeGraphStore:
                     created_ts=_parse_timestamp(now),
                     updated_ts=_parse_timestamp(now)
                 )
-        finally:
-            conn.close()
     
     def get_entity(self, entity_id: str) -> Optional[Entity]:
         """Get entity by ID.
@@ -224,9 +340,8 @@ class KnowledgeGraphStore:
         Returns:
             Entity if found, None otherwise
         """
-        conn = sqlite3.connect(self.db_path)
-        try:
-            cursor = conn.cursor()
+        with self._lock:
+            cursor = self._conn.cursor()
             cursor.execute(
                 "SELECT id, type, name, metadata_json, created_ts, updated_ts FROM entities WHERE id = ?",
                 (entity_id,)
@@ -243,8 +358,6 @@ class KnowledgeGraphStore:
                 created_ts=_parse_timestamp(row[4]),
                 updated_ts=_parse_timestamp(row[5])
             )
-        finally:
-            conn.close()
     
     def search_entities(
         self,
@@ -262,16 +375,22 @@ class KnowledgeGraphStore:
         Returns:
             List of matching entities
         """
-        conn = sqlite3.connect(self.db_path)
-        try:
-            cursor = conn.cursor()
+        with self._lock:
+            cursor = self._conn.cursor()
             
             conditions = []
             params: list[Any] = []
             
             if name:
-                conditions.append("normalized_name LIKE ?")
-                params.append(f"%{_normalize_name(name)}%")
+                normalized = _normalize_name(name)
+                if self.fts_enabled and len(normalized) >= MIN_MATCH_TOKEN_CHARS:
+                    conditions.append(
+                        "rowid IN (SELECT rowid FROM entities_fts WHERE entities_fts MATCH ?)"
+                    )
+                    params.append(f"name : {_fts_phrase(normalized)}")
+                else:
+                    conditions.append("normalized_name LIKE ?")
+                    params.append(f"%{normalized}%")
             
             if entity_type:
                 conditions.append("type = ?")
@@ -300,8 +419,83 @@ class KnowledgeGraphStore:
                 )
                 for row in rows
             ]
-        finally:
-            conn.close()
+    
+    def match_entities(
+        self,
+        query_tokens: Iterable[str],
+        entity_type: Optional[str] = None,
+        limit: int = 20
+    ) -> list[tuple[Entity, float]]:
+        """Resolve several query terms to entities in one indexed query.
+        
+        Each token matches entities whose name (or alias) contains it. Matches
+        are scored 1.0 for an exact name match, 0.8 when a token appears in the
+        name and 0.6 for alias-only matches; ties are broken by BM25 rank.
+        
+        Args:
+            query_tokens: Query words or phrases; tokens shorter than three
+                characters (after normalization) are ignored
+            entity_type: Optional type filter
+            limit: Maximum results to return
+        
+        Returns:
+            List of (Entity, score) tuples, best first
+        """
+        tokens = list(dict.fromkeys(
+            token for token in (_normalize_token(t) for t in query_tokens)
+            if len(token) >= MIN_MATCH_TOKEN_CHARS
+        ))
+        if not tokens:
+            return []
+        
+        columns = "e.id, e.type, e.name, e.metadata_json, e.created_ts, e.updated_ts, e.normalized_name"
+        params: list[Any] = []
+        if self.fts_enabled:
+            query = f"""
+                SELECT {columns}, bm25(entities_fts) AS rank
+                FROM entities_fts
+                JOIN entities e ON e.rowid = entities_fts.rowid
+                WHERE entities_fts MATCH ?
+            """
+            params.append(" OR ".join(_fts_phrase(token) for token in tokens))
+        else:
+            query = f"""
+                SELECT {columns}, 0.0 AS rank
+                FROM entities e
+                WHERE ({" OR ".join("e.normalized_name LIKE ?" for _ in tokens)})
+            """
+            params.extend(f"%{token}%" for token in tokens)
+        if entity_type:
+            query += " AND e.type = ?"
+            params.append(entity_type)
+        # Over-fetch so the Python-side scoring can reorder BM25's candidates
+        query += " ORDER BY rank LIMIT ?"
+        params.append(max(limit * 4, limit))
+        
+        with self._lock:
+            rows = self._conn.execute(query, params).fetchall()
+        
+        token_set = set(tokens)
+        scored: list[tuple[float, float, Entity]] = []
+        for row in rows:
+            normalized = row[6]
+            if normalized in token_set:
+                score = 1.0
+            elif any(token in normalized for token in tokens):
+                score = 0.8
+            else:
+                score = 0.6
+            entity = Entity(
+                id=row[0],
+                type=row[1],
+                name=row[2],
+                metadata=_deserialize_dict(row[3]),
+                created_ts=_parse_timestamp(row[4]),
+                updated_ts=_parse_timestamp(row[5])
+            )
+            scored.append((score, row[7], entity))
+        scored.sort(key=lambda item: (-item[0], item[1]))
+        return [(entity, score) for score, _rank, entity in scored[:limit]]
     
     def upsert_edge(
         self,
@@ -328,8 +522,8 @@ class KnowledgeGraphStore:
         if not (0.0 <= weight <= 1.0):
             raise ValueError(f"Edge weight must be 0.0-1.0, got {weight}")
         
-        conn = sqlite3.connect(self.db_path)
-        try:
+        with self._lock, self._conn as conn:
+            self._invalidate_adjacency((subject_id, object_id))
             cursor = conn.cursor()
             
             # Check for existing edge
@@ -352,7 +546,6 @@ class KnowledgeGraphStore:
                        WHERE id = ?""",
                     (weight, evidence_json, existing_id)
                 )
-                conn.commit()
                 return Edge(
                     id=existing_id,
                     subject_id=subject_id,
@@ -364,7 +557,6 @@ class KnowledgeGraphStore:
                 )
             else:
                 # Insert new
-                from uuid import uuid4
                 edge_id = str(uuid4())
                 now = datetime.now(timezone.utc).isoformat()
                 cursor.execute(
@@ -373,7 +565,6 @@ class KnowledgeGraphStore:
                        VALUES (?, ?, ?, ?, ?, ?, ?)""",
                     (edge_id, subject_id, predicate, object_id, weight, evidence_json, now)
                 )
-                conn.commit()
                 return Edge(
                     id=edge_id,
                     subject_id=subject_id,
@@ -383,8 +574,144 @@ class KnowledgeGraphStore:
                     evidence=evidence or {},
                     created_ts=_parse_timestamp(now)
                 )
-        finally:
-            conn.close()
+    
+    def upsert_entities_bulk(self, entities: Iterable[dict[str, Any]]) -> list[str]:
+        """Insert or update many entities in one transaction.
+        
+        Same semantics as calling ``upsert_entity`` for each spec in order:
+        entities are matched on (normalized name, type), the first spec for a
+        new entity decides its ID, and the last spec decides name/metadata.
+        
+        Args:
+            entities: Dicts with ``entity_type``, ``name`` and optional
+                ``metadata`` / ``entity_id``
+        
+        Returns:
+            Entity IDs, one per input spec
+        """
+        specs = list(entities)
+        if not specs:
+            return []
+        keys = [(_normalize_name(spec["name"]), spec["entity_type"]) for spec in specs]
+        now = datetime.now(timezone.utc).isoformat()
+        
+        with self._lock, self._conn as conn:
+            existing = self._existing_entity_ids(conn, {name for name, _ in keys})
+            resolved: dict[tuple[str, str], str] = {}
+            final_spec: dict[tuple[str, str], dict[str, Any]] = {}
+            for key, spec in zip(keys, specs):
+                if key not in resolved:
+                    resolved[key] = existing.get(key) or spec.get("entity_id") or str(uuid4())
+                final_spec[key] = spec
+            
+            updates = []
+            inserts = []
+            for key, spec in final_spec.items():
+                metadata_json = _serialize_dict(spec.get("metadata") or {})
+                if key in existing:
+                    updates.append((spec["name"], metadata_json, now, resolved[key]))
+                else:
+                    inserts.append(
+                        (resolved[key], key[1], spec["name"], key[0], metadata_json, now, now)
+                    )
+            conn.executemany(
+                """UPDATE entities 
+                   SET name = ?, metadata_json = ?, updated_ts = ?
+                   WHERE id = ?""",
+                updates
+            )
+            conn.executemany(
+                """INSERT INTO entities 
+                   (id, type, name, normalized_name, metadata_json, created_ts, updated_ts)
+                   VALUES (?, ?, ?, ?, ?, ?, ?)""",
+                inserts
+            )
+        return [resolved[key] for key in keys]
+    
+    def upsert_edges_bulk(self, edges: Iterable[dict[str, Any]]) -> list[str]:
+        """Insert or update many edges in one transaction.
+        
+        Edges are matched on (subject, predicate, object); later specs for the
+        same triple overwrite weight/evidence, as with repeated ``upsert_edge``.
+        
+        Args:
+            edges: Dicts with ``subject_id``, ``predicate``, ``object_id`` and
+                optional ``weight`` / ``evidence``
+        
+        Returns:
+            Edge IDs, one per input spec
+        
+        Raises:
+            ValueError: If any weight is outside 0.0-1.0 (nothing is written)
+        """
+        specs = list(edges)
+        if not specs:
+            return []
+        for spec in specs:
+            weight = spec.get("weight", 1.0)
+            if not (0.0 <= weight <= 1.0):
+                raise ValueError(f"Edge weight must be 0.0-1.0, got {weight}")
+        triples = [(spec["subject_id"], spec["predicate"], spec["object_id"]) for spec in specs]
+        now = datetime.now(timezone.utc).isoformat()
+        
+        with self._lock, self._conn as conn:
+            self._invalidate_adjacency(
+                node_id for subject_id, _, object_id in triples for node_id in (subject_id, object_id)
+            )
+            existing: dict[tuple[str, str, str], str] = {}
+            for triple in dict.fromkeys(triples):
+                row = conn.execute(
+                    "SELECT id FROM edges WHERE subject_id = ? AND predicate = ? AND object_id = ?",
+                    triple
+                ).fetchone()
+                if row:
+                    existing[triple] = row[0]
+            
+            resolved = dict(existing)
+            final_spec: dict[tuple[str, str, str], dict[str, Any]] = {}
+            for triple, spec in zip(triples, specs):
+                resolved.setdefault(triple, str(uuid4()))
+                final_spec[triple] = spec
+            
+            updates = []
+            inserts = []
+            for triple, spec in final_spec.items():
+                weight = spec.get("weight", 1.0)
+                evidence_json = _serialize_dict(spec.get("evidence") or {})
+                if triple in existing:
+                    updates.append((weight, evidence_json, resolved[triple]))
+                else:
+                    inserts.append((resolved[triple], *triple, weight, evidence_json, now))
+            conn.executemany(
+                """UPDATE edges 
+                   SET weight = ?, evidence_json = ?
+                   WHERE id = ?""",
+                updates
+            )
+            conn.executemany(
+                """INSERT INTO edges 
+                   (id, subject_id, predicate, object_id, weight, evidence_json, created_ts)
+                   VALUES (?, ?, ?, ?, ?, ?, ?)""",
+                inserts
+            )
+        return [resolved[triple] for triple in triples]
+    
+    def _existing_entity_ids(
+        self, conn: sqlite3.Connection, normalized_names: set[str]
+    ) -> dict[tuple[str, str], str]:
+        """Map (normalized_name, type) -> id for entities already stored."""
+        names = list(normalized_names)
+        found: dict[tuple[str, str], str] = {}
+        for start in range(0, len(names), _SQL_VARIABLE_CHUNK):
+            chunk = names[start:start + _SQL_VARIABLE_CHUNK]
+            placeholders = ",".join("?" * len(chunk))
+            rows = conn.execute(
+                f"SELECT id, normalized_name, type FROM entities WHERE normalized_name IN ({placeholders})",
+                chunk
+            ).fetchall()
+            for entity_id, normalized, entity_type in rows:
+                found.setdefault((normalized, entity_type), entity_id)
+        return found
     
     def get_neighbors(
         self,
@@ -404,9 +731,8 @@ class KnowledgeGraphStore:
         Returns:
             List of (Edge, Entity) tuples
         """
-        conn = sqlite3.connect(self.db_path)
-        try:
-            cursor = conn.cursor()
+        with self._lock:
+            cursor = self._conn.cursor()
             results: list[tuple[Edge, Entity]] = []
             
             # Outgoing edges
@@ -488,8 +814,158 @@ class KnowledgeGraphStore:
                     results.append((edge, entity))
             
             return results[:limit]
-        finally:
-            conn.close()
+    
+    def traverse(
+        self,
+        seed_ids: Iterable[str],
+        depth: int = 1,
+        direction: str = "both",
+        predicates: Optional[Iterable[str]] = None,
+        min_weight: float = 0.0,
+        max_edges: Optional[int] = None,
+        max_edges_per_node: Optional[int] = None
+    ) -> Traversal:
+        """Breadth-first k-hop expansion from a set of seed entities.
+        
+        Each hop fetches the edges of the whole frontier with one batched
+        ``IN (...)`` query (entities not already in the adjacency cache), and
+        the reached entities are loaded with one more query at the end. Edge
+        evidence is not parsed until ``TraversedEdge.evidence`` is read.
+        
+        Args:
+            seed_ids: Entity IDs to start from
+            depth: Number of hops to expand
+            direction: "outgoing", "incoming" or "both"
+            predicates: Optional predicates to follow (others are ignored)
+            min_weight: Skip edges lighter than this
+            max_edges: Stop once this many edges have been collected
+            max_edges_per_node: Follow at most this many edges per node and
+                direction (oldest first), so hubs don't pull in their whole
+                neighborhood
+        
+        Returns:
+            Traversal with the reached entities (seeds included) and edges in
+            hop order; edges to entities that no longer exist are dropped
+        """
+        if direction not in ("outgoing", "incoming", "both"):
+            raise ValueError(f"Invalid direction: {direction}")
+        seeds = list(dict.fromkeys(seed_ids))
+        wanted = set(predicates) if predicates is not None else None
+        follow_out = direction in ("outgoing", "both")
+        follow_in = direction in ("incoming", "both")
+        
+        visited = set(seeds)
+        seen_edges: set[str] = set()
+        edges: list[TraversedEdge] = []
+        frontier = seeds
+        hop = 0
+        with self._lock:
+            self._check_data_version()
+            while frontier and hop < depth:
+                hop += 1
+                adjacency = self._adjacency(frontier)
+                next_frontier: list[str] = []
+                for node_id in frontier:
+                    outgoing, incoming = adjacency.get(node_id, ([], []))
+                    for rows in ((outgoing if follow_out else []), (incoming if follow_in else [])):
+                        taken = 0
+                        for row in filter_rows(rows, wanted, min_weight):
+                            if max_edges is not None and len(edges) >= max_edges:
+                                break
+                            if max_edges_per_node is not None and taken >= max_edges_per_node:
+                                break
+                            if row[0] in seen_edges:
+                                continue
+                            seen_edges.add(row[0])
+                            edges.append(TraversedEdge.from_row(row, hop))
+                            taken += 1
+                            other = row[3] if row[1] == node_id else row[1]
+                            if other not in visited:
+                                visited.add(other)
+                                next_frontier.append(other)
+                    if max_edges is not None and len(edges) >= max_edges:
+                        next_frontier = []
+                        break
+                frontier = next_frontier
+            
+            entities = self._entities_by_id(visited)
+        
+        return Traversal(
+            seed_ids=seeds,
+            depth=depth,
+            entities=entities,
+            edges=[
+                edge for edge in edges
+                if edge.subject_id in entities and edge.object_id in entities
+            ]
+        )
+    
+    def _adjacency(self, node_ids: list[str]) -> dict[str, tuple[list[EdgeRow], list[EdgeRow]]]:
+        """Outgoing and incoming edge rows per node, cached where possible."""
+        if self.adjacency_cache is not None:
+            found, missing = self.adjacency_cache.get_many(node_ids)
+        else:
+            found, missing = {}, list(node_ids)
+        if not missing:
+            return found
+        
+        loaded: dict[str, tuple[list[EdgeRow], list[EdgeRow]]] = {
+            node_id: ([], []) for node_id in missing
+        }
+        for start in range(0, len(missing), _SQL_VARIABLE_CHUNK):
+            chunk = missing[start:start + _SQL_VARIABLE_CHUNK]
+            placeholders = ",".join("?" * len(chunk))
+            rows = self._conn.execute(
+                f"""SELECT id, subject_id, predicate, object_id, weight, evidence_json, created_ts
+                    FROM edges
+                    WHERE subject_id IN ({placeholders}) OR object_id IN ({placeholders})
+                    ORDER BY rowid""",
+                chunk + chunk
+            ).fetchall()
+            for row in rows:
+                if row[1] in loaded:
+                    loaded[row[1]][0].append(row)
+                if row[3] in loaded:
+                    loaded[row[3]][1].append(row)
+        if self.adjacency_cache is not None:
+            self.adjacency_cache.put_many(loaded)
+        found.update(loaded)
+        return found
+    
+    def _entities_by_id(self, entity_ids: Iterable[str]) -> dict[str, Entity]:
+        ids = list(entity_ids)
+        entities: dict[str, Entity] = {}
+        for start in range(0, len(ids), _SQL_VARIABLE_CHUNK):
+            chunk = ids[start:start + _SQL_VARIABLE_CHUNK]
+            placeholders = ",".join("?" * len(chunk))
+            rows = self._conn.execute(
+                f"""SELECT id, type, name, metadata_json, created_ts, updated_ts
+                    FROM entities WHERE id IN ({placeholders})""",
+                chunk
+            ).fetchall()
+            for row in rows:
+                entities[row[0]] = Entity(
+                    id=row[0],
+                    type=row[1],
+                    name=row[2],
+                    metadata=_deserialize_dict(row[3]),
+                    created_ts=_parse_timestamp(row[4]),
+                    updated_ts=_parse_timestamp(row[5])
+                )
+        return entities
+    
+    def _invalidate_adjacency(self, node_ids: Iterable[str]) -> None:
+        if self.adjacency_cache is not None:
+            self.adjacency_cache.invalidate(node_ids)
+    
+    def _check_data_version(self) -> None:
+        """Drop cached adjacency if another connection has committed since."""
+        if self.adjacency_cache is None:
+            return
+        version = self._conn.execute("PRAGMA data_version").fetchone()[0]
+        if self._data_version is not None and version != self._data_version:
+            self.adjacency_cache.clear()
+        self._data_version = version
     
     def export_snapshot(self) -> dict[str, Any]:
         """Export entire graph to JSON-serializable dict.
@@ -497,9 +973,8 @@ class KnowledgeGraphStore:
         Returns:
             Dict with 'entities' and 'edges' lists
         """
-        conn = sqlite3.connect(self.db_path)
-        try:
-            cursor = conn.cursor()
+        with self._lock:
+            cursor = self._conn.cursor()
             
             # Export entities
             cursor.execute("SELECT id, type, name, metadata_json, created_ts, updated_ts FROM entities")
@@ -537,8 +1012,6 @@ class KnowledgeGraphStore:
                 "entities": entities,
                 "edges": edges
             }
-        finally:
-            conn.close()
     
     def import_snapshot(self, snapshot: dict[str, Any], merge: bool = False) -> None:
         """Import graph from JSON snapshot.
@@ -547,48 +1020,47 @@ class KnowledgeGraphStore:
             snapshot: Dict with 'entities' and 'edges' lists
             merge: If True, merge with existing data. If False, clear first.
         """
-        conn = sqlite3.connect(self.db_path)
-        try:
-            cursor = conn.cursor()
-            
+        entity_rows = [
+            (
+                ent["id"],
+                ent["type"],
+                ent["name"],
+                _normalize_name(ent["name"]),
+                _serialize_dict(ent.get("metadata", {})),
+                ent["created_ts"],
+                ent["updated_ts"]
+            )
+            for ent in snapshot.get("entities", [])
+        ]
+        edge_rows = [
+            (
+                edge["id"],
+                edge["subject_id"],
+                edge["predicate"],
+                edge["object_id"],
+                edge["weight"],
+                _serialize_dict(edge.get("evidence", {})),
+                edge["created_ts"]
+            )
+            for edge in snapshot.get("edges", [])
+        ]
+        
+        with self._lock, self._conn as conn:
+            if self.adjacency_cache is not None:
+                self.adjacency_cache.clear()
             if not merge:
-                cursor.execute("DELETE FROM edges")
-                cursor.execute("DELETE FROM entities")
+                conn.execute("DELETE FROM edges")
+                conn.execute("DELETE FROM entities")
             
-            # Import entities
-            for ent in snapshot.get("entities", []):
-                cursor.execute(
-                    """INSERT OR REPLACE INTO entities 
-                       (id, type, name, normalized_name, metadata_json, created_ts, updated_ts)
-                       VALUES (?, ?, ?, ?, ?, ?, ?)""",
-                    (
-                        ent["id"],
-                        ent["type"],
-                        ent["name"],
-                        _normalize_name(ent["name"]),
-                        _serialize_dict(ent.get("metadata", {})),
-                        ent["created_ts"],
-                        ent["updated_ts"]
-                    )
-                )
-            
-            # Import edges
-            for edge in snapshot.get("edges", []):
-                cursor.execute(
-                    """INSERT OR REPLACE INTO edges 
-                       (id, subject_id, predicate, object_id, weight, evidence_json, created_ts)
-                       VALUES (?, ?, ?, ?, ?, ?, ?)""",
-                    (
-                        edge["id"],
-                        edge["subject_id"],
-                        edge["predicate"],
-                        edge["object_id"],
-                        edge["weight"],
-                        _serialize_dict(edge.get("evidence", {})),
-                        edge["created_ts"]
-                    )
-                )
-            
-            conn.commit()
-        finally:
-            conn.close()
+            conn.executemany(
+                """INSERT OR REPLACE INTO entities 
+                   (id, type, name, normalized_name, metadata_json, created_ts, updated_ts)
+                   VALUES (?, ?, ?, ?, ?, ?, ?)""",
+                entity_rows
+            )
+            conn.executemany(
+                """INSERT OR REPLACE INTO edges 
+                   (id, subject_id, predicate, object_id, weight, evidence_json, created_ts)
+                   VALUES (?, ?, ?, ?, ?, ?, ?)""",
+                edge_rows
+            )
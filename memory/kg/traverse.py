@@ -0,0 +1,167 @@
+"""Multi-hop traversal results and adjacency cache for the Knowledge Graph.
+
+``KnowledgeGraphStore.traverse`` expands a set of seed entities breadth-first,
+one batched ``IN (...)`` query per hop for the whole frontier (instead of one
+``get_neighbors`` JOIN per entity and direction). Adjacency rows keep their
+evidence as raw JSON; it is parsed only when a returned edge's ``evidence``
+is read.
+"""
+
+from __future__ import annotations
+
+import json
+import threading
+from collections import OrderedDict
+from dataclasses import dataclass, field
+from datetime import datetime
+from functools import cached_property
+from typing import Any, Iterable, Optional
+
+from .schema import Edge, Entity
+
+# (id, subject_id, predicate, object_id, weight, evidence_json, created_ts)
+EdgeRow = tuple[str, str, str, str, float, str, str]
+
+DEFAULT_ADJACENCY_CACHE_NODES = 4096
+
+
+@dataclass
+class TraversedEdge:
+    """An edge reached during traversal, with lazily parsed evidence."""
+
+    id: str
+    subject_id: str
+    predicate: str
+    object_id: str
+    weight: float
+    depth: int
+    created_ts: str
+    evidence_json: str = field(default="{}", repr=False)
+
+    @classmethod
+    def from_row(cls, row: EdgeRow, depth: int) -> "TraversedEdge":
+        return cls(
+            id=row[0],
+            subject_id=row[1],
+            predicate=row[2],
+            object_id=row[3],
+            weight=row[4],
+            depth=depth,
+            created_ts=row[6],
+            evidence_json=row[5],
+        )
+
+    @cached_property
+    def evidence(self) -> dict[str, Any]:
+        if not self.evidence_json:
+            return {}
+        try:
+            value = json.loads(self.evidence_json)
+        except json.JSONDecodeError:
+            return {}
+        return value if isinstance(value, dict) else {}
+
+    def to_edge(self) -> Edge:
+        return Edge(
+            id=self.id,
+            subject_id=self.subject_id,
+            predicate=self.predicate,
+            object_id=self.object_id,
+            weight=self.weight,
+            evidence=self.evidence,
+            created_ts=datetime.fromisoformat(self.created_ts.replace("Z", "+00:00")),
+        )
+
+
+@dataclass
+class Traversal:
+    """Entities and edges reached from ``seed_ids`` within ``depth`` hops."""
+
+    seed_ids: list[str]
+    depth: int
+    entities: dict[str, Entity] = field(default_factory=dict)
+    edges: list[TraversedEdge] = field(default_factory=list)
+
+    def outgoing(self, entity_id: str) -> list[tuple[TraversedEdge, Entity]]:
+        """Edges with ``entity_id`` as subject, paired with their object."""
+        return [
+            (edge, self.entities[edge.object_id])
+            for edge in self.edges
+            if edge.subject_id == entity_id
+        ]
+
+    def incoming(self, entity_id: str) -> list[tuple[TraversedEdge, Entity]]:
+        """Edges with ``entity_id`` as object, paired with their subject."""
+        return [
+            (edge, self.entities[edge.subject_id])
+            for edge in self.edges
+            if edge.object_id == entity_id
+        ]
+
+
+class AdjacencyCache:
+    """LRU map of entity id -> (outgoing rows, incoming rows)."""
+
+    def __init__(self, max_nodes: int = DEFAULT_ADJACENCY_CACHE_NODES):
+        self.max_nodes = max_nodes
+        self.hits = 0
+        self.misses = 0
+        self._lock = threading.Lock()
+        self._nodes: OrderedDict[str, tuple[list[EdgeRow], list[EdgeRow]]] = OrderedDict()
+
+    def __len__(self) -> int:
+        return len(self._nodes)
+
+    def get_many(
+        self, node_ids: Iterable[str]
+    ) -> tuple[dict[str, tuple[list[EdgeRow], list[EdgeRow]]], list[str]]:
+        """Return cached adjacency and the ids that missed."""
+        found: dict[str, tuple[list[EdgeRow], list[EdgeRow]]] = {}
+        missing: list[str] = []
+        with self._lock:
+            for node_id in node_ids:
+                entry = self._nodes.get(node_id)
+                if entry is None:
+                    missing.append(node_id)
+                else:
+                    self._nodes.move_to_end(node_id)
+                    found[node_id] = entry
+            self.hits += len(found)
+            self.misses += len(missing)
+        return found, missing
+
+    def put_many(self, entries: dict[str, tuple[list[EdgeRow], list[EdgeRow]]]) -> None:
+        if self.max_nodes <= 0:
+            return
+        with self._lock:
+            for node_id, entry in entries.items():
+                self._nodes[node_id] = entry
+                self._nodes.move_to_end(node_id)
+            while len(self._nodes) > self.max_nodes:
+                self._nodes.popitem(last=False)
+
+    def invalidate(self, node_ids: Iterable[str]) -> None:
+        with self._lock:
+            for node_id in node_ids:
+                self._nodes.pop(node_id, None)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._nodes.clear()
+
+    def stats(self) -> dict[str, int]:
+        with self._lock:
+            return {"nodes": len(self._nodes), "hits": self.hits, "misses": self.misses}
+
+
+def filter_rows(
+    rows: Iterable[EdgeRow],
+    predicates: Optional[set[str]],
+    min_weight: float,
+) -> Iterable[EdgeRow]:
+    for row in rows:
+        if predicates is not None and row[2] not in predicates:
+            continue
+        if row[4] < min_weight:
+            continue
+        yield row
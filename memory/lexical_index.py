@@ -0,0 +1,99 @@
+"""Inverted index with BM25 scoring for short-term memory retrieval.
+
+Maintained incrementally by ``JsonlIndex`` as items are appended and
+tombstoned, so a query only touches the postings of its own terms instead of
+re-tokenizing every stored item.
+"""
+
+from __future__ import annotations
+
+import math
+import re
+from collections import Counter
+
+TOKEN_RE = re.compile(r"[a-z0-9]+")
+
+BM25_K1 = 1.2
+BM25_B = 0.75
+
+
+def tokenize(text: str) -> list[str]:
+    return TOKEN_RE.findall(text.lower())
+
+
+def document_text(content: str, tags: list[str]) -> str:
+    return content + " " + " ".join(tags)
+
+
+class LexicalIndex:
+    """Term -> postings map with per-document lengths for BM25."""
+
+    def __init__(self, k1: float = BM25_K1, b: float = BM25_B):
+        self.k1 = k1
+        self.b = b
+        self._postings: dict[str, dict[str, int]] = {}
+        self._doc_terms: dict[str, tuple[str, ...]] = {}
+        self._doc_len: dict[str, int] = {}
+        self._total_len = 0
+
+    def __len__(self) -> int:
+        return len(self._doc_len)
+
+    def add(self, doc_id: str, text: str) -> None:
+        if doc_id in self._doc_len:
+            self.remove(doc_id)
+        counts = Counter(tokenize(text))
+        length = sum(counts.values())
+        for term, tf in counts.items():
+            self._postings.setdefault(term, {})[doc_id] = tf
+        self._doc_terms[doc_id] = tuple(counts)
+        self._doc_len[doc_id] = length
+        self._total_len += length
+
+    def remove(self, doc_id: str) -> None:
+        terms = self._doc_terms.pop(doc_id, None)
+        if terms is None:
+            return
+        self._total_len -= self._doc_len.pop(doc_id)
+        for term in terms:
+            postings = self._postings.get(term)
+            if postings is None:
+                continue
+            postings.pop(doc_id, None)
+            if not postings:
+                del self._postings[term]
+
+    def clear(self) -> None:
+        self._postings.clear()
+        self._doc_terms.clear()
+        self._doc_len.clear()
+        self._total_len = 0
+
+    def score(self, query: str) -> dict[str, float]:
+        """Return BM25 scores for documents containing any query term."""
+        terms = set(tokenize(query))
+        n_docs = len(self._doc_len)
+        if not terms or not n_docs:
+            return {}
+        avg_len = self._total_len / n_docs if self._total_len else 1.0
+        scores: dict[str, float] = {}
+        for term in terms:
+            postings = self._postings.get(term)
+            if not postings:
+                continue
+            df = len(postings)
+            idf = math.log(1.0 + (n_docs - df + 0.5) / (df + 0.5))
+            for doc_id, tf in postings.items():
+                norm = self.k1 * (1.0 - self.b + self.b * self._doc_len[doc_id] / avg_len)
+                scores[doc_id] = scores.get(doc_id, 0.0) + idf * tf * (self.k1 + 1.0) / (tf + norm)
+        return scores
+
+    def normalized_scores(self, query: str) -> dict[str, float]:
+        """BM25 scores scaled to [0, 1] by the best match for this query."""
+        scores = self.score(query)
+        if not scores:
+            return {}
+        best = max(scores.values())
+        if best <= 0.0:
+            return {doc_id: 0.0 for doc_id in scores}
+        return {doc_id: value / best for doc_id, value in scores.items()}
@@ -5,24 +5,49 @@ from __future__ import annotations
 from datetime import datetime, timedelta, timezone
 from pathlib import Path
 from typing import Optional, Any, Literal
+import heapq
+import os
 import re
 import logging
+import threading
+from concurrent.futures import ThreadPoolExecutor
 from contextlib import contextmanager
 
-from .backends import get_backend
+import numpy as np
+
+from .backends import JsonlBackend, get_backend, repo_root_from_file, shared_weaviate_client
 from .schema import MemoryItem
-from .embeddings import embed, is_available as embeddings_available
+from .embedding_service import embed_text, embed_texts
+from .embeddings import is_available as embeddings_available
 from .init_db import get_client
+from .vector_index import LocalVectorIndex, cosine_to_similarity, get_vector_index
 
 logger = logging.getLogger(__name__)
 
 
 TOKEN_RE = re.compile(r"[a-z0-9]+")
+IMPORTANCE_WEIGHT = 0.15
+# Newest missing memories embedded into the local vector index inline per
+# query; the rest are backfilled on a background thread in batches
+LOCAL_VECTOR_INLINE_LIMIT = 16
+LOCAL_VECTOR_BACKFILL_BATCH = 128
+
+_backfill_pool: Optional[ThreadPoolExecutor] = None
+_backfilling: set[Path] = set()
+_backfill_lock = threading.Lock()
 
 
 @contextmanager
 def _weaviate_client():
-    """Context manager for Weaviate client lifecycle; ensures deterministic close."""
+    """Context manager for Weaviate client lifecycle; ensures deterministic close.
+
+    Reuses the pooled client when the shared backend manager is active.
+    """
+    shared = shared_weaviate_client()
+    if shared is not None:
+        yield shared
+        return
+
     client = get_client()
     try:
         yield client
@@ -42,6 +67,22 @@ def _tokenize(text: str) -> set[str]:
     return set(TOKEN_RE.findall(text.lower()))
 
 
+def _blend_score(
+    text_score: float, item: MemoryItem, recency_bias: float, now: datetime
+) -> float:
+    recency_weight = max(0.0, min(recency_bias, 1.0))
+    return _blend(text_score, item, recency_weight, now)
+
+
+def _blend(text_score: float, item: MemoryItem, recency_weight: float, now: datetime) -> float:
+    age_seconds = (now - item.ts).total_seconds()
+    age_hours = age_seconds / 3600.0 if age_seconds > 0.0 else 0.0
+    recency_score = 1.0 / (1.0 + age_hours)
+    score = (text_score * (1.0 - recency_weight)) + (recency_score * recency_weight)
+    score += item.importance * IMPORTANCE_WEIGHT
+    return score
+
+
 def _score_item(
     item: MemoryItem, query_tokens: set[str], recency_bias: float, now: datetime
 ) -> float:
@@ -51,15 +92,173 @@ def _score_item(
         text_score = overlap / max(len(query_tokens), 1)
     else:
         text_score = 0.0
+    return _blend_score(text_score, item, recency_bias, now)
+
+
+def _indexed_text_scores(backend: Any, text: str) -> Optional[dict[str, float]]:
+    """BM25 text scores from the backend's inverted index, if it has one."""
+    score_fn = getattr(backend, "score_short_term", None)
+    if not callable(score_fn):
+        return None
+    return score_fn(text)
+
+
+def _rank_indexed(
+    backend: Any,
+    text_scores: dict[str, float],
+    limit: int,
+    recency_bias: float,
+    now: datetime,
+) -> list[tuple[MemoryItem, float]]:
+    """Rank using postings for matches and recency order for everything else.
+
+    A score is bounded by ``text * (1 - w) + recency * w + IMPORTANCE_WEIGHT``.
+    Matches are visited grouped by text score (best first) and newest-first
+    within a group; non-matches are visited newest-first. Each walk stops once
+    nothing left could reach the current top ``limit``.
+    """
+    recency_weight = max(0.0, min(recency_bias, 1.0))
+    scored: list[tuple[MemoryItem, float]] = []
+    top: list[float] = []
+
+    def _keep(item: MemoryItem, score: float) -> None:
+        scored.append((item, score))
+        if len(top) < limit:
+            heapq.heappush(top, score)
+        elif score > top[0]:
+            heapq.heapreplace(top, score)
+
+    def _ceiling(text_score: float, item: Optional[MemoryItem]) -> float:
+        recency = 1.0
+        if item is not None:
+            age_seconds = (now - item.ts).total_seconds()
+            if age_seconds > 0.0:
+                recency = 1.0 / (1.0 + age_seconds / 3600.0)
+        return text_score * (1.0 - recency_weight) + recency * recency_weight + IMPORTANCE_WEIGHT
+
+    groups: dict[float, list[str]] = {}
+    for memory_id, text_score in text_scores.items():
+        groups.setdefault(text_score, []).append(memory_id)
+    items = backend.get_short_term_many(text_scores)
+
+    for text_score in sorted(groups, reverse=True):
+        if len(top) >= limit and _ceiling(text_score, None) < top[0]:
+            break
+        members = [items[memory_id] for memory_id in groups[text_score] if memory_id in items]
+        members.sort(key=lambda entry: entry.ts, reverse=True)
+        for item in members:
+            if len(top) >= limit and _ceiling(text_score, item) < top[0]:
+                break
+            _keep(item, _blend(text_score, item, recency_weight, now))
+
+    for item in backend.iter_short_term_newest():
+        if item.id in text_scores:
+            continue
+        if len(top) >= limit and _ceiling(0.0, item) < top[0]:
+            break
+        _keep(item, _blend(0.0, item, recency_weight, now))
 
-    age_seconds = max((now - item.ts).total_seconds(), 0.0)
-    age_hours = age_seconds / 3600.0
-    recency_score = 1.0 / (1.0 + age_hours)
+    return scored
 
-    recency_weight = max(0.0, min(recency_bias, 1.0))
-    score = (text_score * (1.0 - recency_weight)) + (recency_score * recency_weight)
-    score += item.importance * 0.15
-    return score
+
+def _local_vector_index(backend: Any, repo_root: Optional[Path]) -> Optional[LocalVectorIndex]:
+    """Pick the local vector index for semantic scoring, if it applies.
+
+    MILTON_MEMORY_VECTOR_INDEX: "auto" (default) uses it for the JSONL backend,
+    "local" also uses it in front of Weaviate, "weaviate"/"off" never uses it.
+    """
+    mode = os.getenv("MILTON_MEMORY_VECTOR_INDEX", "auto").lower()
+    if mode in ("off", "weaviate"):
+        return None
+    if isinstance(backend, JsonlBackend):
+        return get_vector_index(backend.repo_root)
+    if mode == "local":
+        return get_vector_index(repo_root or repo_root_from_file())
+    return None
+
+
+def _embed_into_index(index: LocalVectorIndex, items: list[MemoryItem]) -> None:
+    vectors = embed_texts([item.content for item in items])
+    pairs = [(item.id, vector) for item, vector in zip(items, vectors) if vector is not None]
+    if pairs:
+        index.add_many([memory_id for memory_id, _ in pairs], np.stack([v for _, v in pairs]))
+
+
+def _backfill_index(index: LocalVectorIndex, items: list[MemoryItem]) -> None:
+    """Embed ``items`` still missing from ``index``, newest first, in batches."""
+    try:
+        for start in range(0, len(items), LOCAL_VECTOR_BACKFILL_BATCH):
+            batch = items[start:start + LOCAL_VECTOR_BACKFILL_BATCH]
+            missing, _ = index.diff([item.id for item in batch])
+            if missing:
+                _embed_into_index(index, [batch[pos] for pos in missing])
+    except Exception as e:
+        logger.warning(f"Local vector index backfill failed: {e}")
+    finally:
+        with _backfill_lock:
+            _backfilling.discard(index.directory)
+
+
+def _schedule_backfill(index: LocalVectorIndex, items: list[MemoryItem]) -> None:
+    global _backfill_pool
+    with _backfill_lock:
+        if index.directory in _backfilling:
+            return
+        _backfilling.add(index.directory)
+        if _backfill_pool is None:
+            _backfill_pool = ThreadPoolExecutor(
+                max_workers=1, thread_name_prefix="memory-vector-backfill"
+            )
+        _backfill_pool.submit(_backfill_index, index, items)
+
+
+def _local_semantic_scores(
+    index: LocalVectorIndex, items: list[MemoryItem], query_vector: np.ndarray, k: int
+) -> dict[str, float]:
+    """Sync the local index with ``items`` and return similarity in [0, 1].
+
+    Only the newest few missing memories are embedded before searching;
+    older ones (e.g. a fresh index over an existing memory file) are
+    backfilled in the background and join the results once indexed.
+    """
+    missing_positions, has_stale = index.diff([item.id for item in items])
+    if has_stale:
+        index.retain({item.id for item in items})
+    if missing_positions:
+        missing = sorted(
+            (items[pos] for pos in missing_positions),
+            key=lambda item: item.ts,
+            reverse=True,
+        )
+        _embed_into_index(index, missing[:LOCAL_VECTOR_INLINE_LIMIT])
+        if len(missing) > LOCAL_VECTOR_INLINE_LIMIT:
+            _schedule_backfill(index, missing[LOCAL_VECTOR_INLINE_LIMIT:])
+    return {
+        memory_id: cosine_to_similarity(cosine)
+        for memory_id, cosine in index.search(query_vector, k)
+    }
+
+
+def _weaviate_semantic_scores(query_vector: np.ndarray, k: int) -> dict[str, float]:
+    with _weaviate_client() as client:
+        collection = client.collections.get("ShortTermMemory")
+
+        # Perform vector search
+        search_results = collection.query.near_vector(
+            near_vector=query_vector.tolist(),
+            limit=k,
+            return_metadata=["distance"]
+        )
+
+        # Build mapping from UUID to semantic similarity
+        semantic_scores = {}
+        for result in search_results.objects:
+            # Convert cosine distance to similarity (1 - distance)
+            # Weaviate returns distance in [0, 2] range for cosine
+            distance = result.metadata.distance if result.metadata.distance is not None else 1.0
+            similarity = max(0.0, 1.0 - (distance / 2.0))
+            semantic_scores[str(result.uuid)] = similarity
+        return semantic_scores
 
 
 def query_recent(
@@ -72,8 +271,9 @@ def query_recent(
 ) -> list[MemoryItem]:
     """Return recent short-term memories with optional tag filtering."""
     backend = backend or get_backend(repo_root=repo_root)
-    items = backend.list_short_term()
     cutoff = _now_utc() - timedelta(hours=hours)
+    list_since = getattr(backend, "list_short_term_since", None)
+    items = list_since(cutoff) if callable(list_since) else backend.list_short_term()
 
     tag_filter = [tag.strip().lower() for tag in tags or [] if tag.strip()]
 
@@ -105,13 +305,16 @@ def query_relevant(
     backend = backend or get_backend(repo_root=repo_root)
     
     try:
-        items = backend.list_short_term()
-        query_tokens = _tokenize(text)
         now = _now_utc()
-
-        scored = [
-            (item, _score_item(item, query_tokens, recency_bias, now)) for item in items
-        ]
+        text_scores = _indexed_text_scores(backend, text)
+        if text_scores is not None:
+            scored = _rank_indexed(backend, text_scores, limit, recency_bias, now)
+        else:
+            items = backend.list_short_term()
+            query_tokens = _tokenize(text)
+            scored = [
+                (item, _score_item(item, query_tokens, recency_bias, now)) for item in items
+            ]
         scored.sort(
             key=lambda entry: (entry[1], entry[0].importance, entry[0].ts, entry[0].id),
             reverse=True,
@@ -197,7 +400,7 @@ def query_relevant_hybrid(
             )
 
         # Semantic or hybrid mode - need embeddings
-        query_vector = embed(text)
+        query_vector = embed_text(text)
         if query_vector is None:
             logger.warning("Failed to generate query embedding, falling back to deterministic mode")
             return query_relevant(
@@ -208,27 +411,21 @@ def query_relevant_hybrid(
                 backend=backend,
             )
 
-        # Query Weaviate for semantic similarity
-        try:
-            with _weaviate_client() as client:
-                collection = client.collections.get("ShortTermMemory")
-
-                # Perform vector search
-                search_results = collection.query.near_vector(
-                    near_vector=query_vector.tolist(),
-                    limit=max(limit * 3, 100),  # Get more candidates for reranking
-                    return_metadata=["distance"]
+        candidate_limit = max(limit * 3, 100)  # Get more candidates for reranking
+        semantic_scores: Optional[dict[str, float]] = None
+        vector_index = _local_vector_index(backend, repo_root)
+        if vector_index is not None:
+            try:
+                semantic_scores = _local_semantic_scores(
+                    vector_index, items, query_vector, candidate_limit
                 )
+            except Exception as e:
+                logger.warning(f"Local vector search failed, trying Weaviate: {e}")
 
-                # Build mapping from UUID to semantic similarity
-                semantic_scores = {}
-                for result in search_results.objects:
-                    # Convert cosine distance to similarity (1 - distance)
-                    # Weaviate returns distance in [0, 2] range for cosine
-                    distance = result.metadata.distance if result.metadata.distance is not None else 1.0
-                    similarity = max(0.0, 1.0 - (distance / 2.0))
-                    semantic_scores[str(result.uuid)] = similarity
-
+        # Query Weaviate for semantic similarity
+        try:
+            if semantic_scores is None:
+                semantic_scores = _weaviate_semantic_scores(query_vector, candidate_limit)
         except Exception as e:
             logger.error(f"Semantic search failed: {e}", exc_info=True)
             logger.warning("Falling back to deterministic mode")
@@ -256,10 +453,16 @@ def query_relevant_hybrid(
         query_tokens = _tokenize(text)
         now = _now_utc()
 
-        # Compute deterministic scores for all items
+        # Compute deterministic scores for all items (BM25 postings when indexed)
+        text_scores = _indexed_text_scores(backend, text)
         deterministic_scores = {}
         for item in items:
-            deterministic_scores[item.id] = _score_item(item, query_tokens, recency_bias, now)
+            if text_scores is not None:
+                deterministic_scores[item.id] = _blend_score(
+                    text_scores.get(item.id, 0.0), item, recency_bias, now
+                )
+            else:
+                deterministic_scores[item.id] = _score_item(item, query_tokens, recency_bias, now)
 
         # Normalize scores to [0, 1] range for fair combination
         max_det_score = max(deterministic_scores.values()) if deterministic_scores else 1.0
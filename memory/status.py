@@ -35,6 +35,7 @@ class MemoryStatus:
     detail: str  # Human-readable status message
     last_retrieval: Optional[RetrievalStats] = None
     warnings: list[str] = field(default_factory=list)
+    backend_pool: Optional[dict] = None  # BackendManager stats when shared backend is on
 
 
 class MemoryStatusTracker:
@@ -118,9 +119,10 @@ def get_memory_status() -> MemoryStatus:
     Returns current backend mode, availability, degradation state,
     and last retrieval statistics.
     """
-    from memory.backends import backend_status
+    from memory.backends import backend_status, get_backend_manager
 
-    backend = backend_status()
+    manager = get_backend_manager()
+    backend = manager.status() if manager is not None else backend_status()
     warnings: list[str] = []
 
     # Detect degraded state and add warnings
@@ -149,4 +151,5 @@ def get_memory_status() -> MemoryStatus:
         detail=backend.detail,
         last_retrieval=get_last_retrieval(),
         warnings=warnings,
+        backend_pool=manager.stats() if manager is not None else None,
     )
@@ -2,29 +2,107 @@
 
 from __future__ import annotations
 
+import atexit
 import logging
+import threading
 from datetime import datetime, timezone
 from pathlib import Path
-from typing import Optional, Any
+from typing import Any, Callable, Optional
+
+from milton_orchestrator.env import env_flag, env_float, env_int
+from milton_orchestrator.state_paths import resolve_state_dir
 
 from .backends import get_backend
+from .kg.enrich_queue import (
+    DEFAULT_BATCH_SIZE,
+    DEFAULT_MAX_PENDING,
+    DEFAULT_POLL_SECONDS,
+    DEFAULT_RETRY_BACKOFF_SECONDS,
+    DEFAULT_WORKERS,
+    EnrichmentQueue,
+)
 from .schema import MemoryItem, UserProfile
 
 logger = logging.getLogger(__name__)
 
+ENRICH_QUEUE_DB = "kg_enrich_queue.sqlite"
+
+_enrichment_queue: Optional[EnrichmentQueue] = None
+_enrichment_queue_lock = threading.Lock()
+_memory_listeners: list[Callable[[str, Any], None]] = []
+
 
 def _now_utc() -> datetime:
     return datetime.now(timezone.utc)
 
 
+def _async_enrichment_enabled() -> bool:
+    return env_flag("MILTON_KG_ENRICH_ASYNC", True)
+
+
+def _process_enrichment_job(payload: dict[str, Any], memory_id: str) -> None:
+    _enrich_knowledge_graph(MemoryItem.model_validate(payload), memory_id)
+
+
+def get_enrichment_queue() -> EnrichmentQueue:
+    """Return the durable KG enrichment queue for the current state dir."""
+    global _enrichment_queue
+    db_path = resolve_state_dir() / ENRICH_QUEUE_DB
+    with _enrichment_queue_lock:
+        if _enrichment_queue is None or _enrichment_queue.db_path != db_path:
+            if _enrichment_queue is not None:
+                _enrichment_queue.close()
+            _enrichment_queue = EnrichmentQueue(
+                db_path,
+                _process_enrichment_job,
+                workers=env_int("MILTON_KG_ENRICH_WORKERS", DEFAULT_WORKERS),
+                batch_size=env_int("MILTON_KG_ENRICH_BATCH_SIZE", DEFAULT_BATCH_SIZE),
+                max_pending=env_int("MILTON_KG_ENRICH_MAX_PENDING", DEFAULT_MAX_PENDING),
+                poll_seconds=env_float("MILTON_KG_ENRICH_POLL_S", DEFAULT_POLL_SECONDS),
+                retry_backoff=env_float(
+                    "MILTON_KG_ENRICH_RETRY_BACKOFF_S", DEFAULT_RETRY_BACKOFF_SECONDS
+                ),
+            )
+        return _enrichment_queue
+
+
+def shutdown_enrichment_queue() -> None:
+    """Give queued enrichment a bounded window to finish, then close the queue.
+    
+    Registered with atexit so jobs enqueued by short-lived processes (CLI
+    tools, scripts) are not lost with their daemon worker threads; anything
+    still pending after MILTON_KG_ENRICH_DRAIN_S stays queued for the next
+    process that starts the workers.
+    """
+    global _enrichment_queue
+    with _enrichment_queue_lock:
+        queue, _enrichment_queue = _enrichment_queue, None
+    if queue is None:
+        return
+    if not queue.drain(env_float("MILTON_KG_ENRICH_DRAIN_S", 10.0)):
+        logger.info(f"KG enrichment left {queue.depth()} jobs queued for the next run")
+    queue.close()
+
+
+atexit.register(shutdown_enrichment_queue)
+
+
+def enrichment_queue_stats() -> Optional[dict[str, Any]]:
+    """Depth and lag of the enrichment queue, or None if it was never opened."""
+    with _enrichment_queue_lock:
+        queue = _enrichment_queue
+    return queue.stats() if queue is not None else None
+
+
 def add_memory(
     item: MemoryItem, *, repo_root: Optional[Path] = None, backend: Optional[Any] = None
 ) -> str:
     """Add a memory item to short-term storage.
     
-    After successful storage, automatically extracts entities and relations
-    to populate the knowledge graph. Extraction failures are logged but never
-    block memory writes.
+    After successful storage, the item is queued for knowledge graph
+    enrichment (entity/relation extraction) on background workers and the
+    call returns. Set MILTON_KG_ENRICH_ASYNC=false to enrich inline.
+    Enrichment failures are logged but never block memory writes.
     """
     if not isinstance(item, MemoryItem):
         item = MemoryItem.model_validate(item)
@@ -36,7 +114,8 @@ def add_memory(
         memory_id = backend.append_short_term(item)
         
         # Extract entities/edges and populate KG (async, best-effort)
-        _enrich_knowledge_graph(item, memory_id)
+        _schedule_enrichment(item, memory_id)
+        _notify_memory_listeners("memory", item)
         
         return memory_id
     finally:
@@ -44,6 +123,34 @@ def add_memory(
             backend.close()
 
 
+def add_memory_listener(callback: Callable[[str, Any], None]) -> None:
+    """Register a callback for memories added through ``add_memory``.
+    
+    The callback receives ``("memory", MemoryItem)``. Writes from other
+    processes are not reported.
+    """
+    _memory_listeners.append(callback)
+
+
+def _notify_memory_listeners(event: str, payload: Any) -> None:
+    for callback in list(_memory_listeners):
+        try:
+            callback(event, payload)
+        except Exception as exc:
+            logger.warning(f"Memory listener failed on {event}: {exc}")
+
+
+def _schedule_enrichment(item: MemoryItem, memory_id: str) -> None:
+    """Queue KG enrichment, falling back to inline enrichment."""
+    if _async_enrichment_enabled():
+        try:
+            get_enrichment_queue().enqueue(memory_id, item.model_dump(mode="json"))
+            return
+        except Exception as exc:
+            logger.warning(f"KG enrichment queue unavailable, enriching inline: {exc}")
+    _enrich_knowledge_graph(item, memory_id)
+
+
 def _enrich_knowledge_graph(item: MemoryItem, memory_id: str) -> None:
     """Extract entities/edges from memory item and populate KG.
     
@@ -58,7 +165,7 @@ def _enrich_knowledge_graph(item: MemoryItem, memory_id: str) -> None:
     """
     try:
         from .kg.extract import extract_entities_and_edges
-        from .kg.api import upsert_entity, upsert_edge
+        from .kg.api import upsert_edges_bulk, upsert_entities_bulk, upsert_entity
         from .kg.enrich_llm import propose_graph_updates
         
         # Convert MemoryItem to dict for extractors
@@ -115,44 +222,57 @@ def _enrich_knowledge_graph(item: MemoryItem, memory_id: str) -> None:
         if not entities and not edge_specs:
             return  # Nothing to add
         
-        # Upsert entities first (to ensure they exist for edges)
-        entity_id_map = {}  # Map from type:name to actual UUID
-        for entity in entities:
-            try:
+        # Upsert entities first (to ensure they exist for edges), one transaction
+        from .kg.schema import _normalize_name
+        entity_specs = [
+            {
+                "type": entity.type,
+                "name": entity.name,
+                "metadata": entity.metadata,
                 # Use custom ID if provided (e.g., USER_ENTITY_ID)
-                actual_id = upsert_entity(
-                    type=entity.type,
-                    name=entity.name,
-                    metadata=entity.metadata,
-                    entity_id=entity.id if entity.id.startswith("entity:") else None
-                )
-                # Map both the entity ID and type:normalized_name to actual ID
-                entity_id_map[entity.id] = actual_id
-                # Also map type:normalized_name format used in edge_specs
-                from .kg.schema import _normalize_name
-                normalized_key = f"{entity.type}:{_normalize_name(entity.name)}"
-                entity_id_map[normalized_key] = actual_id
-            except Exception as exc:
-                logger.debug(f"Failed to upsert entity {entity.name}: {exc}")
+                "entity_id": entity.id if entity.id.startswith("entity:") else None,
+            }
+            for entity in entities
+        ]
+        try:
+            actual_ids = upsert_entities_bulk(entity_specs)
+        except Exception as exc:
+            logger.debug(f"Bulk entity upsert failed, retrying per entity: {exc}")
+            actual_ids = []
+            for spec in entity_specs:
+                try:
+                    actual_ids.append(upsert_entity(**spec))
+                except Exception as row_exc:
+                    logger.debug(f"Failed to upsert entity {spec['name']}: {row_exc}")
+                    actual_ids.append(None)
+        
+        entity_id_map = {}  # Map from type:name to actual UUID
+        for entity, actual_id in zip(entities, actual_ids):
+            if actual_id is None:
                 continue
+            # Map both the entity ID and type:normalized_name to actual ID
+            entity_id_map[entity.id] = actual_id
+            # Also map type:normalized_name format used in edge_specs
+            normalized_key = f"{entity.type}:{_normalize_name(entity.name)}"
+            entity_id_map[normalized_key] = actual_id
         
-        # Create edges
+        # Create edges, resolving actual entity IDs (or using them as-is if not in map)
+        edge_rows = []
         for subj_id, predicate, obj_id, weight, evidence in edge_specs:
-            try:
-                # Resolve actual entity IDs (or use as-is if not in map)
-                actual_subj = entity_id_map.get(subj_id, subj_id)
-                actual_obj = entity_id_map.get(obj_id, obj_id)
-                
-                upsert_edge(
-                    subject_id=actual_subj,
-                    predicate=predicate,
-                    object_id=actual_obj,
-                    weight=weight,
-                    evidence=evidence
-                )
-            except Exception as exc:
-                logger.debug(f"Failed to upsert edge {subj_id}->{predicate}->{obj_id}: {exc}")
+            if not (0.0 <= weight <= 1.0):
+                logger.debug(f"Skipping edge {subj_id}->{predicate}->{obj_id}: weight {weight}")
                 continue
+            edge_rows.append(
+                {
+                    "subject_id": entity_id_map.get(subj_id, subj_id),
+                    "predicate": predicate,
+                    "object_id": entity_id_map.get(obj_id, obj_id),
+                    "weight": weight,
+                    "evidence": evidence,
+                }
+            )
+        if edge_rows:
+            upsert_edges_bulk(edge_rows)
         
         logger.debug(f"KG enrichment: {len(entities)} entities, {len(edge_specs)} edges from memory {memory_id}")
     
@@ -0,0 +1,355 @@
+"""Local memory-mapped vector index for short-term memory.
+
+Gives hybrid retrieval a semantic half without Weaviate. Vectors are stored as
+L2-normalized float32 rows appended to ``vectors.f32`` and read back through a
+``numpy.memmap``; ``ids.jsonl`` is an append-only log mapping rows to memory
+ids (``add``) and retiring them (``del``). Search is a single matrix-vector
+(or matrix-matrix for batches) dot product followed by ``argpartition``.
+
+The index is a derived cache: every vector can be regenerated from memory
+content, so an inconsistent pair of files is simply discarded and rebuilt.
+Readers take a shared ``flock`` and writers an exclusive one. A reader that
+finds the files inconsistent only ignores them; the next write discards
+them. Compaction replaces ``ids.jsonl``, which readers notice by its inode.
+"""
+
+from __future__ import annotations
+
+import json
+import logging
+import os
+import threading
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Iterable, Iterator, Optional, Sequence
+
+import numpy as np
+
+try:
+    import fcntl  # type: ignore
+except Exception:  # pragma: no cover - platform dependent
+    fcntl = None
+
+from .embeddings import EMBEDDING_DIM
+
+logger = logging.getLogger(__name__)
+
+VECTORS_FILE = "vectors.f32"
+IDS_FILE = "ids.jsonl"
+LOCK_FILE = ".lock"
+
+
+def vector_index_dir(repo_root: Path) -> Path:
+    return repo_root / "data" / "memory" / "vectors"
+
+
+def cosine_to_similarity(cosine: float) -> float:
+    """Map cosine in [-1, 1] to the [0, 1] scale used for Weaviate distances."""
+    return max(0.0, min(1.0, (1.0 + cosine) / 2.0))
+
+
+class LocalVectorIndex:
+    """Append-only float32 matrix with an id map and tombstoned rows."""
+
+    def __init__(self, directory: Path, dim: int = EMBEDDING_DIM):
+        self.directory = directory
+        self.dim = dim
+        self.vectors_path = directory / VECTORS_FILE
+        self.ids_path = directory / IDS_FILE
+        self._row_bytes = dim * 4
+        self._lock = threading.RLock()
+        self._file_lock_depth = 0
+        self._reset()
+
+    def _reset(self) -> None:
+        self._row_of: dict[str, int] = {}
+        self._row_ids: list[Optional[str]] = []
+        self._dead_rows: set[int] = set()
+        self._log_offset = 0
+        self._log_inode: Optional[int] = None
+        self._broken = False
+        self._matrix: Optional[np.ndarray] = None
+        self._matrix_rows = 0
+
+    # ------------------------------------------------------------------
+    # Reads
+    # ------------------------------------------------------------------
+
+    def __len__(self) -> int:
+        with self._lock:
+            self.refresh()
+            return len(self._row_of)
+
+    def __contains__(self, memory_id: object) -> bool:
+        with self._lock:
+            self.refresh()
+            return memory_id in self._row_of
+
+    def ids(self) -> set[str]:
+        with self._lock:
+            self.refresh()
+            return set(self._row_of)
+
+    def diff(self, memory_ids: Sequence[str]) -> tuple[list[int], bool]:
+        """Compare the index with the live (unique) ``memory_ids``.
+        
+        Returns the positions in ``memory_ids`` that have no vector, and
+        whether the index also holds ids that are not in ``memory_ids``.
+        Checks membership in place rather than copying the id set.
+        """
+        with self._lock:
+            self.refresh()
+            missing = [pos for pos, memory_id in enumerate(memory_ids) if memory_id not in self._row_of]
+            has_stale = len(self._row_of) > len(memory_ids) - len(missing)
+        return missing, has_stale
+
+    def search(self, query: np.ndarray, k: int = 10) -> list[tuple[str, float]]:
+        """Return up to ``k`` ``(memory_id, cosine)`` pairs, best first."""
+        return self.search_batch(np.asarray(query)[None, :], k)[0]
+
+    def search_batch(self, queries: np.ndarray, k: int = 10) -> list[list[tuple[str, float]]]:
+        """Top-``k`` search for several queries with one matrix product."""
+        queries = _normalize_rows(np.asarray(queries, dtype=np.float32).reshape(-1, self.dim))
+        with self._lock:
+            self.refresh()
+            matrix = self._view()
+            row_ids = self._row_ids
+            dead = list(self._dead_rows)
+            live = len(self._row_of)
+        if matrix is None or live == 0 or k <= 0:
+            return [[] for _ in range(len(queries))]
+
+        scores = matrix @ queries.T  # (rows, queries)
+        if dead:
+            scores[dead, :] = -np.inf
+        k = min(k, live)
+        results: list[list[tuple[str, float]]] = []
+        for column in range(scores.shape[1]):
+            col = scores[:, column]
+            if k < len(col):
+                top = np.argpartition(-col, k - 1)[:k]
+            else:
+                top = np.arange(len(col))
+            top = top[np.argsort(-col[top], kind="stable")]
+            results.append(
+                [(row_ids[row], float(col[row])) for row in top if row_ids[row] is not None]
+            )
+        return results
+
+    # ------------------------------------------------------------------
+    # Writes
+    # ------------------------------------------------------------------
+
+    def add_many(self, memory_ids: Sequence[str], vectors: np.ndarray) -> int:
+        """Append (or replace) vectors for ``memory_ids``; returns rows written."""
+        if not memory_ids:
+            return 0
+        matrix = _normalize_rows(np.asarray(vectors, dtype=np.float32).reshape(-1, self.dim))
+        if len(matrix) != len(memory_ids):
+            raise ValueError("memory_ids and vectors must have the same length")
+
+        with self._lock, self._file_lock():
+            self._refresh_for_write()
+            size = self.vectors_path.stat().st_size if self.vectors_path.exists() else 0
+            first_row = size // self._row_bytes
+            if size % self._row_bytes:
+                # Torn write from a crashed process; drop the partial row
+                with self.vectors_path.open("r+b") as handle:
+                    handle.truncate(first_row * self._row_bytes)
+            lines = []
+            for offset, memory_id in enumerate(memory_ids):
+                if memory_id in self._row_of:
+                    lines.append(json.dumps({"op": "del", "id": memory_id}))
+                lines.append(json.dumps({"op": "add", "id": memory_id, "row": first_row + offset}))
+            with self.vectors_path.open("ab") as handle:
+                handle.write(matrix.tobytes())
+            with self.ids_path.open("a", encoding="utf-8") as handle:
+                handle.write("\n".join(lines) + "\n")
+            self.refresh()
+        return len(memory_ids)
+
+    def delete_many(self, memory_ids: Iterable[str]) -> int:
+        with self._lock, self._file_lock():
+            self._refresh_for_write()
+            doomed = [memory_id for memory_id in memory_ids if memory_id in self._row_of]
+            if not doomed:
+                return 0
+            with self.ids_path.open("a", encoding="utf-8") as handle:
+                for memory_id in doomed:
+                    handle.write(json.dumps({"op": "del", "id": memory_id}) + "\n")
+            self.refresh()
+            return len(doomed)
+
+    def retain(self, live_ids: set[str]) -> int:
+        """Drop vectors whose memory no longer exists."""
+        with self._lock:
+            self.refresh()
+            stale = [memory_id for memory_id in self._row_of if memory_id not in live_ids]
+        removed = self.delete_many(stale)
+        if removed and self.needs_compaction():
+            self.compact()
+        return removed
+
+    def needs_compaction(self) -> bool:
+        with self._lock:
+            return len(self._dead_rows) > max(len(self._row_of), 256)
+
+    def compact(self) -> None:
+        """Rewrite both files with live rows only."""
+        with self._lock, self._file_lock():
+            self._refresh_for_write()
+            matrix = self._view()
+            ids = [row_id for row_id in self._row_ids if row_id is not None]
+            rows = [self._row_of[memory_id] for memory_id in ids]
+            live = np.asarray(matrix[rows]) if matrix is not None and rows else np.zeros((0, self.dim), np.float32)
+            tmp_vectors = self.vectors_path.with_name(VECTORS_FILE + ".compact")
+            tmp_ids = self.ids_path.with_name(IDS_FILE + ".compact")
+            tmp_vectors.write_bytes(live.astype(np.float32).tobytes())
+            tmp_ids.write_text(
+                "".join(
+                    json.dumps({"op": "add", "id": memory_id, "row": row}) + "\n"
+                    for row, memory_id in enumerate(ids)
+                ),
+                encoding="utf-8",
+            )
+            self._matrix = None
+            os.replace(tmp_vectors, self.vectors_path)
+            os.replace(tmp_ids, self.ids_path)
+            self._reset()
+            self.refresh()
+
+    # ------------------------------------------------------------------
+    # Internals
+    # ------------------------------------------------------------------
+
+    def refresh(self) -> None:
+        """Replay id-log entries written since the last call (any process)."""
+        with self._lock:
+            if not self.ids_path.exists():
+                if self._row_ids or self._broken:
+                    self._reset()
+                return
+            with self._file_lock(shared=True):
+                self._replay()
+
+    def _replay(self) -> None:
+        try:
+            handle = self.ids_path.open("rb")
+        except FileNotFoundError:
+            self._reset()
+            return
+        with handle:
+            stat = os.fstat(handle.fileno())
+            if stat.st_ino != self._log_inode or stat.st_size < self._log_offset:
+                self._reset()  # Compacted or rebuilt by another process
+                self._log_inode = stat.st_ino
+            if self._broken or stat.st_size == self._log_offset:
+                return
+            handle.seek(self._log_offset)
+            data = handle.read()
+        end = data.rfind(b"\n")
+        if end < 0:
+            return
+        for raw in data[: end + 1].splitlines():
+            if not raw.strip():
+                continue
+            try:
+                entry = json.loads(raw)
+            except json.JSONDecodeError:
+                continue
+            self._apply(entry)
+        self._log_offset += end + 1
+        self._check_consistency()
+
+    def _refresh_for_write(self) -> None:
+        """``refresh`` under the exclusive file lock, discarding a broken index."""
+        self.refresh()
+        if not self._broken:
+            return
+        logger.warning(f"Discarding inconsistent vector index at {self.directory}")
+        self._matrix = None
+        for path in (self.vectors_path, self.ids_path):
+            try:
+                path.unlink()
+            except FileNotFoundError:
+                pass
+        self._reset()
+
+    def _apply(self, entry: dict) -> None:
+        memory_id = entry.get("id")
+        if entry.get("op") == "add":
+            row = int(entry["row"])
+            while len(self._row_ids) <= row:
+                self._row_ids.append(None)
+                self._dead_rows.add(len(self._row_ids) - 1)
+            self._row_ids[row] = memory_id
+            self._dead_rows.discard(row)
+            self._row_of[memory_id] = row
+        elif entry.get("op") == "del":
+            row = self._row_of.pop(memory_id, None)
+            if row is not None:
+                self._row_ids[row] = None
+                self._dead_rows.add(row)
+
+    def _check_consistency(self) -> None:
+        size = self.vectors_path.stat().st_size if self.vectors_path.exists() else 0
+        if len(self._row_ids) * self._row_bytes > size:
+            # Ignore the files until a writer discards them; a read never deletes
+            logger.warning(f"Vector index at {self.directory} is inconsistent; ignoring it")
+            offset, inode = self._log_offset, self._log_inode
+            self._reset()
+            self._log_offset, self._log_inode, self._broken = offset, inode, True
+
+    def _view(self) -> Optional[np.ndarray]:
+        rows = len(self._row_ids)
+        if rows == 0:
+            return None
+        if self._matrix is None or self._matrix_rows != rows:
+            self._matrix = np.memmap(
+                self.vectors_path, dtype=np.float32, mode="r", shape=(rows, self.dim)
+            )
+            self._matrix_rows = rows
+        return self._matrix
+
+    @contextmanager
+    def _file_lock(self, shared: bool = False) -> Iterator[None]:
+        """Cross-process lock; re-entrant within the thread holding ``_lock``."""
+        if self._file_lock_depth:
+            self._file_lock_depth += 1
+            try:
+                yield
+            finally:
+                self._file_lock_depth -= 1
+            return
+        self.directory.mkdir(parents=True, exist_ok=True)
+        with (self.directory / LOCK_FILE).open("a+") as handle:
+            if fcntl is not None:
+                fcntl.flock(handle.fileno(), fcntl.LOCK_SH if shared else fcntl.LOCK_EX)
+            self._file_lock_depth = 1
+            try:
+                yield
+            finally:
+                self._file_lock_depth = 0
+                if fcntl is not None:
+                    fcntl.flock(handle.fileno(), fcntl.LOCK_UN)
+
+
+def _normalize_rows(matrix: np.ndarray) -> np.ndarray:
+    norms = np.linalg.norm(matrix, axis=1, keepdims=True)
+    norms[norms == 0] = 1.0
+    return (matrix / norms).astype(np.float32, copy=False)
+
+
+_indexes: dict[Path, LocalVectorIndex] = {}
+_indexes_lock = threading.Lock()
+
+
+def get_vector_index(repo_root: Path) -> LocalVectorIndex:
+    """Return the process-wide vector index for ``repo_root``."""
+    key = Path(os.path.abspath(vector_index_dir(repo_root)))
+    with _indexes_lock:
+        index = _indexes.get(key)
+        if index is None:
+            index = LocalVectorIndex(key)
+            _indexes[key] = index
+        return index
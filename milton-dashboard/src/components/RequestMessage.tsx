@@ -114,6 +114,11 @@ export function RequestMessage({ message }: RequestMessageProps) {
             <div className="text-sm opacity-90">
               → Duration: {(message.duration_ms / 1000).toFixed(2)}s
             </div>
+            {message.ttft_ms != null && (
+              <div className="text-sm opacity-90">
+                → First token: {(message.ttft_ms / 1000).toFixed(2)}s
+              </div>
+            )}
           </>
         );
     }
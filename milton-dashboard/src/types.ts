@@ -62,6 +62,7 @@ export interface CompleteMessage extends BaseStreamMessage {
   type: "complete";
   total_tokens: number;
   duration_ms: number;
+  ttft_ms?: number | null;
 }
 
 export type StreamMessage =
@@ -2,17 +2,33 @@
 
 Executes validated action plans by calling canonical, existing handlers or
 underlying storage APIs. No new business logic is introduced here.
+
+The gateway runs plans through ``execute_action_plan_async``: side effects
+(SQLite and YAML writes) run on a small bounded worker pool so a slow disk or
+file lock never blocks the event loop. The pool size caps in-flight writes
+(MILTON_ACTION_WORKERS, default 2), and plans of the same action type against
+the same state dir are serialized so duplicate checks stay race-free. The
+serialization happens before the pool: a plan whose key is busy waits in a
+per-key queue and is run by the worker that finishes the one ahead of it,
+so a waiting plan never occupies a worker.
 """
 
 from __future__ import annotations
 
+import asyncio
+import atexit
 import logging
 import re
+import threading
+import time
+from collections import deque
+from concurrent.futures import Future, ThreadPoolExecutor
 from datetime import datetime, timezone
 from pathlib import Path
 from typing import Any, Dict, Optional
 
 from goals.capture import capture_goal
+from milton_orchestrator.env import env_int
 from milton_orchestrator.reminders import ReminderStore, parse_time_expression
 from milton_orchestrator.state_paths import resolve_reminders_db_path, resolve_state_dir
 from storage.chat_memory import ChatMemoryStore
@@ -25,6 +41,8 @@ ALLOWED_ACTIONS = {
     "CREATE_GOAL",
 }
 
+DEFAULT_ACTION_WORKERS = 2
+
 
 def execute_action_plan(plan: Dict[str, Any], context: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
     """Execute a validated action plan.
@@ -221,3 +239,145 @@ def _result(
         "errors": errors or [],
         "artifacts": artifacts or {},
     }
+
+
+class AsyncActionExecutor:
+    """Runs action plans on a bounded thread pool and returns awaitables."""
+
+    def __init__(self, max_workers: Optional[int] = None):
+        if max_workers is None:
+            max_workers = env_int("MILTON_ACTION_WORKERS", DEFAULT_ACTION_WORKERS)
+        self.max_workers = max(max_workers, 1)
+        self._pool = ThreadPoolExecutor(
+            max_workers=self.max_workers, thread_name_prefix="milton-action"
+        )
+        self._lock = threading.Lock()
+        # Keys with a plan on the pool -> plans waiting behind it
+        self._queues: Dict[tuple[str, str], deque] = {}
+        self._stats = {
+            "submitted": 0,
+            "completed": 0,
+            "failed": 0,
+            "in_flight": 0,
+            "peak_in_flight": 0,
+            "run_ms_total": 0.0,
+        }
+
+    def submit(self, plan: Dict[str, Any], context: Optional[Dict[str, Any]] = None) -> Future:
+        """Queue ``plan``; the future resolves to the ``execute_action_plan`` result."""
+        context = dict(context or {})
+        key = self._action_key(plan, context)
+        future: Future = Future()
+        with self._lock:
+            self._stats["submitted"] += 1
+            waiting = self._queues.get(key)
+            if waiting is not None:
+                waiting.append((plan, context, future))
+                return future
+            self._queues[key] = deque()
+        try:
+            self._pool.submit(self._run_key, key, plan, context, future)
+        except RuntimeError as exc:  # pool already shut down
+            with self._lock:
+                waiting = self._queues.pop(key)
+            for _, _, queued in waiting:
+                queued.set_exception(exc)
+            raise
+        return future
+
+    async def execute(
+        self, plan: Dict[str, Any], context: Optional[Dict[str, Any]] = None
+    ) -> Dict[str, Any]:
+        return await asyncio.wrap_future(self.submit(plan, context))
+
+    def stats(self) -> Dict[str, Any]:
+        with self._lock:
+            stats = dict(self._stats)
+        total_ms = stats.pop("run_ms_total")
+        done = stats["completed"] + stats["failed"]
+        stats["avg_run_ms"] = round(total_ms / done, 2) if done else 0.0
+        stats["pending"] = stats["submitted"] - done - stats["in_flight"]
+        stats["max_workers"] = self.max_workers
+        return stats
+
+    def shutdown(self, wait: bool = True) -> None:
+        self._pool.shutdown(wait=wait)
+
+    @staticmethod
+    def _action_key(plan: Dict[str, Any], context: Dict[str, Any]) -> tuple[str, str]:
+        return (str(plan.get("action")), str(context.get("state_dir") or ""))
+
+    def _run_key(
+        self, key: tuple[str, str], plan: Dict[str, Any], context: Dict[str, Any], future: Future
+    ) -> None:
+        """Run ``plan``, then each plan queued behind it for the same key."""
+        while True:
+            if future.set_running_or_notify_cancel():
+                try:
+                    future.set_result(self._run(plan, context))
+                except Exception as exc:
+                    future.set_exception(exc)
+            with self._lock:
+                waiting = self._queues[key]
+                if not waiting:
+                    del self._queues[key]
+                    return
+                plan, context, future = waiting.popleft()
+
+    def _run(self, plan: Dict[str, Any], context: Dict[str, Any]) -> Dict[str, Any]:
+        with self._lock:
+            self._stats["in_flight"] += 1
+            self._stats["peak_in_flight"] = max(
+                self._stats["peak_in_flight"], self._stats["in_flight"]
+            )
+        started = time.perf_counter()
+        failed = False
+        try:
+            return execute_action_plan(plan, context)
+        except Exception:
+            failed = True
+            raise
+        finally:
+            with self._lock:
+                self._stats["in_flight"] -= 1
+                self._stats["failed" if failed else "completed"] += 1
+                self._stats["run_ms_total"] += (time.perf_counter() - started) * 1000.0
+
+
+_executor: Optional[AsyncActionExecutor] = None
+_executor_lock = threading.Lock()
+
+
+def get_action_executor() -> AsyncActionExecutor:
+    """Return the process-wide action executor, creating it on first use."""
+    global _executor
+    with _executor_lock:
+        if _executor is None:
+            _executor = AsyncActionExecutor()
+        return _executor
+
+
+def shutdown_action_executor() -> None:
+    """Wait for in-flight actions and stop the pool."""
+    global _executor
+    with _executor_lock:
+        executor, _executor = _executor, None
+    if executor is not None:
+        executor.shutdown()
+
+
+atexit.register(shutdown_action_executor)
+
+
+def action_executor_stats() -> Optional[Dict[str, Any]]:
+    """Stats of the running executor, or ``None`` if it was never used."""
+    with _executor_lock:
+        executor = _executor
+    return executor.stats() if executor is not None else None
+
+
+async def execute_action_plan_async(
+    plan: Dict[str, Any], context: Optional[Dict[str, Any]] = None
+) -> Dict[str, Any]:
+    """Execute a plan on the shared action pool without blocking the event loop."""
+    return await get_action_executor().execute(plan, context)
@@ -0,0 +1,173 @@
+"""Concurrent context assembly for chat completions.
+
+Before the LLM call the gateway needs several independent context sources:
+recent turns, stored facts, semantic memory and KG context. They are all
+blocking calls (SQLite, Weaviate, embeddings), so running them inline in the
+async handler stalls the event loop for every other request. Here each source
+runs on a small shared thread pool with its own deadline; sources that fail or
+miss their deadline are skipped and the rest of the prompt is built without
+them. Per-source timings are reported as a ``Server-Timing`` header.
+
+A thread cannot be interrupted, so a load that misses its deadline keeps its
+pool worker until it returns. To stop one hung backend from occupying the
+whole pool, each source may have at most ``MAX_STRAGGLERS`` such abandoned
+loads running; while it is at that limit the source is skipped as "busy"
+without being submitted. Loads still queued at their deadline are cancelled.
+
+Configuration:
+    MILTON_GATEWAY_CONTEXT_WORKERS: pool size (default 8)
+    MILTON_GATEWAY_CONTEXT_MAX_STRAGGLERS: abandoned loads allowed per source (default 2)
+    MILTON_GATEWAY_CONTEXT_TIMEOUT_MS: default per-source deadline (default 1500)
+    MILTON_GATEWAY_CONTEXT_TIMEOUT_<SOURCE>_MS: override for one source,
+        e.g. MILTON_GATEWAY_CONTEXT_TIMEOUT_SEMANTIC_MS=3000
+"""
+
+from __future__ import annotations
+
+import asyncio
+import logging
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field
+from typing import Any, Callable, Optional
+
+from milton_orchestrator.env import env_float, env_int
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_WORKERS = 8
+DEFAULT_TIMEOUT_MS = 1500.0
+DEFAULT_MAX_STRAGGLERS = 2
+
+CONTEXT_TIMING_HEADER = "Server-Timing"
+CONTEXT_SKIPPED_HEADER = "X-Milton-Context-Skipped"
+
+
+def source_timeout(name: str) -> float:
+    """Deadline in seconds for the context source ``name``."""
+    default_ms = env_float("MILTON_GATEWAY_CONTEXT_TIMEOUT_MS", DEFAULT_TIMEOUT_MS)
+    return env_float(f"MILTON_GATEWAY_CONTEXT_TIMEOUT_{name.upper()}_MS", default_ms) / 1000.0
+
+
+@dataclass
+class ContextSource:
+    """A blocking context loader and its deadline (seconds)."""
+
+    name: str
+    load: Callable[[], Any]
+    timeout: Optional[float] = None
+
+    def __post_init__(self) -> None:
+        if self.timeout is None:
+            self.timeout = source_timeout(self.name)
+
+
+@dataclass
+class AssembledContext:
+    """Results of the sources that finished in time, plus timings."""
+
+    results: dict[str, Any] = field(default_factory=dict)
+    timings_ms: dict[str, float] = field(default_factory=dict)
+    skipped: dict[str, str] = field(default_factory=dict)  # name -> "timeout" | "error" | "busy"
+    total_ms: float = 0.0
+
+    def get(self, name: str, default: Any = None) -> Any:
+        return self.results.get(name, default)
+
+    def headers(self) -> dict[str, str]:
+        """``Server-Timing`` (and skipped sources) for the HTTP response."""
+        metrics = [f"ctx_total;dur={self.total_ms:.1f}"]
+        for name, duration in self.timings_ms.items():
+            metric = f"ctx_{name};dur={duration:.1f}"
+            if name in self.skipped:
+                metric += f';desc="{self.skipped[name]}"'
+            metrics.append(metric)
+        headers = {CONTEXT_TIMING_HEADER: ", ".join(metrics)}
+        if self.skipped:
+            headers[CONTEXT_SKIPPED_HEADER] = ",".join(self.skipped)
+        return headers
+
+
+_executor: Optional[ThreadPoolExecutor] = None
+_executor_lock = threading.Lock()
+_stragglers: dict[str, int] = {}  # source name -> loads still running past their deadline
+
+
+def _get_executor() -> ThreadPoolExecutor:
+    global _executor
+    with _executor_lock:
+        if _executor is None:
+            workers = env_int("MILTON_GATEWAY_CONTEXT_WORKERS", DEFAULT_WORKERS)
+            _executor = ThreadPoolExecutor(
+                max_workers=max(workers, 1), thread_name_prefix="gateway-context"
+            )
+        return _executor
+
+
+def shutdown_context_executor() -> None:
+    """Stop the pool (gateway shutdown); abandoned loads are not waited for."""
+    global _executor
+    with _executor_lock:
+        executor, _executor = _executor, None
+    if executor is not None:
+        executor.shutdown(wait=False, cancel_futures=True)
+
+
+def _release_straggler(name: str) -> Callable[[Any], None]:
+    def release(_future: Any) -> None:
+        with _executor_lock:
+            _stragglers[name] -= 1
+    return release
+
+
+async def _run_source(source: ContextSource, context: AssembledContext) -> None:
+    started = time.perf_counter()
+    with _executor_lock:
+        busy = _stragglers.get(source.name, 0) >= env_int(
+            "MILTON_GATEWAY_CONTEXT_MAX_STRAGGLERS", DEFAULT_MAX_STRAGGLERS
+        )
+    if busy:
+        context.skipped[source.name] = "busy"
+        context.timings_ms[source.name] = 0.0
+        logger.warning(f"Context source {source.name!r} still has loads past their deadline; skipping")
+        return
+
+    future = _get_executor().submit(source.load)
+    try:
+        context.results[source.name] = await asyncio.wait_for(
+            asyncio.wrap_future(future), source.timeout
+        )
+    except asyncio.TimeoutError:
+        context.skipped[source.name] = "timeout"
+        logger.warning(
+            f"Context source {source.name!r} missed its {source.timeout * 1000:.0f}ms deadline; skipping"
+        )
+        if not future.cancel():
+            # Already running: count it against the source until it returns
+            with _executor_lock:
+                _stragglers[source.name] = _stragglers.get(source.name, 0) + 1
+            future.add_done_callback(_release_straggler(source.name))
+    except Exception as e:
+        context.skipped[source.name] = "error"
+        logger.warning(f"Context source {source.name!r} failed: {e}")
+    finally:
+        context.timings_ms[source.name] = (time.perf_counter() - started) * 1000.0
+
+
+async def assemble_context(sources: list[ContextSource]) -> AssembledContext:
+    """Run all sources concurrently; each is bounded by its own deadline."""
+    context = AssembledContext()
+    started = time.perf_counter()
+    await asyncio.gather(*(_run_source(source, context) for source in sources))
+    context.total_ms = (time.perf_counter() - started) * 1000.0
+    # Report in the order the sources were declared
+    context.timings_ms = {
+        source.name: context.timings_ms[source.name] for source in sources
+    }
+    context.skipped = {
+        source.name: context.skipped[source.name]
+        for source in sources
+        if source.name in context.skipped
+    }
+    return context
@@ -0,0 +1,269 @@
+"""Per-thread conversation context cache for the chat gateway.
+
+Every chat request needs the thread's recent turns, its rolling summary and
+the stored ``/remember`` facts. Reading all of them from SQLite (and
+re-rendering every fact) on each request is wasted work: they only change
+when the gateway itself writes them. This cache keeps, per thread, the
+recent-turn window and summary in a bounded LRU, plus one shared facts entry
+with each fact's rendered prompt line. Writes made through the
+ChatMemoryStore update the cache in place via store listeners; writes from
+other connections (command processor, action executor) are detected with
+SQLite's ``data_version`` and drop the cache. Entries also expire after a
+TTL as a backstop.
+
+Once there are more facts than ``MILTON_GATEWAY_FACTS_MAX``, only the ones
+most relevant to the current query are put in the prompt. For the
+prefix-cache layout, ``split_facts`` keeps that query out of the stable
+segment: the most recently updated facts are stable, and the facts picked
+for the query come separately for the per-query context block.
+
+Configuration:
+    MILTON_GATEWAY_CONTEXT_CACHE_THREADS: threads kept (default 256, 0 disables)
+    MILTON_GATEWAY_CONTEXT_CACHE_TTL_S: entry lifetime in seconds (default 300)
+    MILTON_GATEWAY_FACTS_MAX: facts included before relevance selection (default 50)
+    MILTON_GATEWAY_QUERY_FACTS_MAX: query-relevant facts added beyond those (default 10)
+"""
+
+from __future__ import annotations
+
+import bisect
+import logging
+import re
+import threading
+import time
+from collections import OrderedDict
+from dataclasses import dataclass, field
+from typing import Any, Optional
+
+from milton_orchestrator.env import env_float, env_int
+
+from .prompt_layout import format_fact_line
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_MAX_THREADS = 256
+DEFAULT_TTL_SECONDS = 300.0
+DEFAULT_MAX_FACTS = 50
+DEFAULT_MAX_QUERY_FACTS = 10
+
+_WORD = re.compile(r"[a-z0-9]{3,}")
+
+
+@dataclass
+class _ThreadEntry:
+    turns: list
+    limit: int  # turns requested from the store when loaded
+    summary: Any
+    loaded_at: float = field(default_factory=time.monotonic)
+
+
+@dataclass
+class _FactsEntry:
+    facts: list  # ordered by key, like ChatMemoryStore.get_all_facts
+    lines: dict[str, str]
+    loaded_at: float = field(default_factory=time.monotonic)
+
+
+def _words(text: str) -> set[str]:
+    return set(_WORD.findall(text.lower()))
+
+
+def select_relevant_facts(facts: list, query: str, max_facts: int, min_overlap: int = 0) -> list:
+    """Top ``max_facts`` facts by word overlap with ``query`` (key matches count double).
+
+    Ties go to the most recently updated facts; facts overlapping the query
+    less than ``min_overlap`` are left out. The result keeps key order.
+    """
+    if len(facts) <= max_facts and min_overlap <= 0:
+        return facts
+    query_words = _words(query)
+
+    def score(fact) -> tuple[int, str]:
+        overlap = 2 * len(query_words & _words(fact.key.replace("_", " "))) + len(
+            query_words & _words(fact.value)
+        )
+        return overlap, fact.updated_at
+
+    scored = sorted(((score(fact), fact) for fact in facts), key=lambda pair: pair[0], reverse=True)
+    chosen_keys = {fact.key for (overlap, _), fact in scored[:max_facts] if overlap >= min_overlap}
+    return [fact for fact in facts if fact.key in chosen_keys]
+
+
+class ThreadContextCache:
+    """LRU of per-thread turn windows and summaries, plus the facts block."""
+
+    def __init__(
+        self,
+        store,
+        max_threads: Optional[int] = None,
+        ttl_seconds: Optional[float] = None,
+        max_facts: Optional[int] = None,
+        max_query_facts: Optional[int] = None,
+    ) -> None:
+        self.store = store
+        self.max_threads = int(
+            max_threads
+            if max_threads is not None
+            else env_int("MILTON_GATEWAY_CONTEXT_CACHE_THREADS", DEFAULT_MAX_THREADS)
+        )
+        self.ttl_seconds = (
+            ttl_seconds
+            if ttl_seconds is not None
+            else env_float("MILTON_GATEWAY_CONTEXT_CACHE_TTL_S", DEFAULT_TTL_SECONDS)
+        )
+        self.max_facts = int(
+            max_facts
+            if max_facts is not None
+            else env_int("MILTON_GATEWAY_FACTS_MAX", DEFAULT_MAX_FACTS)
+        )
+        self.max_query_facts = int(
+            max_query_facts
+            if max_query_facts is not None
+            else env_int("MILTON_GATEWAY_QUERY_FACTS_MAX", DEFAULT_MAX_QUERY_FACTS)
+        )
+        self._threads: OrderedDict[str, _ThreadEntry] = OrderedDict()
+        self._facts: Optional[_FactsEntry] = None
+        self._lock = threading.RLock()
+        self._data_version = store.data_version()
+        self._generation = 0  # bumped on every store write; guards in-flight loads
+        self.hits = 0
+        self.misses = 0
+        self.invalidations = 0
+        store.add_listener(self._on_store_event)
+
+    # -- freshness -----------------------------------------------------------
+
+    def _fresh(self, loaded_at: float) -> bool:
+        return time.monotonic() - loaded_at < self.ttl_seconds
+
+    def _check_external_writes(self) -> None:
+        version = self.store.data_version()
+        with self._lock:
+            if version != self._data_version:
+                self._data_version = version
+                self._threads.clear()
+                self._facts = None
+                self.invalidations += 1
+
+    def clear(self) -> None:
+        with self._lock:
+            self._threads.clear()
+            self._facts = None
+
+    # -- reads ---------------------------------------------------------------
+
+    def _thread_entry(self, thread_id: str, limit: int) -> _ThreadEntry:
+        with self._lock:
+            entry = self._threads.get(thread_id)
+            if entry is not None and entry.limit >= limit and self._fresh(entry.loaded_at):
+                self._threads.move_to_end(thread_id)
+                self.hits += 1
+                return entry
+            self.misses += 1
+            generation = self._generation
+
+        entry = _ThreadEntry(
+            turns=self.store.get_recent_turns(thread_id, limit=limit),
+            limit=limit,
+            summary=self.store.get_thread_summary(thread_id),
+        )
+        with self._lock:
+            # A write landed while loading: serve this result but don't cache it
+            if self.max_threads <= 0 or generation != self._generation:
+                return entry
+            self._threads[thread_id] = entry
+            self._threads.move_to_end(thread_id)
+            while len(self._threads) > self.max_threads:
+                self._threads.popitem(last=False)
+        return entry
+
+    def recent_turns(self, thread_id: str, limit: int) -> list:
+        """Up to ``limit`` most recent turns of the thread, oldest first."""
+        self._check_external_writes()
+        return list(self._thread_entry(thread_id, limit).turns[-limit:])
+
+    def history(self, thread_id: str, limit: int) -> tuple[list, Any]:
+        """Recent turns (as ``recent_turns``) and the thread's rolling summary."""
+        self._check_external_writes()
+        entry = self._thread_entry(thread_id, limit)
+        return list(entry.turns[-limit:]), entry.summary
+
+    def _facts_entry(self) -> _FactsEntry:
+        with self._lock:
+            entry = self._facts
+            if entry is not None and self._fresh(entry.loaded_at):
+                self.hits += 1
+                return entry
+            self.misses += 1
+            generation = self._generation
+        facts = self.store.get_all_facts()
+        entry = _FactsEntry(facts=facts, lines={fact.key: format_fact_line(fact) for fact in facts})
+        with self._lock:
+            if generation == self._generation:
+                self._facts = entry
+        return entry
+
+    def facts(self, query: str = "") -> list:
+        """Stored facts, narrowed to the most relevant when there are many."""
+        self._check_external_writes()
+        return select_relevant_facts(list(self._facts_entry().facts), query, self.max_facts)
+
+    def split_facts(self, query: str = "") -> tuple[list, list]:
+        """Query-independent facts for the stable prompt, plus query-relevant extras.
+
+        With more than ``max_facts`` facts, the ``max_facts`` most recently
+        updated are stable; up to ``max_query_facts`` of the others that
+        share words with ``query`` are returned separately, both in key order.
+        """
+        self._check_external_writes()
+        facts = list(self._facts_entry().facts)
+        if len(facts) <= self.max_facts:
+            return facts, []
+        newest = sorted(facts, key=lambda fact: fact.updated_at, reverse=True)[: self.max_facts]
+        stable_keys = {fact.key for fact in newest}
+        stable = [fact for fact in facts if fact.key in stable_keys]
+        rest = [fact for fact in facts if fact.key not in stable_keys]
+        return stable, select_relevant_facts(rest, query, self.max_query_facts, min_overlap=1)
+
+    def render_facts(self, facts: list) -> str:
+        """Prompt lines for ``facts``, reusing the cached rendering."""
+        with self._lock:
+            lines = self._facts.lines if self._facts is not None else {}
+            return "\n".join(lines.get(fact.key) or format_fact_line(fact) for fact in facts)
+
+    # -- incremental updates -------------------------------------------------
+
+    def _on_store_event(self, event: str, payload: Any) -> None:
+        with self._lock:
+            self._generation += 1
+            if event == "turn":
+                entry = self._threads.get(payload.thread_id)
+                if entry is not None:
+                    entry.turns.append(payload)
+                    del entry.turns[: max(len(entry.turns) - entry.limit, 0)]
+            elif event == "summary":
+                entry = self._threads.get(payload.thread_id)
+                if entry is not None:
+                    entry.summary = payload
+            elif event == "fact" and self._facts is not None:
+                keys = [fact.key for fact in self._facts.facts]
+                index = bisect.bisect_left(keys, payload.key)
+                if index < len(keys) and keys[index] == payload.key:
+                    self._facts.facts[index] = payload
+                else:
+                    self._facts.facts.insert(index, payload)
+                self._facts.lines[payload.key] = format_fact_line(payload)
+            elif event == "fact_deleted" and self._facts is not None:
+                self._facts.facts = [f for f in self._facts.facts if f.key != payload]
+                self._facts.lines.pop(payload, None)
+
+    def stats(self) -> dict[str, Any]:
+        with self._lock:
+            return {
+                "threads": len(self._threads),
+                "max_threads": self.max_threads,
+                "facts": len(self._facts.facts) if self._facts is not None else None,
+                "hits": self.hits,
+                "misses": self.misses,
+                "invalidations": self.invalidations,
+            }
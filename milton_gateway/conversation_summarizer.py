@@ -4,35 +4,48 @@ When conversations approach the model's context limit, this module:
 1. Summarizes older messages into a concise summary
 2. Keeps recent messages intact for natural flow
 3. Maintains conversation continuity without hitting token limits
+
+Rolling summaries are persisted per thread in ChatMemoryStore together with
+the id of the last turn they cover. ``refresh_thread_summary`` folds only the
+turns added since then into the stored summary; the gateway schedules it as a
+background task after the response has been sent, and requests that overflow
+the context use the stored summary (``compact_with_summary``) instead of
+calling the LLM inline.
 """
 
 from __future__ import annotations
 
+import asyncio
 import logging
 from typing import List, Dict, Any, Optional, Tuple
 
-logger = logging.getLogger(__name__)
+from .token_budget import MESSAGE_OVERHEAD_TOKENS, get_token_counter
 
+logger = logging.getLogger(__name__)
 
-# Token estimation: ~4 chars per token (rough approximation)
-CHARS_PER_TOKEN = 4
 
 # Context management thresholds
 DEFAULT_MAX_CONTEXT = 8192  # Model's max context window
 SUMMARIZATION_TRIGGER = 0.70  # Summarize when 70% full
 KEEP_RECENT_MESSAGES = 10  # Always keep last N messages unsummarized
+SUMMARY_BATCH_TURNS = 6  # Fold older turns into the rolling summary in batches of at least N
+SUMMARY_MAX_BATCH_TURNS = 24  # ...and at most N turns per LLM call
+SUMMARY_MAX_BATCHES = 4  # LLM calls per refresh; a long backlog catches up over later refreshes
+SUMMARY_TURN_MAX_CHARS = 1500  # Longer turns are truncated in the summary prompt
 
 
 def estimate_tokens(text: str) -> int:
-    """Estimate token count from text.
+    """Count tokens in text with the model tokenizer.
+    
+    Falls back to ~4 chars per token when no tokenizer is available.
     
     Args:
         text: Text to estimate
     
     Returns:
-        Estimated token count
+        Token count
     """
-    return len(text) // CHARS_PER_TOKEN
+    return get_token_counter().count(text)
 
 
 def estimate_messages_tokens(messages: List[Dict[str, Any]]) -> int:
@@ -47,8 +60,7 @@ def estimate_messages_tokens(messages: List[Dict[str, Any]]) -> int:
     total = 0
     for msg in messages:
         content = msg.get("content", "")
-        role = msg.get("role", "")
-        total += estimate_tokens(content) + estimate_tokens(role) + 4  # +4 for formatting
+        total += estimate_tokens(content) + MESSAGE_OVERHEAD_TOKENS  # role header and separators
     return total
 
 
@@ -202,3 +214,153 @@ Summarized {message_count} earlier messages to manage context:
 {summary}
 
 _(Continuing conversation with recent messages...)_"""
+
+
+def create_incremental_summary_prompt(previous_summary: str, messages: List[Dict[str, Any]]) -> str:
+    """Create a prompt that folds new messages into an existing summary.
+    
+    Args:
+        previous_summary: Current rolling summary (may be empty)
+        messages: Messages added since the summary was written
+    
+    Returns:
+        Prompt for LLM to update the summary
+    """
+    if not previous_summary:
+        return create_summary_prompt(messages)
+    
+    conversation_text = "\n\n".join(
+        f"{msg.get('role', 'unknown').upper()}: {msg.get('content', '')}" for msg in messages
+    )
+    return f"""Update this conversation summary with the new messages below. Keep key facts, decisions, and context from both; drop details that no longer matter.
+
+Current summary:
+{previous_summary}
+
+New messages:
+{conversation_text}
+
+Updated summary (2-6 sentences):"""
+
+
+def _truncate_turn(content: str, max_chars: int = SUMMARY_TURN_MAX_CHARS) -> str:
+    if len(content) <= max_chars:
+        return content
+    return content[:max_chars].rstrip() + " …[truncated]"
+
+
+async def refresh_thread_summary(
+    memory_store,
+    thread_id: str,
+    llm_client,
+    keep_recent: int = KEEP_RECENT_MESSAGES,
+    min_new_turns: int = SUMMARY_BATCH_TURNS,
+    max_batch_turns: int = SUMMARY_MAX_BATCH_TURNS,
+    max_batches: int = SUMMARY_MAX_BATCHES,
+) -> Optional[str]:
+    """Fold turns older than the recent window into the thread's stored summary.
+    
+    Only turns newer than the summary's ``last_turn_id`` are sent to the LLM,
+    and only once at least ``min_new_turns`` of them have left the window.
+    A long backlog (e.g. a thread that predates summaries) is folded in
+    batches of at most ``max_batch_turns`` turns, ``max_batches`` LLM calls
+    per refresh, with each turn truncated, so no prompt grows with the
+    thread's history.
+    
+    Args:
+        memory_store: ChatMemoryStore instance
+        thread_id: Thread identifier
+        llm_client: LLM client for generating the summary
+        keep_recent: Number of recent turns left out of the summary
+        min_new_turns: Minimum number of turns to fold in per update
+        max_batch_turns: Maximum number of turns per LLM call
+        max_batches: Maximum number of LLM calls per refresh
+    
+    Returns:
+        The new summary text, or None if nothing was updated
+    """
+    previous = await asyncio.to_thread(memory_store.get_thread_summary, thread_id)
+    summary_text = previous.summary if previous else ""
+    after_id = previous.last_turn_id if previous else 0
+    turn_count = previous.turn_count if previous else 0
+    updated: Optional[str] = None
+    
+    for _ in range(max(1, max_batches)):
+        # Fetching keep_recent extra turns tells us which ones have left the window
+        turns = await asyncio.to_thread(
+            memory_store.get_turns_after, thread_id, after_id, max_batch_turns + keep_recent
+        )
+        delta = (turns[:-keep_recent] if keep_recent else turns)[:max_batch_turns]
+        if len(delta) < min_new_turns:
+            break
+        
+        prompt = create_incremental_summary_prompt(
+            summary_text,
+            [{"role": turn.role, "content": _truncate_turn(turn.content)} for turn in delta],
+        )
+        response = await llm_client.chat_completion(
+            messages=[{"role": "user", "content": prompt}],
+            temperature=0.3,
+            max_tokens=400,
+            stream=False,
+        )
+        new_text = (response["choices"][0]["message"]["content"] or "").strip()
+        if not new_text:
+            break
+        
+        turn_count += len(delta)
+        stored = await asyncio.to_thread(
+            memory_store.upsert_thread_summary, thread_id, new_text, delta[-1].id, turn_count
+        )
+        if not stored:
+            break
+        summary_text, after_id, updated = new_text, delta[-1].id, new_text
+        logger.info(
+            f"Updated summary for thread {thread_id}: +{len(delta)} turns ({turn_count} total)"
+        )
+    return updated
+
+
+_refreshing: set[str] = set()
+
+
+async def refresh_thread_summary_in_background(memory_store, thread_id: str, llm_client) -> None:
+    """Background-task wrapper: one refresh per thread at a time, errors logged."""
+    if thread_id in _refreshing:
+        return
+    _refreshing.add(thread_id)
+    try:
+        await refresh_thread_summary(memory_store, thread_id, llm_client)
+    except Exception as e:
+        logger.warning(f"Thread summary refresh failed for {thread_id}: {e}")
+    finally:
+        _refreshing.discard(thread_id)
+
+
+def compact_with_summary(
+    messages: List[Dict[str, Any]],
+    summary_text: str,
+    keep_recent: int = KEEP_RECENT_MESSAGES,
+) -> List[Dict[str, Any]]:
+    """Replace older messages with a stored summary, without an LLM call.
+    
+    Args:
+        messages: Full conversation history
+        summary_text: Stored rolling summary (may be empty: older messages are dropped)
+        keep_recent: Number of recent messages to keep
+    
+    Returns:
+        System messages, the summary (if any) and the recent messages
+    """
+    if len(messages) <= keep_recent:
+        return messages
+    
+    older, recent = messages[:-keep_recent], messages[-keep_recent:]
+    new_messages = [m for m in older if m.get("role") == "system"]
+    if summary_text:
+        new_messages.append({
+            "role": "system",
+            "content": f"**Previous Conversation Summary:**\n{summary_text}"
+        })
+    new_messages.extend(recent)
+    return new_messages
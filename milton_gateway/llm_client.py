@@ -6,6 +6,8 @@ from typing import AsyncIterator
 
 import httpx
 
+from milton_orchestrator.llm_transport import get_llm_transport
+
 logger = logging.getLogger(__name__)
 
 
@@ -35,7 +37,7 @@ class LLMClient:
             or os.getenv("OLLAMA_API_KEY")
         )
         self.timeout = timeout
-        self._client: httpx.AsyncClient | None = None
+        self.transport = get_llm_transport()
 
     @property
     def headers(self) -> dict[str, str]:
@@ -46,16 +48,12 @@ class LLMClient:
         return headers
 
     async def get_client(self) -> httpx.AsyncClient:
-        """Get or create async HTTP client."""
-        if self._client is None or self._client.is_closed:
-            self._client = httpx.AsyncClient(timeout=self.timeout)
-        return self._client
+        """Shared async HTTP client (keep-alive pool of the LLM transport)."""
+        return self.transport.async_client()
 
     async def close(self):
         """Close the HTTP client."""
-        if self._client is not None:
-            await self._client.aclose()
-            self._client = None
+        await self.transport.aclose()
 
     async def chat_completion(
         self,
@@ -101,12 +99,13 @@ class LLMClient:
 
     async def _blocking_response(self, endpoint: str, payload: dict) -> dict:
         """Make a non-streaming request."""
-        client = await self.get_client()
         logger.debug(f"Making request to {endpoint}")
-        response = await client.post(
+        response = await self.transport.apost(
             endpoint,
-            json=payload,
+            payload,
             headers=self.headers,
+            timeout=self.timeout,
+            caller="gateway",
         )
         if not response.is_success:
             error_text = response.text
@@ -122,14 +121,14 @@ class LLMClient:
         self, endpoint: str, payload: dict
     ) -> AsyncIterator[str]:
         """Stream SSE response from the LLM."""
-        client = await self.get_client()
         logger.debug(f"Starting streaming request to {endpoint}")
 
-        async with client.stream(
-            "POST",
+        async with self.transport.astream(
             endpoint,
-            json=payload,
+            payload,
             headers=self.headers,
+            timeout=self.timeout,
+            caller="gateway",
         ) as response:
             if not response.is_success:
                 error_text = await response.aread()
@@ -0,0 +1,245 @@
+"""Prefix-cache-friendly prompt layout for chat completions.
+
+vLLM's automatic prefix caching reuses the KV cache of the longest prompt
+prefix it has already seen, so anything that changes per query must come
+after everything that does not. The legacy layout appends semantic memory,
+KG context and the truth-gate block into the system prompt next to the
+static instructions, which invalidates the cache from the first differing
+byte on every turn.
+
+The ``prefix_cache`` layout orders segments from most to least stable:
+
+1. the static system prompt, stored facts and thread summary (one system
+   message),
+2. the stored turns not yet covered by the summary, one message each, then
+   the client's messages,
+3. per-query facts, retrieval and the truth gate (a system message placed
+   right before the final user message).
+
+Stable segments are rendered without per-turn counters or timestamps so
+they are byte-identical across turns. Stored turns are separate messages
+rather than a block inside the system message: the window starts at the
+summary's last turn, so between summary refreshes a new turn only appends
+messages and the prefix before it is unchanged.
+
+Configuration:
+    MILTON_GATEWAY_PROMPT_LAYOUT: "legacy" (default) or "prefix_cache"
+"""
+
+from __future__ import annotations
+
+import logging
+import math
+import os
+import re
+import threading
+import time
+from typing import Any, Optional
+
+import httpx
+
+logger = logging.getLogger(__name__)
+
+LAYOUT_LEGACY = "legacy"
+LAYOUT_PREFIX_CACHE = "prefix_cache"
+
+QUERY_CONTEXT_HEADER = "## CONTEXT FOR THIS MESSAGE"
+
+
+def prompt_layout() -> str:
+    """Configured prompt layout (unknown values fall back to legacy)."""
+    layout = os.getenv("MILTON_GATEWAY_PROMPT_LAYOUT", LAYOUT_LEGACY).strip().lower()
+    if layout not in (LAYOUT_LEGACY, LAYOUT_PREFIX_CACHE):
+        logger.warning(f"Unknown MILTON_GATEWAY_PROMPT_LAYOUT={layout!r}; using {LAYOUT_LEGACY}")
+        return LAYOUT_LEGACY
+    return layout
+
+
+def format_fact_line(fact) -> str:
+    """Prompt line for one stored fact."""
+    return f"- **{fact.key}**: {fact.value}"
+
+
+def format_stable_context(system_prompt: str, facts: list, facts_block: Optional[str] = None) -> str:
+    """Static system prompt plus stored facts, sorted by key.
+
+    ``facts_block`` is a pre-rendered version of the fact lines (already in
+    key order), e.g. from the gateway's context cache.
+    """
+    if not facts:
+        return system_prompt
+    if facts_block is None:
+        facts_block = "\n".join(format_fact_line(f) for f in sorted(facts, key=lambda f: f.key))
+    return "\n".join([system_prompt, "", "---", "", "## STORED FACTS (via /remember)", facts_block])
+
+
+def format_turn_messages(turns: list) -> list[dict]:
+    """Stored turns, oldest first, as chat messages (content capped at 200 chars)."""
+    return [
+        {
+            "role": turn.role,
+            "content": turn.content if len(turn.content) <= 200 else turn.content[:200] + "...",
+        }
+        for turn in turns
+    ]
+
+
+def format_query_facts(facts: list, facts_block: Optional[str] = None) -> str:
+    """Stored facts selected for this query (outside the stable segment)."""
+    if not facts:
+        return ""
+    if facts_block is None:
+        facts_block = "\n".join(format_fact_line(f) for f in facts)
+    return f"### Stored facts relevant to this message:\n{facts_block}"
+
+
+def format_query_context(
+    memory_context: str = "", kg_context: str = "", action_status: str = "", facts_context: str = ""
+) -> str:
+    """Per-query facts, retrieval and truth-gate status; empty if there is none."""
+    sections = [
+        s.strip() for s in (facts_context, memory_context, kg_context, action_status) if s and s.strip()
+    ]
+    if not sections:
+        return ""
+    return "\n\n".join([QUERY_CONTEXT_HEADER, *sections])
+
+
+def build_prefix_cached_messages(
+    messages: list[dict],
+    system_prompt: str,
+    facts: list,
+    turns: list,
+    summary: str = "",
+    facts_block: Optional[str] = None,
+) -> list[dict]:
+    """Stable system message, stored turns, then the client's messages.
+
+    The thread's rolling summary follows the facts in the system message; it
+    only changes when the background refresh folds in another batch, which
+    is also when the start of ``turns`` moves.
+
+    The per-query context is added separately with ``insert_query_context``
+    once the conversation has been summarized (if needed), so that it never
+    ends up duplicated or folded into a summary.
+    """
+    stable = format_stable_context(system_prompt, facts, facts_block)
+    if summary:
+        stable = f"{stable}\n\n---\n\n## EARLIER CONVERSATION SUMMARY\n{summary}"
+    return [{"role": "system", "content": stable}, *format_turn_messages(turns), *messages]
+
+
+def insert_query_context(messages: list[dict], query_context: str) -> list[dict]:
+    """Insert ``query_context`` as a system message before the final user message."""
+    if not query_context:
+        return messages
+    index = len(messages)
+    if messages and messages[-1].get("role") == "user":
+        index -= 1
+    return [*messages[:index], {"role": "system", "content": query_context}, *messages[index:]]
+
+
+# ---------------------------------------------------------------------------
+# Prefix-cache hit rate from vLLM's Prometheus metrics
+# ---------------------------------------------------------------------------
+
+# Counter names differ between vLLM releases; the first pair present wins.
+_COUNTER_PAIRS = (
+    ("vllm:prefix_cache_queries_total", "vllm:prefix_cache_hits_total"),
+    ("vllm:gpu_prefix_cache_queries_total", "vllm:gpu_prefix_cache_hits_total"),
+)
+# Older (V0) engines only export a hit-rate gauge
+_HIT_RATE_GAUGE = "vllm:gpu_prefix_cache_hit_rate"
+
+_METRIC_LINE = re.compile(r"^([a-zA-Z_:][a-zA-Z0-9_:]*)(\{[^}]*\})?\s+(\S+)")
+
+
+def parse_prometheus_metrics(text: str) -> dict[str, float]:
+    """Sum every sample of each metric across its label sets."""
+    totals: dict[str, float] = {}
+    for line in text.splitlines():
+        if not line or line.startswith("#"):
+            continue
+        match = _METRIC_LINE.match(line)
+        if not match:
+            continue
+        try:
+            value = float(match.group(3))
+        except ValueError:
+            continue
+        if math.isnan(value):
+            continue
+        totals[match.group(1)] = totals.get(match.group(1), 0.0) + value
+    return totals
+
+
+def prefix_cache_counters(metrics: dict[str, float]) -> Optional[dict[str, float]]:
+    """Cumulative prefix-cache queries/hits (tokens), or a V0 hit-rate gauge."""
+    for queries_name, hits_name in _COUNTER_PAIRS:
+        if queries_name in metrics and hits_name in metrics:
+            return {"queries": metrics[queries_name], "hits": metrics[hits_name]}
+    if _HIT_RATE_GAUGE in metrics:
+        return {"hit_rate": metrics[_HIT_RATE_GAUGE]}
+    return None
+
+
+class PrefixCacheMonitor:
+    """Scrapes vLLM ``/metrics`` and reports lifetime and since-last-scrape hit rates."""
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self._last: Optional[dict[str, float]] = None
+        self._last_at: Optional[float] = None
+
+    def record(self, counters: dict[str, float]) -> dict[str, Any]:
+        """Hit rates for a new sample of cumulative counters."""
+        if "hit_rate" in counters:
+            return {"hit_rate": counters["hit_rate"], "source": "gauge"}
+
+        queries, hits = counters["queries"], counters["hits"]
+        stats: dict[str, Any] = {
+            "source": "counters",
+            "queries_tokens": int(queries),
+            "hit_tokens": int(hits),
+            "hit_rate": (hits / queries) if queries else None,
+            "window": None,
+        }
+        now = time.time()
+        with self._lock:
+            last, last_at = self._last, self._last_at
+            self._last, self._last_at = dict(counters), now
+        # Counters reset when vLLM restarts; skip the window in that case
+        if last is not None and queries >= last["queries"]:
+            window_queries = queries - last["queries"]
+            window_hits = hits - last["hits"]
+            stats["window"] = {
+                "seconds": round(now - last_at, 1),
+                "queries_tokens": int(window_queries),
+                "hit_tokens": int(window_hits),
+                "hit_rate": (window_hits / window_queries) if window_queries else None,
+            }
+        return stats
+
+    async def scrape(self, client: httpx.AsyncClient, base_url: str, headers: Optional[dict] = None) -> dict[str, Any]:
+        """Fetch ``{base_url}/metrics`` and return prefix-cache stats."""
+        try:
+            response = await client.get(f"{base_url}/metrics", headers=headers, timeout=5.0)
+            response.raise_for_status()
+        except Exception as e:
+            logger.warning(f"Prefix-cache metrics scrape failed: {e}")
+            return {"available": False, "error": str(e)}
+
+        counters = prefix_cache_counters(parse_prometheus_metrics(response.text))
+        if counters is None:
+            return {
+                "available": False,
+                "error": "no prefix-cache metrics (is --enable-prefix-caching set?)",
+            }
+        return {"available": True, **self.record(counters)}
+
+
+_monitor = PrefixCacheMonitor()
+
+
+def get_prefix_cache_monitor() -> PrefixCacheMonitor:
+    return _monitor
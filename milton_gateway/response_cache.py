@@ -0,0 +1,309 @@
+"""Opt-in semantic response cache for repeat chat queries.
+
+Phone shortcuts and the morning scripts send the same few questions over and
+over ("what's on my schedule", "summarize my goals"). With the cache enabled
+the gateway answers a repeat from memory instead of running a full
+generation.
+
+Entries are grouped by the system-prompt hash and a fingerprint of the
+stable part of the prompt (stored facts, thread summary and history). The
+per-query block (retrieved memory, KG context, query-selected facts) is
+left out: near-duplicate queries usually retrieve different memories, and
+hashing it would put them in different groups. Instead the whole cache is
+dropped when facts or memories are written in this process; writes by
+other processes are bounded by the entry TTL. Within a group a query
+matches either exactly (after normalizing case, punctuation and
+whitespace) or by embedding similarity above a threshold; the query is
+only embedded after an exact lookup misses. Each entry's lifetime comes from the intent category
+``prompting.classifier`` assigns to the query; categories with a TTL of 0
+(reminders, timers) are never cached. The cache is a bounded LRU.
+
+Configuration:
+    MILTON_GATEWAY_RESPONSE_CACHE: enable the cache (default 0)
+    MILTON_GATEWAY_RESPONSE_CACHE_MAX_ENTRIES: LRU size (default 512)
+    MILTON_GATEWAY_RESPONSE_CACHE_SIMILARITY: cosine threshold for near-duplicate
+        hits (default 0.92; 1 or more disables similarity lookup)
+    MILTON_GATEWAY_RESPONSE_CACHE_TTL_<CATEGORY>_S: per-category TTL override,
+        e.g. MILTON_GATEWAY_RESPONSE_CACHE_TTL_SIMPLE_QUERY_S=120
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import logging
+import math
+import re
+import threading
+import time
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import Any, Awaitable, Callable, Optional
+
+from milton_orchestrator.env import env_flag, env_float, env_int
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_MAX_ENTRIES = 512
+DEFAULT_SIMILARITY_THRESHOLD = 0.92
+DEFAULT_TTL_SECONDS = 600.0
+
+RESPONSE_CACHE_HEADER = "X-Milton-Response-Cache"
+
+# Seconds a cached answer stays valid, by prompting.classifier category
+CATEGORY_TTL_SECONDS: dict[str, float] = {
+    "reminder": 0.0,
+    "timer": 0.0,
+    "simple_query": 300.0,  # time/date/weather questions go stale quickly
+    "planning": 900.0,
+    "summarization": 900.0,
+    "greeting": 3600.0,
+    "acknowledgment": 3600.0,
+    "explanation": 86400.0,
+    "comparison": 86400.0,
+}
+
+Embedder = Callable[[str], Awaitable[Any]]
+
+_PUNCTUATION = re.compile(r"[^\w\s]")
+_WHITESPACE = re.compile(r"\s+")
+
+
+def response_cache_enabled() -> bool:
+    return env_flag("MILTON_GATEWAY_RESPONSE_CACHE")
+
+
+def category_ttl(category: str) -> float:
+    """TTL in seconds for an intent category (0 = never cache)."""
+    default = CATEGORY_TTL_SECONDS.get(category, DEFAULT_TTL_SECONDS)
+    return env_float(f"MILTON_GATEWAY_RESPONSE_CACHE_TTL_{category.upper()}_S", default)
+
+
+def normalize_query(text: str) -> str:
+    """Lowercase, drop punctuation (so "what's" == "whats") and collapse whitespace."""
+    text = _PUNCTUATION.sub("", text.lower())
+    return _WHITESPACE.sub(" ", text).strip()
+
+
+def context_fingerprint(messages: list[dict]) -> str:
+    """Hash of the stable prompt context (everything but the final user message)."""
+    context = messages[:-1] if messages and messages[-1].get("role") == "user" else messages
+    payload = json.dumps(
+        [(m.get("role"), m.get("content")) for m in context], ensure_ascii=False
+    )
+    return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+
+@dataclass(frozen=True)
+class CacheKey:
+    group: str  # system-prompt hash + context fingerprint
+    query: str  # normalized user text
+    category: str
+    ttl: float
+
+    @property
+    def cacheable(self) -> bool:
+        return self.ttl > 0 and bool(self.query)
+
+
+@dataclass
+class _Entry:
+    key: CacheKey
+    content: str
+    embedding: Optional[tuple[float, ...]]  # unit length
+    expires_at: float
+    hits: int = 0
+
+
+@dataclass
+class CacheHit:
+    content: str
+    match: str  # "exact" | "similar"
+    similarity: float = 1.0
+
+
+async def _default_embedder(text: str) -> Any:
+    from memory import embeddings
+    from memory.embedding_service import get_embedding_service
+
+    if not embeddings.is_available():
+        return None
+    return await get_embedding_service().aembed(text)
+
+
+def _unit(vector: Any) -> Optional[tuple[float, ...]]:
+    """``vector`` scaled to unit length (None for missing or zero vectors)."""
+    if vector is None:
+        return None
+    values = tuple(float(x) for x in vector)
+    norm = math.sqrt(sum(x * x for x in values))
+    return tuple(x / norm for x in values) if norm else None
+
+
+def _cosine(a: tuple[float, ...], b: tuple[float, ...]) -> float:
+    return sum(x * y for x, y in zip(a, b))
+
+
+class ResponseCache:
+    """Bounded LRU of chat answers with exact and similarity lookup."""
+
+    def __init__(
+        self,
+        max_entries: Optional[int] = None,
+        similarity_threshold: Optional[float] = None,
+        embedder: Optional[Embedder] = None,
+        classify: Optional[Callable[[str], str]] = None,
+    ) -> None:
+        self.max_entries = int(
+            max_entries
+            if max_entries is not None
+            else env_int("MILTON_GATEWAY_RESPONSE_CACHE_MAX_ENTRIES", DEFAULT_MAX_ENTRIES)
+        )
+        self.similarity_threshold = (
+            similarity_threshold
+            if similarity_threshold is not None
+            else env_float("MILTON_GATEWAY_RESPONSE_CACHE_SIMILARITY", DEFAULT_SIMILARITY_THRESHOLD)
+        )
+        self._embedder = embedder or _default_embedder
+        self._classify = classify
+        self._entries: OrderedDict[tuple[str, str], _Entry] = OrderedDict()
+        self._lock = threading.Lock()
+        self._stats = {"exact_hits": 0, "similar_hits": 0, "misses": 0, "stores": 0, "invalidations": 0}
+
+    @property
+    def similarity_enabled(self) -> bool:
+        return self.similarity_threshold < 1.0
+
+    def _category(self, user_text: str) -> str:
+        if self._classify is not None:
+            return self._classify(user_text)
+        from prompting.classifier import classify_prompt
+
+        return classify_prompt(user_text).category
+
+    def make_key(self, system_prompt_hash: str, messages: list[dict], user_text: str) -> CacheKey:
+        category = self._category(user_text)
+        group = hashlib.sha256(
+            f"{system_prompt_hash}:{context_fingerprint(messages)}".encode("utf-8")
+        ).hexdigest()
+        return CacheKey(
+            group=group,
+            query=normalize_query(user_text),
+            category=category,
+            ttl=category_ttl(category),
+        )
+
+    async def embed(self, user_text: str) -> Any:
+        """Query embedding for similarity lookup (None if disabled or unavailable)."""
+        if not self.similarity_enabled:
+            return None
+        try:
+            return await self._embedder(user_text)
+        except Exception as e:
+            logger.debug(f"Response cache embedding failed: {e}")
+            return None
+
+    def lookup_exact(self, key: CacheKey) -> Optional[CacheHit]:
+        """Exact (normalized) match only; a miss is not counted, so ``lookup`` can follow."""
+        if not key.cacheable:
+            return None
+        with self._lock:
+            entry = self._entries.get((key.group, key.query))
+            if entry is None or entry.expires_at <= time.time():
+                return None
+            self._entries.move_to_end((key.group, key.query))
+            entry.hits += 1
+            self._stats["exact_hits"] += 1
+            return CacheHit(content=entry.content, match="exact")
+
+    def lookup(self, key: CacheKey, embedding: Any = None) -> Optional[CacheHit]:
+        if not key.cacheable:
+            return None
+        hit = self.lookup_exact(key)
+        if hit is not None:
+            return hit
+        now = time.time()
+        embedding = _unit(embedding)
+        with self._lock:
+            best, best_score = None, self.similarity_threshold
+            if embedding is not None:
+                for (group, _), candidate in self._entries.items():
+                    if group != key.group or candidate.expires_at <= now:
+                        continue
+                    if candidate.embedding is None or candidate.key.category != key.category:
+                        continue
+                    score = _cosine(embedding, candidate.embedding)
+                    if score >= best_score:
+                        best, best_score = candidate, score
+            if best is not None:
+                self._entries.move_to_end((best.key.group, best.key.query))
+                best.hits += 1
+                self._stats["similar_hits"] += 1
+                return CacheHit(content=best.content, match="similar", similarity=best_score)
+            self._stats["misses"] += 1
+            return None
+
+    def store(self, key: CacheKey, content: str, embedding: Any = None) -> None:
+        if not key.cacheable or not content:
+            return
+        entry = _Entry(key=key, content=content, embedding=_unit(embedding), expires_at=time.time() + key.ttl)
+        with self._lock:
+            self._entries[(key.group, key.query)] = entry
+            self._entries.move_to_end((key.group, key.query))
+            self._stats["stores"] += 1
+            now = time.time()
+            for cache_key in [k for k, e in self._entries.items() if e.expires_at <= now]:
+                del self._entries[cache_key]
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+    def invalidate(self) -> None:
+        """Drop every entry (facts or memory changed)."""
+        with self._lock:
+            self._entries.clear()
+            self._stats["invalidations"] += 1
+
+    def on_memory_event(self, event: str, payload: Any) -> None:
+        """Fact or memory listener: cached answers may rest on stale context."""
+        if event in ("fact", "fact_deleted", "memory"):
+            self.invalidate()
+
+    def stats(self) -> dict[str, Any]:
+        with self._lock:
+            return {
+                **self._stats,
+                "entries": len(self._entries),
+                "max_entries": self.max_entries,
+                "similarity_threshold": self.similarity_threshold,
+            }
+
+
+def replay_chunks(content: str, max_chars: int = 24) -> list[str]:
+    """Split cached content into word-boundary deltas for SSE replay."""
+    chunks, current = [], ""
+    for piece in re.findall(r"\S+\s*|\s+", content):
+        if current and len(current) + len(piece) > max_chars:
+            chunks.append(current)
+            current = ""
+        current += piece
+    if current:
+        chunks.append(current)
+    return chunks
+
+
+_cache: Optional[ResponseCache] = None
+_cache_lock = threading.Lock()
+
+
+def get_response_cache() -> ResponseCache:
+    global _cache
+    with _cache_lock:
+        if _cache is None:
+            _cache = ResponseCache()
+        return _cache
+
+
+def response_cache_stats() -> Optional[dict[str, Any]]:
+    with _cache_lock:
+        cache = _cache
+    return cache.stats() if cache is not None else None
@@ -1,5 +1,6 @@
 """Milton Chat Gateway - OpenAI-compatible FastAPI server for Open WebUI integration."""
 
+import asyncio
 import json
 import logging
 import os
@@ -9,7 +10,7 @@ import uuid
 from datetime import datetime, timezone
 from contextlib import asynccontextmanager
 from pathlib import Path
-from typing import Any, AsyncIterator, Dict, Mapping, Optional
+from typing import Any, AsyncIterator, Callable, Dict, Mapping, Optional
 
 from dotenv import load_dotenv
 
@@ -18,13 +19,46 @@ ROOT_DIR = Path(__file__).resolve().parents[1]
 load_dotenv(dotenv_path=ROOT_DIR / ".env")
 
 import httpx
-from fastapi import FastAPI, HTTPException, Request, Response
+from fastapi import BackgroundTasks, FastAPI, HTTPException, Request, Response
 from fastapi.middleware.cors import CORSMiddleware
 from fastapi.responses import JSONResponse, StreamingResponse
 
+from agents.prompt_registry import RenderedPrompt, get_prompt_registry
 from .llm_client import LLMClient
 from milton_orchestrator.state_paths import resolve_state_dir
+from storage.chat_memory import ThreadSummary
 from .command_processor import CommandProcessor, CommandResult
+from .context_assembly import ContextSource, assemble_context, shutdown_context_executor
+from .context_cache import ThreadContextCache
+from .conversation_summarizer import SUMMARY_BATCH_TURNS
+from .token_budget import (
+    SAFETY_MARGIN_TOKENS,
+    allocate_budget,
+    fit_items,
+    get_model_limits,
+    get_token_counter,
+    warm_token_counter,
+)
+from .prompt_layout import (
+    LAYOUT_PREFIX_CACHE,
+    build_prefix_cached_messages,
+    format_fact_line,
+    format_query_context,
+    format_query_facts,
+    format_turn_messages,
+    get_prefix_cache_monitor,
+    insert_query_context,
+    prompt_layout,
+)
+from .response_cache import (
+    RESPONSE_CACHE_HEADER,
+    CacheKey,
+    ResponseCache,
+    get_response_cache,
+    replay_chunks,
+    response_cache_enabled,
+    response_cache_stats,
+)
 from .models import (
     AddMemoryRequest,
     AddSnapshotRequest,
@@ -69,6 +103,10 @@ _THREAD_ID_HEADER_KEYS = (
 
 _ACTION_INTERNAL_TAG = "[[MILTON_INTERNAL]]"
 
+_SHARED_CONTEXT_PATH = ROOT_DIR / "Prompts" / "SHARED_CONTEXT.md"
+
+_HISTORY_MAX_TURNS = 10
+
 
 # Configuration from environment
 def get_config() -> dict:
@@ -136,8 +174,28 @@ Give ONE clear, complete response and then wait for user input.
 When in doubt, be honest about limitations rather than pretending to do something you cannot."""
 
 
+def get_system_prompt() -> RenderedPrompt:
+    """System prompt from the shared prompt registry, with its content hash.
+
+    The prompt file is read once and re-read only when it changes on disk.
+    """
+    prompt_path = os.getenv("MILTON_CHAT_SYSTEM_PROMPT") or ""
+    sources = [Path(prompt_path)] if prompt_path else []
+    sources.append(_SHARED_CONTEXT_PATH)
+    return get_prompt_registry().get(
+        f"gateway:{prompt_path}",
+        sources,
+        lambda: _render_system_prompt(prompt_path),
+    )
+
+
 def load_system_prompt() -> str:
-    """Load system prompt from file or use default.
+    """Load system prompt from file or use default (cached, see get_system_prompt)."""
+    return get_system_prompt().text
+
+
+def _render_system_prompt(prompt_path: str) -> str:
+    """Read the system prompt from file or use default.
     
     Priority:
     1. MILTON_CHAT_SYSTEM_PROMPT env var (file path)
@@ -145,22 +203,21 @@ def load_system_prompt() -> str:
     3. Hardcoded MILTON_SYSTEM_PROMPT
     """
     # Check env var first
-    prompt_path = os.getenv("MILTON_CHAT_SYSTEM_PROMPT")
     if prompt_path and os.path.exists(prompt_path):
         try:
             with open(prompt_path) as f:
-                logger.info(f"Loaded system prompt from {prompt_path}")
+                logger.debug(f"Reading system prompt from {prompt_path}")
                 return f.read().strip()
         except Exception as e:
             logger.warning(f"Failed to load system prompt from {prompt_path}: {e}")
     
     # Try SHARED_CONTEXT.md
-    shared_context_path = os.path.join(os.path.dirname(__file__), "..", "Prompts", "SHARED_CONTEXT.md")
+    shared_context_path = str(_SHARED_CONTEXT_PATH)
     if os.path.exists(shared_context_path):
         try:
             with open(shared_context_path) as f:
                 content = f.read().strip()
-                logger.info(f"Loaded SHARED_CONTEXT.md from {shared_context_path}")
+                logger.debug(f"Reading SHARED_CONTEXT.md from {shared_context_path}")
                 # Add chat-specific instructions
                 return f"""{content}
 
@@ -205,6 +262,9 @@ execute arbitrary code, or access services beyond the Milton API."""
 _llm_client: LLMClient | None = None
 _command_processor: CommandProcessor | None = None
 _memory_store = None
+_context_cache: ThreadContextCache | None = None
+_response_cache_store = None  # memory store the response cache listens to
+_response_cache_memory_listener = False
 _declarative_memory_store = None
 _activity_snapshot_store = None
 
@@ -259,6 +319,31 @@ def get_memory_store():
     return _memory_store
 
 
+def get_context_cache() -> ThreadContextCache:
+    """Get or create the per-thread context cache over the chat memory store."""
+    global _context_cache
+    memory_store = get_memory_store()
+    if _context_cache is None or _context_cache.store is not memory_store:
+        _context_cache = ThreadContextCache(memory_store)
+    return _context_cache
+
+
+def get_gateway_response_cache() -> ResponseCache:
+    """Get the response cache, invalidated by fact and memory writes."""
+    global _response_cache_store, _response_cache_memory_listener
+    response_cache = get_response_cache()
+    memory_store = get_memory_store()
+    if _response_cache_store is not memory_store:
+        memory_store.add_listener(response_cache.on_memory_event)
+        _response_cache_store = memory_store
+    if not _response_cache_memory_listener:
+        from memory.store import add_memory_listener
+
+        add_memory_listener(response_cache.on_memory_event)
+        _response_cache_memory_listener = True
+    return response_cache
+
+
 def get_llm_client() -> LLMClient:
     """Get or create the LLM client."""
     global _llm_client
@@ -311,6 +396,14 @@ async def lifespan(app: FastAPI):
     logger.info(f"Gateway config: host={config['host']}, port={config['port']}")
     logger.info(f"LLM backend: {config['llm_api_url']}, model={config['llm_model']}")
     logger.info(f"Milton API: {config['milton_api_url']}")
+    from memory.backends import enable_shared_backend
+    enable_shared_backend()
+    from memory.store import get_enrichment_queue
+    try:
+        get_enrichment_queue().start()  # Resume enrichment left over from a previous run
+    except Exception as exc:
+        logger.warning(f"KG enrichment queue unavailable: {exc}")
+    await warm_token_counter()  # keep tokenizer loading off the request path
     yield
     # Cleanup
     global _llm_client, _command_processor, _memory_store, _declarative_memory_store, _activity_snapshot_store
@@ -324,6 +417,15 @@ async def lifespan(app: FastAPI):
         _declarative_memory_store.close()
     if _activity_snapshot_store is not None:
         _activity_snapshot_store.close()
+    enable_shared_backend(False)
+    shutdown_context_executor()
+    from milton_gateway.action_executor import shutdown_action_executor
+    shutdown_action_executor()
+    from memory.embedding_service import shutdown_embedding_service
+    shutdown_embedding_service()
+    from memory.store import enrichment_queue_stats
+    if enrichment_queue_stats() is not None:
+        get_enrichment_queue().stop()
     logger.info("Milton Chat Gateway shut down.")
 
 
@@ -379,10 +481,18 @@ async def health_check():
     """Health check endpoint."""
     llm_client = get_llm_client()
     llm_healthy = await llm_client.check_health()
+    from milton_gateway.action_executor import action_executor_stats
+    from milton_orchestrator.llm_transport import get_llm_transport
+
     return {
         "status": "healthy" if llm_healthy else "degraded",
         "llm_backend": llm_healthy,
         "gateway": True,
+        "action_executor": action_executor_stats(),
+        "prompts": get_prompt_registry().stats(),
+        "context_cache": _context_cache.stats() if _context_cache is not None else None,
+        "response_cache": response_cache_stats(),
+        "llm_transport": get_llm_transport().stats(),
     }
 
 
@@ -394,7 +504,9 @@ async def memory_status():
     Returns memory backend mode, availability, degradation state,
     and last retrieval statistics.
     """
+    from memory.embedding_service import embedding_service_stats
     from memory.status import get_memory_status
+    from memory.store import enrichment_queue_stats
 
     status = get_memory_status()
 
@@ -404,6 +516,9 @@ async def memory_status():
         "degraded": status.degraded,
         "detail": status.detail,
         "warnings": status.warnings,
+        "backend_pool": status.backend_pool,
+        "embedding_service": embedding_service_stats(),
+        "kg_enrichment": enrichment_queue_stats(),
     }
 
     if status.last_retrieval:
@@ -420,6 +535,22 @@ async def memory_status():
     return response
 
 
+@app.get("/llm/prefix-cache")
+async def prefix_cache_status():
+    """
+    vLLM prefix-cache hit rate, scraped from the backend's /metrics.
+
+    Reports the lifetime hit rate and the hit rate since the previous call,
+    plus the active prompt layout.
+    """
+    llm_client = get_llm_client()
+    client = await llm_client.get_client()
+    stats = await get_prefix_cache_monitor().scrape(
+        client, llm_client.base_url, headers=llm_client.headers
+    )
+    return {"prompt_layout": prompt_layout(), **stats}
+
+
 @app.get("/v1/models")
 async def list_models() -> ModelsResponse:
     """List available models (OpenAI-compatible)."""
@@ -438,6 +569,7 @@ async def chat_completions(
     chat_request: ChatCompletionRequest,
     raw_request: Request,
     response: Response,
+    background_tasks: BackgroundTasks,
 ):
     """
     Chat completions endpoint (OpenAI-compatible).
@@ -522,9 +654,11 @@ async def chat_completions(
 
         if not skip_planning:
             from milton_gateway.action_planner import extract_action_plan, should_use_llm_fallback
-            from milton_gateway.action_executor import execute_action_plan
+            from milton_gateway.action_executor import execute_action_plan_async
 
-            plan = extract_action_plan(
+            # Rule-based but synchronous; keep it off the event loop
+            plan = await asyncio.to_thread(
+                extract_action_plan,
                 user_message,
                 datetime.now(timezone.utc).isoformat(),
                 "America/Chicago",
@@ -594,7 +728,7 @@ async def chat_completions(
                                       f"confidence={fallback_plan.get('confidence')}")
                             
                             # Execute the fallback plan
-                            exec_result = execute_action_plan(
+                            exec_result = await execute_action_plan_async(
                                 fallback_plan,
                                 {"timezone": "America/Chicago", "state_dir": str(resolve_state_dir())},
                             )
@@ -663,7 +797,7 @@ async def chat_completions(
             
             elif plan.get("action") != "NOOP":
                 # Execute the action
-                exec_result = execute_action_plan(
+                exec_result = await execute_action_plan_async(
                     plan,
                     {"timezone": "America/Chicago", "state_dir": str(resolve_state_dir())},
                 )
@@ -675,53 +809,125 @@ async def chat_completions(
 
     # Not a command - proceed with normal LLM flow
     # Inject system prompt if not already present
+    context_headers: dict[str, str] = {}
+    query_context = ""
+    thread_summary = None
+    # Use default max_tokens if not specified
+    max_tokens = chat_request.max_tokens or config["max_tokens_default"]
+    model_limits = await get_model_limits(llm_client)
+    token_counter = get_token_counter()  # tokenizer loaded at startup or by the limits refresh
+
     has_system = any(m["role"] == "system" for m in messages)
+    cache_context = list(messages)  # response-cache group: stable context only
     if not has_system:
         system_prompt = load_system_prompt()
 
         # Extract user query for memory retrieval
         user_query = messages[-1]["content"] if messages and messages[-1]["role"] == "user" else ""
 
-        # Load recent conversation history, memory facts, and semantic memory
-        try:
-            history_context = _build_history_context(memory_store, thread_id, user_query=user_query)
+        # Load recent conversation history, memory facts, semantic memory and
+        # KG context concurrently; sources that miss their deadline are skipped
+        context_cache = get_context_cache()
+        assembled = await assemble_context(_context_sources(context_cache, thread_id, user_query))
+        context_headers = assembled.headers()
+        recent_turns, thread_summary = assembled.get("history") or ([], None)
+        if not isinstance(thread_summary, ThreadSummary):
+            thread_summary = None
+        summary_text = thread_summary.summary if thread_summary else ""
+        stable_facts, query_facts = assembled.get("facts") or ([], [])
+        facts, turns, semantic_context, kg_context = _apply_context_budget(
+            token_counter,
+            model_limits.max_context,
+            system_prompt,
+            messages,
+            max_tokens,
+            stable_facts + query_facts,
+            _unsummarized_turns(recent_turns, thread_summary),
+            assembled.get("semantic") or "",
+            assembled.get("kg") or "",
+            summary_text=summary_text,
+        )
+        kept_keys = {fact.key for fact in facts}
+        facts = [fact for fact in stable_facts if fact.key in kept_keys]
+        query_facts = [fact for fact in query_facts if fact.key in kept_keys]
+        stable_block = "\n\n".join(filter(None, (context_cache.render_facts(facts), summary_text)))
+        cache_context = [
+            {"role": "system", "content": stable_block},
+            *format_turn_messages(turns),
+            *messages,
+        ]
+
+        if prompt_layout() == LAYOUT_PREFIX_CACHE:
+            # Stable segments first so vLLM can reuse the KV cache across
+            # turns; retrieval and the truth gate go last (after summarizing)
+            messages = build_prefix_cached_messages(
+                messages,
+                system_prompt,
+                facts,
+                turns,
+                summary=summary_text,
+                facts_block=context_cache.render_facts(facts),
+            )
+            query_context = format_query_context(
+                semantic_context,
+                kg_context,
+                _format_action_status(action_context) if action_context is not None else "",
+                facts_context=format_query_facts(query_facts, context_cache.render_facts(query_facts)),
+            )
+        else:
+            history_context = _format_history_context(
+                turns,
+                facts,
+                semantic_context,
+                summary=summary_text,
+                facts_block=context_cache.render_facts(facts),
+            )
             if history_context:
                 system_prompt = f"{system_prompt}\n\n{history_context}"
-        except Exception as e:
-            logger.warning(f"Failed to load conversation history: {e}")
-        
-        # TRUTH GATE: Inject action context if action was planned
+            if kg_context:
+                system_prompt = f"{system_prompt}\n\n{kg_context}"
+
+            # TRUTH GATE: Inject action context if action was planned
+            if action_context is not None:
+                system_prompt = _inject_action_context_into_prompt(system_prompt, action_context)
+
+            messages.insert(0, {"role": "system", "content": system_prompt})
         if action_context is not None:
-            system_prompt = _inject_action_context_into_prompt(system_prompt, action_context)
             logger.info(f"🛡️ Truth gate: Injected action context (executed={action_context.get('action_executed')})")
-
-        messages.insert(0, {"role": "system", "content": system_prompt})
         logger.debug("Injected Milton system prompt with conversation history")
     
-    # Check if conversation needs summarization
-    from .conversation_summarizer import should_summarize, summarize_conversation
+    # Check if conversation needs summarization. The rolling summary is
+    # refreshed in the background, so this never waits on an LLM call.
+    from .conversation_summarizer import (
+        compact_with_summary,
+        refresh_thread_summary_in_background,
+        should_summarize,
+    )
     
-    if should_summarize(messages, max_tokens=8192):
-        logger.info("Conversation approaching context limit, summarizing...")
-        try:
-            messages, summary = await summarize_conversation(messages, llm_client, keep_recent=10)
-            logger.info(f"Summarized conversation: {len(messages)} messages remain")
-        except Exception as e:
-            logger.error(f"Failed to summarize conversation: {e}")
-            # Continue with original messages
+    if should_summarize(messages, max_tokens=model_limits.max_context):
+        logger.info("Conversation approaching context limit, compacting with stored summary...")
+        summary_in_prompt = thread_summary is not None
+        if has_system:
+            try:
+                thread_summary = await asyncio.to_thread(memory_store.get_thread_summary, thread_id)
+            except Exception as e:
+                logger.warning(f"Failed to load thread summary: {e}")
+        stored_summary = thread_summary.summary if thread_summary and not summary_in_prompt else ""
+        messages = compact_with_summary(messages, stored_summary, keep_recent=10)
+        logger.info(f"Compacted conversation: {len(messages)} messages remain")
+    background_tasks.add_task(
+        refresh_thread_summary_in_background, memory_store, thread_id, llm_client
+    )
 
-    # Use default max_tokens if not specified
-    max_tokens = chat_request.max_tokens or config["max_tokens_default"]
-    
-    # Cap max_tokens to prevent context overflow
-    # Rough estimate: 1 token ≈ 4 chars, leave 20% buffer for model context (8192 for llama)
-    model_max_context = 8192
-    estimated_input_tokens = sum(len(msg.get("content", "")) for msg in messages) // 4
-    safe_max_tokens = min(max_tokens, model_max_context - estimated_input_tokens - 200)
+    messages = insert_query_context(messages, query_context)
+
+    # Cap max_tokens to the model's context window (tokenizer-accurate count)
+    input_tokens = token_counter.count_messages(messages)
+    safe_max_tokens = min(max_tokens, model_limits.max_context - input_tokens - SAFETY_MARGIN_TOKENS)
     
     if safe_max_tokens < 100:
         safe_max_tokens = 100  # Minimum reasonable response
-        logger.warning(f"Input very large ({estimated_input_tokens} tokens), capping output to {safe_max_tokens}")
+        logger.warning(f"Input very large ({input_tokens} tokens), capping output to {safe_max_tokens}")
     elif safe_max_tokens < max_tokens:
         logger.info(f"Reduced max_tokens from {max_tokens} to {safe_max_tokens} to fit context window")
     
@@ -732,6 +938,55 @@ async def chat_completions(
         f"stream={chat_request.stream}, max_tokens={max_tokens}"
     )
 
+    # Response cache: only plain chat turns (no planned or executed action)
+    cache_store = None
+    if (
+        response_cache_enabled()
+        and action_context is None
+        and not skip_auto_store
+        and messages
+        and messages[-1]["role"] == "user"
+    ):
+        response_cache = get_gateway_response_cache()
+        user_text = messages[-1]["content"]
+        cache_key = response_cache.make_key(get_system_prompt().sha256, cache_context, user_text)
+        if cache_key.cacheable:
+            # Embed only when the exact lookup misses
+            cache_embedding = None
+            hit = response_cache.lookup_exact(cache_key)
+            if hit is None:
+                cache_embedding = await response_cache.embed(user_text)
+                hit = response_cache.lookup(cache_key, cache_embedding)
+            if hit is not None:
+                logger.info(f"Response cache {hit.match} hit ({cache_key.category})")
+                await asyncio.to_thread(
+                    _store_cached_turn, memory_store, thread_id, user_text, hit.content
+                )
+                context_headers[RESPONSE_CACHE_HEADER] = f"hit-{hit.match}"
+                if chat_request.stream:
+                    stream_response = StreamingResponse(
+                        replay_cached_stream(hit.content, config["model_id"]),
+                        media_type="text/event-stream",
+                        headers={
+                            "Cache-Control": "no-cache",
+                            "Connection": "keep-alive",
+                            "X-Accel-Buffering": "no",
+                            **context_headers,
+                        },
+                    )
+                    if new_session_id:
+                        stream_response.set_cookie(
+                            _SESSION_COOKIE_NAME,
+                            new_session_id,
+                            httponly=True,
+                            samesite="Lax",
+                        )
+                    return stream_response
+                response.headers.update(context_headers)
+                return _cached_chat_response(hit.content, config["model_id"])
+            context_headers[RESPONSE_CACHE_HEADER] = "miss"
+            cache_store = _response_cache_writer(response_cache, cache_key, cache_embedding)
+
     if chat_request.stream:
         stream_response = StreamingResponse(
             stream_chat_response(
@@ -744,12 +999,14 @@ async def chat_completions(
                 memory_store,
                 action_summary=action_summary,
                 skip_auto_store=skip_auto_store,
+                cache_store=cache_store,
             ),
             media_type="text/event-stream",
             headers={
                 "Cache-Control": "no-cache",
                 "Connection": "keep-alive",
                 "X-Accel-Buffering": "no",  # Disable nginx buffering
+                **context_headers,
             },
         )
         if new_session_id:
@@ -761,6 +1018,7 @@ async def chat_completions(
             )
         return stream_response
     else:
+        response.headers.update(context_headers)
         return await blocking_chat_response(
             llm_client,
             messages,
@@ -771,6 +1029,7 @@ async def chat_completions(
             memory_store,
             action_summary=action_summary,
             skip_auto_store=skip_auto_store,
+            cache_store=cache_store,
         )
 
 
@@ -999,65 +1258,160 @@ async def _smart_extract_and_store_facts(user_message: str, session_id: str):
         logger.error(f"Smart fact extraction/reminder detection failed: {e}")
 
 
-def _build_history_context(memory_store, thread_id: str, max_turns: int = 10, user_query: str = "") -> str:
-    """Build conversation history context for system prompt.
+def _context_sources(
+    context_cache: ThreadContextCache,
+    thread_id: str,
+    user_query: str,
+    max_turns: int = _HISTORY_MAX_TURNS,
+) -> list[ContextSource]:
+    """Independent context loaders for one chat request.
 
     Args:
-        memory_store: ChatMemoryStore instance
+        context_cache: Per-thread cache over the ChatMemoryStore
         thread_id: Thread identifier
+        user_query: Latest user message (semantic memory and KG lookups)
         max_turns: Maximum number of recent turns to include (default: 10)
-        user_query: Optional user query for memory retrieval
 
     Returns:
-        Formatted history context string, or empty string if no history
+        Sources for ``assemble_context``
     """
-    try:
-        # Load recent conversation turns
-        turns = memory_store.get_recent_turns(thread_id, limit=max_turns)
+    sources = [
+        # Extra turns cover the gap between the summary and the recent window
+        ContextSource(
+            "history",
+            lambda: context_cache.history(thread_id, limit=max_turns + SUMMARY_BATCH_TURNS),
+        ),
+        # (stable facts, query-selected facts); only the prefix-cache layout
+        # keeps the query's picks out of the stable segment
+        ContextSource(
+            "facts",
+            (lambda: context_cache.split_facts(user_query))
+            if prompt_layout() == LAYOUT_PREFIX_CACHE
+            else (lambda: (context_cache.facts(user_query), [])),
+        ),
+    ]
+    if user_query:
+        sources.append(ContextSource("semantic", lambda: _build_memory_retrieval_context(user_query)))
+        sources.append(ContextSource("kg", lambda: _build_kg_context_section(user_query)))
+    return sources
 
-        # Load memory facts
-        facts = memory_store.get_all_facts()
 
-        # Load semantic memory (if enabled)
-        memory_context = ""
-        if user_query:
-            memory_context = _build_memory_retrieval_context(user_query)
+def _unsummarized_turns(turns: list, summary, max_turns: int = _HISTORY_MAX_TURNS) -> list:
+    """Turns not yet covered by the thread summary (the last ``max_turns`` if none)."""
+    if summary is None:
+        return turns[-max_turns:]
+    return [turn for turn in turns if turn.id > summary.last_turn_id]
 
-        if not turns and not facts and not memory_context:
-            return ""
 
-        parts = ["---", "", "## CONVERSATION MEMORY"]
+def _apply_context_budget(
+    counter,
+    context_window: int,
+    system_prompt: str,
+    messages: list[dict],
+    max_tokens: int,
+    facts: list,
+    turns: list,
+    semantic_context: str,
+    kg_context: str,
+    summary_text: str = "",
+) -> tuple[list, list, str, str]:
+    """Trim facts, stored turns and retrieved memory to their token budgets.
+
+    The client's own messages and the thread summary count against the
+    history budget; stored turns fill whatever is left of it, newest first.
+    """
+    render_fact = format_fact_line
+    render_turn = lambda turn: f"{turn.role.upper()}: {turn.content[:200]}"
+    conversation_tokens = counter.count_messages(messages) + counter.count(summary_text)
+    budget = allocate_budget(
+        context_window,
+        {
+            "system": counter.count(system_prompt),
+            "output": max_tokens,
+            "history": conversation_tokens + sum(counter.count(render_turn(t)) for t in turns),
+            "facts": sum(counter.count(render_fact(f)) for f in facts),
+            "memory": counter.count(semantic_context) + counter.count(kg_context),
+        },
+    )
+    trimmed = budget.trimmed()
+    if not trimmed:
+        return facts, turns, semantic_context, kg_context
+
+    logger.info(f"Context budget ({context_window} tokens) trimmed: {', '.join(trimmed)}")
+    facts = fit_items(counter, facts, render_fact, budget.granted["facts"])
+    turns = fit_items(
+        counter, turns, render_turn, budget.granted["history"] - conversation_tokens, keep_newest=True
+    )
+    memory_budget = budget.granted["memory"]
+    semantic_context = counter.truncate(semantic_context, memory_budget)
+    kg_context = counter.truncate(kg_context, memory_budget - counter.count(semantic_context))
+    return facts, turns, semantic_context, kg_context
+
 
-        # Add explicit memory facts
-        if facts:
-            parts.append("")
-            parts.append("### Stored Facts (via /remember):")
-            for fact in facts:
-                parts.append(f"- **{fact.key}**: {fact.value}")
-
-        # Add semantic memory retrieval
-        if memory_context:
-            parts.append(memory_context)
-
-        # Add recent conversation history
-        if turns:
-            parts.append("")
-            parts.append(f"### Recent Conversation History ({len(turns)} turns):")
-            parts.append("```")
-            for turn in turns:
-                # Truncate long messages
-                content = turn.content if len(turn.content) <= 200 else turn.content[:200] + "..."
-                parts.append(f"{turn.role.upper()}: {content}")
-            parts.append("```")
-            parts.append("")
-            parts.append("*You can reference this history naturally in your responses.*")
+def _build_kg_context_section(user_query: str) -> str:
+    """KG entities/relationships for the query (empty if disabled or none)."""
+    from agents.kg_context import build_kg_context
 
-        return "\n".join(parts)
+    return build_kg_context(user_query).to_prompt_section()
 
-    except Exception as e:
-        logger.exception(f"Error building history context: {e}")
+
+def _format_history_context(
+    turns: list,
+    facts: list,
+    memory_context: str = "",
+    summary: str = "",
+    facts_block: Optional[str] = None,
+) -> str:
+    """Format conversation history context for system prompt.
+
+    Args:
+        turns: Recent ConversationTurns, oldest first
+        facts: Stored MemoryFacts
+        memory_context: Formatted semantic memory section (may be empty)
+        summary: Rolling summary of older turns (may be empty)
+        facts_block: Pre-rendered fact lines (rendered from ``facts`` if None)
+
+    Returns:
+        Formatted history context string, or empty string if no history
+    """
+    if not turns and not facts and not memory_context and not summary:
         return ""
 
+    parts = ["---", "", "## CONVERSATION MEMORY"]
+
+    # Add explicit memory facts
+    if facts:
+        parts.append("")
+        parts.append("### Stored Facts (via /remember):")
+        parts.append(
+            facts_block if facts_block is not None else "\n".join(format_fact_line(f) for f in facts)
+        )
+
+    # Add semantic memory retrieval
+    if memory_context:
+        parts.append(memory_context)
+
+    # Add rolling summary of older turns
+    if summary:
+        parts.append("")
+        parts.append("### Earlier Conversation Summary:")
+        parts.append(summary)
+
+    # Add recent conversation history
+    if turns:
+        parts.append("")
+        parts.append(f"### Recent Conversation History ({len(turns)} turns):")
+        parts.append("```")
+        for turn in turns:
+            # Truncate long messages
+            content = turn.content if len(turn.content) <= 200 else turn.content[:200] + "..."
+            parts.append(f"{turn.role.upper()}: {content}")
+        parts.append("```")
+        parts.append("")
+        parts.append("*You can reference this history naturally in your responses.*")
+
+    return "\n".join(parts)
+
 
 def _build_action_context(plan: dict, exec_result: dict | None = None) -> dict:
     """Build structured action context for LLM truth gate.
@@ -1155,6 +1509,11 @@ def _inject_action_context_into_prompt(system_prompt: str, action_context: dict)
     
     This ensures the LLM knows exactly what was and wasn't executed.
     """
+    return f"{system_prompt}{_format_action_status(action_context)}"
+
+
+def _format_action_status(action_context: dict) -> str:
+    """Truth-gate block describing what was and wasn't executed."""
     action_executed = action_context.get("action_executed", False)
     action_detected = action_context.get("action_detected", False)
     action_type = action_context.get("action_type")
@@ -1211,7 +1570,7 @@ def _inject_action_context_into_prompt(system_prompt: str, action_context: dict)
         action_status += "2. Reference specific IDs or details from the execution\n"
         action_status += "3. Be confident in stating what was done\n"
     
-    return f"{system_prompt}{action_status}"
+    return action_status
 
 
 def _summary_text(value: Any) -> str:
@@ -1367,8 +1726,12 @@ async def blocking_chat_response(
     memory_store,
     action_summary: str | None = None,
     skip_auto_store: bool = False,
+    cache_store: Callable[[str], None] | None = None,
 ) -> ChatCompletionResponse:
-    """Generate a non-streaming chat response."""
+    """Generate a non-streaming chat response.
+
+    ``cache_store`` receives the answer if the model finished normally.
+    """
     try:
         result = await llm_client.chat_completion(
             messages=messages,
@@ -1380,6 +1743,8 @@ async def blocking_chat_response(
         # Extract the assistant's response
         content = result["choices"][0]["message"]["content"]
         base_content = content
+        if cache_store is not None and result["choices"][0].get("finish_reason") in (None, "stop"):
+            cache_store(base_content)
         if action_summary:
             content = f"{content}\n\n{action_summary}"
         usage = result.get("usage", {})
@@ -1441,10 +1806,13 @@ async def stream_chat_response(
     memory_store,
     action_summary: str | None = None,
     skip_auto_store: bool = False,
+    cache_store: Callable[[str], None] | None = None,
 ) -> AsyncIterator[str]:
     """
     Generate a streaming chat response using SSE.
 
+    ``cache_store`` receives the full answer if the model finished normally.
+
     Yields OpenAI-compatible SSE events:
     - data: {chunk_json}
     - data: [DONE]
@@ -1452,6 +1820,7 @@ async def stream_chat_response(
     completion_id = f"chatcmpl-{uuid.uuid4().hex[:12]}"
     created = int(time.time())
     accumulated_content = []  # Track full response for storage
+    llm_finish_reason = None
 
     try:
         # First, send a role delta
@@ -1497,6 +1866,8 @@ async def stream_chat_response(
                     # Accumulate content for storage
                     if content:
                         accumulated_content.append(content)
+                    if finish_reason:
+                        llm_finish_reason = finish_reason
 
                     if content or finish_reason:
                         chunk = ChatCompletionChunk(
@@ -1516,6 +1887,9 @@ async def stream_chat_response(
                 logger.warning(f"Failed to parse streaming chunk: {data}")
                 continue
 
+        if cache_store is not None and accumulated_content and llm_finish_reason in (None, "stop"):
+            cache_store("".join(accumulated_content))
+
         if action_summary:
             summary_chunk = ChatCompletionChunk(
                 id=completion_id,
@@ -1590,6 +1964,59 @@ async def stream_chat_response(
         yield "data: [DONE]\n\n"
 
 
+def _response_cache_writer(response_cache: ResponseCache, key: CacheKey, embedding: Any) -> Callable[[str], None]:
+    """Callback that stores a completed answer under ``key``."""
+
+    def store(content: str) -> None:
+        response_cache.store(key, content, embedding)
+
+    return store
+
+
+def _store_cached_turn(memory_store, thread_id: str, user_text: str, content: str) -> None:
+    """Record a cache-served exchange in the thread history."""
+    try:
+        memory_store.append_turn(thread_id, "user", user_text)
+        memory_store.append_turn(thread_id, "assistant", content)
+    except Exception as e:
+        logger.warning(f"Failed to store cached conversation turn: {e}")
+
+
+def _cached_chat_response(content: str, model_id: str) -> ChatCompletionResponse:
+    """Non-streaming response for a cache hit (no tokens were generated)."""
+    return ChatCompletionResponse(
+        model=model_id,
+        choices=[
+            ChatCompletionChoice(
+                index=0,
+                message=ChatMessage(role="assistant", content=content),
+                finish_reason="stop",
+            )
+        ],
+    )
+
+
+async def replay_cached_stream(content: str, model_id: str) -> AsyncIterator[str]:
+    """Replay a cached answer as OpenAI-compatible SSE chunks."""
+    completion_id = f"chatcmpl-{uuid.uuid4().hex[:12]}"
+    created = int(time.time())
+
+    def chunk(delta: DeltaContent, finish_reason: str | None = None) -> str:
+        event = ChatCompletionChunk(
+            id=completion_id,
+            created=created,
+            model=model_id,
+            choices=[StreamChoice(index=0, delta=delta, finish_reason=finish_reason)],
+        )
+        return f"data: {event.model_dump_json()}\n\n"
+
+    yield chunk(DeltaContent(role="assistant", content=""))
+    for piece in replay_chunks(content):
+        yield chunk(DeltaContent(content=piece))
+    yield chunk(DeltaContent(), finish_reason="stop")
+    yield "data: [DONE]\n\n"
+
+
 def create_app() -> FastAPI:
     """Factory function to create the FastAPI app."""
     return app
@@ -0,0 +1,359 @@
+"""Tokenizer-accurate context budgeting for chat completions.
+
+Token counts come from the served model's tokenizer, loaded locally with
+``transformers`` (optional; without it, or without a local copy of the
+tokenizer, counts fall back to the old 4-characters-per-token estimate).
+Counts are memoized per text hash in a bounded LRU. The context window is
+read from vLLM's ``/v1/models`` metadata (``max_model_len``); only the first
+lookup waits for it, later refreshes run in the background while requests
+keep using the cached limits.
+
+The window is split between the prompt segments (system, facts, memory,
+history) and the output in a configurable priority order: each segment in
+turn gets what it asks for, as far as the remaining budget allows. The
+output always keeps a minimum reservation.
+
+Configuration:
+    MILTON_TOKENIZER: tokenizer name or local path (default: the model's
+        ``root`` from /v1/models, else LLM_MODEL)
+    MILTON_TOKENIZER_ALLOW_DOWNLOAD: fetch the tokenizer from the HF hub if
+        it is not cached locally (default 0)
+    MILTON_MODEL_MAX_CONTEXT: context window when /v1/models has none (default 8192)
+    MILTON_GATEWAY_BUDGET_PRIORITIES: comma-separated segment order
+        (default "system,output,history,facts,memory")
+    MILTON_GATEWAY_MIN_OUTPUT_TOKENS: output reservation (default 256)
+"""
+
+from __future__ import annotations
+
+import asyncio
+import hashlib
+import logging
+import os
+import threading
+import time
+from collections import OrderedDict
+from dataclasses import dataclass, field
+from typing import Any, Optional
+
+from milton_orchestrator.env import env_flag, env_int
+
+logger = logging.getLogger(__name__)
+
+CHARS_PER_TOKEN = 4
+MESSAGE_OVERHEAD_TOKENS = 4  # role header and separators per chat message
+SAFETY_MARGIN_TOKENS = 32
+DEFAULT_MAX_CONTEXT = 8192
+DEFAULT_MIN_OUTPUT_TOKENS = 256
+DEFAULT_COUNT_CACHE_SIZE = 4096
+DEFAULT_PRIORITIES = ("system", "output", "history", "facts", "memory")
+SEGMENTS = frozenset(DEFAULT_PRIORITIES)
+
+_LIMITS_TTL_SECONDS = 300.0
+_LIMITS_RETRY_SECONDS = 30.0
+
+
+def budget_priorities() -> tuple[str, ...]:
+    """Segment order from MILTON_GATEWAY_BUDGET_PRIORITIES; missing segments go last."""
+    raw = os.getenv("MILTON_GATEWAY_BUDGET_PRIORITIES", "")
+    order = [name.strip().lower() for name in raw.split(",") if name.strip().lower() in SEGMENTS]
+    order = list(dict.fromkeys(order))
+    order.extend(name for name in DEFAULT_PRIORITIES if name not in order)
+    return tuple(order)
+
+
+# ---------------------------------------------------------------------------
+# Token counting
+# ---------------------------------------------------------------------------
+
+
+class TokenCounter:
+    """Counts tokens with the model tokenizer, memoized per text hash."""
+
+    def __init__(self, tokenizer_name: Optional[str] = None, cache_size: int = DEFAULT_COUNT_CACHE_SIZE):
+        self.tokenizer_name = tokenizer_name
+        self.cache_size = cache_size
+        self._tokenizer: Any = None
+        self._loaded = False
+        self._cache: OrderedDict[str, int] = OrderedDict()
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    @property
+    def backend(self) -> str:
+        self._ensure_tokenizer()
+        return "tokenizer" if self._tokenizer is not None else "heuristic"
+
+    def _ensure_tokenizer(self) -> None:
+        if self._loaded:
+            return
+        with self._lock:
+            if self._loaded:
+                return
+            self._tokenizer = _load_tokenizer(self.tokenizer_name)
+            self._loaded = True
+
+    def _encode(self, text: str) -> list[int]:
+        return self._tokenizer.encode(text, add_special_tokens=False)
+
+    def count(self, text: str) -> int:
+        if not text:
+            return 0
+        self._ensure_tokenizer()
+        key = hashlib.sha1(text.encode("utf-8")).hexdigest()
+        with self._lock:
+            cached = self._cache.get(key)
+            if cached is not None:
+                self._cache.move_to_end(key)
+                self.hits += 1
+                return cached
+        if self._tokenizer is not None:
+            tokens = len(self._encode(text))
+        else:
+            tokens = len(text) // CHARS_PER_TOKEN
+        with self._lock:
+            self.misses += 1
+            self._cache[key] = tokens
+            self._cache.move_to_end(key)
+            while len(self._cache) > self.cache_size:
+                self._cache.popitem(last=False)
+        return tokens
+
+    def count_messages(self, messages: list[dict]) -> int:
+        return sum(
+            self.count(m.get("content") or "") + MESSAGE_OVERHEAD_TOKENS for m in messages
+        )
+
+    def truncate(self, text: str, max_tokens: int) -> str:
+        """Longest prefix of ``text`` that fits in ``max_tokens``."""
+        if max_tokens <= 0:
+            return ""
+        if self.count(text) <= max_tokens:
+            return text
+        if self._tokenizer is not None:
+            ids = self._encode(text)[:max_tokens]
+            return self._tokenizer.decode(ids)
+        return text[: max_tokens * CHARS_PER_TOKEN]
+
+    def stats(self) -> dict[str, Any]:
+        return {
+            "backend": self.backend,
+            "tokenizer": self.tokenizer_name,
+            "cached_counts": len(self._cache),
+            "hits": self.hits,
+            "misses": self.misses,
+        }
+
+
+def _load_tokenizer(name: Optional[str]) -> Any:
+    if not name:
+        logger.info("No tokenizer configured; estimating tokens from characters")
+        return None
+    try:
+        from transformers import AutoTokenizer
+    except ImportError:
+        logger.info("transformers not installed; estimating tokens from characters")
+        return None
+    allow_download = env_flag("MILTON_TOKENIZER_ALLOW_DOWNLOAD")
+    try:
+        tokenizer = AutoTokenizer.from_pretrained(name, local_files_only=not allow_download)
+    except Exception as e:
+        logger.warning(f"Could not load tokenizer {name!r} ({e}); estimating tokens from characters")
+        return None
+    logger.info(f"Loaded tokenizer {name!r} for context budgeting")
+    return tokenizer
+
+
+_counter: Optional[TokenCounter] = None
+_counter_lock = threading.Lock()
+
+
+def get_token_counter() -> TokenCounter:
+    """Shared counter; the tokenizer is resolved from the model metadata if known."""
+    global _counter
+    with _counter_lock:
+        if _counter is None:
+            name = os.getenv("MILTON_TOKENIZER") or (
+                _limits.tokenizer if _limits is not None else None
+            ) or os.getenv("LLM_MODEL")
+            _counter = TokenCounter(name)
+        return _counter
+
+
+def reset_token_counter() -> None:
+    global _counter
+    with _counter_lock:
+        _counter = None
+
+
+async def warm_token_counter() -> TokenCounter:
+    """Load the shared counter's tokenizer off the event loop (call at startup)."""
+    counter = get_token_counter()
+    await asyncio.to_thread(lambda: counter.backend)
+    return counter
+
+
+async def _replace_token_counter(current: Optional[TokenCounter], tokenizer: str) -> None:
+    """Swap in a counter for ``tokenizer``, loaded before requests can use it."""
+    global _counter
+    replacement = TokenCounter(tokenizer)
+    await asyncio.to_thread(lambda: replacement.backend)
+    with _counter_lock:
+        if _counter is current:
+            _counter = replacement
+
+
+# ---------------------------------------------------------------------------
+# Model limits from /v1/models
+# ---------------------------------------------------------------------------
+
+
+@dataclass
+class ModelLimits:
+    max_context: int
+    tokenizer: Optional[str] = None
+    source: str = "default"  # "models_endpoint" | "env" | "default"
+    fetched_at: float = field(default_factory=time.monotonic)
+
+
+_limits: Optional[ModelLimits] = None
+_limits_lock = threading.Lock()
+_limits_refresh: Optional[asyncio.Task] = None
+
+
+def _fallback_limits() -> ModelLimits:
+    env_value = os.getenv("MILTON_MODEL_MAX_CONTEXT")
+    if env_value:
+        return ModelLimits(max_context=env_int("MILTON_MODEL_MAX_CONTEXT", DEFAULT_MAX_CONTEXT), source="env")
+    return ModelLimits(max_context=DEFAULT_MAX_CONTEXT)
+
+
+def limits_from_models_response(data: dict, model: str) -> Optional[ModelLimits]:
+    """``max_model_len`` (and tokenizer root) of ``model`` in a /v1/models payload."""
+    entries = data.get("data") or []
+    entry = next((e for e in entries if e.get("id") == model), entries[0] if entries else None)
+    if not entry or not entry.get("max_model_len"):
+        return None
+    return ModelLimits(
+        max_context=int(entry["max_model_len"]),
+        tokenizer=entry.get("root") or entry.get("id"),
+        source="models_endpoint",
+    )
+
+
+async def get_model_limits(llm_client) -> ModelLimits:
+    """Context window of the served model, refreshed every few minutes.
+
+    Stale limits are returned as-is while a background task refetches them,
+    so an unreachable ``/v1/models`` never delays a chat request after the
+    first one.
+    """
+    global _limits_refresh
+    with _limits_lock:
+        cached = _limits
+    if cached is None:
+        return await _refresh_model_limits(llm_client)
+    ttl = _LIMITS_TTL_SECONDS if cached.source == "models_endpoint" else _LIMITS_RETRY_SECONDS
+    if time.monotonic() - cached.fetched_at >= ttl and (
+        _limits_refresh is None or _limits_refresh.done()
+    ):
+        _limits_refresh = asyncio.create_task(_refresh_model_limits(llm_client))
+    return cached
+
+
+async def _refresh_model_limits(llm_client) -> ModelLimits:
+    global _limits
+    limits = None
+    try:
+        client = await llm_client.get_client()
+        response = await client.get(
+            f"{llm_client.base_url}/v1/models", headers=llm_client.headers, timeout=5.0
+        )
+        if response.is_success:
+            limits = limits_from_models_response(response.json(), llm_client.model)
+    except Exception as e:
+        logger.debug(f"Model metadata unavailable: {e}")
+    if limits is None:
+        limits = _fallback_limits()
+    with _limits_lock:
+        _limits = limits
+    # The counter may have been created before the tokenizer root was known
+    counter = _counter
+    if (
+        limits.tokenizer
+        and not os.getenv("MILTON_TOKENIZER")
+        and (counter is None or counter.tokenizer_name != limits.tokenizer)
+    ):
+        await _replace_token_counter(counter, limits.tokenizer)
+    return limits
+
+
+def reset_model_limits() -> None:
+    global _limits, _limits_refresh
+    with _limits_lock:
+        _limits = None
+    _limits_refresh = None
+
+
+# ---------------------------------------------------------------------------
+# Budget allocation
+# ---------------------------------------------------------------------------
+
+
+@dataclass
+class TokenBudget:
+    """Tokens granted to each segment (and the output) within the window."""
+
+    context_window: int
+    requested: dict[str, int]
+    granted: dict[str, int]
+
+    @property
+    def output_tokens(self) -> int:
+        return self.granted.get("output", 0)
+
+    def trimmed(self) -> list[str]:
+        return [name for name, want in self.requested.items() if self.granted.get(name, 0) < want]
+
+
+def allocate_budget(
+    context_window: int,
+    requested: dict[str, int],
+    priorities: Optional[tuple[str, ...]] = None,
+    min_output: Optional[int] = None,
+) -> TokenBudget:
+    """Grant each segment its request in priority order until the window is full.
+
+    ``requested["output"]`` is the desired completion length; up to
+    ``min_output`` of it is reserved before any prompt segment is served.
+    """
+    priorities = priorities or budget_priorities()
+    if min_output is None:
+        min_output = env_int("MILTON_GATEWAY_MIN_OUTPUT_TOKENS", DEFAULT_MIN_OUTPUT_TOKENS)
+    remaining = max(context_window - SAFETY_MARGIN_TOKENS, 0)
+
+    reserved = min(requested.get("output", 0), min_output, remaining)
+    remaining -= reserved
+    granted = {"output": reserved}
+    for name in priorities:
+        want = requested.get(name, 0)
+        if name == "output":
+            want -= reserved
+        grant = max(min(want, remaining), 0)
+        granted[name] = granted.get(name, 0) + grant
+        remaining -= grant
+    return TokenBudget(context_window=context_window, requested=dict(requested), granted=granted)
+
+
+def fit_items(counter: TokenCounter, items: list, render, max_tokens: int, keep_newest: bool = False) -> list:
+    """Leading (or, with ``keep_newest``, trailing) items whose rendered text fits."""
+    ordered = list(reversed(items)) if keep_newest else list(items)
+    kept, used = [], 0
+    for item in ordered:
+        cost = counter.count(render(item))
+        if used + cost > max_tokens:
+            break
+        kept.append(item)
+        used += cost
+    return list(reversed(kept)) if keep_newest else kept
@@ -0,0 +1,51 @@
+"""Typed environment-variable readers shared by the Milton services.
+
+Tuning knobs (worker counts, timeouts, cache sizes) are read from the
+environment with a default; a missing, empty or unparsable value falls back
+to the default instead of failing at startup. Unparsable values are logged.
+"""
+
+from __future__ import annotations
+
+import logging
+import os
+
+logger = logging.getLogger(__name__)
+
+_TRUE_VALUES = {"1", "true", "yes", "on"}
+
+
+def _raw(name: str) -> str:
+    return (os.getenv(name) or "").strip()
+
+
+def env_float(name: str, default: float) -> float:
+    """``float`` value of ``name``, or ``default`` if unset or invalid."""
+    value = _raw(name)
+    if not value:
+        return default
+    try:
+        return float(value)
+    except ValueError:
+        logger.warning(f"Ignoring invalid {name}={value!r}")
+        return default
+
+
+def env_int(name: str, default: int) -> int:
+    """``int`` value of ``name`` (``"2.0"`` is accepted), or ``default``."""
+    value = _raw(name)
+    if not value:
+        return default
+    try:
+        return int(float(value))
+    except ValueError:
+        logger.warning(f"Ignoring invalid {name}={value!r}")
+        return default
+
+
+def env_flag(name: str, default: bool = False) -> bool:
+    """True for 1/true/yes/on (any case), False for other set values."""
+    value = _raw(name)
+    if not value:
+        return default
+    return value.lower() in _TRUE_VALUES
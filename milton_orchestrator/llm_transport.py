@@ -0,0 +1,683 @@
+"""Shared HTTP transport for OpenAI-compatible LLM calls.
+
+Every component that talks to the local vLLM server (the agents, the
+verification pipeline, KG enrichment, the orchestrator's CHAT mode and the
+chat gateway) goes through one ``LLMTransport``. It keeps a keep-alive
+connection pool per face (a sync ``httpx.Client`` and, per event loop, an
+``httpx.AsyncClient``), caps the number of in-flight requests, retries
+connection failures and overload responses with jittered exponential
+backoff, enforces a per-call deadline that covers queueing, retries and
+backoff, and records latency, token and error metrics per caller.
+
+HTTP/2 is used when ``MILTON_LLM_HTTP2`` is set and the ``h2`` package is
+installed (useful behind a TLS proxy; vLLM itself speaks HTTP/1.1).
+
+Configuration:
+    LLM_API_URL: default base URL (default http://localhost:8000)
+    LLM_MODEL / OLLAMA_MODEL: default model (default llama31-8b-instruct)
+    LLM_API_KEY / VLLM_API_KEY / OLLAMA_API_KEY: bearer token
+    MILTON_LLM_TIMEOUT_S: default per-call deadline (default 120)
+    MILTON_LLM_MAX_CONCURRENCY: in-flight requests per face (default 8)
+    MILTON_LLM_MAX_CONNECTIONS: pool size per face (default 16)
+    MILTON_LLM_MAX_KEEPALIVE: idle connections kept open (default 8)
+    MILTON_LLM_KEEPALIVE_EXPIRY_S: idle connection lifetime (default 30)
+    MILTON_LLM_RETRIES: retries after the first attempt (default 2)
+    MILTON_LLM_BACKOFF_S / MILTON_LLM_BACKOFF_MAX_S: backoff base and cap
+        (default 0.5 / 8)
+    MILTON_LLM_HTTP2: negotiate HTTP/2 when possible (default 0)
+"""
+
+from __future__ import annotations
+
+import asyncio
+import logging
+import os
+import random
+import threading
+import time
+import weakref
+from collections import deque
+from contextlib import asynccontextmanager, contextmanager
+from dataclasses import dataclass
+from typing import Any, AsyncIterator, Iterator, Optional
+
+import httpx
+
+from .env import env_flag, env_float, env_int
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_BASE_URL = "http://localhost:8000"
+DEFAULT_MODEL = "llama31-8b-instruct"
+
+# Worth retrying: the request was not processed or the server is overloaded
+RETRYABLE_STATUS = frozenset({408, 429, 502, 503, 504})
+_RETRYABLE_ERRORS = (httpx.ConnectError, httpx.ConnectTimeout, httpx.PoolTimeout, httpx.RemoteProtocolError)
+
+_LATENCY_WINDOW = 512
+
+
+def resolve_api_key() -> Optional[str]:
+    return os.getenv("LLM_API_KEY") or os.getenv("VLLM_API_KEY") or os.getenv("OLLAMA_API_KEY")
+
+
+def resolve_base_url() -> str:
+    return os.getenv("LLM_API_URL", DEFAULT_BASE_URL).rstrip("/")
+
+
+def resolve_model() -> str:
+    return os.getenv("LLM_MODEL") or os.getenv("OLLAMA_MODEL") or DEFAULT_MODEL
+
+
+class LLMTransportError(RuntimeError):
+    """An LLM request failed after all retries."""
+
+
+class LLMConnectionError(LLMTransportError):
+    """The LLM server could not be reached."""
+
+
+class LLMTimeoutError(LLMTransportError):
+    """The call did not complete within its deadline."""
+
+
+class LLMHTTPError(LLMTransportError):
+    """The LLM server answered with an error status."""
+
+    def __init__(self, status_code: int, reason: str, body: str):
+        super().__init__(f"LLM API error: {status_code} {reason} - {body}")
+        self.status_code = status_code
+        self.reason = reason
+        self.body = body
+
+
+@dataclass(frozen=True)
+class TransportSettings:
+    timeout: float = 120.0
+    max_concurrency: int = 8
+    max_connections: int = 16
+    max_keepalive: int = 8
+    keepalive_expiry: float = 30.0
+    retries: int = 2
+    backoff_base: float = 0.5
+    backoff_max: float = 8.0
+    http2: bool = False
+
+    @classmethod
+    def from_env(cls) -> "TransportSettings":
+        return cls(
+            timeout=env_float("MILTON_LLM_TIMEOUT_S", cls.timeout),
+            max_concurrency=max(env_int("MILTON_LLM_MAX_CONCURRENCY", cls.max_concurrency), 1),
+            max_connections=max(env_int("MILTON_LLM_MAX_CONNECTIONS", cls.max_connections), 1),
+            max_keepalive=max(env_int("MILTON_LLM_MAX_KEEPALIVE", cls.max_keepalive), 0),
+            keepalive_expiry=env_float("MILTON_LLM_KEEPALIVE_EXPIRY_S", cls.keepalive_expiry),
+            retries=max(env_int("MILTON_LLM_RETRIES", cls.retries), 0),
+            backoff_base=env_float("MILTON_LLM_BACKOFF_S", cls.backoff_base),
+            backoff_max=env_float("MILTON_LLM_BACKOFF_MAX_S", cls.backoff_max),
+            http2=env_flag("MILTON_LLM_HTTP2"),
+        )
+
+
+def _http2_available() -> bool:
+    try:
+        import h2  # noqa: F401
+    except ImportError:
+        return False
+    return True
+
+
+# ---------------------------------------------------------------------------
+# Metrics
+# ---------------------------------------------------------------------------
+
+
+class _CallerStats:
+    def __init__(self) -> None:
+        self.requests = 0
+        self.errors: dict[str, int] = {}
+        self.retries = 0
+        self.prompt_tokens = 0
+        self.completion_tokens = 0
+        self.latencies: deque[float] = deque(maxlen=_LATENCY_WINDOW)
+
+
+class LLMMetrics:
+    """Per-caller request counts, latency percentiles, tokens and errors."""
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self._callers: dict[str, _CallerStats] = {}
+
+    def _caller(self, caller: str) -> _CallerStats:
+        stats = self._callers.get(caller)
+        if stats is None:
+            stats = self._callers[caller] = _CallerStats()
+        return stats
+
+    def record(self, caller: str, latency: float, retries: int = 0, error: Optional[str] = None) -> None:
+        with self._lock:
+            stats = self._caller(caller)
+            stats.requests += 1
+            stats.retries += retries
+            stats.latencies.append(latency)
+            if error:
+                stats.errors[error] = stats.errors.get(error, 0) + 1
+
+    def record_usage(self, caller: str, usage: Optional[dict]) -> None:
+        if not usage:
+            return
+        with self._lock:
+            stats = self._caller(caller)
+            stats.prompt_tokens += int(usage.get("prompt_tokens") or 0)
+            stats.completion_tokens += int(usage.get("completion_tokens") or 0)
+
+    def snapshot(self) -> dict[str, dict[str, Any]]:
+        with self._lock:
+            result = {}
+            for caller, stats in self._callers.items():
+                ordered = sorted(stats.latencies)
+
+                def pct(p: float) -> Optional[float]:
+                    if not ordered:
+                        return None
+                    return round(ordered[min(int(p * len(ordered)), len(ordered) - 1)] * 1000, 1)
+
+                result[caller] = {
+                    "requests": stats.requests,
+                    "errors": dict(stats.errors),
+                    "retries": stats.retries,
+                    "prompt_tokens": stats.prompt_tokens,
+                    "completion_tokens": stats.completion_tokens,
+                    "latency_ms": {"p50": pct(0.5), "p95": pct(0.95), "max": pct(1.0)},
+                }
+            return result
+
+
+# ---------------------------------------------------------------------------
+# Transport
+# ---------------------------------------------------------------------------
+
+
+class _Deadline:
+    def __init__(self, seconds: float) -> None:
+        self.seconds = seconds
+        self.expires_at = time.monotonic() + seconds
+
+    def remaining(self) -> float:
+        return self.expires_at - time.monotonic()
+
+    def check(self, what: str) -> float:
+        remaining = self.remaining()
+        if remaining <= 0:
+            raise LLMTimeoutError(f"LLM request timed out after {self.seconds:g}s ({what})")
+        return remaining
+
+
+def _error_kind(exc: BaseException) -> str:
+    if isinstance(exc, LLMHTTPError):
+        return f"http_{exc.status_code}"
+    if isinstance(exc, (LLMTimeoutError, httpx.TimeoutException)):
+        return "timeout"
+    return "connection"
+
+
+def _wrap(exc: httpx.HTTPError, url: str, deadline: _Deadline) -> LLMTransportError:
+    if isinstance(exc, httpx.TimeoutException):
+        return LLMTimeoutError(f"LLM request timed out after {deadline.seconds:g}s: {exc}")
+    return LLMConnectionError(f"Cannot connect to LLM at {url}: {exc}")
+
+
+def _retry_after(response: Optional[httpx.Response]) -> Optional[float]:
+    if response is None:
+        return None
+    try:
+        return float(response.headers.get("retry-after", ""))
+    except ValueError:
+        return None
+
+
+class LLMTransport:
+    """Pooled, rate-limited, retrying client for an OpenAI-compatible server."""
+
+    def __init__(
+        self,
+        settings: Optional[TransportSettings] = None,
+        http_transport: Optional[httpx.BaseTransport] = None,
+        async_http_transport: Optional[httpx.AsyncBaseTransport] = None,
+    ) -> None:
+        self.settings = settings or TransportSettings.from_env()
+        self.metrics = LLMMetrics()
+        self._http_transport = http_transport
+        self._async_http_transport = async_http_transport
+        self._client: Optional[httpx.Client] = None
+        self._slots = threading.BoundedSemaphore(self.settings.max_concurrency)
+        self._lock = threading.Lock()
+        # One async client and semaphore per event loop (they are loop-bound)
+        self._async: "weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, tuple[httpx.AsyncClient, asyncio.Semaphore]]" = (
+            weakref.WeakKeyDictionary()
+        )
+        if self.settings.http2 and not _http2_available():
+            logger.warning("MILTON_LLM_HTTP2 is set but the h2 package is missing; using HTTP/1.1")
+
+    # -- clients -------------------------------------------------------------
+
+    def _client_kwargs(self) -> dict[str, Any]:
+        s = self.settings
+        return {
+            "limits": httpx.Limits(
+                max_connections=s.max_connections,
+                max_keepalive_connections=s.max_keepalive,
+                keepalive_expiry=s.keepalive_expiry,
+            ),
+            "timeout": s.timeout,
+            "http2": s.http2 and _http2_available(),
+        }
+
+    def client(self) -> httpx.Client:
+        """Shared sync client (keep-alive pool)."""
+        with self._lock:
+            if self._client is None or self._client.is_closed:
+                self._client = httpx.Client(transport=self._http_transport, **self._client_kwargs())
+            return self._client
+
+    def _async_state(self) -> tuple[httpx.AsyncClient, asyncio.Semaphore]:
+        loop = asyncio.get_running_loop()
+        state = self._async.get(loop)
+        if state is None or state[0].is_closed:
+            state = (
+                httpx.AsyncClient(transport=self._async_http_transport, **self._client_kwargs()),
+                asyncio.Semaphore(self.settings.max_concurrency),
+            )
+            self._async[loop] = state
+        return state
+
+    def async_client(self) -> httpx.AsyncClient:
+        """Shared async client for the running event loop."""
+        return self._async_state()[0]
+
+    def close(self) -> None:
+        with self._lock:
+            if self._client is not None:
+                self._client.close()
+                self._client = None
+
+    async def aclose(self) -> None:
+        loop = asyncio.get_running_loop()
+        state = self._async.pop(loop, None)
+        if state is not None:
+            await state[0].aclose()
+
+    # -- helpers -------------------------------------------------------------
+
+    @staticmethod
+    def headers(api_key: Optional[str] = None) -> dict[str, str]:
+        headers = {"Content-Type": "application/json"}
+        api_key = api_key if api_key is not None else resolve_api_key()
+        if api_key:
+            headers["Authorization"] = f"Bearer {api_key}"
+        return headers
+
+    @staticmethod
+    def chat_payload(
+        messages: list[dict],
+        model: Optional[str] = None,
+        max_tokens: Optional[int] = None,
+        temperature: float = 0.7,
+        stop: Optional[list[str]] = None,
+        stream: bool = False,
+        **extra: Any,
+    ) -> dict[str, Any]:
+        payload: dict[str, Any] = {
+            "model": model or resolve_model(),
+            "messages": messages,
+            "temperature": temperature,
+        }
+        if max_tokens is not None:
+            payload["max_tokens"] = max_tokens
+        if stop:
+            payload["stop"] = stop
+        if stream:
+            payload["stream"] = True
+        payload.update(extra)
+        return payload
+
+    def _backoff(self, attempt: int, response: Optional[httpx.Response]) -> float:
+        delay = random.uniform(0, min(self.settings.backoff_max, self.settings.backoff_base * 2**attempt))
+        retry_after = _retry_after(response)
+        if retry_after is not None:
+            delay = max(delay, min(retry_after, self.settings.backoff_max))
+        return delay
+
+    def _should_retry(self, attempt: int, delay: float, deadline: _Deadline) -> bool:
+        return attempt < self.settings.retries and delay < deadline.remaining()
+
+    def _record_result(self, caller: str, started: float, retries: int, response: httpx.Response) -> None:
+        error = None if response.is_success else f"http_{response.status_code}"
+        self.metrics.record(caller, time.monotonic() - started, retries, error)
+
+    def _record_usage(self, caller: str, response: httpx.Response) -> None:
+        if not response.is_success:
+            return
+        try:
+            self.metrics.record_usage(caller, response.json().get("usage"))
+        except (ValueError, AttributeError):
+            pass
+
+    # -- sync face -----------------------------------------------------------
+
+    def request(
+        self,
+        method: str,
+        url: str,
+        *,
+        json: Any = None,
+        headers: Optional[dict[str, str]] = None,
+        timeout: Optional[float] = None,
+        caller: str = "llm",
+    ) -> httpx.Response:
+        """Send a request with retries; returns the final response (any status).
+
+        Raises ``LLMConnectionError`` / ``LLMTimeoutError`` when no response
+        could be obtained within ``timeout`` seconds.
+        """
+        deadline = _Deadline(timeout if timeout is not None else self.settings.timeout)
+        started = time.monotonic()
+        if not self._slots.acquire(timeout=max(deadline.remaining(), 0)):
+            error = LLMTimeoutError(f"LLM request timed out after {deadline.seconds:g}s waiting for a slot")
+            self.metrics.record(caller, time.monotonic() - started, 0, "timeout")
+            raise error
+        try:
+            attempt = 0
+            while True:
+                response = None
+                try:
+                    response = self.client().request(
+                        method,
+                        url,
+                        json=json,
+                        headers=headers if headers is not None else self.headers(),
+                        timeout=deadline.check("before sending"),
+                    )
+                except _RETRYABLE_ERRORS as exc:
+                    failure: BaseException = exc
+                except httpx.HTTPError as exc:
+                    self.metrics.record(caller, time.monotonic() - started, attempt, _error_kind(exc))
+                    raise _wrap(exc, url, deadline) from exc
+                except LLMTimeoutError:
+                    self.metrics.record(caller, time.monotonic() - started, attempt, "timeout")
+                    raise
+                else:
+                    if response.status_code not in RETRYABLE_STATUS:
+                        self._record_result(caller, started, attempt, response)
+                        return response
+                    failure = LLMHTTPError(response.status_code, response.reason_phrase, response.text)
+
+                delay = self._backoff(attempt, response)
+                if not self._should_retry(attempt, delay, deadline):
+                    if response is not None:
+                        self._record_result(caller, started, attempt, response)
+                        return response
+                    self.metrics.record(caller, time.monotonic() - started, attempt, _error_kind(failure))
+                    raise _wrap(failure, url, deadline) from failure
+                logger.debug(f"Retrying LLM request to {url} in {delay:.2f}s ({failure})")
+                time.sleep(delay)
+                attempt += 1
+        finally:
+            self._slots.release()
+
+    def post(self, url: str, payload: dict, **kwargs: Any) -> httpx.Response:
+        response = self.request("POST", url, json=payload, **kwargs)
+        self._record_usage(kwargs.get("caller", "llm"), response)
+        return response
+
+    def get(self, url: str, **kwargs: Any) -> httpx.Response:
+        return self.request("GET", url, **kwargs)
+
+    def chat(
+        self,
+        messages: list[dict],
+        *,
+        base_url: Optional[str] = None,
+        headers: Optional[dict[str, str]] = None,
+        timeout: Optional[float] = None,
+        caller: str = "llm",
+        **options: Any,
+    ) -> dict[str, Any]:
+        """Non-streaming chat completion; raises ``LLMHTTPError`` on error status."""
+        url = f"{(base_url or resolve_base_url()).rstrip('/')}/v1/chat/completions"
+        payload = self.chat_payload(messages, **options)
+        response = self.post(url, payload, headers=headers, timeout=timeout, caller=caller)
+        if not response.is_success:
+            raise LLMHTTPError(response.status_code, response.reason_phrase, response.text)
+        return response.json()
+
+    def chat_text(self, messages: list[dict], **kwargs: Any) -> str:
+        """Content of the first choice of a chat completion."""
+        data = self.chat(messages, **kwargs)
+        try:
+            return data["choices"][0]["message"]["content"]
+        except (KeyError, IndexError, TypeError) as e:
+            raise LLMTransportError(f"Invalid LLM response format: {e}") from e
+
+    @contextmanager
+    def stream(
+        self,
+        url: str,
+        payload: dict,
+        *,
+        headers: Optional[dict[str, str]] = None,
+        timeout: Optional[float] = None,
+        caller: str = "llm",
+    ) -> Iterator[httpx.Response]:
+        """Open a streaming POST; raises ``LLMHTTPError`` on error status.
+
+        The deadline covers the wait for the response headers; each read
+        afterwards may take up to the same timeout. Connection failures are
+        retried like ``request``; nothing is retried once the body starts.
+        """
+        deadline = _Deadline(timeout if timeout is not None else self.settings.timeout)
+        started = time.monotonic()
+        if not self._slots.acquire(timeout=max(deadline.remaining(), 0)):
+            self.metrics.record(caller, time.monotonic() - started, 0, "timeout")
+            raise LLMTimeoutError(f"LLM request timed out after {deadline.seconds:g}s waiting for a slot")
+        try:
+            attempt = 0
+            opened = False
+            while True:
+                try:
+                    with self.client().stream(
+                        "POST",
+                        url,
+                        json=payload,
+                        headers=headers if headers is not None else self.headers(),
+                        timeout=deadline.check("before sending"),
+                    ) as response:
+                        opened = True
+                        if not response.is_success:
+                            response.read()
+                            self._record_result(caller, started, attempt, response)
+                            raise LLMHTTPError(response.status_code, response.reason_phrase, response.text)
+                        yield response
+                        self._record_result(caller, started, attempt, response)
+                        return
+                except _RETRYABLE_ERRORS as exc:
+                    delay = self._backoff(attempt, None)
+                    if opened or not self._should_retry(attempt, delay, deadline):
+                        self.metrics.record(caller, time.monotonic() - started, attempt, _error_kind(exc))
+                        raise _wrap(exc, url, deadline) from exc
+                    time.sleep(delay)
+                    attempt += 1
+                except httpx.HTTPError as exc:
+                    self.metrics.record(caller, time.monotonic() - started, attempt, _error_kind(exc))
+                    raise _wrap(exc, url, deadline) from exc
+        finally:
+            self._slots.release()
+
+    # -- async face ----------------------------------------------------------
+
+    async def arequest(
+        self,
+        method: str,
+        url: str,
+        *,
+        json: Any = None,
+        headers: Optional[dict[str, str]] = None,
+        timeout: Optional[float] = None,
+        caller: str = "llm",
+    ) -> httpx.Response:
+        """Async ``request``."""
+        deadline = _Deadline(timeout if timeout is not None else self.settings.timeout)
+        started = time.monotonic()
+        client, slots = self._async_state()
+        try:
+            await asyncio.wait_for(slots.acquire(), max(deadline.remaining(), 0))
+        except asyncio.TimeoutError:
+            self.metrics.record(caller, time.monotonic() - started, 0, "timeout")
+            raise LLMTimeoutError(f"LLM request timed out after {deadline.seconds:g}s waiting for a slot")
+        try:
+            attempt = 0
+            while True:
+                response = None
+                try:
+                    response = await client.request(
+                        method,
+                        url,
+                        json=json,
+                        headers=headers if headers is not None else self.headers(),
+                        timeout=deadline.check("before sending"),
+                    )
+                except _RETRYABLE_ERRORS as exc:
+                    failure: BaseException = exc
+                except httpx.HTTPError as exc:
+                    self.metrics.record(caller, time.monotonic() - started, attempt, _error_kind(exc))
+                    raise _wrap(exc, url, deadline) from exc
+                except LLMTimeoutError:
+                    self.metrics.record(caller, time.monotonic() - started, attempt, "timeout")
+                    raise
+                else:
+                    if response.status_code not in RETRYABLE_STATUS:
+                        self._record_result(caller, started, attempt, response)
+                        return response
+                    failure = LLMHTTPError(response.status_code, response.reason_phrase, response.text)
+
+                delay = self._backoff(attempt, response)
+                if not self._should_retry(attempt, delay, deadline):
+                    if response is not None:
+                        self._record_result(caller, started, attempt, response)
+                        return response
+                    self.metrics.record(caller, time.monotonic() - started, attempt, _error_kind(failure))
+                    raise _wrap(failure, url, deadline) from failure
+                logger.debug(f"Retrying LLM request to {url} in {delay:.2f}s ({failure})")
+                await asyncio.sleep(delay)
+                attempt += 1
+        finally:
+            slots.release()
+
+    async def apost(self, url: str, payload: dict, **kwargs: Any) -> httpx.Response:
+        response = await self.arequest("POST", url, json=payload, **kwargs)
+        self._record_usage(kwargs.get("caller", "llm"), response)
+        return response
+
+    async def aget(self, url: str, **kwargs: Any) -> httpx.Response:
+        return await self.arequest("GET", url, **kwargs)
+
+    async def achat(
+        self,
+        messages: list[dict],
+        *,
+        base_url: Optional[str] = None,
+        headers: Optional[dict[str, str]] = None,
+        timeout: Optional[float] = None,
+        caller: str = "llm",
+        **options: Any,
+    ) -> dict[str, Any]:
+        """Async ``chat``."""
+        url = f"{(base_url or resolve_base_url()).rstrip('/')}/v1/chat/completions"
+        payload = self.chat_payload(messages, **options)
+        response = await self.apost(url, payload, headers=headers, timeout=timeout, caller=caller)
+        if not response.is_success:
+            raise LLMHTTPError(response.status_code, response.reason_phrase, response.text)
+        return response.json()
+
+    @asynccontextmanager
+    async def astream(
+        self,
+        url: str,
+        payload: dict,
+        *,
+        headers: Optional[dict[str, str]] = None,
+        timeout: Optional[float] = None,
+        caller: str = "llm",
+    ) -> AsyncIterator[httpx.Response]:
+        """Async ``stream``; the response is yielded even on error status.
+
+        Callers check ``response.is_success`` themselves so they can read
+        the error body (the gateway reports it to the client).
+        """
+        deadline = _Deadline(timeout if timeout is not None else self.settings.timeout)
+        started = time.monotonic()
+        client, slots = self._async_state()
+        try:
+            await asyncio.wait_for(slots.acquire(), max(deadline.remaining(), 0))
+        except asyncio.TimeoutError:
+            self.metrics.record(caller, time.monotonic() - started, 0, "timeout")
+            raise LLMTimeoutError(f"LLM request timed out after {deadline.seconds:g}s waiting for a slot")
+        try:
+            attempt = 0
+            opened = False
+            while True:
+                try:
+                    async with client.stream(
+                        "POST",
+                        url,
+                        json=payload,
+                        headers=headers if headers is not None else self.headers(),
+                        timeout=deadline.check("before sending"),
+                    ) as response:
+                        opened = True
+                        yield response
+                        self._record_result(caller, started, attempt, response)
+                        return
+                except _RETRYABLE_ERRORS as exc:
+                    delay = self._backoff(attempt, None)
+                    if opened or not self._should_retry(attempt, delay, deadline):
+                        self.metrics.record(caller, time.monotonic() - started, attempt, _error_kind(exc))
+                        raise _wrap(exc, url, deadline) from exc
+                    await asyncio.sleep(delay)
+                    attempt += 1
+                except httpx.HTTPError as exc:
+                    self.metrics.record(caller, time.monotonic() - started, attempt, _error_kind(exc))
+                    raise _wrap(exc, url, deadline) from exc
+        finally:
+            slots.release()
+
+    def stats(self) -> dict[str, Any]:
+        s = self.settings
+        return {
+            "max_concurrency": s.max_concurrency,
+            "max_connections": s.max_connections,
+            "retries": s.retries,
+            "http2": s.http2 and _http2_available(),
+            "callers": self.metrics.snapshot(),
+        }
+
+
+_transport: Optional[LLMTransport] = None
+_transport_lock = threading.Lock()
+
+
+def get_llm_transport() -> LLMTransport:
+    """Process-wide transport shared by every LLM caller."""
+    global _transport
+    with _transport_lock:
+        if _transport is None:
+            _transport = LLMTransport()
+        return _transport
+
+
+def set_llm_transport(transport: Optional[LLMTransport]) -> Optional[LLMTransport]:
+    """Replace the shared transport (``None`` resets it); returns the previous one."""
+    global _transport
+    with _transport_lock:
+        previous, _transport = _transport, transport
+    return previous
@@ -2,6 +2,17 @@
 
 Provides a provider-based architecture for sending reminders through different
 channels (ntfy, voice, desktop popups, etc.) with unified delivery tracking.
+
+NotificationRouter fans a reminder out to its channels concurrently. Each
+channel has its own bounded worker pool and optional rate limit, so a hung
+or throttled channel only delays deliveries on that channel. HTTP providers
+share one keep-alive requests.Session.
+
+Configuration:
+    MILTON_NOTIFY_WORKERS: worker threads per channel (default 4)
+    MILTON_NOTIFY_RATE_<CHANNEL>: max sends per second on a channel, e.g.
+        MILTON_NOTIFY_RATE_NTFY=0.5 (default unlimited)
+    MILTON_NOTIFY_TIMEOUT_S: ntfy request timeout (default 10)
 """
 
 from __future__ import annotations
@@ -9,16 +20,64 @@ from __future__ import annotations
 import json
 import logging
 import os
+import threading
 import time
 from abc import ABC, abstractmethod
+from concurrent.futures import Future, ThreadPoolExecutor
 from dataclasses import dataclass, field
 from datetime import datetime
 from typing import Any, Optional, Protocol
 
 import requests
+from requests.adapters import HTTPAdapter
+
+from .env import env_float, env_int
 
 logger = logging.getLogger(__name__)
 
+DEFAULT_CHANNEL_WORKERS = 4
+
+
+_session: Optional[requests.Session] = None
+_session_lock = threading.Lock()
+
+
+def get_http_session() -> requests.Session:
+    """Keep-alive session shared by the HTTP notification providers."""
+    global _session
+    with _session_lock:
+        if _session is None:
+            workers = env_int("MILTON_NOTIFY_WORKERS", DEFAULT_CHANNEL_WORKERS)
+            adapter = HTTPAdapter(pool_connections=4, pool_maxsize=max(workers, 1))
+            session = requests.Session()
+            session.mount("http://", adapter)
+            session.mount("https://", adapter)
+            _session = session
+        return _session
+
+
+class RateLimiter:
+    """Token bucket: ``rate`` sends per second with bursts of up to ``burst``."""
+
+    def __init__(self, rate: float, burst: Optional[float] = None):
+        self.rate = rate
+        self.burst = burst if burst is not None else max(rate, 1.0)
+        self._tokens = self.burst
+        self._updated = time.monotonic()
+        self._lock = threading.Lock()
+
+    def acquire(self) -> float:
+        """Block until a send is allowed; returns the seconds spent waiting."""
+        with self._lock:
+            now = time.monotonic()
+            self._tokens = min(self.burst, self._tokens + (now - self._updated) * self.rate)
+            self._updated = now
+            self._tokens -= 1
+            wait = -self._tokens / self.rate if self._tokens < 0 else 0.0
+        if wait:
+            time.sleep(wait)
+        return wait
+
 
 @dataclass
 class DeliveryResult:
@@ -85,6 +144,8 @@ class NtfyProvider:
         public_base_url: Optional[str] = None,
         action_token: Optional[str] = None,
         dry_run: bool = False,
+        session: Optional[requests.Session] = None,
+        timeout: Optional[float] = None,
     ):
         """Initialize ntfy provider.
         
@@ -94,12 +155,22 @@ class NtfyProvider:
             public_base_url: Public URL for action callbacks (e.g., https://milton.example.com)
             action_token: Optional bearer token for action authentication
             dry_run: If True, log payloads without actually posting
+            session: HTTP session (defaults to the shared keep-alive session)
+            timeout: Request timeout in seconds (default MILTON_NOTIFY_TIMEOUT_S or 10)
         """
         self.base_url = base_url.rstrip('/')
         self.topic = topic
         self.public_base_url = public_base_url.rstrip('/') if public_base_url else None
         self.action_token = action_token
         self.dry_run = dry_run or os.getenv("MILTON_NOTIFY_DRY_RUN", "0") in ("1", "true", "yes")
+        self._session = session
+        self.timeout = timeout if timeout is not None else env_float("MILTON_NOTIFY_TIMEOUT_S", 10.0)
+
+    @property
+    def session(self) -> requests.Session:
+        if self._session is None:
+            self._session = get_http_session()
+        return self._session
     
     @property
     def name(self) -> str:
@@ -172,11 +243,11 @@ Actions: {action_labels}"""
             )
         
         try:
-            response = requests.post(
+            response = self.session.post(
                 url,
                 data=full_body.encode("utf-8"),
                 headers=headers,
-                timeout=10,
+                timeout=self.timeout,
             )
             
             message_id = None
@@ -264,19 +335,96 @@ class DesktopPopupProvider:
 
 
 class NotificationRouter:
-    """Routes reminders to multiple notification providers."""
+    """Routes reminders to multiple notification providers.
+
+    Channels are sent concurrently, each on its own bounded worker pool so
+    a slow provider cannot hold up the others or exhaust a shared pool.
+    """
     
-    def __init__(self, providers: Optional[dict[str, NotificationProvider]] = None):
+    def __init__(
+        self,
+        providers: Optional[dict[str, NotificationProvider]] = None,
+        *,
+        max_workers: Optional[int] = None,
+        rate_limits: Optional[dict[str, float]] = None,
+    ):
         """Initialize router with provider registry.
         
         Args:
             providers: Dict mapping channel name to provider instance
+            max_workers: Worker threads per channel (default MILTON_NOTIFY_WORKERS or 4)
+            rate_limits: Max sends per second by channel name; channels not
+                listed fall back to MILTON_NOTIFY_RATE_<CHANNEL> (default unlimited)
         """
         self.providers = providers or {}
+        self.max_workers = max(
+            1,
+            max_workers if max_workers is not None
+            else env_int("MILTON_NOTIFY_WORKERS", DEFAULT_CHANNEL_WORKERS),
+        )
+        self._rate_limits = dict(rate_limits or {})
+        self._executors: dict[str, ThreadPoolExecutor] = {}
+        self._limiters: dict[str, Optional[RateLimiter]] = {}
+        self._lock = threading.Lock()
     
     def register_provider(self, channel: str, provider: NotificationProvider) -> None:
         """Register a provider for a channel."""
         self.providers[channel] = provider
+
+    def _executor(self, channel: str) -> ThreadPoolExecutor:
+        with self._lock:
+            executor = self._executors.get(channel)
+            if executor is None:
+                executor = ThreadPoolExecutor(
+                    max_workers=self.max_workers, thread_name_prefix=f"notify-{channel}"
+                )
+                self._executors[channel] = executor
+            return executor
+
+    def _limiter(self, channel: str) -> Optional[RateLimiter]:
+        with self._lock:
+            if channel not in self._limiters:
+                rate = self._rate_limits.get(channel)
+                if rate is None:
+                    rate = env_float(f"MILTON_NOTIFY_RATE_{channel.upper()}", 0.0)
+                self._limiters[channel] = RateLimiter(rate) if rate and rate > 0 else None
+            return self._limiters[channel]
+
+    def _send_one(
+        self,
+        channel: str,
+        provider: NotificationProvider,
+        reminder,
+        title: str,
+        body: str,
+        actions: list[str],
+    ) -> DeliveryResult:
+        limiter = self._limiter(channel)
+        if limiter is not None:
+            waited = limiter.acquire()
+            if waited:
+                logger.debug(f"Rate limited {channel} for {waited:.2f}s (reminder {reminder.id})")
+        try:
+            result = provider.send(
+                reminder,
+                title=title,
+                body=body,
+                actions=actions,
+            )
+        except Exception as exc:
+            logger.error(f"Exception delivering reminder {reminder.id} via {channel}: {exc}", exc_info=True)
+            return DeliveryResult(
+                ok=False,
+                provider=channel,
+                error=f"Exception: {str(exc)[:200]}",
+                metadata={"exception_type": type(exc).__name__},
+            )
+
+        if result.ok:
+            logger.info(f"Delivered reminder {reminder.id} via {channel}")
+        else:
+            logger.warning(f"Failed to deliver reminder {reminder.id} via {channel}: {result.error}")
+        return result
     
     def send_all(
         self,
@@ -286,7 +434,7 @@ class NotificationRouter:
         title: Optional[str] = None,
         body: Optional[str] = None,
     ) -> list[DeliveryResult]:
-        """Send notification through all specified channels.
+        """Send notification through all specified channels concurrently.
         
         Args:
             reminder: Reminder object to send
@@ -295,7 +443,7 @@ class NotificationRouter:
             body: Optional body override
             
         Returns:
-            List of DeliveryResult for each channel attempt
+            List of DeliveryResult for each channel attempt, in channel order
         """
         if not title:
             title = f"Milton Reminder ({reminder.kind})"
@@ -305,7 +453,7 @@ class NotificationRouter:
         # Get actions from reminder
         actions = reminder.actions if hasattr(reminder, 'actions') else []
         
-        results = []
+        pending: list[Future | DeliveryResult] = []
         
         for channel in channels:
             provider = self.providers.get(channel)
@@ -313,7 +461,7 @@ class NotificationRouter:
             if provider is None:
                 # Unknown channel - log and skip
                 logger.warning(f"No provider registered for channel '{channel}' (reminder {reminder.id})")
-                results.append(DeliveryResult(
+                pending.append(DeliveryResult(
                     ok=False,
                     provider=channel,
                     error=f"Unknown channel '{channel}'",
@@ -321,30 +469,18 @@ class NotificationRouter:
                 ))
                 continue
             
-            try:
-                result = provider.send(
-                    reminder,
-                    title=title,
-                    body=body,
-                    actions=actions,
-                )
-                results.append(result)
-                
-                if result.ok:
-                    logger.info(f"Delivered reminder {reminder.id} via {channel}")
-                else:
-                    logger.warning(f"Failed to deliver reminder {reminder.id} via {channel}: {result.error}")
-            
-            except Exception as exc:
-                logger.error(f"Exception delivering reminder {reminder.id} via {channel}: {exc}", exc_info=True)
-                results.append(DeliveryResult(
-                    ok=False,
-                    provider=channel,
-                    error=f"Exception: {str(exc)[:200]}",
-                    metadata={"exception_type": type(exc).__name__},
-                ))
+            pending.append(self._executor(channel).submit(
+                self._send_one, channel, provider, reminder, title, body, actions,
+            ))
         
-        return results
+        return [item.result() if isinstance(item, Future) else item for item in pending]
+
+    def close(self) -> None:
+        """Stop the channel worker pools (in-flight sends finish first)."""
+        with self._lock:
+            executors, self._executors = list(self._executors.values()), {}
+        for executor in executors:
+            executor.shutdown(wait=True)
 
 
 def create_default_router(
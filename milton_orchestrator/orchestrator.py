@@ -12,12 +12,11 @@ from collections import deque
 from pathlib import Path
 from typing import Optional, Set
 
-import requests
-
 from .config import Config
 from .ntfy_client import NtfyClient, subscribe_topics_with_reconnect
 from .ntfy_summarizer import truncate_text
 from .input_normalizer import normalize_incoming_input
+from .llm_transport import get_llm_transport, resolve_base_url
 from .output_publisher import publish_response
 from .perplexity_client import PerplexityClient, fallback_prompt_optimizer
 from .prompt_builder import ClaudePromptBuilder
@@ -653,18 +652,7 @@ class Orchestrator:
 
     @staticmethod
     def _run_chat_llm(content: str) -> str:
-        base_url = os.getenv("LLM_API_URL", "http://localhost:8000").rstrip("/")
-        model = (
-            os.getenv("LLM_MODEL")
-            or os.getenv("OLLAMA_MODEL")
-            or "llama31-8b-instruct"
-        )
-        api_key = (
-            os.getenv("LLM_API_KEY")
-            or os.getenv("VLLM_API_KEY")
-            or os.getenv("OLLAMA_API_KEY")
-        )
-        headers = {"Authorization": f"Bearer {api_key}"} if api_key else {}
+        base_url = resolve_base_url()
         max_tokens = int(os.getenv("MILTON_CHAT_MAX_TOKENS", "4000"))
         
         # CRITICAL: Add stop sequences to prevent runaway token generation
@@ -677,24 +665,23 @@ class Orchestrator:
             "\n\nassistant",  # Double newline + assistant
         ]
         
-        payload = {
-            "model": model,
-            "messages": [{"role": "user", "content": content}],
-            "max_tokens": max_tokens,
-            "temperature": 0.7,
-            "stop": stop_sequences,  # ← FIX: Add stop sequences
-        }
-        response = requests.post(
+        transport = get_llm_transport()
+        payload = transport.chat_payload(
+            [{"role": "user", "content": content}],
+            max_tokens=max_tokens,
+            temperature=0.7,
+            stop=stop_sequences,  # ← FIX: Add stop sequences
+        )
+        response = transport.post(
             f"{base_url}/v1/chat/completions",
-            json=payload,
-            headers=headers,
-            timeout=120,
+            payload,
+            caller="orchestrator",
         )
         
         # Check response status and raise with body on error
-        if not response.ok:
+        if not response.is_success:
             raise RuntimeError(
-                f"LLM API error: {response.status_code} {response.reason} - {response.text}"
+                f"LLM API error: {response.status_code} {response.reason_phrase} - {response.text}"
             )
         
         data = response.json()
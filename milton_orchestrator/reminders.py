@@ -5,15 +5,17 @@ from __future__ import annotations
 import json
 import logging
 import os
+import random
 import re
 import requests
 import sqlite3
 import threading
 import time
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
 from dataclasses import dataclass, field
 from datetime import datetime, timedelta
 from pathlib import Path
-from typing import Any, Callable, Iterable, Optional
+from typing import Any, Callable, Iterable, Iterator, Optional
 
 try:
     import dateparser
@@ -46,6 +48,15 @@ _LEGACY_SOURCE_MAP = {
 # Default action buttons for reminders
 DEFAULT_ACTIONS = ["DONE", "SNOOZE_30", "DELAY_2H"]
 
+# UPDATE ... RETURNING lets claim_due_reminders claim in one statement
+_SQLITE_HAS_RETURNING = sqlite3.sqlite_version_info >= (3, 35, 0)
+
+# Audit entries loaded onto Reminder.audit_log by ReminderStore.get_reminder
+AUDIT_LOG_LIMIT = 100
+
+# delivery_attempts channel name for schedulers using a legacy publish_fn
+LEGACY_PUBLISH_CHANNEL = "publish_fn"
+
 
 def _serialize_list(items: list) -> str:
     """Serialize a list to JSON string for storage."""
@@ -133,6 +144,39 @@ def _serialize_channels(channels: list[str]) -> str:
     return json.dumps(unique)
 
 
+_INSERT_EVENT_SQL = """INSERT INTO reminder_events (reminder_id, ts, action, actor, details, metadata)
+                        VALUES (?, ?, ?, ?, ?, ?)"""
+
+
+def _event_row(reminder_id: int, entry: dict) -> tuple:
+    """reminder_events row for an audit entry dict (ts, action, actor, details, metadata)."""
+    metadata = entry.get("metadata")
+    return (
+        reminder_id,
+        int(entry.get("ts") or time.time()),
+        entry.get("action") or "unknown",
+        entry.get("actor"),
+        entry.get("details"),
+        json.dumps(metadata) if metadata is not None else None,
+    )
+
+
+def _event_entry(row: sqlite3.Row) -> dict:
+    """Audit entry dict for a reminder_events row."""
+    entry = {
+        "ts": row["ts"],
+        "action": row["action"],
+        "actor": row["actor"],
+        "details": row["details"],
+    }
+    if row["metadata"] is not None:
+        try:
+            entry["metadata"] = json.loads(row["metadata"])
+        except json.JSONDecodeError:
+            entry["metadata"] = row["metadata"]
+    return entry
+
+
 @dataclass
 class Reminder:
     """Stored reminder record with Phase 0 enhancements and multi-channel support.
@@ -158,6 +202,8 @@ class Reminder:
     actions: list = field(default_factory=lambda: list(DEFAULT_ACTIONS))
     source: str = "other"
     updated_at: Optional[int] = None
+    # Last AUDIT_LOG_LIMIT entries, loaded by ReminderStore.get_reminder; bulk
+    # queries leave it empty (use ReminderStore.iter_audit_log for full history)
     audit_log: list = field(default_factory=list)
     # Phase 2C field
     context_ref: Optional[str] = None
@@ -213,9 +259,31 @@ class ReminderStore:
         self._lock = threading.Lock()
         self._conn = sqlite3.connect(self.db_path, check_same_thread=False)
         self._conn.row_factory = sqlite3.Row
+        self._listeners: list[Callable[[str, int], None]] = []
         self._init_db()
         self._migrate_schema()
 
+    def add_listener(self, callback: Callable[[str, int], None]) -> None:
+        """Register a callback for schedule changes made through this store.
+
+        The callback receives ``(event, reminder_id)`` with event one of
+        ``"added"``, ``"snoozed"``, ``"canceled"`` or ``"status"``. Writes from
+        other connections are not reported; see ``data_version``.
+        """
+        self._listeners.append(callback)
+
+    def _notify(self, event: str, reminder_id: int) -> None:
+        for callback in self._listeners:
+            try:
+                callback(event, reminder_id)
+            except Exception as exc:
+                logger.warning(f"Reminder store listener failed on {event}: {exc}")
+
+    def data_version(self) -> int:
+        """SQLite data_version; changes when another connection commits."""
+        with self._lock:
+            return int(self._conn.execute("PRAGMA data_version").fetchone()[0])
+
     def _init_db(self) -> None:
         with self._conn:
             self._conn.execute(
@@ -249,6 +317,46 @@ class ReminderStore:
                 """
             )
             
+            # Per-channel delivery retry queue (state: pending | delivered | dead)
+            self._conn.execute(
+                """
+                CREATE TABLE IF NOT EXISTS delivery_attempts (
+                    reminder_id INTEGER NOT NULL,
+                    channel TEXT NOT NULL,
+                    attempts INTEGER NOT NULL DEFAULT 0,
+                    state TEXT NOT NULL DEFAULT 'pending',
+                    next_attempt_at INTEGER,
+                    last_error TEXT,
+                    created_at INTEGER NOT NULL,
+                    updated_at INTEGER NOT NULL,
+                    PRIMARY KEY (reminder_id, channel)
+                )
+                """
+            )
+            self._conn.execute(
+                """CREATE INDEX IF NOT EXISTS idx_delivery_attempts_pending
+                   ON delivery_attempts (next_attempt_at) WHERE state = 'pending'"""
+            )
+
+            # Append-only audit history (replaces the reminders.audit_log JSON column)
+            self._conn.execute(
+                """
+                CREATE TABLE IF NOT EXISTS reminder_events (
+                    id INTEGER PRIMARY KEY AUTOINCREMENT,
+                    reminder_id INTEGER NOT NULL,
+                    ts INTEGER NOT NULL,
+                    action TEXT NOT NULL,
+                    actor TEXT,
+                    details TEXT,
+                    metadata TEXT
+                )
+                """
+            )
+            self._conn.execute(
+                """CREATE INDEX IF NOT EXISTS idx_reminder_events_reminder_ts
+                   ON reminder_events (reminder_id, ts)"""
+            )
+
             cursor = self._conn.execute("PRAGMA table_info(reminders)")
             columns = {row[1] for row in cursor.fetchall()}
 
@@ -346,6 +454,39 @@ class ReminderStore:
                 (_serialize_channels(["ntfy"]),),
             )
 
+            # Hot-path indexes. The pending set (not sent, not canceled) stays
+            # small however much history accumulates, so claims, next-due and
+            # health queries scan only it; status rides along in the index.
+            self._conn.execute(
+                """CREATE INDEX IF NOT EXISTS idx_reminders_pending
+                   ON reminders (due_at, priority DESC, status)
+                   WHERE sent_at IS NULL AND canceled_at IS NULL"""
+            )
+            self._conn.execute(
+                """CREATE INDEX IF NOT EXISTS idx_reminders_errors
+                   ON reminders (updated_at) WHERE last_error IS NOT NULL"""
+            )
+
+            # Move JSON audit logs into reminder_events, emptying the column
+            legacy_logs = list(self._conn.execute(
+                "SELECT id, audit_log FROM reminders WHERE audit_log IS NOT NULL AND audit_log NOT IN ('', '[]')"
+            ))
+            if legacy_logs:
+                logger.info(f"Migrating audit logs of {len(legacy_logs)} reminders to reminder_events")
+                self._conn.executemany(
+                    _INSERT_EVENT_SQL,
+                    [
+                        _event_row(row["id"], entry)
+                        for row in legacy_logs
+                        for entry in _deserialize_list(row["audit_log"])
+                        if isinstance(entry, dict)
+                    ],
+                )
+                self._conn.executemany(
+                    "UPDATE reminders SET audit_log = '[]' WHERE id = ?",
+                    [(row["id"],) for row in legacy_logs],
+                )
+
     def add_reminder(
         self,
         kind: str,
@@ -390,25 +531,25 @@ class ReminderStore:
             if action not in REMINDER_ACTIONS:
                 raise ValueError(f"Invalid action '{action}'")
 
-        # Create initial audit log entry
-        audit_log = [{
-            "ts": created_at,
-            "action": "created",
-            "actor": "system",
-            "details": f"Reminder created via {source}",
-        }]
-
         with self._lock, self._conn:
             cursor = self._conn.execute(
                 """INSERT INTO reminders
                    (kind, message, due_at, created_at, timezone, delivery_target,
-                    channel, priority, status, actions, source, updated_at, audit_log, context_ref)
-                   VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)""",
+                    channel, priority, status, actions, source, updated_at, context_ref)
+                   VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)""",
                 (kind, message, due_at, created_at, timezone, delivery_target,
                  channel_json, priority, "scheduled", _serialize_list(actions),
-                 source, created_at, _serialize_list(audit_log), context_ref),
+                 source, created_at, context_ref),
             )
-            return int(cursor.lastrowid)
+            reminder_id = int(cursor.lastrowid)
+            self._conn.execute(_INSERT_EVENT_SQL, _event_row(reminder_id, {
+                "ts": created_at,
+                "action": "created",
+                "actor": "system",
+                "details": f"Reminder created via {source}",
+            }))
+        self._notify("added", reminder_id)
+        return reminder_id
 
     def list_reminders(self, include_sent: bool = False, include_canceled: bool = False) -> list[Reminder]:
         clauses = []
@@ -434,29 +575,23 @@ class ReminderStore:
         """Cancel a reminder with audit logging."""
         canceled_at = canceled_at or int(time.time())
         with self._lock, self._conn:
-            # Get current audit log
-            row = self._conn.execute(
-                "SELECT audit_log FROM reminders WHERE id = ? AND sent_at IS NULL AND canceled_at IS NULL",
-                (reminder_id,),
-            ).fetchone()
-            if not row:
-                return False
-
-            audit_log = _deserialize_list(row["audit_log"] if row else None)
-            audit_log.append({
-                "ts": canceled_at,
-                "action": "canceled",
-                "actor": actor,
-                "details": details or "Reminder canceled",
-            })
-
             cursor = self._conn.execute(
                 """UPDATE reminders
-                   SET canceled_at = ?, status = 'canceled', updated_at = ?, audit_log = ?
+                   SET canceled_at = ?, status = 'canceled', updated_at = ?
                    WHERE id = ? AND sent_at IS NULL AND canceled_at IS NULL""",
-                (canceled_at, canceled_at, _serialize_list(audit_log), reminder_id),
+                (canceled_at, canceled_at, reminder_id),
             )
-            return cursor.rowcount > 0
+            canceled = cursor.rowcount > 0
+            if canceled:
+                self._conn.execute(_INSERT_EVENT_SQL, _event_row(reminder_id, {
+                    "ts": canceled_at,
+                    "action": "canceled",
+                    "actor": actor,
+                    "details": details or "Reminder canceled",
+                }))
+        if canceled:
+            self._notify("canceled", reminder_id)
+        return canceled
 
     def get_due(self, now_ts: Optional[int] = None) -> list[Reminder]:
         now_ts = now_ts or int(time.time())
@@ -469,6 +604,15 @@ class ReminderStore:
             )
         return [self._row_to_reminder(row) for row in rows]
 
+    def next_due_at(self) -> Optional[int]:
+        """Earliest due_at among reminders ``claim_due_reminders`` could claim."""
+        with self._lock:
+            row = self._conn.execute(
+                """SELECT MIN(due_at) AS due_at FROM reminders
+                   WHERE sent_at IS NULL AND canceled_at IS NULL AND status = 'scheduled'"""
+            ).fetchone()
+        return int(row["due_at"]) if row["due_at"] is not None else None
+
     def claim_due_reminders(
         self, now_ts: Optional[int] = None, limit: int = 100
     ) -> list[Reminder]:
@@ -476,7 +620,8 @@ class ReminderStore:
 
         This method prevents double-firing by atomically updating reminders
         from scheduled to fired state. Only reminders successfully claimed
-        by THIS call will be returned.
+        by THIS call will be returned. On SQLite 3.35+ the claim is a single
+        UPDATE ... RETURNING over idx_reminders_pending.
 
         Args:
             now_ts: Current timestamp (defaults to now)
@@ -487,6 +632,34 @@ class ReminderStore:
         """
         now_ts = now_ts or int(time.time())
 
+        if _SQLITE_HAS_RETURNING:
+            with self._lock, self._conn:
+                rows = list(
+                    self._conn.execute(
+                        """
+                        UPDATE reminders
+                        SET sent_at = ?,
+                            status = 'fired',
+                            updated_at = ?
+                        WHERE id IN (
+                            SELECT id FROM reminders
+                            WHERE due_at <= ?
+                              AND sent_at IS NULL
+                              AND canceled_at IS NULL
+                              AND status = 'scheduled'
+                            ORDER BY due_at ASC, priority DESC
+                            LIMIT ?
+                        )
+                        RETURNING *
+                        """,
+                        (now_ts, now_ts, now_ts, limit),
+                    )
+                )
+            # RETURNING order is unspecified; match the ORDER BY above
+            rows.sort(key=lambda row: row["priority"] or "", reverse=True)
+            rows.sort(key=lambda row: row["due_at"])
+            return [self._row_to_reminder(row) for row in rows]
+
         with self._lock, self._conn:
             # Step 1: Select IDs to claim within the transaction
             id_rows = list(
@@ -564,7 +737,17 @@ class ReminderStore:
             row = self._conn.execute(
                 "SELECT * FROM reminders WHERE id = ?", (reminder_id,)
             ).fetchone()
-        return self._row_to_reminder(row) if row else None
+            if not row:
+                return None
+            # Most recent entries only; the full history is in iter_audit_log
+            events = list(self._conn.execute(
+                """SELECT id, ts, action, actor, details, metadata FROM reminder_events
+                   WHERE reminder_id = ? ORDER BY ts DESC, id DESC LIMIT ?""",
+                (reminder_id, AUDIT_LOG_LIMIT),
+            ))
+        reminder = self._row_to_reminder(row)
+        reminder.audit_log = [_event_entry(event) for event in reversed(events)]
+        return reminder
 
     def update_status(
         self,
@@ -583,25 +766,18 @@ class ReminderStore:
         now_ts = int(time.time())
         with self._lock, self._conn:
             row = self._conn.execute(
-                "SELECT audit_log, status FROM reminders WHERE id = ?",
+                "SELECT status FROM reminders WHERE id = ?",
                 (reminder_id,),
             ).fetchone()
             if not row:
                 return False
 
             old_status = row["status"]
-            audit_log = _deserialize_list(row["audit_log"])
-            audit_log.append({
-                "ts": now_ts,
-                "action": f"status_change:{old_status}->{new_status}",
-                "actor": actor,
-                "details": details or f"Status changed to {new_status}",
-            })
 
             # Determine timestamp updates based on new status
             sent_at_update = ""
             canceled_at_update = ""
-            params: list[Any] = [new_status, now_ts, _serialize_list(audit_log)]
+            params: list[Any] = [new_status, now_ts]
 
             if new_status == "fired":
                 sent_at_update = ", sent_at = ?"
@@ -613,11 +789,21 @@ class ReminderStore:
             params.append(reminder_id)
             cursor = self._conn.execute(
                 f"""UPDATE reminders
-                   SET status = ?, updated_at = ?, audit_log = ?{sent_at_update}{canceled_at_update}
+                   SET status = ?, updated_at = ?{sent_at_update}{canceled_at_update}
                    WHERE id = ?""",
                 params,
             )
-            return cursor.rowcount > 0
+            updated = cursor.rowcount > 0
+            if updated:
+                self._conn.execute(_INSERT_EVENT_SQL, _event_row(reminder_id, {
+                    "ts": now_ts,
+                    "action": f"status_change:{old_status}->{new_status}",
+                    "actor": actor,
+                    "details": details or f"Status changed to {new_status}",
+                }))
+        if updated:
+            self._notify("status", reminder_id)
+        return updated
 
     def snooze(
         self,
@@ -633,7 +819,7 @@ class ReminderStore:
         now_ts = int(time.time())
         with self._lock, self._conn:
             row = self._conn.execute(
-                "SELECT due_at, audit_log FROM reminders WHERE id = ?",
+                "SELECT due_at FROM reminders WHERE id = ?",
                 (reminder_id,),
             ).fetchone()
             if not row:
@@ -641,21 +827,24 @@ class ReminderStore:
 
             old_due_at = row["due_at"]
             new_due_at = now_ts + (minutes * 60)
-            audit_log = _deserialize_list(row["audit_log"])
-            audit_log.append({
-                "ts": now_ts,
-                "action": f"snoozed:{minutes}min",
-                "actor": actor,
-                "details": details or f"Snoozed for {minutes} minutes (was due at {old_due_at})",
-            })
 
             cursor = self._conn.execute(
                 """UPDATE reminders
-                   SET due_at = ?, status = 'scheduled', sent_at = NULL, updated_at = ?, audit_log = ?
+                   SET due_at = ?, status = 'scheduled', sent_at = NULL, updated_at = ?
                    WHERE id = ?""",
-                (new_due_at, now_ts, _serialize_list(audit_log), reminder_id),
+                (new_due_at, now_ts, reminder_id),
             )
-            return cursor.rowcount > 0
+            snoozed = cursor.rowcount > 0
+            if snoozed:
+                self._conn.execute(_INSERT_EVENT_SQL, _event_row(reminder_id, {
+                    "ts": now_ts,
+                    "action": f"snoozed:{minutes}min",
+                    "actor": actor,
+                    "details": details or f"Snoozed for {minutes} minutes (was due at {old_due_at})",
+                }))
+        if snoozed:
+            self._notify("snoozed", reminder_id)
+        return snoozed
 
     def acknowledge(
         self,
@@ -681,7 +870,8 @@ class ReminderStore:
     ) -> bool:
         """Append audit log entries to a reminder.
         
-        Uses BEGIN IMMEDIATE to prevent lost updates across processes.
+        Entries are inserted into the append-only reminder_events table, so
+        the cost does not grow with the reminder's history.
         
         Args:
             reminder_id: Reminder ID
@@ -691,34 +881,155 @@ class ReminderStore:
             True if successful, False if reminder not found
         """
         now_ts = int(time.time())
-        with self._lock:
-            # BEGIN IMMEDIATE to acquire write lock before reading
-            self._conn.execute("BEGIN IMMEDIATE")
-            try:
-                row = self._conn.execute(
-                    "SELECT audit_log FROM reminders WHERE id = ?",
-                    (reminder_id,),
-                ).fetchone()
-                if not row:
-                    self._conn.rollback()
-                    return False
-                
-                audit_log = _deserialize_list(row["audit_log"])
-                audit_log.extend(entries)
-                
-                # Keep last 100 entries to prevent unbounded growth
-                if len(audit_log) > 100:
-                    audit_log = audit_log[-100:]
-                
+        with self._lock, self._conn:
+            cursor = self._conn.execute(
+                "UPDATE reminders SET updated_at = ? WHERE id = ?",
+                (now_ts, reminder_id),
+            )
+            if cursor.rowcount == 0:
+                return False
+            self._conn.executemany(
+                _INSERT_EVENT_SQL, [_event_row(reminder_id, entry) for entry in entries]
+            )
+            return True
+
+    def append_audit_events(self, events: list[tuple[int, dict]]) -> None:
+        """Insert ``(reminder_id, entry)`` audit events for many reminders in one transaction."""
+        if not events:
+            return
+        now_ts = int(time.time())
+        reminder_ids = sorted({reminder_id for reminder_id, _ in events})
+        placeholders = ",".join("?" for _ in reminder_ids)
+        with self._lock, self._conn:
+            self._conn.executemany(
+                _INSERT_EVENT_SQL, [_event_row(reminder_id, entry) for reminder_id, entry in events]
+            )
+            self._conn.execute(
+                f"UPDATE reminders SET updated_at = ? WHERE id IN ({placeholders})",
+                [now_ts, *reminder_ids],
+            )
+
+    def iter_audit_log(
+        self,
+        reminder_id: int,
+        since: Optional[int] = None,
+        page_size: int = 100,
+    ) -> Iterator[dict]:
+        """Yield a reminder's audit entries oldest first, one page query at a time.
+
+        Args:
+            reminder_id: Reminder ID
+            since: Only entries with ts >= since
+            page_size: Rows fetched per query
+        """
+        last_ts, last_id = (since if since is not None else -1), -1
+        while True:
+            with self._lock:
+                rows = list(self._conn.execute(
+                    """SELECT id, ts, action, actor, details, metadata FROM reminder_events
+                       WHERE reminder_id = ? AND (ts > ? OR (ts = ? AND id > ?))
+                       ORDER BY ts ASC, id ASC LIMIT ?""",
+                    (reminder_id, last_ts, last_ts, last_id, page_size),
+                ))
+            for row in rows:
+                yield _event_entry(row)
+            if len(rows) < page_size:
+                return
+            last_ts, last_id = rows[-1]["ts"], rows[-1]["id"]
+
+    def enqueue_retry(
+        self, reminder_id: int, channel: str, error: Optional[str], next_attempt_at: int
+    ) -> None:
+        """Queue a failed first delivery on ``channel`` for retry."""
+        now_ts = int(time.time())
+        with self._lock, self._conn:
+            self._conn.execute(
+                """INSERT INTO delivery_attempts
+                   (reminder_id, channel, attempts, state, next_attempt_at, last_error, created_at, updated_at)
+                   VALUES (?, ?, 1, 'pending', ?, ?, ?, ?)
+                   ON CONFLICT (reminder_id, channel) DO UPDATE SET
+                       attempts = 1, state = 'pending',
+                       next_attempt_at = excluded.next_attempt_at,
+                       last_error = excluded.last_error, updated_at = excluded.updated_at""",
+                (reminder_id, channel, next_attempt_at, error, now_ts, now_ts),
+            )
+
+    def claim_due_retries(
+        self, now_ts: Optional[int] = None, limit: int = 20, lease_seconds: int = 120
+    ) -> list[tuple[int, str, int]]:
+        """Lease due retries as ``(reminder_id, channel, attempts)``.
+
+        The lease pushes next_attempt_at forward so other schedulers skip the
+        rows; a retry whose worker dies becomes due again when it expires.
+        """
+        now_ts = now_ts or int(time.time())
+        with self._lock, self._conn:
+            rows = list(
+                self._conn.execute(
+                    """SELECT reminder_id, channel, attempts FROM delivery_attempts
+                       WHERE state = 'pending' AND next_attempt_at <= ?
+                       ORDER BY next_attempt_at ASC LIMIT ?""",
+                    (now_ts, limit),
+                )
+            )
+            for row in rows:
                 self._conn.execute(
-                    "UPDATE reminders SET audit_log = ?, updated_at = ? WHERE id = ?",
-                    (_serialize_list(audit_log), now_ts, reminder_id),
+                    """UPDATE delivery_attempts SET next_attempt_at = ?, updated_at = ?
+                       WHERE reminder_id = ? AND channel = ?""",
+                    (now_ts + lease_seconds, now_ts, row["reminder_id"], row["channel"]),
                 )
-                self._conn.commit()
-                return True
-            except Exception:
-                self._conn.rollback()
-                raise
+        return [(int(r["reminder_id"]), r["channel"], int(r["attempts"])) for r in rows]
+
+    def record_retry(
+        self,
+        reminder_id: int,
+        channel: str,
+        *,
+        ok: bool,
+        error: Optional[str] = None,
+        next_attempt_at: Optional[int] = None,
+    ) -> None:
+        """Record a retry outcome: delivered, rescheduled, or dead-lettered
+        (failed with no ``next_attempt_at``)."""
+        now_ts = int(time.time())
+        state = "delivered" if ok else ("pending" if next_attempt_at is not None else "dead")
+        with self._lock, self._conn:
+            self._conn.execute(
+                """UPDATE delivery_attempts
+                   SET attempts = attempts + 1, state = ?, next_attempt_at = ?,
+                       last_error = COALESCE(?, last_error), updated_at = ?
+                   WHERE reminder_id = ? AND channel = ?""",
+                (state, next_attempt_at if state == "pending" else None, error, now_ts,
+                 reminder_id, channel),
+            )
+
+    def drop_retries(self, reminder_id: int) -> None:
+        """Forget queued retries for a reminder that no longer needs delivering."""
+        with self._lock, self._conn:
+            self._conn.execute(
+                "DELETE FROM delivery_attempts WHERE reminder_id = ? AND state = 'pending'",
+                (reminder_id,),
+            )
+
+    def next_retry_at(self) -> Optional[int]:
+        """Earliest next_attempt_at in the retry queue."""
+        with self._lock:
+            row = self._conn.execute(
+                """SELECT MIN(next_attempt_at) AS next_at FROM delivery_attempts
+                   WHERE state = 'pending'"""
+            ).fetchone()
+        return int(row["next_at"]) if row["next_at"] is not None else None
+
+    def list_delivery_attempts(self, state: Optional[str] = None) -> list[dict]:
+        """Retry queue rows (optionally filtered by state), oldest first."""
+        query = "SELECT * FROM delivery_attempts"
+        params: tuple = ()
+        if state:
+            query += " WHERE state = ?"
+            params = (state,)
+        with self._lock:
+            rows = list(self._conn.execute(query + " ORDER BY created_at ASC", params))
+        return [dict(row) for row in rows]
 
     def close(self) -> None:
         with self._lock:
@@ -757,6 +1068,8 @@ class ReminderStore:
         - heartbeat_age_sec: Seconds since last heartbeat (None if never)
         - last_ntfy_ok: Unix timestamp of last successful ntfy delivery (None if never)
         - last_error: Most recent error message from any reminder (None if no errors)
+        - retry_queue_depth: Channel deliveries waiting to be retried
+        - dead_letter_count: Channel deliveries that exhausted their retries
         """
         now_ts = int(time.time())
         
@@ -781,6 +1094,14 @@ class ReminderStore:
                    ORDER BY updated_at DESC LIMIT 1"""
             ).fetchone()
             last_error = last_error_row["last_error"] if last_error_row else None
+
+            retry_counts = {
+                row["state"]: row["cnt"]
+                for row in self._conn.execute(
+                    """SELECT state, COUNT(*) AS cnt FROM delivery_attempts
+                       WHERE state IN ('pending', 'dead') GROUP BY state"""
+                )
+            }
         
         # Get metadata for heartbeat and ntfy
         heartbeat_meta = self.get_metadata("last_heartbeat")
@@ -797,6 +1118,8 @@ class ReminderStore:
             "heartbeat_age_sec": heartbeat_age,
             "last_ntfy_ok": last_ntfy_ok,
             "last_error": last_error,
+            "retry_queue_depth": retry_counts.get("pending", 0),
+            "dead_letter_count": retry_counts.get("dead", 0),
         }
 
     @staticmethod
@@ -830,24 +1153,42 @@ class ReminderStore:
             actions=_deserialize_list(safe_get(row, "actions", "[]")) or list(DEFAULT_ACTIONS),
             source=source,
             updated_at=safe_get(row, "updated_at"),
-            audit_log=_deserialize_list(safe_get(row, "audit_log", "[]")),
             # Phase 2C field
             context_ref=safe_get(row, "context_ref"),
         )
 
 
 class ReminderScheduler(threading.Thread):
-    """Background scheduler that dispatches reminders when due with multi-channel support."""
+    """Background scheduler that dispatches reminders when due with multi-channel support.
+
+    The thread sleeps until the earliest pending ``due_at`` (or the next
+    heartbeat) rather than polling. Schedule changes made through the same
+    ReminderStore wake it immediately; changes committed by other processes
+    are picked up by checking SQLite's data_version every
+    ``interval_seconds``, which is a read and costs no disk writes.
+
+    A channel that fails its first delivery goes into the store's
+    delivery_attempts queue and is retried on its own with jittered
+    exponential backoff (``retry_backoff`` * 2^n) until ``max_retries`` is
+    used up, after which it is dead-lettered. Retries run on a separate
+    pool so they never hold up newly due reminders.
+    """
+
+    claim_batch = 100
+    retry_batch = 20
+    retry_lease_seconds = 120
 
     def __init__(
         self,
         store: ReminderStore,
         notification_router=None,  # NotificationRouter from notifications.py
         publish_fn: Optional[Callable[[str, str, int], bool]] = None,  # Legacy fallback
-        interval_seconds: int = 5,
+        interval_seconds: float = 5,
         now_fn: Optional[Callable[[], int]] = None,
         max_retries: int = 3,
         retry_backoff: int = 60,
+        heartbeat_seconds: float = 30,
+        delivery_workers: int = 8,
     ):
         """Initialize reminder scheduler.
         
@@ -855,10 +1196,16 @@ class ReminderScheduler(threading.Thread):
             store: ReminderStore instance
             notification_router: NotificationRouter for multi-channel delivery (preferred)
             publish_fn: Legacy single-channel publish function (fallback)
-            interval_seconds: Polling interval in seconds
+            interval_seconds: How often an idle scheduler checks for reminders
+                written by other processes
             now_fn: Override current time (for testing)
-            max_retries: Max delivery retries (currently unused)
-            retry_backoff: Backoff between retries (currently unused)
+            max_retries: Retries per failed channel before it is dead-lettered
+                (0 disables retries)
+            retry_backoff: Base delay in seconds before the first retry; doubles
+                with each further attempt
+            heartbeat_seconds: How often the last_heartbeat metadata is written
+                (keep below the 60s health check threshold)
+            delivery_workers: Claimed reminders delivered concurrently
         """
         super().__init__(daemon=True)
         self.store = store
@@ -866,47 +1213,249 @@ class ReminderScheduler(threading.Thread):
         self.publish_fn = publish_fn
         self.interval_seconds = interval_seconds
         self.now_fn = now_fn or (lambda: int(time.time()))
+        # Sub-second clock for sleeping until due_at; follows now_fn when overridden
+        self._clock: Callable[[], float] = now_fn or time.time
         self.max_retries = max_retries
         self.retry_backoff = retry_backoff
+        self.heartbeat_seconds = heartbeat_seconds
+        self.delivery_workers = max(1, delivery_workers)
+        self._delivery_pool: Optional[ThreadPoolExecutor] = None
+        self._retry_pool: Optional[ThreadPoolExecutor] = None
+        self._pool_lock = threading.Lock()
         self._stop_event = threading.Event()
-        self._retry_tracker: dict[int, tuple[int, int]] = {}  # reminder_id -> (attempts, next_retry_ts)
+        self._wake = threading.Event()
 
     def run(self) -> None:
         logger.info("Reminder scheduler started")
+        self.store.add_listener(self._on_store_event)
+        next_heartbeat = 0.0
         while not self._stop_event.is_set():
+            self._wake.clear()
+            wake_at: Optional[float] = None
+            version: Optional[int] = None
             try:
-                self.run_once()
+                # Taken before claiming so a remote write during this pass still wakes us
+                version = self.store.data_version()
+                if time.monotonic() >= next_heartbeat:
+                    self.store.set_metadata("last_heartbeat", str(self.now_fn()))
+                    next_heartbeat = time.monotonic() + self.heartbeat_seconds
+                claimed = self.process_due()
+                self.process_retries()
+                now_ts = self.now_fn()
+                next_due = self.store.next_due_at()
+                next_retry = self.store.next_retry_at()
+                if claimed >= self.claim_batch or (next_retry is not None and next_retry <= now_ts):
+                    wake_at = self._clock()  # more is due than one batch took; go straight round
+                else:
+                    upcoming = [t for t in (next_due, next_retry) if t is not None and t > now_ts]
+                    wake_at = min(upcoming) if upcoming else None
             except Exception as exc:
                 logger.error(f"Reminder scheduler error: {exc}", exc_info=True)
-            self._stop_event.wait(self.interval_seconds)
+                version = None
+            self._sleep(wake_at, next_heartbeat, version)
+
+    def _sleep(self, wake_at: Optional[float], next_heartbeat: float, version: Optional[int]) -> None:
+        """Wait until ``wake_at``, the next heartbeat, a store event or a remote write.
+
+        With nothing pending (or a due reminder that could not be claimed)
+        only the heartbeat and change notifications end the wait.
+        """
+        deadline = next_heartbeat - time.monotonic()
+        if wake_at is not None:
+            deadline = min(deadline, wake_at - self._clock())
+        if version is None:
+            # The last pass failed; retry after one interval
+            deadline = min(deadline, self.interval_seconds)
+        deadline += time.monotonic()
+        while not self._stop_event.is_set():
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                return
+            if self._wake.wait(min(remaining, self.interval_seconds)):
+                return
+            try:
+                if self.store.data_version() != version:
+                    return
+            except Exception as exc:
+                logger.error(f"Reminder scheduler data_version check failed: {exc}")
+                return
+
+    def _on_store_event(self, event: str, reminder_id: int) -> None:
+        self._wake.set()
 
     def run_once(self) -> None:
+        """Record a heartbeat, process one batch of due reminders and wait for due retries."""
+        self.store.set_metadata("last_heartbeat", str(self.now_fn()))
+        self.process_due()
+        self.process_retries(wait=True)
+
+    def process_due(self) -> int:
         """Process one batch of due reminders with exactly-once semantics.
 
         Uses atomic claim mechanism to prevent double-firing even if multiple
-        scheduler instances run concurrently.
+        scheduler instances run concurrently. Returns the number claimed.
         """
         now_ts = self.now_fn()
-        
-        # Record heartbeat
-        self.store.set_metadata("last_heartbeat", str(now_ts))
 
         # Atomically claim due reminders (marks them as fired immediately)
         # This prevents double-firing even with concurrent scheduler instances
-        claimed = self.store.claim_due_reminders(now_ts, limit=100)
+        claimed = self.store.claim_due_reminders(now_ts, limit=self.claim_batch)
 
         if not claimed:
-            logger.debug(f"Scheduler heartbeat: no due reminders at {now_ts}")
-            return
+            logger.debug(f"Scheduler: no due reminders at {now_ts}")
+            return 0
 
         logger.info(f"Claimed {len(claimed)} due reminder(s)")
 
-        # Try to deliver each claimed reminder
+        # Deliver claimed reminders concurrently; each one fans out across
+        # its channels inside the notification router. A reminder's audit
+        # entries are written as soon as its delivery completes, so a crash
+        # mid-batch only loses the entries of deliveries still in flight
+        if len(claimed) == 1 or self.delivery_workers == 1:
+            for reminder in claimed:
+                audit: list[tuple[int, dict]] = []
+                try:
+                    self._deliver_reminder(reminder, now_ts, audit)
+                finally:
+                    self.store.append_audit_events(audit)
+            return len(claimed)
+
+        pool = self._get_delivery_pool()
+        audits: dict = {}
         for reminder in claimed:
-            self._deliver_reminder(reminder, now_ts)
+            audit = []
+            audits[pool.submit(self._deliver_reminder, reminder, now_ts, audit)] = audit
+        pending = set(audits)
+        while pending:
+            done, pending = wait(pending, return_when=FIRST_COMPLETED)
+            # Deliveries that completed together share one audit transaction
+            self.store.append_audit_events([event for future in done for event in audits[future]])
+        for future in audits:
+            future.result()
+        return len(claimed)
+
+    def _record_audit(self, audit: Optional[list], reminder_id: int, entries: list[dict]) -> None:
+        if audit is None:
+            self.store.append_audit_log(reminder_id, entries)
+        else:
+            audit.extend((reminder_id, entry) for entry in entries)
+
+    def _get_delivery_pool(self) -> ThreadPoolExecutor:
+        with self._pool_lock:
+            if self._delivery_pool is None:
+                self._delivery_pool = ThreadPoolExecutor(
+                    max_workers=self.delivery_workers, thread_name_prefix="reminder-delivery"
+                )
+            return self._delivery_pool
+
+    def _get_retry_pool(self) -> ThreadPoolExecutor:
+        with self._pool_lock:
+            if self._retry_pool is None:
+                self._retry_pool = ThreadPoolExecutor(
+                    max_workers=2, thread_name_prefix="reminder-retry"
+                )
+            return self._retry_pool
+
+    def process_retries(self, wait: bool = False) -> int:
+        """Hand due channel retries to the retry pool; returns the number leased.
 
-    def _deliver_reminder(self, reminder, now_ts: int) -> None:
-        """Deliver a single reminder through all configured channels."""
+        With ``wait`` the call blocks until those retries have finished.
+        """
+        leased = self.store.claim_due_retries(
+            self.now_fn(), limit=self.retry_batch, lease_seconds=self.retry_lease_seconds
+        )
+        if not leased:
+            return 0
+        logger.info(f"Retrying {len(leased)} failed channel deliveries")
+        pool = self._get_retry_pool()
+        futures = [pool.submit(self._retry_delivery, *item) for item in leased]
+        if wait:
+            for future in futures:
+                future.result()
+        return len(leased)
+
+    def _retry_delay(self, retry_number: int) -> int:
+        """Backoff before retry ``retry_number`` (1-based), with equal jitter."""
+        delay = self.retry_backoff * (2 ** (retry_number - 1))
+        return int(delay / 2 + random.uniform(0, delay / 2))
+
+    def _queue_retries(self, reminder, failures: list[tuple[str, Optional[str]]], now_ts: int) -> None:
+        if self.max_retries <= 0:
+            return
+        for channel, error in failures:
+            self.store.enqueue_retry(reminder.id, channel, error, now_ts + self._retry_delay(1))
+            logger.info(f"Queued retry for reminder {reminder.id} via {channel}")
+
+    @staticmethod
+    def _retryable(result) -> bool:
+        """Skipped (unknown) channels and stub providers will never succeed."""
+        metadata = result.metadata or {}
+        return not result.ok and not metadata.get("skipped") and not metadata.get("stub")
+
+    def _retry_delivery(self, reminder_id: int, channel: str, attempts: int) -> None:
+        """Retry one channel for one reminder and record the outcome."""
+        try:
+            reminder = self.store.get_reminder(reminder_id)
+            if reminder is None or reminder.status != "fired":
+                # Canceled, acknowledged or snoozed since: nothing left to deliver
+                self.store.drop_retries(reminder_id)
+                return
+
+            now_ts = self.now_fn()
+            title = f"Milton Reminder ({reminder.kind})"
+            ok, error = False, None
+            try:
+                if channel == LEGACY_PUBLISH_CHANNEL:
+                    ok = bool(self.publish_fn and self.publish_fn(reminder.message, title, reminder.id))
+                    error = None if ok else "Delivery failed (legacy publish_fn returned false)"
+                elif self.notification_router:
+                    result = self.notification_router.send_all(
+                        reminder, [channel], title=title, body=reminder.message
+                    )[0]
+                    ok, error = result.ok, result.error
+                else:
+                    error = "No delivery method configured"
+            except Exception as exc:
+                error = f"Exception: {str(exc)[:200]}"
+
+            retries_done = attempts  # attempts counts the first delivery too
+            if ok:
+                self.store.record_retry(reminder_id, channel, ok=True)
+                self.store.set_metadata("last_ntfy_ok", str(now_ts))
+                action, details = "delivery_retry", f"Channel {channel}: success on retry {retries_done}"
+                logger.info(f"Delivered reminder {reminder_id} via {channel} on retry {retries_done}")
+            elif retries_done >= self.max_retries:
+                self.store.record_retry(reminder_id, channel, ok=False, error=error)
+                self.store.mark_error(
+                    reminder_id, f"Dead-lettered {channel} after {retries_done} retries: {error}"[:500]
+                )
+                action, details = "delivery_dead_letter", f"Channel {channel}: gave up after {retries_done} retries ({error})"
+                logger.error(f"Reminder {reminder_id} dead-lettered on {channel}: {error}")
+            else:
+                next_at = now_ts + self._retry_delay(retries_done + 1)
+                self.store.record_retry(reminder_id, channel, ok=False, error=error, next_attempt_at=next_at)
+                action, details = "delivery_retry", f"Channel {channel}: failed on retry {retries_done} ({error})"
+                logger.warning(f"Retry {retries_done} of reminder {reminder_id} via {channel} failed: {error}")
+
+            self.store.append_audit_log(reminder_id, [{
+                "ts": now_ts,
+                "action": action,
+                "actor": "scheduler",
+                "details": details,
+            }])
+        except Exception as exc:
+            # The lease expires and the retry is picked up again
+            logger.error(f"Retry of reminder {reminder_id} via {channel} errored: {exc}", exc_info=True)
+        finally:
+            self._wake.set()
+
+    def _deliver_reminder(self, reminder, now_ts: int, audit: Optional[list] = None) -> None:
+        """Deliver a single reminder through all configured channels.
+
+        Audit entries go into ``audit`` as ``(reminder_id, entry)`` pairs for
+        the caller to write once delivery completes; without it they are
+        written directly.
+        """
         message = reminder.message
         title = f"Milton Reminder ({reminder.kind})"
         
@@ -933,8 +1482,7 @@ class ReminderScheduler(threading.Thread):
                         "metadata": result.to_dict(),
                     })
                 
-                # Append audit entries to reminder
-                self.store.append_audit_log(reminder.id, audit_entries)
+                self._record_audit(audit, reminder.id, audit_entries)
                 
                 if any_success:
                     logger.info(f"Delivered reminder {reminder.id} via {sum(r.ok for r in results)}/{len(results)} channels")
@@ -943,17 +1491,26 @@ class ReminderScheduler(threading.Thread):
                     error = f"All channels failed: {', '.join(r.provider + ': ' + (r.error or 'unknown') for r in results)}"
                     logger.error(f"Reminder {reminder.id} delivery failed: {error}")
                     self.store.mark_error(reminder.id, error[:500])
+
+                # send_all returns one result per channel, in order
+                channels = reminder.channels if len(reminder.channels) == len(results) else [r.provider for r in results]
+                self._queue_retries(
+                    reminder,
+                    [(ch, r.error) for ch, r in zip(channels, results) if self._retryable(r)],
+                    now_ts,
+                )
                     
             except Exception as exc:
                 error = f"Router exception: {str(exc)[:200]}"
                 logger.error(f"Reminder {reminder.id} router error: {exc}", exc_info=True)
                 self.store.mark_error(reminder.id, error)
-                self.store.append_audit_log(reminder.id, [{
+                self._record_audit(audit, reminder.id, [{
                     "ts": now_ts,
                     "action": "delivery_exception",
                     "actor": "scheduler",
                     "details": error,
                 }])
+                self._queue_retries(reminder, [(ch, error) for ch in reminder.channels], now_ts)
         
         # Fallback to legacy publish_fn (single channel, for backward compatibility)
         elif self.publish_fn:
@@ -962,7 +1519,7 @@ class ReminderScheduler(threading.Thread):
                 if success:
                     logger.info(f"Delivered reminder {reminder.id}: {message[:50]}...")
                     self.store.set_metadata("last_ntfy_ok", str(now_ts))
-                    self.store.append_audit_log(reminder.id, [{
+                    self._record_audit(audit, reminder.id, [{
                         "ts": now_ts,
                         "action": "delivery_attempt",
                         "actor": "scheduler",
@@ -972,27 +1529,36 @@ class ReminderScheduler(threading.Thread):
                     error = "Delivery failed (legacy publish_fn returned false)"
                     logger.error(f"Reminder {reminder.id} delivery failed: {error}")
                     self.store.mark_error(reminder.id, error)
-                    self.store.append_audit_log(reminder.id, [{
+                    self._record_audit(audit, reminder.id, [{
                         "ts": now_ts,
                         "action": "delivery_attempt",
                         "actor": "scheduler",
                         "details": "Legacy publish_fn: failed",
                     }])
+                    self._queue_retries(reminder, [(LEGACY_PUBLISH_CHANNEL, error)], now_ts)
             except Exception as exc:
                 error = f"Exception: {str(exc)[:200]}"
                 logger.error(f"Reminder {reminder.id} delivery exception: {exc}", exc_info=True)
                 self.store.mark_error(reminder.id, error)
-                self.store.append_audit_log(reminder.id, [{
+                self._record_audit(audit, reminder.id, [{
                     "ts": now_ts,
                     "action": "delivery_exception",
                     "actor": "scheduler",
                     "details": error,
                 }])
+                self._queue_retries(reminder, [(LEGACY_PUBLISH_CHANNEL, error)], now_ts)
         else:
             logger.error(f"No delivery method configured for reminder {reminder.id}")
 
     def stop(self) -> None:
         self._stop_event.set()
+        self._wake.set()
+        with self._pool_lock:
+            pools = [self._delivery_pool, self._retry_pool]
+            self._delivery_pool = self._retry_pool = None
+        for pool in pools:
+            if pool is not None:
+                pool.shutdown(wait=False)
 
 
 def parse_reminder_command(
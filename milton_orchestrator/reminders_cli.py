@@ -339,9 +339,9 @@ Environment Variables:
 
     # Run command
     run_parser = subparsers.add_parser("run", help="Run the reminder scheduler daemon")
-    run_parser.add_argument("--interval", "-i", type=int, default=5, help="Check interval in seconds (default: 5)")
-    run_parser.add_argument("--max-retries", type=int, default=3, help="Max retry attempts (default: 3)")
-    run_parser.add_argument("--retry-backoff", type=int, default=60, help="Retry backoff in seconds (default: 60)")
+    run_parser.add_argument("--interval", "-i", type=int, default=5, help="Seconds between checks for reminders added by other processes (default: 5)")
+    run_parser.add_argument("--max-retries", type=int, default=3, help="Retries per failed channel before dead-lettering (default: 3)")
+    run_parser.add_argument("--retry-backoff", type=int, default=60, help="Base retry backoff in seconds, doubled per attempt (default: 60)")
     run_parser.add_argument("--once", action="store_true", help="Run once and exit (for testing)")
     run_parser.add_argument("--verbose", "-v", action="store_true", help="Verbose logging")
     run_parser.set_defaults(func=cmd_run)
@@ -19,7 +19,7 @@ from dataclasses import dataclass, field
 from pathlib import Path
 from typing import Any, Optional, TYPE_CHECKING
 
-import requests
+from milton_orchestrator.llm_transport import LLMTransportError, get_llm_transport
 
 from .config import PromptingConfig
 from .types import (
@@ -128,7 +128,7 @@ class ChainOfVerification:
 
         try:
             url = f"{self.llm_url.rstrip('/')}/v1/models"
-            response = requests.get(url, timeout=5)
+            response = get_llm_transport().get(url, timeout=5, caller="cove")
             self._llm_available = response.status_code == 200
         except Exception:
             self._llm_available = False
@@ -184,28 +184,21 @@ class ChainOfVerification:
         if not self.is_llm_available():
             raise CoveError("LLM not available")
 
-        url = f"{self.llm_url.rstrip('/')}/v1/chat/completions"
-        api_key = os.getenv("LLM_API_KEY") or os.getenv("VLLM_API_KEY")
-        headers = {"Authorization": f"Bearer {api_key}"} if api_key else {}
-
-        payload = {
-            "model": self.model_name,
-            "messages": [
-                {"role": "system", "content": system_prompt},
-                {"role": "user", "content": user_prompt},
-            ],
-            "max_tokens": max_tokens,
-            "temperature": temperature,
-        }
-
         try:
-            response = requests.post(url, json=payload, timeout=60, headers=headers)
-            response.raise_for_status()
-            return response.json()["choices"][0]["message"]["content"]
-        except requests.RequestException as e:
+            return get_llm_transport().chat_text(
+                [
+                    {"role": "system", "content": system_prompt},
+                    {"role": "user", "content": user_prompt},
+                ],
+                base_url=self.llm_url,
+                model=self.model_name,
+                max_tokens=max_tokens,
+                temperature=temperature,
+                timeout=60,
+                caller="cove",
+            )
+        except LLMTransportError as e:
             raise CoveError(f"LLM request failed: {e}")
-        except (KeyError, IndexError) as e:
-            raise CoveError(f"Invalid LLM response format: {e}")
 
     def generate_draft(
         self,
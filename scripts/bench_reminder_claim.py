@@ -0,0 +1,148 @@
+#!/usr/bin/env python3
+"""
+Benchmark ReminderStore.claim_due_reminders against a large history.
+
+Builds a throwaway reminders database with N historical (fired, acknowledged
+or canceled) reminders plus a small pending set, then times repeated claims
+of a freshly due batch under three configurations:
+
+1. legacy: no hot-path indexes, SELECT ids / UPDATE / SELECT rows
+2. indexed: partial indexes, SELECT ids / UPDATE / SELECT rows
+3. returning: partial indexes, single UPDATE ... RETURNING (SQLite >= 3.35)
+
+Usage:
+    python scripts/bench_reminder_claim.py
+    python scripts/bench_reminder_claim.py --history 100000 --batch 10 --iterations 300
+"""
+
+from __future__ import annotations
+
+import argparse
+import random
+import statistics
+import sqlite3
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+# Add repo root to path
+ROOT_DIR = Path(__file__).resolve().parents[1]
+sys.path.insert(0, str(ROOT_DIR))
+
+import milton_orchestrator.reminders as reminders_module
+from milton_orchestrator.reminders import ReminderStore
+
+HOT_PATH_INDEXES = ("idx_reminders_pending", "idx_reminders_errors")
+
+
+def build_database(path: Path, history: int, pending: int, now_ts: int) -> None:
+    """Create the schema through ReminderStore, then bulk-load rows."""
+    ReminderStore(path).close()
+    rng = random.Random(42)
+    rows = []
+    for i in range(history):
+        due_at = now_ts - rng.randint(3600, 365 * 86400)
+        kind = rng.random()
+        if kind < 0.8:
+            status, sent_at, canceled_at = "fired", due_at, None
+        elif kind < 0.9:
+            status, sent_at, canceled_at = "acknowledged", due_at, None
+        else:
+            status, sent_at, canceled_at = "canceled", None, due_at - 60
+        error = "HTTP 500" if rng.random() < 0.02 else None
+        rows.append((due_at, sent_at, canceled_at, status, error, f"history {i}"))
+    for i in range(pending):
+        rows.append((now_ts + rng.randint(3600, 30 * 86400), None, None, "scheduled", None, f"pending {i}"))
+
+    conn = sqlite3.connect(path)
+    with conn:
+        conn.executemany(
+            """INSERT INTO reminders
+               (kind, message, due_at, created_at, sent_at, canceled_at, status,
+                last_error, priority, updated_at)
+               VALUES ('REMIND', ?, ?, ?, ?, ?, ?, ?, 'med', ?)""",
+            [(msg, due, due - 600, sent, canceled, status, error, due)
+             for due, sent, canceled, status, error, msg in rows],
+        )
+    conn.execute("ANALYZE")
+    conn.close()
+
+
+def time_claims(store: ReminderStore, batch: int, iterations: int, now_ts: int) -> list[float]:
+    """Make ``batch`` reminders due, claim them, and record the claim latency (ms)."""
+    latencies = []
+    for i in range(iterations):
+        due_at = now_ts + i
+        with store._lock, store._conn:
+            store._conn.executemany(
+                """INSERT INTO reminders (kind, message, due_at, created_at, status, priority, updated_at)
+                   VALUES ('REMIND', 'bench', ?, ?, 'scheduled', 'med', ?)""",
+                [(due_at, due_at, due_at)] * batch,
+            )
+        started = time.perf_counter()
+        claimed = store.claim_due_reminders(now_ts=due_at, limit=100)
+        latencies.append((time.perf_counter() - started) * 1000)
+        assert len(claimed) == batch, f"claimed {len(claimed)}, expected {batch}"
+    return latencies
+
+
+def run_config(name: str, template: Path, args: argparse.Namespace, now_ts: int) -> dict:
+    workdir = Path(tempfile.mkdtemp(prefix="bench_claim_"))
+    db_path = workdir / "reminders.db"
+    db_path.write_bytes(template.read_bytes())
+
+    store = ReminderStore(db_path)
+    if name == "legacy":
+        with store._lock, store._conn:
+            for index in HOT_PATH_INDEXES:
+                store._conn.execute(f"DROP INDEX IF EXISTS {index}")
+    original = reminders_module._SQLITE_HAS_RETURNING
+    reminders_module._SQLITE_HAS_RETURNING = name == "returning" and original
+    try:
+        time_claims(store, args.batch, 5, now_ts - 10_000)  # warm the page cache
+        latencies = sorted(time_claims(store, args.batch, args.iterations, now_ts))
+    finally:
+        reminders_module._SQLITE_HAS_RETURNING = original
+        store.close()
+
+    return {
+        "config": name,
+        "mean": statistics.fmean(latencies),
+        "p50": latencies[len(latencies) // 2],
+        "p95": latencies[int(len(latencies) * 0.95) - 1],
+        "max": latencies[-1],
+    }
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--history", type=int, default=100_000, help="Historical reminders (default: 100000)")
+    parser.add_argument("--pending", type=int, default=200, help="Future scheduled reminders (default: 200)")
+    parser.add_argument("--batch", type=int, default=10, help="Reminders due per claim (default: 10)")
+    parser.add_argument("--iterations", type=int, default=200, help="Timed claims per config (default: 200)")
+    args = parser.parse_args()
+
+    now_ts = int(time.time())
+    template = Path(tempfile.mkdtemp(prefix="bench_claim_")) / "template.db"
+    print(f"SQLite {sqlite3.sqlite_version}; building {args.history:,} historical reminders...")
+    build_database(template, args.history, args.pending, now_ts)
+
+    configs = ["legacy", "indexed"]
+    if reminders_module._SQLITE_HAS_RETURNING:
+        configs.append("returning")
+    else:
+        print("SQLite < 3.35: skipping the UPDATE ... RETURNING configuration")
+
+    print(f"{'config':<10} {'mean ms':>9} {'p50 ms':>9} {'p95 ms':>9} {'max ms':>9}")
+    for name in configs:
+        result = run_config(name, template, args, now_ts)
+        print(
+            f"{result['config']:<10} {result['mean']:>9.3f} {result['p50']:>9.3f} "
+            f"{result['p95']:>9.3f} {result['max']:>9.3f}"
+        )
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
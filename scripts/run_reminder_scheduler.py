@@ -39,7 +39,7 @@ def main():
     scheduler = ReminderScheduler(
         store=store,
         notification_router=router,
-        interval_seconds=5,  # Poll every 5 seconds
+        interval_seconds=5,  # Check for reminders added by other processes every 5s
     )
     
     logger.info("Starting reminder scheduler...")
@@ -62,6 +62,7 @@ def main():
     except KeyboardInterrupt:
         logger.info("Stopping scheduler...")
         scheduler.stop()
+        router.close()
         store.close()
         logger.info("Scheduler stopped")
 
@@ -469,6 +469,20 @@ def _run_agent(agent_name: str, query: str, use_web: Optional[bool] = None) -> s
     return agent._call_llm(query, system_prompt=agent.system_prompt, max_tokens=300)
 
 
+def _stream_agent(
+    agent_name: str, query: str, use_web: Optional[bool] = None
+) -> Iterable[str]:
+    """Yield response deltas as the agent generates them.
+
+    NEXUS streams from vLLM; agents without a streaming mode fall back to
+    chunking their full response.
+    """
+    agent = AGENT_MAP[agent_name]
+    if agent_name == "NEXUS" and hasattr(agent, "answer"):
+        return agent.answer(query, use_web=use_web, stream=True)
+    return _chunk_text(_run_agent(agent_name, query, use_web=use_web))
+
+
 def _run_integration(target: str, query: str) -> str:
     target_lower = target.lower()
     if target_lower == "weather":
@@ -671,27 +685,38 @@ def stream_request(ws, request_id: str) -> None:
     _send_ws(ws, "thinking", content=f"Processing with {agent_name}...")
 
     start_time = time.time()
-    response_text = ""
+    first_token_at: Optional[float] = None
+    parts: list[str] = []
     error_text = None
 
+    def emit(content: str) -> None:
+        nonlocal first_token_at
+        if not content:
+            return
+        if first_token_at is None:
+            first_token_at = time.time()
+        parts.append(content)
+        _send_ws(ws, "token", content=content)
+
     try:
         if integration_target:
-            response_text = _run_integration(integration_target, req["query"])
+            deltas = _chunk_text(_run_integration(integration_target, req["query"]))
         else:
-            response_text = _run_agent(
-                agent_name, req["query"], use_web=req.get("use_web")
-            )
+            deltas = _stream_agent(agent_name, req["query"], use_web=req.get("use_web"))
+        # Forward deltas as they arrive instead of waiting for the full answer
+        for delta in deltas:
+            emit(delta)
     except Exception as exc:
         error_text = f"Error: {exc}"
-        response_text = error_text
+        emit(f"\n\n{error_text}" if parts else error_text)
 
     goal_capture = req.get("goal_capture")
     if goal_capture:
-        response_text = f"{response_text}\n\n{_format_goal_capture(goal_capture)}"
+        emit(f"\n\n{_format_goal_capture(goal_capture)}")
 
-    for chunk in _chunk_text(response_text):
-        _send_ws(ws, "token", content=chunk)
+    response_text = "".join(parts)
 
+    # Memory is stored only once the full response has been streamed
     vector_id = _store_memory(agent_name, req["query"], response_text)
     if vector_id:
         _send_ws(ws, "memory", vector_id=vector_id, stored=True, embedding_size=1536)
@@ -699,12 +724,20 @@ def stream_request(ws, request_id: str) -> None:
         _send_ws(ws, "memory", vector_id="unavailable", stored=False)
 
     duration_ms = int((time.time() - start_time) * 1000)
+    ttft_ms = int((first_token_at - start_time) * 1000) if first_token_at else None
     total_tokens = len(response_text.split())
-    _send_ws(ws, "complete", total_tokens=total_tokens, duration_ms=duration_ms)
+    _send_ws(
+        ws,
+        "complete",
+        total_tokens=total_tokens,
+        duration_ms=duration_ms,
+        ttft_ms=ttft_ms,
+    )
 
     with _REQUESTS_LOCK:
         req["status"] = "failed" if error_text else "complete"
         req["duration_ms"] = duration_ms
+        req["ttft_ms"] = ttft_ms
         req["response"] = response_text
         req["completed_at"] = _now_iso()
         req["error"] = error_text
@@ -1495,7 +1528,9 @@ def reminder_health() -> Any:
         },
         "delivery": {
             "last_success": int | null (unix timestamp of last successful ntfy delivery),
-            "last_error": str | null (most recent error message)
+            "last_error": str | null (most recent error message),
+            "retry_queue_depth": int (channel deliveries waiting to be retried),
+            "dead_letter_count": int (channel deliveries that exhausted retries)
         },
         "timestamp": int (current server time)
     }
@@ -1533,6 +1568,8 @@ def reminder_health() -> Any:
             "delivery": {
                 "last_success": stats["last_ntfy_ok"],
                 "last_error": stats["last_error"],
+                "retry_queue_depth": stats["retry_queue_depth"],
+                "dead_letter_count": stats["dead_letter_count"],
             },
             "timestamp": now_ts,
         }), 200
@@ -1545,6 +1582,10 @@ def reminder_health() -> Any:
 if __name__ == "__main__":
     # Initialize app with environment loading
     create_app(load_env=True)
+
+    # Long-lived process: probe Weaviate once and reuse a pooled client
+    from memory.backends import enable_shared_backend
+    enable_shared_backend()
     
     # Allow port to be configured via environment variable
     api_port = int(os.getenv("MILTON_API_PORT", "8001"))
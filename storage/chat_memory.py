@@ -19,6 +19,9 @@ Usage:
     # Store explicit memory facts
     store.upsert_fact(key="user_name", value="Cole")
     facts = store.get_all_facts()
+    
+    # Rolling per-thread summary of older turns
+    summary = store.get_thread_summary(thread_id="thread-123")
 """
 
 from __future__ import annotations
@@ -29,7 +32,7 @@ import threading
 from dataclasses import dataclass
 from datetime import datetime, timezone
 from pathlib import Path
-from typing import Optional
+from typing import Any, Callable, Optional
 
 logger = logging.getLogger(__name__)
 
@@ -81,6 +84,27 @@ class MemoryFact:
         }
 
 
+@dataclass
+class ThreadSummary:
+    """Rolling summary of a thread's older turns."""
+    
+    thread_id: str
+    summary: str
+    last_turn_id: int  # newest conversation_turns.id covered by the summary
+    turn_count: int  # number of turns folded into the summary so far
+    updated_at: str  # ISO8601 UTC
+    
+    def to_dict(self) -> dict:
+        """Convert to dictionary for JSON serialization."""
+        return {
+            "thread_id": self.thread_id,
+            "summary": self.summary,
+            "last_turn_id": self.last_turn_id,
+            "turn_count": self.turn_count,
+            "updated_at": self.updated_at,
+        }
+
+
 class ChatMemoryStore:
     """SQLite-backed storage for chat conversation history and memory facts.
     
@@ -102,8 +126,31 @@ class ChatMemoryStore:
         self._lock = threading.Lock()
         self._conn = sqlite3.connect(self.db_path, check_same_thread=False)
         self._conn.row_factory = sqlite3.Row
+        self._listeners: list[Callable[[str, Any], None]] = []
         self._init_db()
     
+    def add_listener(self, callback: Callable[[str, Any], None]) -> None:
+        """Register a callback for writes made through this store.
+        
+        The callback receives ``(event, payload)``: ``("turn", ConversationTurn)``,
+        ``("fact", MemoryFact)``, ``("fact_deleted", key)`` or
+        ``("summary", ThreadSummary)``. Writes from other connections are not
+        reported; see ``data_version``.
+        """
+        self._listeners.append(callback)
+    
+    def _notify(self, event: str, payload: Any) -> None:
+        for callback in self._listeners:
+            try:
+                callback(event, payload)
+            except Exception as e:
+                logger.warning(f"Chat memory listener failed on {event}: {e}")
+    
+    def data_version(self) -> int:
+        """SQLite data_version; changes when another connection commits."""
+        with self._lock:
+            return int(self._conn.execute("PRAGMA data_version").fetchone()[0])
+    
     def _init_db(self) -> None:
         """Initialize the database schema."""
         with self._conn:
@@ -146,6 +193,19 @@ class ChatMemoryStore:
                 ON memory_facts(key)
                 """
             )
+            
+            # Rolling per-thread summaries of older turns
+            self._conn.execute(
+                """
+                CREATE TABLE IF NOT EXISTS thread_summaries (
+                    thread_id TEXT PRIMARY KEY,
+                    summary TEXT NOT NULL,
+                    last_turn_id INTEGER NOT NULL,
+                    turn_count INTEGER NOT NULL,
+                    updated_at TEXT NOT NULL
+                )
+                """
+            )
     
     def append_turn(
         self,
@@ -182,7 +242,19 @@ class ChatMemoryStore:
             )
             turn_id = int(cursor.lastrowid)
             logger.debug(f"Stored conversation turn {turn_id} for thread {thread_id}: {role}")
-            return turn_id
+        
+        if self._listeners:
+            self._notify(
+                "turn",
+                ConversationTurn(
+                    id=turn_id,
+                    thread_id=thread_id,
+                    role=role,
+                    content=content.strip(),
+                    created_at=created_at,
+                ),
+            )
+        return turn_id
     
     def get_recent_turns(
         self,
@@ -224,6 +296,123 @@ class ChatMemoryStore:
         logger.debug(f"Retrieved {len(turns)} turns for thread {thread_id}")
         return turns
     
+    def get_turns_after(
+        self,
+        thread_id: str,
+        after_id: int,
+        limit: Optional[int] = None,
+    ) -> list[ConversationTurn]:
+        """Retrieve turns of a thread newer than ``after_id``.
+        
+        Args:
+            thread_id: Conversation thread identifier.
+            after_id: Only turns with a greater id are returned.
+            limit: Maximum number of turns (oldest first); None for all.
+        
+        Returns:
+            List of ConversationTurn objects, ordered by id (oldest first).
+        """
+        with self._lock:
+            cursor = self._conn.execute(
+                """SELECT id, thread_id, role, content, created_at
+                   FROM conversation_turns
+                   WHERE thread_id = ? AND id > ?
+                   ORDER BY id ASC
+                   LIMIT ?""",
+                (thread_id, after_id, -1 if limit is None else limit),
+            )
+            rows = cursor.fetchall()
+        
+        return [
+            ConversationTurn(
+                id=row["id"],
+                thread_id=row["thread_id"],
+                role=row["role"],
+                content=row["content"],
+                created_at=row["created_at"],
+            )
+            for row in rows
+        ]
+    
+    def get_thread_summary(self, thread_id: str) -> Optional[ThreadSummary]:
+        """Retrieve the rolling summary of a thread.
+        
+        Args:
+            thread_id: Conversation thread identifier.
+        
+        Returns:
+            ThreadSummary if one has been stored, None otherwise.
+        """
+        with self._lock:
+            cursor = self._conn.execute(
+                """SELECT thread_id, summary, last_turn_id, turn_count, updated_at
+                   FROM thread_summaries
+                   WHERE thread_id = ?""",
+                (thread_id,),
+            )
+            row = cursor.fetchone()
+        
+        if not row:
+            return None
+        
+        return ThreadSummary(
+            thread_id=row["thread_id"],
+            summary=row["summary"],
+            last_turn_id=row["last_turn_id"],
+            turn_count=row["turn_count"],
+            updated_at=row["updated_at"],
+        )
+    
+    def upsert_thread_summary(
+        self,
+        thread_id: str,
+        summary: str,
+        last_turn_id: int,
+        turn_count: int,
+    ) -> bool:
+        """Store a thread's rolling summary if it covers newer turns.
+        
+        A summary that does not advance ``last_turn_id`` (e.g. from a slower,
+        concurrent refresh) is ignored.
+        
+        Args:
+            thread_id: Conversation thread identifier.
+            summary: Summary text.
+            last_turn_id: Newest turn id covered by the summary.
+            turn_count: Total number of turns covered by the summary.
+        
+        Returns:
+            True if the summary was stored, False if a newer one exists.
+        
+        Raises:
+            ValueError: If summary is empty.
+        """
+        if not summary or not summary.strip():
+            raise ValueError("Summary cannot be empty")
+        
+        with self._lock, self._conn:
+            cursor = self._conn.execute(
+                """INSERT INTO thread_summaries
+                   (thread_id, summary, last_turn_id, turn_count, updated_at)
+                   VALUES (?, ?, ?, ?, ?)
+                   ON CONFLICT(thread_id) DO UPDATE SET
+                   summary = excluded.summary,
+                   last_turn_id = excluded.last_turn_id,
+                   turn_count = excluded.turn_count,
+                   updated_at = excluded.updated_at
+                   WHERE excluded.last_turn_id > thread_summaries.last_turn_id""",
+                (thread_id, summary.strip(), last_turn_id, turn_count, _now_utc_iso()),
+            )
+            stored = cursor.rowcount > 0
+        
+        if stored:
+            logger.debug(f"Stored summary for thread {thread_id} through turn {last_turn_id}")
+            if self._listeners:
+                summary_row = self.get_thread_summary(thread_id)
+                if summary_row is not None:
+                    self._notify("summary", summary_row)
+        return stored
+    
     def upsert_fact(self, key: str, value: str) -> int:
         """Store or update a memory fact.
         
@@ -258,7 +447,12 @@ class ChatMemoryStore:
             )
             fact_id = int(cursor.lastrowid)
             logger.info(f"Stored memory fact: {key} = {value[:50]}...")
-            return fact_id
+        
+        if self._listeners:
+            fact = self.get_fact(key)
+            if fact is not None:
+                self._notify("fact", fact)
+        return fact_id
     
     def get_fact(self, key: str) -> Optional[MemoryFact]:
         """Retrieve a single memory fact by key.
@@ -339,6 +533,7 @@ class ChatMemoryStore:
         
         if deleted:
             logger.info(f"Deleted memory fact: {key}")
+            self._notify("fact_deleted", key)
         return deleted
     
     def close(self) -> None:
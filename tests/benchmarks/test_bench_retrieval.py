@@ -6,6 +6,8 @@ Tests retrieval evaluation with mocked and local fixtures.
 import pytest
 import tempfile
 import json
+import time
+from datetime import datetime, timedelta, timezone
 from pathlib import Path
 
 from benchmarks.tiers.retrieval import (
@@ -349,5 +351,98 @@ class TestRealGoldenSet:
         assert 0 <= results["retrieval_score"] <= 100
 
 
+class _ScanOnlyBackend:
+    """Wraps a backend so query_relevant takes the pre-index linear scan path."""
+
+    def __init__(self, backend):
+        self._backend = backend
+
+    def list_short_term(self):
+        return self._backend.list_short_term()
+
+
+def _write_memory_corpus(repo_root: Path, size: int, now: datetime) -> None:
+    from memory.backends import ensure_memory_dir, memory_paths
+
+    # A handful of very common topic words plus a long tail of rarer terms
+    vocab = [
+        "python", "weaviate", "reminder", "coffee", "thesis", "neuron", "calendar",
+        "gym", "budget", "paper", "grant", "meeting", "dataset", "model", "travel",
+    ] + [f"term{n}" for n in range(5_000)]
+    ensure_memory_dir(repo_root)
+    short_path, _ = memory_paths(repo_root)
+    with short_path.open("w") as handle:
+        for i in range(size):
+            words = [vocab[(i * 7 + j * 3) % 15] for j in range(2)]
+            words += [vocab[15 + (i * 7919 + j * 104_729) % 5_000] for j in range(6)]
+            record = {
+                "record_type": "memory_item",
+                "data": {
+                    "id": f"mem-{i}",
+                    "ts": (now - timedelta(minutes=size - i)).isoformat(),
+                    "agent": "NEXUS",
+                    "type": "crumb",
+                    "content": f"note {i} " + " ".join(words),
+                    "tags": [vocab[i % len(vocab)]],
+                    "importance": (i % 10) / 10.0,
+                    "source": "bench",
+                },
+            }
+            handle.write(json.dumps(record) + "\n")
+
+
+def _median_latency_ms(fn, repeats: int) -> float:
+    samples = []
+    for _ in range(repeats):
+        started = time.perf_counter()
+        fn()
+        samples.append((time.perf_counter() - started) * 1000.0)
+    samples.sort()
+    return samples[len(samples) // 2]
+
+
+class TestQueryRelevantLatency:
+    """Latency of memory.retrieve.query_relevant with and without the BM25 index."""
+
+    @pytest.mark.parametrize("size", [1_000, 10_000, 100_000])
+    def test_indexed_latency(self, tmp_path, monkeypatch, size):
+        import memory.retrieve as retrieve
+        from memory.backends import JsonlBackend
+        from memory.retrieve import query_relevant
+
+        now = datetime.now(timezone.utc)
+        monkeypatch.setattr(retrieve, "_now_utc", lambda: now)
+        _write_memory_corpus(tmp_path, size, now)
+        backend = JsonlBackend(tmp_path)
+        backend.list_short_term()  # Build the index once, outside the timing
+
+        query = "thesis term42 deadline"
+        indexed_ms = _median_latency_ms(
+            lambda: query_relevant(query, limit=10, backend=backend), repeats=5
+        )
+        scan_backend = _ScanOnlyBackend(backend)
+        scan_ms = _median_latency_ms(
+            lambda: query_relevant(query, limit=10, backend=scan_backend),
+            repeats=1 if size >= 100_000 else 3,
+        )
+        print(f"\nquery_relevant @ {size:>7} items: indexed={indexed_ms:.2f}ms scan={scan_ms:.2f}ms")
+
+        # Pruned ranking must match blending every item's BM25 score exhaustively
+        indexed = query_relevant(query, limit=10, backend=backend)
+        text_scores = backend.score_short_term(query)
+        exhaustive = sorted(
+            backend.list_short_term(),
+            key=lambda item: (
+                retrieve._blend_score(text_scores.get(item.id, 0.0), item, 0.35, now),
+                item.importance, item.ts, item.id,
+            ),
+            reverse=True,
+        )[:10]
+        assert len(indexed) == 10
+        assert [item.id for item in indexed] == [item.id for item in exhaustive]
+        if size >= 10_000:
+            assert indexed_ms < scan_ms
+
+
 if __name__ == "__main__":
     pytest.main([__file__, "-v"])
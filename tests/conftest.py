@@ -44,3 +44,62 @@ def pytest_collection_modifyitems(config, items) -> None:
                     reason="System-level or long-running test (opt-in via -m integration)."
                 )
             )
+
+
+class MockLLM:
+    """Records LLM requests made through the shared transport and answers them."""
+
+    def __init__(self) -> None:
+        self.requests = []
+        self.status_code = 200
+        self.reason = None
+        self.body = {"choices": [{"message": {"content": "OK"}}]}
+        self.stream_lines = None  # SSE lines served instead of ``body`` when set
+        self.error = None  # exception raised instead of answering
+
+    def handler(self, request):
+        import httpx
+
+        self.requests.append(request)
+        if self.error is not None:
+            raise self.error
+        extensions = {"reason_phrase": self.reason.encode()} if self.reason else None
+        if self.stream_lines is not None:
+            content = "".join(f"{line}\n" for line in self.stream_lines).encode()
+            return httpx.Response(self.status_code, content=content, extensions=extensions)
+        if isinstance(self.body, str):
+            return httpx.Response(self.status_code, text=self.body, extensions=extensions)
+        return httpx.Response(self.status_code, json=self.body, extensions=extensions)
+
+    @property
+    def last_json(self) -> dict:
+        import json
+
+        return json.loads(self.requests[-1].content)
+
+    @property
+    def last_headers(self):
+        return self.requests[-1].headers
+
+
+@pytest.fixture
+def mock_llm():
+    """Install an ``httpx.MockTransport``-backed shared LLM transport."""
+    import httpx
+
+    from milton_orchestrator.llm_transport import (
+        LLMTransport,
+        TransportSettings,
+        set_llm_transport,
+    )
+
+    llm = MockLLM()
+    transport = LLMTransport(
+        TransportSettings(retries=0),
+        http_transport=httpx.MockTransport(llm.handler),
+        async_http_transport=httpx.MockTransport(llm.handler),
+    )
+    previous = set_llm_transport(transport)
+    yield llm
+    set_llm_transport(previous)
+    transport.close()
@@ -0,0 +1,198 @@
+"""Tests for the bounded async action executor used by the chat gateway."""
+
+from __future__ import annotations
+
+import asyncio
+import threading
+from unittest.mock import AsyncMock, patch
+
+import pytest
+
+import milton_gateway.action_executor as action_executor
+from milton_gateway.action_executor import AsyncActionExecutor
+
+
+def _blocking_memory_action(release: threading.Event, calls: list, active: list):
+    """Fake write that holds its worker until ``release`` is set."""
+    lock = threading.Lock()
+
+    def _execute_memory(payload, state_dir):
+        with lock:
+            calls.append(threading.current_thread().name)
+            active[0] += 1
+            active[1] = max(active[1], active[0])
+        release.wait(5)
+        with lock:
+            active[0] -= 1
+        return action_executor._result(status="ok", executed=[{"action": "CREATE_MEMORY"}])
+    return _execute_memory
+
+
+def test_execute_runs_off_the_event_loop_and_caps_in_flight(tmp_path, monkeypatch):
+    release = threading.Event()
+    calls: list = []
+    active = [0, 0]  # running now, most at once
+    monkeypatch.setattr(action_executor, "_execute_memory", _blocking_memory_action(release, calls, active))
+    executor = AsyncActionExecutor(max_workers=2)
+    plan = {"action": "CREATE_MEMORY", "payload": {"text": "x"}}
+
+    async def run():
+        tasks = [
+            asyncio.ensure_future(executor.execute(plan, {"state_dir": str(tmp_path / f"s{i}")}))
+            for i in range(4)
+        ]
+        # The loop keeps running while both workers are blocked
+        while executor.stats()["in_flight"] < 2:
+            await asyncio.sleep(0.001)
+        assert not any(task.done() for task in tasks)
+        release.set()
+        return await asyncio.wait_for(asyncio.gather(*tasks), 5)
+
+    results = asyncio.run(run())
+    executor.shutdown()
+
+    assert all(result["status"] == "ok" for result in results)
+    assert all(name.startswith("milton-action") for name in calls)
+    assert active[1] == 2
+    stats = executor.stats()
+    assert stats["completed"] == 4 and stats["in_flight"] == 0
+    assert stats["peak_in_flight"] == 2
+
+
+def test_same_action_and_state_dir_is_serialized(tmp_path, monkeypatch):
+    release = threading.Event()
+    release.set()
+    calls: list = []
+    active = [0, 0]
+    monkeypatch.setattr(action_executor, "_execute_memory", _blocking_memory_action(release, calls, active))
+    executor = AsyncActionExecutor(max_workers=4)
+    plan = {"action": "CREATE_MEMORY", "payload": {"text": "x"}}
+    context = {"state_dir": str(tmp_path)}
+
+    futures = [executor.submit(plan, context) for _ in range(3)]
+    for future in futures:
+        future.result(timeout=5)
+    executor.shutdown()
+
+    assert len(calls) == 3
+    assert active[1] == 1  # never two at once
+    assert executor.stats()["peak_in_flight"] == 1
+
+
+def test_failed_action_is_counted_and_reraised(monkeypatch):
+    def boom(payload, state_dir):
+        raise OSError("disk full")
+
+    monkeypatch.setattr(action_executor, "_execute_goal", boom)
+    executor = AsyncActionExecutor(max_workers=1)
+    with pytest.raises(OSError):
+        executor.submit({"action": "CREATE_GOAL", "payload": {"text": "x"}}).result(timeout=5)
+    executor.shutdown()
+    assert executor.stats()["failed"] == 1
+
+
+def test_chat_is_served_while_action_workers_are_blocked(tmp_path, monkeypatch):
+    """Pure chat requests complete while slow reminder actions hold the pool."""
+    import httpx
+
+    from milton_gateway.server import app
+
+    monkeypatch.setenv("MILTON_GATEWAY_MEMORY_RETRIEVAL", "0")
+    monkeypatch.setenv("MILTON_KG_CONTEXT_ENABLED", "false")
+    monkeypatch.setenv("MILTON_ACTION_WORKERS", "2")
+    action_executor.shutdown_action_executor()
+    release = threading.Event()
+    started = threading.Event()
+
+    def slow_reminder(payload, state_dir, context):
+        started.set()
+        release.wait(10)  # A slow disk write or held file lock
+        return action_executor._result(status="ok", executed=[{"action": "CREATE_REMINDER", "id": 1}])
+
+    monkeypatch.setattr(action_executor, "_execute_reminder", slow_reminder)
+    llm_response = {
+        "choices": [{"message": {"role": "assistant", "content": "Sure."}}],
+        "usage": {"prompt_tokens": 1, "completion_tokens": 1, "total_tokens": 2},
+    }
+
+    async def post(client, content):
+        response = await client.post(
+            "/v1/chat/completions",
+            json={
+                "model": "milton-local",
+                "messages": [{"role": "user", "content": content}],
+                "stream": False,
+            },
+        )
+        assert response.status_code == 200
+
+    async def run():
+        transport = httpx.ASGITransport(app=app)
+        async with httpx.AsyncClient(transport=transport, base_url="http://gateway") as client:
+            actions = [
+                asyncio.ensure_future(post(client, "remind me tomorrow at 9am to submit report"))
+                for _ in range(4)
+            ]
+            assert await asyncio.to_thread(started.wait, 5)
+
+            async def all_submitted():
+                while action_executor.action_executor_stats()["submitted"] < 4:
+                    await asyncio.sleep(0.001)
+
+            await asyncio.wait_for(all_submitted(), 5)
+            # Same-key reminders wait in the executor's queue, not on workers
+            assert action_executor.action_executor_stats()["in_flight"] == 1
+
+            # Executed inline, every chat would wait behind the blocked action
+            await asyncio.wait_for(
+                asyncio.gather(*(post(client, "Tell me something about cats") for _ in range(8))), 5
+            )
+            assert not release.is_set() and not any(task.done() for task in actions)
+
+            release.set()
+            await asyncio.wait_for(asyncio.gather(*actions), 10)
+
+    with (
+        patch("milton_gateway.server.get_llm_client") as mock_get_client,
+        patch("milton_gateway.server.resolve_state_dir", return_value=tmp_path),
+    ):
+        mock_client = AsyncMock()
+        mock_client.chat_completion = AsyncMock(return_value=llm_response)
+        mock_get_client.return_value = mock_client
+        try:
+            asyncio.run(run())
+        finally:
+            release.set()
+            action_executor.shutdown_action_executor()
+
+
+def test_queued_plans_for_a_busy_key_do_not_hold_workers(tmp_path, monkeypatch):
+    release = threading.Event()
+    calls: list = []
+
+    def _execute_memory(payload, state_dir):
+        calls.append(payload["text"])
+        release.wait(5)
+        return action_executor._result(status="ok")
+
+    monkeypatch.setattr(action_executor, "_execute_memory", _execute_memory)
+    monkeypatch.setattr(
+        action_executor, "_execute_goal", lambda payload, state_dir: action_executor._result(status="ok")
+    )
+    executor = AsyncActionExecutor(max_workers=2)
+    context = {"state_dir": str(tmp_path)}
+
+    same_key = [
+        executor.submit({"action": "CREATE_MEMORY", "payload": {"text": f"m{i}"}}, context)
+        for i in range(3)
+    ]
+    # Two plans wait behind the first without occupying the second worker
+    other = executor.submit({"action": "CREATE_GOAL", "payload": {"text": "g"}}, context)
+    assert other.result(timeout=2)["status"] == "ok"
+    assert calls == ["m0"]
+
+    release.set()
+    assert [future.result(timeout=5)["status"] for future in same_key] == ["ok"] * 3
+    assert calls == ["m0", "m1", "m2"]
+    executor.shutdown()
+    assert executor.stats()["completed"] == 4
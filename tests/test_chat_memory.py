@@ -204,6 +204,34 @@ class TestMemoryFacts:
         assert fact is None
 
 
+class TestThreadSummaries:
+    """Tests for rolling per-thread summaries."""
+
+    def test_get_thread_summary_missing(self, store):
+        """Test that a thread without a summary returns None."""
+        assert store.get_thread_summary("no-summary") is None
+
+    def test_upsert_thread_summary_only_advances(self, store):
+        """Test that a summary covering older turns does not overwrite a newer one."""
+        assert store.upsert_thread_summary("t", "first", last_turn_id=5, turn_count=5)
+        assert store.upsert_thread_summary("t", "second", last_turn_id=9, turn_count=9)
+        assert not store.upsert_thread_summary("t", "stale", last_turn_id=7, turn_count=7)
+
+        summary = store.get_thread_summary("t")
+        assert summary.summary == "second"
+        assert summary.last_turn_id == 9
+        assert summary.turn_count == 9
+
+    def test_get_turns_after(self, store):
+        """Test retrieving only the turns newer than a given id."""
+        ids = [store.append_turn("t", "user", f"Message {i}") for i in range(5)]
+        store.append_turn("other", "user", "Elsewhere")
+
+        turns = store.get_turns_after("t", ids[1])
+        assert [t.id for t in turns] == ids[2:]
+        assert [t.id for t in store.get_turns_after("t", ids[1], limit=2)] == ids[2:4]
+
+
 class TestIntegration:
     """Integration tests for combined functionality."""
 
@@ -0,0 +1,117 @@
+"""Tests for concurrent context assembly in the chat gateway."""
+
+from __future__ import annotations
+
+import asyncio
+import threading
+import time
+from unittest.mock import AsyncMock, patch
+
+from milton_gateway.context_assembly import (
+    CONTEXT_SKIPPED_HEADER,
+    CONTEXT_TIMING_HEADER,
+    ContextSource,
+    assemble_context,
+    source_timeout,
+)
+
+
+def test_sources_run_concurrently_and_slow_ones_are_skipped():
+    def slow(value, delay):
+        def load():
+            time.sleep(delay)
+            return value
+        return load
+
+    def boom():
+        raise RuntimeError("weaviate down")
+
+    sources = [
+        ContextSource("history", slow(["turn"], 0.2), timeout=1.0),
+        ContextSource("facts", slow(["fact"], 0.2), timeout=1.0),
+        ContextSource("semantic", slow("late", 1.0), timeout=0.05),
+        ContextSource("kg", boom, timeout=1.0),
+    ]
+    started = time.perf_counter()
+    context = asyncio.run(assemble_context(sources))
+    elapsed = time.perf_counter() - started
+
+    assert elapsed < 0.6  # history and facts overlapped; semantic was abandoned
+    assert context.results == {"history": ["turn"], "facts": ["fact"]}
+    assert context.skipped == {"semantic": "timeout", "kg": "error"}
+    assert list(context.timings_ms) == ["history", "facts", "semantic", "kg"]
+
+    headers = context.headers()
+    assert headers[CONTEXT_TIMING_HEADER].startswith("ctx_total;dur=")
+    assert 'ctx_semantic;dur=' in headers[CONTEXT_TIMING_HEADER]
+    assert 'desc="timeout"' in headers[CONTEXT_TIMING_HEADER]
+    assert headers[CONTEXT_SKIPPED_HEADER] == "semantic,kg"
+
+
+def test_hung_source_is_skipped_while_its_abandoned_loads_run(monkeypatch):
+    monkeypatch.setenv("MILTON_GATEWAY_CONTEXT_MAX_STRAGGLERS", "1")
+    release = threading.Event()
+    calls = []
+
+    def hung():
+        calls.append(1)
+        release.wait(5)
+        return "late"
+
+    first = asyncio.run(assemble_context([ContextSource("hung", hung, timeout=0.05)]))
+    assert first.skipped == {"hung": "timeout"}
+
+    # The abandoned load still holds a worker, so the source is not resubmitted
+    second = asyncio.run(assemble_context([ContextSource("hung", hung, timeout=0.05)]))
+    assert second.skipped == {"hung": "busy"}
+    assert len(calls) == 1
+
+    release.set()
+    deadline = time.monotonic() + 5
+    while time.monotonic() < deadline:
+        third = asyncio.run(assemble_context([ContextSource("hung", lambda: "ok", timeout=1.0)]))
+        if not third.skipped:
+            break
+        time.sleep(0.02)
+    assert third.results == {"hung": "ok"}
+
+
+def test_source_timeout_env_overrides(monkeypatch):
+    monkeypatch.setenv("MILTON_GATEWAY_CONTEXT_TIMEOUT_MS", "800")
+    monkeypatch.setenv("MILTON_GATEWAY_CONTEXT_TIMEOUT_SEMANTIC_MS", "2500")
+    assert source_timeout("facts") == 0.8
+    assert source_timeout("semantic") == 2.5
+    assert ContextSource("kg", lambda: "").timeout == 0.8
+
+
+def test_chat_completion_reports_context_timings(monkeypatch):
+    from fastapi.testclient import TestClient
+
+    from milton_gateway.server import app
+
+    monkeypatch.setenv("MILTON_GATEWAY_MEMORY_RETRIEVAL", "0")
+    monkeypatch.setenv("MILTON_KG_CONTEXT_ENABLED", "false")
+    llm_response = {
+        "choices": [{"message": {"role": "assistant", "content": "Hi"}}],
+        "usage": {"prompt_tokens": 1, "completion_tokens": 1, "total_tokens": 2},
+    }
+    with patch("milton_gateway.server.get_llm_client") as mock_get_client:
+        mock_client = AsyncMock()
+        mock_client.chat_completion = AsyncMock(return_value=llm_response)
+        mock_get_client.return_value = mock_client
+
+        response = TestClient(app).post(
+            "/v1/chat/completions",
+            json={
+                "model": "milton-local",
+                "messages": [{"role": "user", "content": "What is the weather like?"}],
+                "stream": False,
+            },
+        )
+
+    assert response.status_code == 200
+    timing = response.headers[CONTEXT_TIMING_HEADER]
+    for name in ("history", "facts", "semantic", "kg"):
+        assert f"ctx_{name};dur=" in timing
+    system_prompt = mock_client.chat_completion.call_args.kwargs["messages"][0]
+    assert system_prompt["role"] == "system"
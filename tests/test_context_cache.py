@@ -0,0 +1,102 @@
+"""Tests for the gateway's per-thread context cache."""
+
+from __future__ import annotations
+
+from unittest.mock import patch
+
+from milton_gateway.context_cache import ThreadContextCache, select_relevant_facts
+from storage.chat_memory import ChatMemoryStore, MemoryFact
+
+
+def _store(tmp_path):
+    return ChatMemoryStore(tmp_path / "chat.sqlite3")
+
+
+def test_turn_window_is_served_from_cache_and_updated_on_append(tmp_path):
+    store = _store(tmp_path)
+    for i in range(5):
+        store.append_turn("t", "user", f"Message {i}")
+    cache = ThreadContextCache(store, max_threads=4, ttl_seconds=60)
+
+    assert [t.content for t in cache.recent_turns("t", 3)] == ["Message 2", "Message 3", "Message 4"]
+    with patch.object(store, "get_recent_turns", side_effect=AssertionError("cache miss")):
+        store.append_turn("t", "assistant", "Reply")
+        turns, summary = cache.history("t", 3)
+    assert [t.content for t in turns] == ["Message 3", "Message 4", "Reply"]
+    assert summary is None
+
+    store.upsert_thread_summary("t", "Earlier stuff", last_turn_id=2, turn_count=2)
+    assert cache.history("t", 3)[1].summary == "Earlier stuff"
+    assert cache.stats()["hits"] >= 2
+
+
+def test_lru_is_bounded(tmp_path):
+    store = _store(tmp_path)
+    cache = ThreadContextCache(store, max_threads=2, ttl_seconds=60)
+    for thread in ("a", "b", "c"):
+        cache.recent_turns(thread, 5)
+    assert cache.stats()["threads"] == 2
+
+
+def test_facts_update_incrementally(tmp_path):
+    store = _store(tmp_path)
+    store.upsert_fact("name", "Cole")
+    cache = ThreadContextCache(store, ttl_seconds=60)
+    assert [f.key for f in cache.facts()] == ["name"]
+
+    with patch.object(store, "get_all_facts", side_effect=AssertionError("cache miss")):
+        store.upsert_fact("city", "St. Louis")
+        store.upsert_fact("name", "Cole H")
+        facts = cache.facts()
+        assert [(f.key, f.value) for f in facts] == [("city", "St. Louis"), ("name", "Cole H")]
+        assert cache.render_facts(facts) == "- **city**: St. Louis\n- **name**: Cole H"
+        store.delete_fact("city")
+        assert [f.key for f in cache.facts()] == ["name"]
+
+
+def test_writes_from_other_connections_invalidate(tmp_path):
+    store = _store(tmp_path)
+    cache = ThreadContextCache(store, ttl_seconds=60)
+    assert cache.facts() == []
+
+    other = ChatMemoryStore(tmp_path / "chat.sqlite3")
+    other.upsert_fact("editor", "Neovim")
+    assert [f.key for f in cache.facts()] == ["editor"]
+    assert cache.stats()["invalidations"] == 1
+
+
+def test_select_relevant_facts_when_many():
+    facts = [
+        MemoryFact(id=i, key=f"fact_{i}", value=f"value {i}", created_at="", updated_at=f"2026-01-{i + 1:02d}")
+        for i in range(10)
+    ]
+    facts.append(MemoryFact(id=99, key="favorite_editor", value="Neovim", created_at="", updated_at="2025-01-01"))
+    facts.sort(key=lambda f: f.key)
+
+    chosen = select_relevant_facts(facts, "which editor do I like?", max_facts=3)
+    keys = [f.key for f in chosen]
+    assert "favorite_editor" in keys
+    assert len(keys) == 3
+    assert keys == sorted(keys)
+    assert select_relevant_facts(facts, "anything", max_facts=50) is facts
+
+
+def test_split_facts_keeps_query_picks_out_of_the_stable_set(tmp_path):
+    store = _store(tmp_path)
+    store.upsert_fact("favorite_editor", "Neovim")
+    for i in range(4):
+        store.upsert_fact(f"fact_{i}", f"value {i}")
+    with store._conn:
+        store._conn.execute("UPDATE memory_facts SET updated_at = '2026-01-01T00:00:00Z'")
+        store._conn.execute(
+            "UPDATE memory_facts SET updated_at = '2026-02-01T00:00:00Z' WHERE key IN ('fact_1', 'fact_2', 'fact_3')"
+        )
+    cache = ThreadContextCache(store, ttl_seconds=60, max_facts=3, max_query_facts=2)
+
+    stable, picked = cache.split_facts("which editor do I like?")
+    assert [f.key for f in stable] == ["fact_1", "fact_2", "fact_3"]  # newest, query-independent
+    assert [f.key for f in picked] == ["favorite_editor"]
+
+    other_stable, other_picked = cache.split_facts("something unrelated")
+    assert other_stable == stable
+    assert other_picked == []
@@ -0,0 +1,78 @@
+"""Tests for rolling, persisted conversation summaries."""
+
+from __future__ import annotations
+
+import asyncio
+from unittest.mock import AsyncMock
+
+from milton_gateway.conversation_summarizer import (
+    compact_with_summary,
+    refresh_thread_summary,
+)
+from storage.chat_memory import ChatMemoryStore
+
+
+def _llm(text):
+    client = AsyncMock()
+    client.chat_completion = AsyncMock(
+        return_value={"choices": [{"message": {"role": "assistant", "content": text}}]}
+    )
+    return client
+
+
+def test_refresh_summarizes_only_new_turns(tmp_path):
+    store = ChatMemoryStore(tmp_path / "chat.sqlite3")
+    ids = [store.append_turn("t", "user", f"Message {i}") for i in range(12)]
+
+    llm = _llm("Summary one")
+    result = asyncio.run(refresh_thread_summary(store, "t", llm, keep_recent=4, min_new_turns=3))
+    assert result == "Summary one"
+    summary = store.get_thread_summary("t")
+    assert summary.last_turn_id == ids[7]
+    assert summary.turn_count == 8
+
+    # Not enough new turns have left the recent window yet
+    store.append_turn("t", "user", "Message 12")
+    assert asyncio.run(refresh_thread_summary(store, "t", llm, keep_recent=4, min_new_turns=3)) is None
+    assert llm.chat_completion.await_count == 1
+
+    for i in range(13, 16):
+        store.append_turn("t", "user", f"Message {i}")
+    llm2 = _llm("Summary two")
+    asyncio.run(refresh_thread_summary(store, "t", llm2, keep_recent=4, min_new_turns=3))
+    prompt = llm2.chat_completion.call_args.kwargs["messages"][0]["content"]
+    assert "Summary one" in prompt
+    assert "Message 8" in prompt and "Message 11" in prompt
+    assert "Message 7" not in prompt and "Message 12" not in prompt
+    assert store.get_thread_summary("t").turn_count == 12
+
+
+def test_refresh_folds_long_backlog_in_bounded_batches(tmp_path):
+    store = ChatMemoryStore(tmp_path / "chat.sqlite3")
+    ids = [store.append_turn("t", "user", f"Message {i} " + "x" * 5000) for i in range(30)]
+
+    llm = _llm("Summary")
+    asyncio.run(
+        refresh_thread_summary(
+            store, "t", llm, keep_recent=4, min_new_turns=3, max_batch_turns=5, max_batches=2
+        )
+    )
+    assert llm.chat_completion.await_count == 2
+    first, second = (c.kwargs["messages"][0]["content"] for c in llm.chat_completion.call_args_list)
+    assert "Message 4 " in first and "Message 5 " not in first
+    assert "Message 5 " in second and "Message 9 " in second and "Message 10 " not in second
+    assert len(second) < 5 * 2000
+    summary = store.get_thread_summary("t")
+    assert summary.last_turn_id == ids[9]
+    assert summary.turn_count == 10
+
+
+def test_compact_with_summary_does_not_call_llm():
+    messages = [{"role": "system", "content": "SYSTEM"}] + [
+        {"role": "user", "content": f"m{i}"} for i in range(6)
+    ]
+    compacted = compact_with_summary(messages, "older stuff", keep_recent=2)
+    assert compacted[0]["content"] == "SYSTEM"
+    assert "older stuff" in compacted[1]["content"]
+    assert [m["content"] for m in compacted[2:]] == ["m4", "m5"]
+    assert compact_with_summary(messages, "", keep_recent=2)[1:] == messages[-2:]
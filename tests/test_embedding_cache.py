@@ -0,0 +1,134 @@
+"""Tests for the single-file embedding cache and its use by embed/embed_batch."""
+
+from __future__ import annotations
+
+import numpy as np
+import pytest
+
+import memory.embeddings as embeddings
+from memory.embedding_cache import EmbeddingCache
+
+
+class _FakeModel:
+    def __init__(self):
+        self.encoded: list[str] = []
+
+    def encode(self, texts, **kwargs):
+        single = isinstance(texts, str)
+        batch = [texts] if single else list(texts)
+        self.encoded.extend(batch)
+        vectors = np.zeros((len(batch), embeddings.EMBEDDING_DIM), dtype=np.float32)
+        for row, text in enumerate(batch):
+            vectors[row, len(text) % embeddings.EMBEDDING_DIM] = 1.0
+        return vectors[0] if single else vectors
+
+
+def _use_tmp_cache(tmp_path, monkeypatch) -> _FakeModel:
+    model = _FakeModel()
+    monkeypatch.setattr(embeddings, "EMBEDDING_CACHE_DIR", tmp_path / "embeddings_cache")
+    monkeypatch.setattr(embeddings, "_CACHE", None)
+    monkeypatch.setattr(embeddings, "_load_model", lambda model_name=None: model)
+    return model
+
+
+def test_get_many_put_many_and_lru_eviction(tmp_path):
+    cache = EmbeddingCache(tmp_path / "cache.sqlite3", max_entries=2)
+    cache.put_many({"a": np.ones(4), "b": np.zeros(4)})
+
+    found = cache.get_many(["a", "missing"])
+    assert list(found) == ["a"]
+    assert found["a"].dtype == np.float32
+    assert (cache.hits, cache.misses) == (1, 1)
+
+    # "b" is now the least recently used entry
+    cache.put("c", np.full(4, 2.0))
+    assert len(cache) == 2
+    assert set(cache.get_many(["a", "b", "c"])) == {"a", "c"}
+    assert cache.stats()["evictions"] == 1
+
+
+def test_embed_batch_encodes_only_misses(tmp_path, monkeypatch):
+    model = _use_tmp_cache(tmp_path, monkeypatch)
+
+    first = embeddings.embed_batch(["alpha", "beta", "alpha"])
+    assert model.encoded == ["alpha", "beta"]  # duplicates encoded once
+    assert np.array_equal(first[0], first[2])
+
+    second = embeddings.embed_batch(["beta", "gamma"])
+    assert model.encoded == ["alpha", "beta", "gamma"]
+    assert np.array_equal(second[0], first[1])
+
+    # embed() shares the same store
+    assert np.array_equal(embeddings.embed("alpha"), first[0])
+    assert model.encoded == ["alpha", "beta", "gamma"]
+
+    stats = embeddings.get_cache_stats()
+    assert stats["count"] == 3
+    assert stats["hits"] == 2 and stats["misses"] == 3
+    assert list((tmp_path / "embeddings_cache").glob("*.npy")) == []
+
+    assert embeddings.clear_cache() == 3
+    assert embeddings.get_cache_stats()["count"] == 0
+
+
+def test_legacy_npy_files_are_imported(tmp_path, monkeypatch):
+    model = _use_tmp_cache(tmp_path, monkeypatch)
+    legacy_dir = tmp_path / "embeddings_cache"
+    legacy_dir.mkdir()
+    key = embeddings._cache_key("old text", embeddings.DEFAULT_MODEL)
+    vector = np.arange(embeddings.EMBEDDING_DIM, dtype=np.float32)
+    np.save(legacy_dir / f"{key}.npy", vector)
+
+    assert np.array_equal(embeddings.embed("old text"), vector)
+    assert model.encoded == []
+    assert list(legacy_dir.glob("*.npy")) == []
+
+
+def test_hits_buffer_last_access_until_flush(tmp_path):
+    cache = EmbeddingCache(tmp_path / "cache.sqlite3")
+    cache.put("a", np.ones(4))
+    (before,) = cache._conn.execute("SELECT last_access FROM embeddings").fetchone()
+
+    assert "a" in cache.get_many(["a"])
+    assert cache._conn.execute("SELECT last_access FROM embeddings").fetchone()[0] == before
+    cache.flush()
+    assert cache._conn.execute("SELECT last_access FROM embeddings").fetchone()[0] > before
+    cache.close()
+
+
+def test_row_count_is_tracked_across_connections(tmp_path):
+    db_path = tmp_path / "cache.sqlite3"
+    cache = EmbeddingCache(db_path, max_entries=3)
+    cache.put_many({"a": np.ones(4), "b": np.ones(4)})
+    cache.put("a", np.zeros(4))  # replacing a key does not grow the count
+    assert cache._count == 2
+
+    other = EmbeddingCache(db_path, max_entries=0)
+    other.put_many({"c": np.ones(4), "d": np.ones(4)})
+    other.close()
+
+    cache.put("e", np.ones(4))
+    assert len(cache) == 3
+    assert cache._count == 3
+    assert cache.stats()["evictions"] == 2
+    cache.close()
+
+
+def test_legacy_import_keeps_files_when_the_write_fails(tmp_path, monkeypatch):
+    legacy_dir = tmp_path / "legacy"
+    legacy_dir.mkdir()
+    np.save(legacy_dir / "k1.npy", np.ones(4, dtype=np.float32))
+    cache = EmbeddingCache(tmp_path / "cache.sqlite3")
+
+    def _fail(vectors):
+        raise RuntimeError("disk full")
+
+    monkeypatch.setattr(cache, "put_many", _fail)
+    with pytest.raises(RuntimeError):
+        cache.import_npy_dir(legacy_dir)
+    assert (legacy_dir / "k1.npy").exists()
+
+    monkeypatch.undo()
+    assert cache.import_npy_dir(legacy_dir) == 1
+    assert not (legacy_dir / "k1.npy").exists()
+    cache.close()
@@ -0,0 +1,99 @@
+"""Tests for the micro-batching embedding service."""
+
+from __future__ import annotations
+
+import asyncio
+import threading
+
+import numpy as np
+
+from memory.embedding_service import EmbeddingService
+
+
+class _RecordingEncoder:
+    def __init__(self):
+        self.calls: list[list[str]] = []
+        self._lock = threading.Lock()
+
+    def __call__(self, texts):
+        with self._lock:
+            self.calls.append(list(texts))
+        return [np.full(4, float(len(text)), dtype=np.float32) for text in texts]
+
+
+def test_concurrent_requests_share_one_deduplicated_batch():
+    encoder = _RecordingEncoder()
+    service = EmbeddingService(window_ms=200, max_batch=64, encoder=encoder)
+    texts = ["alpha", "beta", "alpha", "gamma", "beta"]
+    results: dict[int, np.ndarray] = {}
+    barrier = threading.Barrier(len(texts))
+
+    def worker(i: int) -> None:
+        barrier.wait()
+        results[i] = service.embed(texts[i], timeout=5)
+
+    threads = [threading.Thread(target=worker, args=(i,)) for i in range(len(texts))]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    service.shutdown()
+
+    assert len(encoder.calls) == 1
+    assert sorted(encoder.calls[0]) == ["alpha", "beta", "gamma"]
+    assert all(results[i][0] == len(texts[i]) for i in range(len(texts)))
+    stats = service.stats()
+    assert stats["requests"] == 5 and stats["duplicates"] == 2 and stats["batches"] == 1
+
+
+def test_max_batch_splits_and_awaitables_resolve():
+    encoder = _RecordingEncoder()
+    service = EmbeddingService(window_ms=50, max_batch=2, encoder=encoder)
+
+    async def run():
+        return await service.aembed_many(["a", "bb", "ccc", ""])
+
+    vectors = asyncio.run(run())
+    service.shutdown()
+
+    assert [v[0] for v in vectors[:3]] == [1.0, 2.0, 3.0]
+    assert vectors[3] is None  # empty text never reaches the encoder
+    assert all(len(call) <= 2 for call in encoder.calls)
+    assert sum(len(call) for call in encoder.calls) == 3
+
+
+def test_encoder_failure_propagates_to_callers():
+    def broken(texts):
+        raise RuntimeError("model crashed")
+
+    service = EmbeddingService(window_ms=0, encoder=broken)
+    future = service.submit("text")
+    try:
+        future.result(timeout=5)
+    except RuntimeError as exc:
+        assert "model crashed" in str(exc)
+    else:  # pragma: no cover - defensive
+        raise AssertionError("expected the encoder error")
+    finally:
+        service.shutdown()
+    assert service.stats()["failures"] == 1
+
+
+def test_request_queued_during_shutdown_still_resolves():
+    service = EmbeddingService(window_ms=0, encoder=_RecordingEncoder())
+    service.embed("warm", timeout=5)  # start the worker
+    enqueue = service._queue.put
+    stopper = threading.Thread(target=service.shutdown)
+
+    def put_racing_shutdown(entry):
+        if entry is not None:
+            # shutdown() runs between the closed check and the enqueue
+            stopper.start()
+            stopper.join(0.2)
+        enqueue(entry)
+
+    service._queue.put = put_racing_shutdown
+    future = service.submit("late")
+    service._queue.put = enqueue
+    stopper.join(5)
+    assert future.result(timeout=2)[0] == 4.0
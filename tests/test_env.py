@@ -0,0 +1,29 @@
+"""Tests for the shared environment-variable readers."""
+
+from __future__ import annotations
+
+from milton_orchestrator.env import env_flag, env_float, env_int
+
+
+def test_env_readers_fall_back_on_missing_or_invalid(monkeypatch):
+    monkeypatch.delenv("MILTON_TEST_KNOB", raising=False)
+    assert env_float("MILTON_TEST_KNOB", 1.5) == 1.5
+    assert env_int("MILTON_TEST_KNOB", 3) == 3
+    assert env_flag("MILTON_TEST_KNOB") is False
+    assert env_flag("MILTON_TEST_KNOB", True) is True
+
+    monkeypatch.setenv("MILTON_TEST_KNOB", "  ")
+    assert env_int("MILTON_TEST_KNOB", 3) == 3
+
+    monkeypatch.setenv("MILTON_TEST_KNOB", "bogus")
+    assert env_float("MILTON_TEST_KNOB", 1.5) == 1.5
+    assert env_int("MILTON_TEST_KNOB", 3) == 3
+    assert env_flag("MILTON_TEST_KNOB", True) is False
+
+
+def test_env_readers_parse_values(monkeypatch):
+    monkeypatch.setenv("MILTON_TEST_KNOB", "4.0")
+    assert env_float("MILTON_TEST_KNOB", 0.0) == 4.0
+    assert env_int("MILTON_TEST_KNOB", 0) == 4
+    monkeypatch.setenv("MILTON_TEST_KNOB", "Yes")
+    assert env_flag("MILTON_TEST_KNOB") is True
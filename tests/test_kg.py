@@ -3,20 +3,27 @@
 Tests storage, querying, and snapshot operations without requiring Weaviate.
 """
 
+import threading
 from pathlib import Path
 
 import pytest
 
+import memory.kg.api as kg_api
 from memory.kg import (
     Entity,
     export_snapshot,
     get_entity,
     import_snapshot,
+    match_entities,
     neighbors,
     search_entities,
+    traverse,
     upsert_edge,
+    upsert_edges_bulk,
+    upsert_entities_bulk,
     upsert_entity,
 )
+from memory.kg.store import KnowledgeGraphStore
 
 
 def test_upsert_entity_creates_new(tmp_path: Path):
@@ -431,3 +438,216 @@ def test_multiple_predicates_same_entities(tmp_path: Path):
     predicates = {edge.predicate for edge, entity in results}
     assert "works_on" in predicates
     assert "owns" in predicates
+
+
+def test_bulk_upserts_match_single_upsert_semantics(tmp_path: Path):
+    """Bulk upserts dedupe by normalized name/triple and reuse existing rows."""
+    db_path = tmp_path / "test.db"
+    existing_id = upsert_entity(type="project", name="Milton", db_path=db_path)
+
+    ids = upsert_entities_bulk(
+        [
+            {"type": "project", "name": "milton ", "metadata": {"v": 2}},
+            {"type": "tool", "name": "SQLite"},
+            {"type": "tool", "name": "sqlite", "metadata": {"latest": True}},
+            {"type": "person", "name": "User", "entity_id": "entity:user"},
+        ],
+        db_path=db_path,
+    )
+    assert ids[0] == existing_id
+    assert ids[1] == ids[2]
+    assert ids[3] == "entity:user"
+    assert get_entity(ids[1], db_path=db_path).metadata == {"latest": True}
+    assert get_entity(existing_id, db_path=db_path).metadata == {"v": 2}
+
+    first = upsert_edges_bulk(
+        [
+            {"subject_id": ids[3], "predicate": "uses", "object_id": ids[1], "weight": 0.5},
+            {"subject_id": ids[3], "predicate": "works_on", "object_id": ids[0]},
+        ],
+        db_path=db_path,
+    )
+    again = upsert_edges_bulk(
+        [{"subject_id": ids[3], "predicate": "uses", "object_id": ids[1], "weight": 0.9}],
+        db_path=db_path,
+    )
+    assert again == first[:1]
+    results = neighbors(ids[3], db_path=db_path)
+    assert {(edge.predicate, edge.weight) for edge, _ in results} == {("uses", 0.9), ("works_on", 1.0)}
+
+    with pytest.raises(ValueError):
+        upsert_edges_bulk(
+            [{"subject_id": ids[3], "predicate": "likes", "object_id": ids[0], "weight": 2.0}],
+            db_path=db_path,
+        )
+    assert len(neighbors(ids[3], db_path=db_path)) == 2
+
+
+def test_store_uses_one_wal_connection(tmp_path: Path):
+    """The store keeps a single WAL-mode connection across calls."""
+    store = KnowledgeGraphStore(db_path=tmp_path / "test.db")
+    conn = store._conn
+    store.upsert_entity(entity_type="project", name="Milton")
+    store.search_entities(name="milton")
+    assert store._conn is conn
+    assert conn.execute("PRAGMA journal_mode").fetchone()[0] == "wal"
+    store.close()
+
+
+def test_match_entities_ranks_all_terms_in_one_query(tmp_path: Path):
+    """match_entities resolves several terms via the trigram index."""
+    db_path = tmp_path / "test.db"
+    milton_id = upsert_entity(type="project", name="Milton", db_path=db_path)
+    gateway_id = upsert_entity(type="project", name="Milton Gateway", db_path=db_path)
+    python_id = upsert_entity(type="tool", name="Python", db_path=db_path)
+    upsert_entity(type="tool", name="Dashboard", db_path=db_path)
+    k8s_id = upsert_entity(
+        type="tool", name="Kubernetes", metadata={"aliases": ["K8s cluster"]}, db_path=db_path
+    )
+
+    results = match_entities(["Milton,", "pyth", "cluster", "is"], db_path=db_path)
+    scores = {entity.id: score for entity, score in results}
+    assert scores == {milton_id: 1.0, gateway_id: 0.8, python_id: 0.8, k8s_id: 0.6}
+    assert results[0][0].id == milton_id
+
+    assert [e.id for e, _ in match_entities(["milton"], type="project", limit=1, db_path=db_path)] == [milton_id]
+    assert match_entities(["xy", ""], db_path=db_path) == []
+
+
+def test_entity_index_follows_writes_and_backfills(tmp_path: Path):
+    """The FTS index is backfilled for old databases and tracks replaces/deletes."""
+    import sqlite3
+
+    db_path = tmp_path / "legacy.db"
+    store = KnowledgeGraphStore(db_path=db_path)
+    store.upsert_entity(entity_type="tool", name="Weaviate")
+    store._conn.execute("DROP TABLE entities_fts")
+    store._conn.commit()
+    store.close()
+
+    store = KnowledgeGraphStore(db_path=db_path)  # Recreates and backfills
+    assert store.fts_enabled
+    assert [e.name for e, _ in store.match_entities(["weav"])] == ["Weaviate"]
+
+    snapshot = store.export_snapshot()
+    snapshot["entities"][0]["name"] = "Weaviate DB"
+    store.import_snapshot(snapshot, merge=True)  # INSERT OR REPLACE
+    assert store._conn.execute("SELECT COUNT(*) FROM entities_fts").fetchone()[0] == 1
+    assert [e.name for e in store.search_entities(name="db")] == ["Weaviate DB"]  # LIKE path
+    assert [e.name for e in store.search_entities(name="te d")] == ["Weaviate DB"]
+
+    conn = sqlite3.connect(db_path)  # Another writer, e.g. the CLI
+    conn.execute("DELETE FROM entities")
+    conn.commit()
+    conn.close()
+    assert store.match_entities(["weaviate"]) == []
+    assert store._conn.execute("SELECT COUNT(*) FROM entities_fts").fetchone()[0] == 0
+    store.close()
+
+
+def test_traverse_expands_k_hops_with_filters(tmp_path: Path):
+    """traverse walks several hops from many seeds and applies filters."""
+    db_path = tmp_path / "test.db"
+    a = upsert_entity(type="project", name="A", db_path=db_path)
+    b = upsert_entity(type="tool", name="B", db_path=db_path)
+    c = upsert_entity(type="tool", name="C", db_path=db_path)
+    d = upsert_entity(type="tool", name="D", db_path=db_path)
+    e = upsert_entity(type="person", name="E", db_path=db_path)
+    upsert_edge(a, "uses", b, weight=0.9, evidence={"memory_id": "m1"}, db_path=db_path)
+    upsert_edge(b, "uses", c, weight=0.8, db_path=db_path)
+    upsert_edge(c, "uses", d, weight=0.8, db_path=db_path)
+    upsert_edge(e, "works_on", a, weight=0.2, db_path=db_path)
+
+    one_hop = traverse([a], depth=1, db_path=db_path)
+    assert {edge.depth for edge in one_hop.edges} == {1}
+    assert set(one_hop.entities) == {a, b, e}
+    assert [(edge.predicate, ent.id) for edge, ent in one_hop.outgoing(a)] == [("uses", b)]
+    assert [(edge.predicate, ent.id) for edge, ent in one_hop.incoming(a)] == [("works_on", e)]
+    assert one_hop.outgoing(a)[0][0].evidence == {"memory_id": "m1"}
+    assert one_hop.outgoing(a)[0][0].to_edge().weight == 0.9
+
+    two_hop = traverse([a], depth=2, direction="outgoing", db_path=db_path)
+    assert [(edge.subject_id, edge.object_id, edge.depth) for edge in two_hop.edges] == [
+        (a, b, 1),
+        (b, c, 2),
+    ]
+
+    assert set(traverse([a], depth=3, min_weight=0.5, db_path=db_path).entities) == {a, b, c, d}
+    assert traverse([a, e], predicates=["works_on"], db_path=db_path).edges[0].subject_id == e
+    assert len(traverse([a], depth=3, max_edges=2, db_path=db_path).edges) == 2
+    with pytest.raises(ValueError):
+        traverse([a], direction="sideways", db_path=db_path)
+
+
+def test_traverse_caps_edges_per_node(tmp_path: Path):
+    """max_edges_per_node bounds each seed's expansion per direction."""
+    db_path = tmp_path / "test.db"
+    hub = upsert_entity(type="project", name="Hub", db_path=db_path)
+    other = upsert_entity(type="project", name="Other", db_path=db_path)
+    for i in range(6):
+        tool = upsert_entity(type="tool", name=f"T{i}", db_path=db_path)
+        upsert_edge(hub, "uses", tool, db_path=db_path)
+        fan = upsert_entity(type="person", name=f"P{i}", db_path=db_path)
+        upsert_edge(fan, "works_on", hub, db_path=db_path)
+    upsert_edge(other, "uses", hub, db_path=db_path)
+
+    result = traverse([hub, other], depth=1, max_edges_per_node=2, db_path=db_path)
+    assert len(result.outgoing(hub)) == 2
+    # The cap on the hub does not starve the next seed
+    assert [ent.id for _, ent in result.outgoing(other)] == [hub]
+    assert len(result.edges) == 5
+    assert len(result.entities) == 6
+
+
+def test_traverse_adjacency_cache_invalidation(tmp_path: Path):
+    """Cached adjacency is dropped on edge upserts and on other writers' commits."""
+    import sqlite3
+
+    db_path = tmp_path / "test.db"
+    store = KnowledgeGraphStore(db_path=db_path, adjacency_cache_nodes=16)
+    a = store.upsert_entity(entity_type="tool", name="A").id
+    b = store.upsert_entity(entity_type="tool", name="B").id
+    c = store.upsert_entity(entity_type="tool", name="C").id
+    store.upsert_edge(a, "uses", b)
+
+    assert len(store.traverse([a]).edges) == 1
+    assert store.traverse([a]).edges[0].object_id == b
+    assert store.adjacency_cache.hits == 1
+
+    store.upsert_edges_bulk([{"subject_id": a, "predicate": "uses", "object_id": c}])
+    assert {edge.object_id for edge in store.traverse([a]).edges} == {b, c}
+
+    conn = sqlite3.connect(db_path)  # Another writer, e.g. the CLI
+    conn.execute("DELETE FROM edges WHERE object_id = ?", (c,))
+    conn.commit()
+    conn.close()
+    assert [edge.object_id for edge in store.traverse([a]).edges] == [b]
+
+    uncached = KnowledgeGraphStore(db_path=db_path, adjacency_cache_nodes=0)
+    assert uncached.adjacency_cache is None
+    assert [edge.object_id for edge in uncached.traverse([a]).edges] == [b]
+    uncached.close()
+    store.close()
+
+
+def test_get_store_is_shared_across_threads(tmp_path: Path, monkeypatch):
+    """Concurrent first calls create one store; a path switch keeps the old one usable."""
+    monkeypatch.setattr(kg_api, "_store", None)
+    db_path = tmp_path / "shared.db"
+    barrier = threading.Barrier(8)
+    stores = []
+
+    def _worker():
+        barrier.wait()
+        stores.append(kg_api._get_store(db_path))
+
+    threads = [threading.Thread(target=_worker) for _ in range(8)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    assert len({id(store) for store in stores}) == 1
+
+    old = stores[0]
+    kg_api._get_store(tmp_path / "other.db")
+    assert old.get_entity("missing") is None  # still open for in-flight callers
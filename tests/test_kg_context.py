@@ -180,11 +180,11 @@ class TestBuildKGContext:
         milton_id = upsert_entity(type="project", name="Milton", db_path=kg_db)
 
         # Mock the search to return our entities
-        with patch("memory.kg.api.search_entities") as mock_search:
+        with patch("memory.kg.api.match_entities") as mock_match:
             from memory.kg.schema import Entity
             from datetime import datetime, timezone
 
-            mock_search.return_value = [
+            mock_match.return_value = [(entity, 0.8) for entity in [
                 Entity(
                     id=python_id,
                     type="tool",
@@ -192,10 +192,11 @@ class TestBuildKGContext:
                     created_ts=datetime.now(timezone.utc),
                     updated_ts=datetime.now(timezone.utc),
                 ),
-            ]
+            ]]
 
-            with patch("memory.kg.api.neighbors") as mock_neighbors:
-                mock_neighbors.return_value = []  # No edges
+            with patch("memory.kg.api.traverse") as mock_traverse:
+                from memory.kg.traverse import Traversal
+                mock_traverse.return_value = Traversal(seed_ids=[python_id], depth=1)  # No edges
 
                 packet = build_kg_context("Using Python for development")
 
@@ -221,13 +222,13 @@ class TestBuildKGContext:
             db_path=kg_db,
         )
 
-        # Mock search and neighbors
-        with patch("memory.kg.api.search_entities") as mock_search:
+        # Mock search; the edge comes from the real traversal
+        with patch("memory.kg.api.match_entities") as mock_match:
             from datetime import datetime, timezone
 
             from memory.kg.schema import Entity
 
-            mock_search.return_value = [
+            mock_match.return_value = [(entity, 0.8) for entity in [
                 Entity(
                     id=python_id,
                     type="tool",
@@ -235,47 +236,29 @@ class TestBuildKGContext:
                     created_ts=datetime.now(timezone.utc),
                     updated_ts=datetime.now(timezone.utc),
                 ),
-            ]
+            ]]
 
-            with patch("memory.kg.api.neighbors") as mock_neighbors:
-                fastapi_entity = Entity(
-                    id=fastapi_id,
-                    type="tool",
-                    name="FastAPI",
-                    created_ts=datetime.now(timezone.utc),
-                    updated_ts=datetime.now(timezone.utc),
-                )
-                from memory.kg.schema import Edge
-                mock_edge = Edge(
-                    id="test-edge",
-                    subject_id="test-subj",
-                    predicate="enables",
-                    object_id="test-obj",
-                    weight=0.8,
-                    evidence={"memory_id": "test-mem"},
-                )
-                mock_neighbors.return_value = [(mock_edge, fastapi_entity)]
-
-                packet = build_kg_context("Python development")
+            packet = build_kg_context("Python development")
 
-                assert not packet.is_empty()
-                assert len(packet.entities) > 0
-                assert len(packet.relationships) > 0
-                # Check relationship format (subj, pred, obj, evidence)
-                assert any(
-                    rel[0] == "Python" and rel[1] == "enables" and rel[2] == "FastAPI"
-                    for rel in packet.relationships
-                )
+            assert not packet.is_empty()
+            assert len(packet.entities) > 0
+            assert len(packet.relationships) > 0
+            # Check relationship format (subj, pred, obj, evidence)
+            assert any(
+                rel[0] == "Python" and rel[1] == "enables" and rel[2] == "FastAPI"
+                for rel in packet.relationships
+            )
+            assert ("Python", "enables", "FastAPI", "mem-123") in packet.relationships
 
     def test_respects_edge_cap(self, tmp_path):
         """Should respect max edges limit."""
         with patch.dict(os.environ, {"MILTON_KG_CONTEXT_MAX_EDGES": "3"}):
-            with patch("memory.kg.api.search_entities") as mock_search:
+            with patch("memory.kg.api.match_entities") as mock_match:
                 from datetime import datetime, timezone
 
                 from memory.kg.schema import Entity
 
-                mock_search.return_value = [
+                mock_match.return_value = [(entity, 0.8) for entity in [
                     Entity(
                         id="test-1",
                         type="tool",
@@ -283,32 +266,39 @@ class TestBuildKGContext:
                         created_ts=datetime.now(timezone.utc),
                         updated_ts=datetime.now(timezone.utc),
                     ),
-                ]
+                ]]
 
-                with patch("memory.kg.api.neighbors") as mock_neighbors:
-                    from memory.kg.schema import Edge
+                with patch("memory.kg.api.traverse") as mock_traverse:
+                    from memory.kg.traverse import Traversal, TraversedEdge
                     # Return 10 edges
+                    now = datetime.now(timezone.utc)
+                    entities = {
+                        f"ent-{i}": Entity(
+                            id=f"ent-{i}",
+                            type="concept",
+                            name=f"Entity{i}",
+                            created_ts=now,
+                            updated_ts=now,
+                        )
+                        for i in range(10)
+                    }
+                    entities["test-1"] = mock_match.return_value[0][0]
                     edges = [
-                        (
-                            Edge(
-                                id=f"edge-{i}",
-                                subject_id="test-1",
-                                predicate=f"pred{i}",
-                                object_id=f"ent-{i}",
-                                weight=0.8,
-                                evidence={"memory_id": "test-mem"},
-                            ),
-                            Entity(
-                                id=f"ent-{i}",
-                                type="concept",
-                                name=f"Entity{i}",
-                                created_ts=datetime.now(timezone.utc),
-                                updated_ts=datetime.now(timezone.utc),
-                            ),
+                        TraversedEdge(
+                            id=f"edge-{i}",
+                            subject_id="test-1",
+                            predicate=f"pred{i}",
+                            object_id=f"ent-{i}",
+                            weight=0.8,
+                            depth=1,
+                            created_ts=now.isoformat(),
+                            evidence_json='{"memory_id": "test-mem"}',
                         )
                         for i in range(10)
                     ]
-                    mock_neighbors.return_value = edges
+                    mock_traverse.return_value = Traversal(
+                        seed_ids=["test-1"], depth=1, entities=entities, edges=edges
+                    )
 
                     packet = build_kg_context("test query")
 
@@ -338,12 +328,12 @@ class TestBuildKGContext:
             assert len(prompt) > 200
 
             # Now test build_kg_context with mocks
-            with patch("memory.kg.api.search_entities") as mock_search:
+            with patch("memory.kg.api.match_entities") as mock_match:
                 from datetime import datetime, timezone
 
                 from memory.kg.schema import Entity
 
-                mock_search.return_value = [
+                mock_match.return_value = [(entity, 0.8) for entity in [
                     Entity(
                         id=f"ent-{i}",
                         type="concept",
@@ -352,10 +342,11 @@ class TestBuildKGContext:
                         updated_ts=datetime.now(timezone.utc),
                     )
                     for i in range(5)
-                ]
+                ]]
 
-                with patch("memory.kg.api.neighbors") as mock_neighbors:
-                    mock_neighbors.return_value = []
+                with patch("memory.kg.api.traverse") as mock_traverse:
+                    from memory.kg.traverse import Traversal
+                    mock_traverse.return_value = Traversal(seed_ids=[], depth=1)
 
                     packet = build_kg_context("test")
                     prompt = packet.to_prompt_section()
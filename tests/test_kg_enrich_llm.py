@@ -2,7 +2,7 @@
 
 import json
 import os
-from unittest.mock import Mock, patch
+from unittest.mock import patch
 
 import pytest
 
@@ -283,38 +283,31 @@ class TestProposeGraphUpdates:
 
 
 class TestCallLLM:
-    """Test LLM calling with mocked requests."""
+    """Test LLM calling through a mocked transport."""
 
-    @patch("memory.kg.enrich_llm.requests.post")
-    def test_successful_call(self, mock_post):
-        mock_response = Mock()
-        mock_response.raise_for_status = Mock()
-        mock_response.json.return_value = {
-            "choices": [{"message": {"content": "test response"}}]
-        }
-        mock_post.return_value = mock_response
+    def test_successful_call(self, mock_llm):
+        mock_llm.body = {"choices": [{"message": {"content": "test response"}}]}
 
         config = _get_llm_config()
         messages = [{"role": "user", "content": "test"}]
         result = _call_llm(messages, config)
         assert result == "test response"
+        assert mock_llm.last_json["max_tokens"] == 1500
 
-    @patch("memory.kg.enrich_llm.requests.post")
-    def test_connection_error(self, mock_post):
-        import requests
+    def test_connection_error(self, mock_llm):
+        import httpx
 
-        mock_post.side_effect = requests.exceptions.ConnectionError("Connection failed")
+        mock_llm.error = httpx.ConnectError("Connection failed")
 
         config = _get_llm_config()
         messages = [{"role": "user", "content": "test"}]
         with pytest.raises(RuntimeError, match="Cannot connect to LLM"):
             _call_llm(messages, config)
 
-    @patch("memory.kg.enrich_llm.requests.post")
-    def test_timeout_error(self, mock_post):
-        import requests
+    def test_timeout_error(self, mock_llm):
+        import httpx
 
-        mock_post.side_effect = requests.exceptions.Timeout("Timeout")
+        mock_llm.error = httpx.ReadTimeout("Timeout")
 
         config = _get_llm_config()
         messages = [{"role": "user", "content": "test"}]
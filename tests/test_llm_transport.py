@@ -0,0 +1,156 @@
+"""Tests for the shared LLM transport."""
+
+from __future__ import annotations
+
+import asyncio
+import json
+import threading
+import time
+
+import httpx
+import pytest
+
+from milton_orchestrator.llm_transport import (
+    LLMConnectionError,
+    LLMHTTPError,
+    LLMTimeoutError,
+    LLMTransport,
+    TransportSettings,
+)
+
+URL = "http://llm/v1/chat/completions"
+OK = {"choices": [{"message": {"content": "hi"}}], "usage": {"prompt_tokens": 7, "completion_tokens": 2}}
+
+
+def _transport(handler, **settings) -> LLMTransport:
+    settings.setdefault("backoff_base", 0.001)
+    mock = httpx.MockTransport(handler)
+    return LLMTransport(TransportSettings(**settings), http_transport=mock, async_http_transport=mock)
+
+
+def test_chat_text_builds_payload_and_records_metrics(monkeypatch):
+    monkeypatch.setenv("LLM_API_KEY", "secret")
+    seen = []
+
+    def handler(request):
+        seen.append(request)
+        return httpx.Response(200, json=OK)
+
+    transport = _transport(handler)
+    text = transport.chat_text(
+        [{"role": "user", "content": "x"}], base_url="http://llm/", model="m", max_tokens=5, caller="test"
+    )
+
+    assert text == "hi"
+    payload = json.loads(seen[0].content)
+    assert str(seen[0].url) == URL
+    assert payload == {"model": "m", "messages": [{"role": "user", "content": "x"}], "temperature": 0.7, "max_tokens": 5}
+    assert seen[0].headers["Authorization"] == "Bearer secret"
+    stats = transport.stats()["callers"]["test"]
+    assert stats["requests"] == 1 and stats["errors"] == {}
+    assert stats["prompt_tokens"] == 7 and stats["completion_tokens"] == 2
+
+
+def test_overload_is_retried_then_succeeds():
+    statuses = [503, 429, 200]
+
+    def handler(request):
+        status = statuses.pop(0)
+        return httpx.Response(status, json=OK if status == 200 else {"error": "busy"})
+
+    transport = _transport(handler, retries=2)
+    assert transport.chat_text([], base_url="http://llm", caller="t") == "hi"
+    assert transport.stats()["callers"]["t"]["retries"] == 2
+
+
+def test_error_status_is_not_retried_and_raises():
+    calls = []
+
+    def handler(request):
+        calls.append(request)
+        return httpx.Response(400, text="bad request body")
+
+    transport = _transport(handler, retries=3)
+    with pytest.raises(LLMHTTPError) as exc_info:
+        transport.chat([], base_url="http://llm", caller="t")
+    assert exc_info.value.status_code == 400
+    assert "bad request body" in str(exc_info.value)
+    assert len(calls) == 1
+    assert transport.stats()["callers"]["t"]["errors"] == {"http_400": 1}
+
+
+def test_connection_errors_exhaust_retries():
+    calls = []
+
+    def handler(request):
+        calls.append(request)
+        raise httpx.ConnectError("refused")
+
+    transport = _transport(handler, retries=2)
+    with pytest.raises(LLMConnectionError, match="Cannot connect"):
+        transport.post(URL, {}, caller="t")
+    assert len(calls) == 3
+    assert transport.stats()["callers"]["t"]["errors"] == {"connection": 1}
+
+
+def test_deadline_stops_retries():
+    def handler(request):
+        return httpx.Response(503)
+
+    transport = _transport(handler, retries=10, backoff_base=1.0, backoff_max=1.0)
+    started = time.monotonic()
+    response = transport.post(URL, {}, timeout=0.05, caller="t")
+    # The backoff would overrun the deadline, so the last response is returned
+    assert response.status_code == 503
+    assert time.monotonic() - started < 0.5
+
+
+def test_concurrency_limit_times_out_waiting_for_a_slot():
+    release = threading.Event()
+
+    def handler(request):
+        release.wait(2)
+        return httpx.Response(200, json=OK)
+
+    transport = _transport(handler, max_concurrency=1)
+    worker = threading.Thread(target=transport.post, args=(URL, {}))
+    worker.start()
+    time.sleep(0.05)
+    try:
+        with pytest.raises(LLMTimeoutError, match="slot"):
+            transport.post(URL, {}, timeout=0.05)
+    finally:
+        release.set()
+        worker.join()
+
+
+def test_stream_yields_lines():
+    def handler(request):
+        assert json.loads(request.content)["stream"] is True
+        return httpx.Response(200, content=b"data: a\n\ndata: [DONE]\n")
+
+    transport = _transport(handler)
+    payload = transport.chat_payload([], model="m", stream=True)
+    with transport.stream(URL, payload) as response:
+        lines = [line for line in response.iter_lines() if line]
+    assert lines == ["data: a", "data: [DONE]"]
+
+
+def test_async_face_shares_settings_and_metrics():
+    def handler(request):
+        return httpx.Response(200, json=OK)
+
+    transport = _transport(handler)
+
+    async def run():
+        results = await asyncio.gather(
+            *(transport.achat([], base_url="http://llm", caller="async") for _ in range(3))
+        )
+        async with transport.astream(URL, {}, caller="async") as response:
+            assert response.is_success
+        await transport.aclose()
+        return results
+
+    results = asyncio.run(run())
+    assert [r["choices"][0]["message"]["content"] for r in results] == ["hi"] * 3
+    assert transport.stats()["callers"]["async"]["requests"] == 4
@@ -0,0 +1,133 @@
+"""Tests for the shared, health-checked memory backend manager."""
+
+from __future__ import annotations
+
+import threading
+from unittest.mock import Mock
+
+import pytest
+
+import memory.backends as backends
+from memory.backends import BackendManager, JsonlBackend, WeaviateBackend
+
+
+@pytest.fixture
+def manager(monkeypatch):
+    monkeypatch.delenv("MILTON_MEMORY_BACKEND", raising=False)
+    monkeypatch.setattr(backends, "_should_try_weaviate", lambda root: True)
+    monkeypatch.setattr(backends, "weaviate", object())
+    # Keep the background thread idle for the duration of the test
+    mgr = BackendManager(health_interval=3600)
+    yield mgr
+    mgr.shutdown()
+
+
+def test_probes_and_connects_once(manager, monkeypatch, tmp_path):
+    probe = Mock(return_value=True)
+    client = Mock()
+    connect = Mock(return_value=client)
+    monkeypatch.setattr(backends, "probe_weaviate", probe)
+    monkeypatch.setattr(backends, "get_client", connect)
+
+    first = manager.get_backend(tmp_path)
+    second = manager.get_backend(tmp_path)
+
+    assert isinstance(first, WeaviateBackend)
+    assert first is second
+    assert probe.call_count == 1
+    assert connect.call_count == 1
+
+    # Callers close backends they get from get_backend(); the pool must survive
+    first.close()
+    client.close.assert_not_called()
+
+    stats = manager.stats()
+    assert stats["probes"] == 1
+    assert stats["probes_avoided"] == 1
+    assert stats["connects_avoided"] == 1
+    assert stats["weaviate_healthy"] is True
+
+
+def test_switches_to_jsonl_when_unhealthy(manager, monkeypatch, tmp_path):
+    client = Mock()
+    monkeypatch.setattr(backends, "probe_weaviate", lambda url=None: True)
+    monkeypatch.setattr(backends, "get_client", lambda: client)
+    assert isinstance(manager.get_backend(tmp_path), WeaviateBackend)
+
+    monkeypatch.setattr(backends, "probe_weaviate", lambda url=None: False)
+    assert manager.check_health() is False
+
+    backend = manager.get_backend(tmp_path)
+    assert isinstance(backend, JsonlBackend)
+    assert manager.get_backend(tmp_path) is backend
+    # The retired client stays open for queries already running on it
+    client.close.assert_not_called()
+    assert manager.status(tmp_path).degraded is True
+    assert manager.stats()["switches"] == 1
+
+    monkeypatch.setattr(backends, "probe_weaviate", lambda url=None: True)
+    manager.check_health()
+    assert isinstance(manager.get_backend(tmp_path), WeaviateBackend)
+    assert manager.stats()["switches"] == 2
+
+    manager.shutdown()
+    client.close.assert_called()
+
+
+def test_retired_client_closes_after_grace(monkeypatch, tmp_path):
+    monkeypatch.setattr(backends, "_should_try_weaviate", lambda root: True)
+    monkeypatch.setattr(backends, "weaviate", object())
+    closed = threading.Event()
+    client = Mock()
+    client.close.side_effect = closed.set
+    monkeypatch.setattr(backends, "probe_weaviate", lambda url=None: True)
+    monkeypatch.setattr(backends, "get_client", lambda: client)
+    manager = BackendManager(health_interval=3600, close_grace=0.05)
+    try:
+        manager.get_backend(tmp_path)
+        monkeypatch.setattr(backends, "probe_weaviate", lambda url=None: False)
+        manager.check_health()
+        assert closed.wait(2)
+        assert client.close.call_count == 1
+    finally:
+        manager.shutdown()
+    assert client.close.call_count == 1
+
+
+def test_probe_runs_outside_the_state_lock(manager, monkeypatch, tmp_path):
+    probing = threading.Event()
+    release = threading.Event()
+
+    def slow_probe(url=None):
+        probing.set()
+        release.wait(5)
+        return True
+
+    monkeypatch.setattr(backends, "probe_weaviate", slow_probe)
+    monkeypatch.setattr(backends, "get_client", Mock)
+    caller = threading.Thread(target=manager.get_backend, args=(tmp_path,))
+    caller.start()
+    assert probing.wait(2)
+
+    # Readers of the cached state are not held up by the probe
+    reader = threading.Thread(target=lambda: (manager.stats(), manager.get_client()))
+    reader.start()
+    reader.join(1)
+    alive = reader.is_alive()
+    release.set()
+    caller.join(5)
+    reader.join(5)
+    assert not alive
+
+
+def test_get_backend_uses_manager_when_enabled(monkeypatch, tmp_path):
+    monkeypatch.delenv("MILTON_MEMORY_BACKEND", raising=False)
+    monkeypatch.setattr(backends, "_should_try_weaviate", lambda root: False)
+    backends.enable_shared_backend()
+    try:
+        first = backends.get_backend(repo_root=tmp_path)
+        assert backends.get_backend(repo_root=tmp_path) is first
+    finally:
+        backends.enable_shared_backend(False)
+
+    assert backends.get_backend(repo_root=tmp_path) is not first
@@ -0,0 +1,175 @@
+"""Tests for the durable KG enrichment queue behind add_memory."""
+
+from __future__ import annotations
+
+import threading
+import time
+
+import pytest
+
+import memory.kg.enrich_queue as enrich_queue_module
+import memory.store as store
+from memory.backends import JsonlBackend
+from memory.kg.enrich_queue import EnrichmentQueue
+from memory.schema import MemoryItem
+
+
+def _item(content: str) -> MemoryItem:
+    return MemoryItem(agent="NEXUS", type="fact", content=content, source="test")
+
+
+def test_pending_jobs_survive_restart(tmp_path):
+    db_path = tmp_path / "queue.sqlite"
+    seen: list[str] = []
+
+    first = EnrichmentQueue(db_path, lambda payload, memory_id: seen.append(memory_id), autostart=False)
+    first.enqueue("m1", {"content": "a"})
+    first.enqueue("m2", {"content": "b"})
+    assert first.depth() == 2
+    first.close()
+    assert seen == []
+
+    second = EnrichmentQueue(db_path, lambda payload, memory_id: seen.append(memory_id))
+    assert second.wait_idle(timeout=5)
+    assert sorted(seen) == ["m1", "m2"]
+    stats = second.stats()
+    assert stats["depth"] == 0 and stats["processed"] == 2
+    second.close()
+
+
+def test_failed_jobs_are_retried_then_dropped(tmp_path):
+    attempts: dict[str, int] = {}
+
+    def flaky(payload, memory_id):
+        attempts[memory_id] = attempts.get(memory_id, 0) + 1
+        if memory_id == "bad" or attempts[memory_id] == 1:
+            raise RuntimeError("boom")
+
+    queue = EnrichmentQueue(
+        tmp_path / "queue.sqlite", flaky, workers=1, poll_seconds=0.01, retry_backoff=0.01
+    )
+    queue.enqueue("ok", {})
+    queue.enqueue("bad", {})
+    assert queue.wait_idle(timeout=5)
+    assert attempts == {"ok": 2, "bad": 3}
+    stats = queue.stats()
+    assert stats["processed"] == 1 and stats["failed"] == 1 and stats["retried"] == 3
+    queue.close()
+
+
+@pytest.mark.parametrize("use_returning", [True, False])
+def test_claim_with_and_without_returning(tmp_path, monkeypatch, use_returning):
+    if use_returning and not enrich_queue_module._SQLITE_HAS_RETURNING:
+        pytest.skip("SQLite < 3.35 has no RETURNING")
+    monkeypatch.setattr(enrich_queue_module, "_SQLITE_HAS_RETURNING", use_returning)
+    queue = EnrichmentQueue(tmp_path / "queue.sqlite", lambda payload, memory_id: None, batch_size=2, autostart=False)
+    for i in range(3):
+        queue.enqueue(f"m{i}", {"n": i})
+
+    with queue._lock:
+        first = queue._claim_locked()
+        second = queue._claim_locked()
+        assert queue._claim_locked() == []
+    assert [row[1] for row in first] == ["m0", "m1"]
+    assert [row[1] for row in second] == ["m2"]
+    queue.close()
+
+
+def test_depth_is_tracked_without_counting_rows(tmp_path):
+    db_path = tmp_path / "queue.sqlite"
+    seed = EnrichmentQueue(db_path, lambda payload, memory_id: None, autostart=False)
+    seed.enqueue("old", {})
+    seed.close()
+
+    queue = EnrichmentQueue(db_path, lambda payload, memory_id: None, autostart=False)
+    assert queue.depth() == 1
+    queue._count_locked = lambda: pytest.fail("enqueue should not count rows")
+    queue.enqueue("new", {})
+    assert queue.depth() == 2
+    del queue._count_locked
+    assert queue.drain(timeout=5)
+    assert queue.depth() == 0
+    queue.close()
+
+
+def test_workers_pick_up_rows_enqueued_by_another_process(tmp_path):
+    db_path = tmp_path / "queue.sqlite"
+    seen: list[str] = []
+    worker = EnrichmentQueue(
+        db_path, lambda payload, memory_id: seen.append(memory_id), lease_seconds=300, poll_seconds=0.05
+    )
+    worker.start()
+    time.sleep(0.1)  # workers are idle, waiting
+
+    producer = EnrichmentQueue(db_path, lambda payload, memory_id: None, autostart=False)
+    producer.enqueue("remote", {})
+    deadline = time.monotonic() + 5
+    while not seen and time.monotonic() < deadline:
+        time.sleep(0.02)
+    assert seen == ["remote"]
+    producer.close()
+    worker.close()
+
+
+def test_drain_processes_pending_rows_before_stopping(tmp_path):
+    seen: list[str] = []
+    queue = EnrichmentQueue(tmp_path / "queue.sqlite", lambda payload, memory_id: seen.append(memory_id))
+    for i in range(5):
+        queue.enqueue(f"m{i}", {})
+    assert queue.drain(timeout=5)
+    assert len(seen) == 5
+    assert not any(thread.is_alive() for thread in queue._threads)
+    queue.close()
+
+
+def test_add_memory_returns_before_enrichment(tmp_path, monkeypatch):
+    monkeypatch.setenv("STATE_DIR", str(tmp_path / "state"))
+    monkeypatch.setattr(store, "_enrichment_queue", None)
+    release = threading.Event()
+    enriched: list[str] = []
+
+    def slow_enrich(item, memory_id):
+        release.wait(5)
+        enriched.append(item.content)
+
+    monkeypatch.setattr(store, "_enrich_knowledge_graph", slow_enrich)
+
+    memory_id = store.add_memory(_item("I prefer tabs"), backend=JsonlBackend(tmp_path))
+    assert memory_id
+    assert enriched == []
+    assert store.enrichment_queue_stats()["enqueued"] == 1
+
+    release.set()
+    queue = store.get_enrichment_queue()
+    assert queue.wait_idle(timeout=5)
+    assert enriched == ["I prefer tabs"]
+    queue.close()
+
+
+def test_add_memory_enriches_inline_when_async_disabled(tmp_path, monkeypatch):
+    monkeypatch.setenv("MILTON_KG_ENRICH_ASYNC", "false")
+    enriched: list[str] = []
+    monkeypatch.setattr(store, "_enrich_knowledge_graph", lambda item, memory_id: enriched.append(memory_id))
+
+    memory_id = store.add_memory(_item("inline"), backend=JsonlBackend(tmp_path))
+    assert enriched == [memory_id]
+
+
+def test_failed_job_waits_for_its_backoff(tmp_path):
+    calls: list[float] = []
+
+    def flaky(payload, memory_id):
+        calls.append(time.monotonic())
+        if len(calls) == 1:
+            raise RuntimeError("endpoint down")
+
+    queue = EnrichmentQueue(
+        tmp_path / "queue.sqlite", flaky, workers=1, poll_seconds=0.01, retry_backoff=0.3
+    )
+    queue.enqueue("m1", {})
+    assert not queue.wait_idle(timeout=0.1)
+    assert len(calls) == 1  # not retried straight away
+    assert queue.wait_idle(timeout=5)
+    assert len(calls) == 2 and calls[1] - calls[0] >= 0.3
+    assert queue.depth() == 0 and queue.stats()["retried"] == 1
+    queue.close()
@@ -0,0 +1,137 @@
+"""Tests for the indexed, append-only JSONL short-term store."""
+
+from __future__ import annotations
+
+import json
+import threading
+from datetime import datetime, timedelta, timezone
+
+from memory.backends import JsonlBackend, memory_paths
+from memory.jsonl_index import JsonlIndex
+from memory.schema import MemoryItem
+
+NOW = datetime(2025, 1, 1, tzinfo=timezone.utc)
+
+
+def _item(memory_id: str, hours_ago: float, tags: list[str] | None = None) -> MemoryItem:
+    return MemoryItem(
+        id=memory_id,
+        ts=NOW - timedelta(hours=hours_ago),
+        agent="NEXUS",
+        type="crumb",
+        content=f"memory {memory_id}",
+        tags=tags or [],
+        source="test",
+    )
+
+
+def test_reads_only_appended_lines(tmp_path):
+    backend = JsonlBackend(tmp_path)
+    backend.append_short_term(_item("a", 3, ["x"]))
+    assert [item.id for item in backend.list_short_term()] == ["a"]
+
+    # Another process appends directly to the file
+    short_path, _ = memory_paths(tmp_path)
+    record = {"record_type": "memory_item", "data": _item("b", 1).model_dump(mode="json")}
+    with short_path.open("a") as handle:
+        handle.write(json.dumps(record) + "\n")
+
+    index = JsonlIndex(short_path)
+    assert [item.id for item in index.items()] == ["a", "b"]
+    offset = index.stats()["offset"]
+    assert offset == short_path.stat().st_size
+    assert [item.id for item in backend.list_short_term()] == ["a", "b"]
+    assert [item.id for item in backend.list_short_term_since(NOW - timedelta(hours=2))] == ["b"]
+    assert backend.get_short_term("a").tags == ["x"]
+
+
+def test_detects_external_rewrite(tmp_path):
+    backend = JsonlBackend(tmp_path)
+    backend.append_short_term(_item("a", 3))
+    backend.append_short_term(_item("b", 2))
+    assert len(backend.list_short_term()) == 2
+
+    short_path, _ = memory_paths(tmp_path)
+    record = {"record_type": "memory_item", "data": _item("c", 1).model_dump(mode="json")}
+    short_path.write_text(json.dumps(record) + "\n")
+
+    assert [item.id for item in backend.list_short_term()] == ["c"]
+
+
+def test_delete_appends_tombstone_and_compacts(tmp_path):
+    short_path, _ = memory_paths(tmp_path)
+    index = JsonlIndex(short_path, compact_min_dead=4)
+    for i in range(5):
+        index.append(_item(f"m{i}", hours_ago=10 - i))
+
+    size_before = short_path.stat().st_size
+    removed = index.delete_before(NOW - timedelta(hours=6.5))
+    assert removed == 4
+    assert [item.id for item in index.items()] == ["m4"]
+    # Deletion is an append, not a rewrite
+    assert short_path.stat().st_size > size_before
+
+    index.wait_for_compaction(timeout=5)
+    lines = [json.loads(line) for line in short_path.read_text().splitlines()]
+    assert [line["data"]["id"] for line in lines] == ["m4"]
+    assert index.stats()["dead"] == 0
+    assert [item.id for item in JsonlIndex(short_path).items()] == ["m4"]
+
+
+
+def test_compaction_waits_for_other_writers_and_drops_torn_tail(tmp_path):
+    short_path, _ = memory_paths(tmp_path)
+    index = JsonlIndex(short_path)
+    for i in range(3):
+        index.append(_item(f"m{i}", hours_ago=10 - i))
+    index.delete_before(NOW - timedelta(hours=9.5))
+
+    # Another process holds the lock while it appends
+    other = JsonlIndex(short_path)
+    locked = threading.Event()
+    release = threading.Event()
+
+    def append_under_lock():
+        with other._file_lock():
+            locked.set()
+            release.wait(5)
+            record = {"record_type": "memory_item", "data": _item("late", 1).model_dump(mode="json")}
+            with short_path.open("a") as handle:
+                handle.write(json.dumps(record) + "\n")
+
+    writer = threading.Thread(target=append_under_lock)
+    writer.start()
+    assert locked.wait(5)
+    compactor = threading.Thread(target=index.compact)
+    compactor.start()
+    compactor.join(0.2)
+    assert compactor.is_alive()  # blocked behind the writer
+    release.set()
+    writer.join(5)
+    compactor.join(5)
+    assert [item.id for item in JsonlIndex(short_path).items()] == ["m1", "m2", "late"]
+
+    # A torn line from a crashed writer is not carried into the compacted file
+    index.delete_before(NOW - timedelta(hours=8.5))
+    with short_path.open("ab") as handle:
+        handle.write(b'{"record_type": "memory_item", "da')
+    index.compact()
+    assert short_path.read_bytes().endswith(b"\n")
+    assert [item.id for item in JsonlIndex(short_path).items()] == ["m2", "late"]
+
+
+def test_lexical_index_follows_appends_and_deletes(tmp_path):
+    backend = JsonlBackend(tmp_path)
+    old = _item("old", 10)
+    old.content = "grant deadline friday"
+    new = _item("new", 1)
+    new.content = "thesis chapter draft"
+    backend.append_short_term(old)
+    backend.append_short_term(new)
+
+    assert set(backend.score_short_term("grant thesis")) == {"old", "new"}
+    assert backend.score_short_term("deadline") == {"old": 1.0}
+
+    backend.delete_short_term_before(NOW - timedelta(hours=5))
+    assert backend.score_short_term("grant deadline") == {}
+    assert set(backend.score_short_term("thesis")) == {"new"}
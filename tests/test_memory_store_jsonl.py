@@ -34,3 +34,27 @@ def test_store_and_query_jsonl(tmp_path, monkeypatch):
     )
     assert len(results) == 1
     assert results[0].id == "mem-1"
+
+
+def test_add_memory_notifies_listeners(tmp_path, monkeypatch):
+    import memory.store as store
+
+    monkeypatch.setenv("MILTON_MEMORY_BACKEND", "jsonl")
+    monkeypatch.setattr(store, "_memory_listeners", [])
+    events = []
+    store.add_memory_listener(lambda event, payload: events.append((event, payload.id)))
+
+    def broken(event, payload):
+        raise RuntimeError("listener bug")
+
+    store.add_memory_listener(broken)
+    item = MemoryItem(
+        id="mem-2",
+        ts=datetime(2025, 1, 1, tzinfo=timezone.utc),
+        agent="NEXUS",
+        type="fact",
+        content="User prefers tea",
+        source="chat",
+    )
+    assert add_memory(item, repo_root=tmp_path) == "mem-2"
+    assert events == [("memory", "mem-2")]
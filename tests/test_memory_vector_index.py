@@ -0,0 +1,172 @@
+"""Tests for the local memory-mapped vector index and its hybrid retrieval use."""
+
+from __future__ import annotations
+
+import threading
+from datetime import datetime, timedelta, timezone
+
+import numpy as np
+
+import memory.retrieve as retrieve
+from memory.backends import JsonlBackend
+from memory.schema import MemoryItem
+from memory.vector_index import LocalVectorIndex, get_vector_index, vector_index_dir
+
+DIM = 8
+
+
+def _unit(i: int) -> np.ndarray:
+    vector = np.zeros(DIM, dtype=np.float32)
+    vector[i] = 1.0
+    return vector
+
+
+def test_search_append_and_delete(tmp_path):
+    index = LocalVectorIndex(tmp_path, dim=DIM)
+    index.add_many(["a", "b", "c"], np.stack([_unit(0), _unit(1), _unit(2) * 5]))
+
+    assert len(index) == 3
+    assert index.search(_unit(2), k=1) == [("c", 1.0)]  # rows are normalized
+
+    index.delete_many(["c"])
+    assert "c" not in index
+    assert [memory_id for memory_id, _ in index.search(_unit(2), k=3)] != ["c"]
+    assert len(index.search(_unit(2), k=3)) == 2
+
+    # Replacing a vector retires the old row
+    index.add_many(["a"], _unit(3)[None, :])
+    assert index.search(_unit(3), k=1)[0][0] == "a"
+
+    batch = index.search_batch(np.stack([_unit(1), _unit(3)]), k=1)
+    assert [hits[0][0] for hits in batch] == ["b", "a"]
+
+    # A fresh instance (another process) replays the same state from disk
+    reopened = LocalVectorIndex(tmp_path, dim=DIM)
+    assert reopened.ids() == {"a", "b"}
+    reopened.compact()
+    assert reopened.search(_unit(1), k=1)[0][0] == "b"
+    assert (tmp_path / "vectors.f32").stat().st_size == 2 * DIM * 4
+
+
+
+def test_reader_notices_compaction_that_grows_the_log(tmp_path):
+    writer = LocalVectorIndex(tmp_path, dim=DIM)
+    reader = LocalVectorIndex(tmp_path, dim=DIM)
+    writer.add_many(["a", "b"], np.stack([_unit(0), _unit(1)]))
+    writer.delete_many(["a"])
+    assert reader.ids() == {"b"}
+
+    # The compacted log plus new appends is longer than the reader's offset
+    writer.compact()
+    writer.add_many(["c", "d", "e"], np.stack([_unit(2), _unit(3), _unit(4)]))
+    assert reader.ids() == {"b", "c", "d", "e"}
+    assert reader.search(_unit(3), k=1)[0][0] == "d"
+
+
+def test_inconsistent_index_is_ignored_on_read_and_discarded_on_write(tmp_path):
+    index = LocalVectorIndex(tmp_path, dim=DIM)
+    index.add_many(["a", "b"], np.stack([_unit(0), _unit(1)]))
+    with (tmp_path / "vectors.f32").open("r+b") as handle:
+        handle.truncate(DIM * 4)  # one vector row for two ids
+
+    reader = LocalVectorIndex(tmp_path, dim=DIM)
+    assert reader.ids() == set()
+    assert reader.search(_unit(0), k=2) == []
+    assert (tmp_path / "ids.jsonl").exists() and (tmp_path / "vectors.f32").exists()
+
+    reader.add_many(["c"], _unit(2)[None, :])
+    assert reader.ids() == {"c"}
+    assert LocalVectorIndex(tmp_path, dim=DIM).search(_unit(2), k=1) == [("c", 1.0)]
+
+
+def test_hybrid_uses_local_index_for_jsonl(tmp_path, monkeypatch):
+    monkeypatch.delenv("MILTON_MEMORY_VECTOR_INDEX", raising=False)
+    now = datetime(2025, 1, 1, tzinfo=timezone.utc)
+    monkeypatch.setattr(retrieve, "_now_utc", lambda: now)
+
+    topics = {"espresso": 0, "thesis": 1, "gym": 2}
+    full_dim = retrieve.get_vector_index(tmp_path).dim
+
+    def fake_vector(text: str) -> np.ndarray:
+        vector = np.zeros(full_dim, dtype=np.float32)
+        for word, slot in topics.items():
+            if word in text:
+                vector[slot] = 1.0
+        vector[-1] = 0.1
+        return vector
+
+    monkeypatch.setattr(retrieve, "embeddings_available", lambda: True)
+    monkeypatch.setattr(retrieve, "embed_text", fake_vector)
+    monkeypatch.setattr(
+        retrieve, "embed_texts", lambda texts, **kwargs: [fake_vector(t) for t in texts]
+    )
+
+    def _fail_client():
+        raise AssertionError("Weaviate must not be queried in JSONL mode")
+
+    monkeypatch.setattr(retrieve, "_weaviate_client", _fail_client)
+
+    backend = JsonlBackend(tmp_path)
+    for memory_id, content in [("m1", "espresso beans"), ("m2", "thesis draft"), ("m3", "gym plan")]:
+        backend.append_short_term(
+            MemoryItem(
+                id=memory_id,
+                ts=now - timedelta(hours=1),
+                agent="NEXUS",
+                type="fact",
+                content=content,
+                source="test",
+            )
+        )
+
+    results = retrieve.query_relevant_hybrid(
+        "thesis", limit=1, mode="semantic", backend=backend
+    )
+    assert [item.id for item in results] == ["m2"]
+    assert get_vector_index(tmp_path).ids() == {"m1", "m2", "m3"}
+    assert vector_index_dir(tmp_path).exists()
+
+
+def test_local_scores_backfill_older_memories_in_background(tmp_path, monkeypatch):
+    index = LocalVectorIndex(tmp_path, dim=DIM)
+    now = datetime(2025, 1, 1, tzinfo=timezone.utc)
+    items = [
+        MemoryItem(
+            id=f"m{i}",
+            ts=now - timedelta(minutes=i),
+            agent="NEXUS",
+            type="fact",
+            content=f"note {i}",
+            source="test",
+        )
+        for i in range(10)
+    ]
+    embedded: list[int] = []
+    release = threading.Event()
+
+    def fake_embed(texts, **kwargs):
+        if threading.current_thread().name.startswith("memory-vector-backfill"):
+            release.wait(5)
+        embedded.append(len(texts))
+        return [_unit(int(text.split()[1]) % DIM) for text in texts]
+
+    monkeypatch.setattr(retrieve, "embed_texts", fake_embed)
+    monkeypatch.setattr(retrieve, "LOCAL_VECTOR_INLINE_LIMIT", 3)
+    monkeypatch.setattr(retrieve, "LOCAL_VECTOR_BACKFILL_BATCH", 4)
+    stale = LocalVectorIndex(tmp_path, dim=DIM)
+    stale.add_many(["gone"], _unit(0)[None, :])
+
+    scores = retrieve._local_semantic_scores(index, items, _unit(1), k=10)
+    # Only the newest memories were embedded before searching
+    assert embedded[0] == 3
+    assert set(scores) <= {"m0", "m1", "m2"}
+    assert "gone" not in index
+
+    release.set()
+    retrieve._backfill_pool.submit(lambda: None).result(timeout=5)
+    assert index.ids() == {item.id for item in items}
+    assert embedded[1:] == [4, 3]
+
+    # Nothing left to embed
+    retrieve._local_semantic_scores(index, items, _unit(1), k=10)
+    assert len(embedded) == 3
@@ -3,6 +3,8 @@
 from unittest.mock import Mock, patch, MagicMock
 import pytest
 import json
+import threading
+import time
 
 from milton_orchestrator.notifications import (
     DeliveryResult,
@@ -10,6 +12,7 @@ from milton_orchestrator.notifications import (
     VoiceProvider,
     DesktopPopupProvider,
     NotificationRouter,
+    RateLimiter,
     create_default_router,
 )
 from milton_orchestrator.reminders import Reminder, DEFAULT_ACTIONS
@@ -52,7 +55,7 @@ def test_delivery_result_to_dict():
     assert d["metadata"]["url"] == "https://ntfy.sh/topic"
 
 
-@patch("milton_orchestrator.notifications.requests.post")
+@patch("milton_orchestrator.notifications.requests.Session.post")
 def test_ntfy_provider_success(mock_post, mock_reminder):
     """Test successful ntfy delivery."""
     mock_response = Mock()
@@ -94,7 +97,7 @@ def test_ntfy_provider_success(mock_post, mock_reminder):
     assert "secret123" in headers["Actions"]
 
 
-@patch("milton_orchestrator.notifications.requests.post")
+@patch("milton_orchestrator.notifications.requests.Session.post")
 def test_ntfy_provider_no_actions(mock_post, mock_reminder):
     """Test ntfy delivery without action buttons."""
     mock_response = Mock()
@@ -122,7 +125,7 @@ def test_ntfy_provider_no_actions(mock_post, mock_reminder):
     assert "Actions" not in headers
 
 
-@patch("milton_orchestrator.notifications.requests.post")
+@patch("milton_orchestrator.notifications.requests.Session.post")
 def test_ntfy_provider_http_error(mock_post, mock_reminder):
     """Test ntfy delivery with HTTP error."""
     mock_response = Mock()
@@ -146,7 +149,7 @@ def test_ntfy_provider_http_error(mock_post, mock_reminder):
     assert "HTTP 500" in result.error
 
 
-@patch("milton_orchestrator.notifications.requests.post")
+@patch("milton_orchestrator.notifications.requests.Session.post")
 def test_ntfy_provider_exception(mock_post, mock_reminder):
     """Test ntfy delivery with exception."""
     mock_post.side_effect = Exception("Network error")
@@ -317,3 +320,95 @@ def test_create_default_router_with_actions():
     assert isinstance(ntfy, NtfyProvider)
     assert ntfy.public_base_url == "https://milton.example.com"
     assert ntfy.action_token == "secret"
+
+
+class _SlowProvider:
+    """Provider that blocks for ``delay`` seconds and records its thread."""
+
+    def __init__(self, name, delay, ok=True):
+        self._name = name
+        self.delay = delay
+        self.ok = ok
+        self.calls = []
+
+    @property
+    def name(self):
+        return self._name
+
+    def send(self, reminder, *, title, body, actions, context=None):
+        self.calls.append((reminder.id, threading.current_thread().name))
+        time.sleep(self.delay)
+        return DeliveryResult(ok=self.ok, provider=self._name)
+
+
+def test_notification_router_sends_channels_concurrently(mock_reminder):
+    """A slow channel does not delay the others; results keep channel order."""
+    router = NotificationRouter({
+        "ntfy": _SlowProvider("ntfy", 0.3),
+        "voice": _SlowProvider("voice", 0.3, ok=False),
+    })
+
+    started = time.monotonic()
+    results = router.send_all(mock_reminder, ["voice", "unknown", "ntfy"])
+    elapsed = time.monotonic() - started
+    router.close()
+
+    assert [r.provider for r in results] == ["voice", "unknown", "ntfy"]
+    assert [r.ok for r in results] == [False, False, True]
+    assert elapsed < 0.55
+    assert router.providers["ntfy"].calls[0][1].startswith("notify-ntfy")
+
+
+def test_notification_router_pool_is_bounded_per_channel(mock_reminder):
+    """Each channel runs at most max_workers sends at a time."""
+    provider = _SlowProvider("ntfy", 0.1)
+    router = NotificationRouter({"ntfy": provider}, max_workers=1)
+
+    threads = [
+        threading.Thread(target=router.send_all, args=(mock_reminder, ["ntfy"]))
+        for _ in range(3)
+    ]
+    started = time.monotonic()
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    router.close()
+
+    assert len(provider.calls) == 3
+    assert time.monotonic() - started >= 0.3
+
+
+def test_notification_router_rate_limits_channel(mock_reminder):
+    """Configured per-channel rate limits space out sends."""
+    provider = _SlowProvider("ntfy", 0)
+    router = NotificationRouter({"ntfy": provider}, rate_limits={"ntfy": 10})
+
+    started = time.monotonic()
+    for _ in range(12):
+        router.send_all(mock_reminder, ["ntfy"])
+    router.close()
+
+    # Burst of 10, then one token per 0.1s
+    assert time.monotonic() - started >= 0.15
+
+
+def test_rate_limiter_allows_burst_then_waits():
+    limiter = RateLimiter(rate=100, burst=2)
+    assert limiter.acquire() == 0
+    assert limiter.acquire() == 0
+    assert limiter.acquire() > 0
+
+
+@patch("milton_orchestrator.notifications.requests.Session.post")
+def test_ntfy_providers_share_keepalive_session(mock_post, mock_reminder):
+    """Providers without an explicit session reuse the module session."""
+    mock_post.return_value = Mock(status_code=200, json=Mock(return_value={}))
+    first = NtfyProvider(base_url="https://ntfy.sh", topic="a")
+    second = NtfyProvider(base_url="https://ntfy.sh", topic="b", timeout=3)
+
+    first.send(mock_reminder, title="t", body="b", actions=[])
+    second.send(mock_reminder, title="t", body="b", actions=[])
+
+    assert first.session is second.session
+    assert mock_post.call_args[1]["timeout"] == 3
@@ -153,22 +153,15 @@ class TestOrchestratorChatLoop:
     """Test orchestrator CHAT mode loop prevention."""
 
     @patch.dict(os.environ, {"LLM_API_URL": "http://test:8000"})
-    @patch("milton_orchestrator.orchestrator.requests.post")
-    def test_chat_with_stop_sequences(self, mock_post, mock_config):
+    def test_chat_with_stop_sequences(self, mock_llm, mock_config):
         """Test that CHAT requests include stop sequences."""
-        mock_response = MagicMock()
-        mock_response.ok = True
-        mock_response.json.return_value = {
-            "choices": [{"message": {"content": "Test response"}}]
-        }
-        mock_post.return_value = mock_response
+        mock_llm.body = {"choices": [{"message": {"content": "Test response"}}]}
         
         orchestrator = Orchestrator(mock_config, dry_run=False)
         orchestrator._run_chat_llm("test query")
         
         # Verify stop sequences were included
-        call_args = mock_post.call_args
-        payload = call_args[1]["json"]
+        payload = mock_llm.last_json
         
         assert "stop" in payload
         assert "assistant" in payload["stop"]
@@ -203,18 +196,12 @@ class TestOrchestratorChatLoop:
         assert not Orchestrator._detect_token_loop(normal_text)
 
     @patch.dict(os.environ, {"LLM_API_URL": "http://test:8000"})
-    @patch("milton_orchestrator.orchestrator.requests.post")
-    def test_chat_truncates_excessive_output(self, mock_post, mock_config):
+    def test_chat_truncates_excessive_output(self, mock_llm, mock_config):
         """Test that excessive output is truncated."""
         # Simulate runaway generation
         huge_response = "a" * 25000
         
-        mock_response = MagicMock()
-        mock_response.ok = True
-        mock_response.json.return_value = {
-            "choices": [{"message": {"content": huge_response}}]
-        }
-        mock_post.return_value = mock_response
+        mock_llm.body = {"choices": [{"message": {"content": huge_response}}]}
         
         orchestrator = Orchestrator(mock_config, dry_run=False)
         
@@ -853,69 +853,61 @@ def test_clarification_patterns_compile():
 # Integration: One-Way Mode End-to-End (Mocked LLM)
 # ==============================================================================
 
-def test_nexus_answer_one_way_mode_modifies_prompt():
+def test_nexus_answer_one_way_mode_modifies_prompt(mock_llm):
     """Test that NEXUS.answer() injects one-way mode prompt."""
-    with patch("agents.nexus.requests.post") as mock_post:
-        # Mock LLM response
-        mock_post.return_value.json.return_value = {
-            "choices": [{"message": {"content": "**Summary:** Done\n\n**Assumptions:**\n- None\n\n**Next Steps:**\n- Check later\n\nEND"}}]
-        }
-        mock_post.return_value.raise_for_status = MagicMock()
+    # Mock LLM response
+    mock_llm.body = {
+        "choices": [{"message": {"content": "**Summary:** Done\n\n**Assumptions:**\n- None\n\n**Next Steps:**\n- Check later\n\nEND"}}]
+    }
 
-        from agents.nexus import NEXUS, ONE_WAY_PHONE_MODE_PROMPT
+    from agents.nexus import NEXUS, ONE_WAY_PHONE_MODE_PROMPT
 
-        # Create NEXUS instance (may fail if integrations not mocked, so wrap)
-        try:
-            nexus = NEXUS()
-            nexus.answer("test query", one_way_mode=True)
+    # Create NEXUS instance (may fail if integrations not mocked, so wrap)
+    try:
+        nexus = NEXUS()
+        nexus.answer("test query", one_way_mode=True)
 
-            # Verify the call was made
-            mock_post.assert_called()
+        # Verify the call was made
+        assert mock_llm.requests
 
-            # Check that one-way mode prompt was injected
-            call_args = mock_post.call_args
-            payload = call_args[1].get("json", call_args[0][0] if call_args[0] else {})
-            messages = payload.get("messages", [])
+        # Check that one-way mode prompt was injected
+        messages = mock_llm.last_json.get("messages", [])
 
-            # Find system message
-            system_content = ""
-            for msg in messages:
-                if msg.get("role") == "system":
-                    system_content += msg.get("content", "")
+        # Find system message
+        system_content = ""
+        for msg in messages:
+            if msg.get("role") == "system":
+                system_content += msg.get("content", "")
 
-            assert "ONE-WAY" in system_content, \
-                "One-way mode prompt should be in system message"
+        assert "ONE-WAY" in system_content, \
+            "One-way mode prompt should be in system message"
 
-        except Exception as e:
-            # Skip if imports fail (e.g., missing dependencies)
-            pytest.skip(f"NEXUS initialization failed (likely missing deps): {e}")
+    except Exception as e:
+        # Skip if imports fail (e.g., missing dependencies)
+        pytest.skip(f"NEXUS initialization failed (likely missing deps): {e}")
 
 
-def test_nexus_answer_post_guard_rewrites_bad_response():
+def test_nexus_answer_post_guard_rewrites_bad_response(mock_llm):
     """Test that post-guard rewrites clarification-seeking responses."""
-    with patch("agents.nexus.requests.post") as mock_post:
-        # Mock LLM returning a clarification-seeking response
-        bad_response = "What do you mean? Can you provide more details?"
-        mock_post.return_value.json.return_value = {
-            "choices": [{"message": {"content": bad_response}}]
-        }
-        mock_post.return_value.raise_for_status = MagicMock()
+    # Mock LLM returning a clarification-seeking response
+    bad_response = "What do you mean? Can you provide more details?"
+    mock_llm.body = {"choices": [{"message": {"content": bad_response}}]}
 
-        from agents.nexus import NEXUS
+    from agents.nexus import NEXUS
 
-        try:
-            nexus = NEXUS()
-            result = nexus.answer("vague request", one_way_mode=True)
-
-            # Result should be rewritten, not the original bad response
-            assert "What do you mean?" not in result
-            assert "**Summary:**" in result
-            assert "**Assumptions:**" in result
-            assert "**Next Steps:**" in result
-            assert "END" in result
-
-        except Exception as e:
-            pytest.skip(f"NEXUS initialization failed: {e}")
+    try:
+        nexus = NEXUS()
+        result = nexus.answer("vague request", one_way_mode=True)
+
+        # Result should be rewritten, not the original bad response
+        assert "What do you mean?" not in result
+        assert "**Summary:**" in result
+        assert "**Assumptions:**" in result
+        assert "**Next Steps:**" in result
+        assert "END" in result
+
+    except Exception as e:
+        pytest.skip(f"NEXUS initialization failed: {e}")
 
 
 if __name__ == "__main__":
@@ -0,0 +1,167 @@
+"""Tests for the prefix-cache-friendly prompt layout."""
+
+from __future__ import annotations
+
+import asyncio
+from types import SimpleNamespace
+from unittest.mock import AsyncMock, patch
+
+import httpx
+
+from milton_gateway.prompt_layout import (
+    QUERY_CONTEXT_HEADER,
+    PrefixCacheMonitor,
+    build_prefix_cached_messages,
+    format_query_context,
+    format_query_facts,
+    insert_query_context,
+    parse_prometheus_metrics,
+    prefix_cache_counters,
+    prompt_layout,
+)
+
+
+def _fact(key, value):
+    return SimpleNamespace(key=key, value=value)
+
+
+def _turn(role, content):
+    return SimpleNamespace(role=role, content=content)
+
+
+def test_prompt_layout_env(monkeypatch):
+    monkeypatch.delenv("MILTON_GATEWAY_PROMPT_LAYOUT", raising=False)
+    assert prompt_layout() == "legacy"
+    monkeypatch.setenv("MILTON_GATEWAY_PROMPT_LAYOUT", "prefix_cache")
+    assert prompt_layout() == "prefix_cache"
+    monkeypatch.setenv("MILTON_GATEWAY_PROMPT_LAYOUT", "bogus")
+    assert prompt_layout() == "legacy"
+
+
+def test_stable_prefix_is_byte_identical_across_turns():
+    facts = [_fact("name", "Cole"), _fact("city", "St. Louis")]
+    turns = [_turn("user", "hi"), _turn("assistant", "hello")]
+
+    first = build_prefix_cached_messages(
+        [{"role": "user", "content": "weather?"}], "SYSTEM", facts, turns, summary="Earlier."
+    )
+    second = build_prefix_cached_messages(
+        [{"role": "user", "content": "news?"}], "SYSTEM", list(reversed(facts)),
+        turns + [_turn("user", "weather?"), _turn("assistant", "sunny")],
+        summary="Earlier.",
+    )
+
+    first_system = first[0]["content"]
+    assert first_system.startswith("SYSTEM")
+    assert first_system.index("city") < first_system.index("name")
+    assert "Earlier." in first_system
+    # Stored turns are messages after the system prompt; turn two only appends
+    assert first[1:3] == [{"role": "user", "content": "hi"}, {"role": "assistant", "content": "hello"}]
+    assert second[:3] == first[:3]
+    assert second[3:] == [
+        {"role": "user", "content": "weather?"},
+        {"role": "assistant", "content": "sunny"},
+        {"role": "user", "content": "news?"},
+    ]
+
+
+def test_query_context_goes_before_final_user_message():
+    messages = [
+        {"role": "system", "content": "SYSTEM"},
+        {"role": "user", "content": "earlier"},
+        {"role": "assistant", "content": "reply"},
+        {"role": "user", "content": "now"},
+    ]
+    context = format_query_context("### Relevant Memory Context:\n- x", "", "\n\n## ACTION EXECUTION STATUS")
+    result = insert_query_context(messages, context)
+
+    assert [m["role"] for m in result] == ["system", "user", "assistant", "system", "user"]
+    assert result[3]["content"].startswith(QUERY_CONTEXT_HEADER)
+    assert "ACTION EXECUTION STATUS" in result[3]["content"]
+    assert result[-1]["content"] == "now"
+    assert insert_query_context(messages, "") is messages
+    assert format_query_context("", "  ", "") == ""
+
+    with_facts = format_query_context("", "", "", facts_context=format_query_facts([_fact("editor", "Neovim")]))
+    assert with_facts.startswith(QUERY_CONTEXT_HEADER)
+    assert "- **editor**: Neovim" in with_facts
+    assert format_query_facts([]) == ""
+
+
+METRICS_V1 = """
+# HELP vllm:prefix_cache_queries_total Prefix cache queries
+# TYPE vllm:prefix_cache_queries_total counter
+vllm:prefix_cache_queries_total{engine="0",model_name="m"} 1000.0
+vllm:prefix_cache_hits_total{engine="0",model_name="m"} 600.0
+vllm:num_requests_running{model_name="m"} 1.0
+"""
+
+
+def test_parse_metrics_and_counters():
+    metrics = parse_prometheus_metrics(METRICS_V1)
+    assert metrics["vllm:prefix_cache_queries_total"] == 1000.0
+    assert prefix_cache_counters(metrics) == {"queries": 1000.0, "hits": 600.0}
+    assert prefix_cache_counters({"vllm:gpu_prefix_cache_hit_rate": 0.4}) == {"hit_rate": 0.4}
+    assert prefix_cache_counters({"vllm:num_requests_running": 1.0}) is None
+
+
+def test_monitor_reports_window_hit_rate():
+    monitor = PrefixCacheMonitor()
+    first = monitor.record({"queries": 1000.0, "hits": 600.0})
+    assert first["hit_rate"] == 0.6
+    assert first["window"] is None
+
+    second = monitor.record({"queries": 1500.0, "hits": 1050.0})
+    assert second["window"]["queries_tokens"] == 500
+    assert second["window"]["hit_rate"] == 0.9
+
+    # vLLM restarted: counters went backwards
+    assert monitor.record({"queries": 10.0, "hits": 0.0})["window"] is None
+
+
+def test_monitor_scrape_handles_missing_metrics():
+    def handler(request):
+        assert request.url.path == "/metrics"
+        return httpx.Response(200, text="vllm:num_requests_running 0\n")
+
+    async def run():
+        async with httpx.AsyncClient(transport=httpx.MockTransport(handler)) as client:
+            return await PrefixCacheMonitor().scrape(client, "http://vllm")
+
+    stats = asyncio.run(run())
+    assert stats["available"] is False
+
+
+def test_chat_completion_uses_prefix_cache_layout(monkeypatch):
+    from fastapi.testclient import TestClient
+
+    from milton_gateway.server import app
+
+    monkeypatch.setenv("MILTON_GATEWAY_PROMPT_LAYOUT", "prefix_cache")
+    monkeypatch.setenv("MILTON_GATEWAY_MEMORY_RETRIEVAL", "0")
+    monkeypatch.setenv("MILTON_KG_CONTEXT_ENABLED", "false")
+    llm_response = {
+        "choices": [{"message": {"role": "assistant", "content": "Hi"}}],
+        "usage": {"prompt_tokens": 1, "completion_tokens": 1, "total_tokens": 2},
+    }
+    with patch("milton_gateway.server.get_llm_client") as mock_get_client:
+        mock_client = AsyncMock()
+        mock_client.chat_completion = AsyncMock(return_value=llm_response)
+        mock_get_client.return_value = mock_client
+
+        response = TestClient(app).post(
+            "/v1/chat/completions",
+            json={
+                "model": "milton-local",
+                "messages": [{"role": "user", "content": "What is the weather like?"}],
+                "stream": False,
+            },
+        )
+
+    assert response.status_code == 200
+    sent = mock_client.chat_completion.call_args.kwargs["messages"]
+    assert sent[0]["role"] == "system"
+    assert "ACTION EXECUTION STATUS" not in sent[0]["content"]
+    assert sent[-1] == {"role": "user", "content": "What is the weather like?"}
+    assert sent[-2]["role"] == "system"
+    assert sent[-2]["content"].startswith(QUERY_CONTEXT_HEADER)
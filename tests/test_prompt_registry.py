@@ -0,0 +1,87 @@
+"""Tests for the shared prompt registry."""
+
+from __future__ import annotations
+
+import os
+
+from agents.prompt_registry import PromptRegistry, content_hash
+
+
+def _bump_mtime(path, seconds=5):
+    stat = path.stat()
+    os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns + seconds * 1_000_000_000))
+
+
+def test_prompt_is_rendered_once_until_file_changes(tmp_path):
+    path = tmp_path / "prompt.md"
+    path.write_text("v1")
+    registry = PromptRegistry(reload_interval=0)
+    renders = []
+
+    def render():
+        renders.append(1)
+        return path.read_text()
+
+    first = registry.get("p", [path], render)
+    second = registry.get("p", [path], render)
+    assert first is second
+    assert first.sha256 == content_hash("v1")
+    assert len(renders) == 1
+
+    path.write_text("v2")
+    _bump_mtime(path)
+    third = registry.get("p", [path], render)
+    assert third.text == "v2"
+    assert third.sha256 != first.sha256
+    assert len(renders) == 2
+
+
+def test_reload_interval_throttles_stat_checks(tmp_path):
+    path = tmp_path / "prompt.md"
+    path.write_text("v1")
+    registry = PromptRegistry(reload_interval=3600)
+
+    registry.get("p", [path], path.read_text)
+    path.write_text("v2-longer")
+    assert registry.get("p", [path], path.read_text).text == "v1"
+
+    registry.invalidate("p")
+    assert registry.get("p", [path], path.read_text).text == "v2-longer"
+
+
+def test_missing_file_appearing_triggers_reload(tmp_path):
+    path = tmp_path / "override.md"
+    registry = PromptRegistry(reload_interval=0)
+
+    def render():
+        return path.read_text() if path.exists() else "default"
+
+    assert registry.get("p", [path], render).text == "default"
+    path.write_text("override")
+    assert registry.get("p", [path], render).text == "override"
+
+
+def test_render_errors_are_not_cached(tmp_path):
+    path = tmp_path / "missing.md"
+    registry = PromptRegistry(reload_interval=0)
+
+    try:
+        registry.get("p", [path], path.read_text)
+    except FileNotFoundError:
+        pass
+    else:
+        raise AssertionError("expected FileNotFoundError")
+    assert registry.stats() == {}
+
+
+def test_gateway_system_prompt_uses_env_file(tmp_path, monkeypatch):
+    from milton_gateway.server import get_system_prompt, load_system_prompt
+
+    path = tmp_path / "system.md"
+    path.write_text("  Custom prompt  ")
+    monkeypatch.setenv("MILTON_CHAT_SYSTEM_PROMPT", str(path))
+
+    prompt = get_system_prompt()
+    assert prompt.text == "Custom prompt"
+    assert load_system_prompt() == "Custom prompt"
+    assert str(path) in prompt.sources
@@ -1,5 +1,6 @@
 """Tests for reminder parsing and scheduling."""
 
+import time
 from datetime import datetime, timedelta
 from unittest.mock import patch, Mock
 
@@ -172,10 +173,10 @@ def test_store_mark_error(tmp_path):
 
 
 def test_scheduler_retry_logic(tmp_path):
-    """Test that scheduler does NOT retry failed deliveries (exactly-once semantics).
+    """Failed deliveries are retried per channel, then dead-lettered.
 
-    Phase 1: Reminders are claimed atomically and marked as fired immediately.
-    Failed deliveries are logged but NOT retried to ensure exactly-once semantics.
+    The reminder itself is claimed exactly once and stays fired; only the
+    failed channel goes through the retry queue, up to max_retries times.
     """
     store = ReminderStore(tmp_path / "reminders.sqlite3")
     now_ts = int(datetime.now().timestamp())
@@ -185,7 +186,6 @@ def test_scheduler_retry_logic(tmp_path):
 
     def publish_fn(message: str, title: str, rid: int) -> bool:
         attempts.append(rid)
-        # Always fail to test that there's NO retry
         return False
 
     scheduler = ReminderScheduler(
@@ -196,19 +196,83 @@ def test_scheduler_retry_logic(tmp_path):
         retry_backoff=0,  # No backoff for testing
     )
 
-    # Run 3 times
-    for _ in range(3):
+    for _ in range(5):
         scheduler.run_once()
 
-    # Should only attempt ONCE (no retry with new exactly-once semantics)
-    assert len(attempts) == 1
+    # One claimed delivery plus three retries, then nothing more
+    assert attempts == [reminder_id] * 4
 
     # Reminder should still be marked as sent (fired) despite delivery failure
     reminders = store.list_reminders(include_sent=True)
     assert reminders[0].sent_at is not None
     assert reminders[0].status == "fired"
-    assert reminders[0].last_error is not None  # Error should be logged
+    assert "Dead-lettered" in reminders[0].last_error
+    assert any(e["action"] == "delivery_dead_letter" for e in store.iter_audit_log(reminder_id))
 
+    stats = store.get_health_stats()
+    assert stats["retry_queue_depth"] == 0
+    assert stats["dead_letter_count"] == 1
+
+    scheduler.stop()
+    store.close()
+
+
+def test_scheduler_retry_succeeds_with_backoff(tmp_path):
+    """A retry waits out its backoff and is delivered on a later pass."""
+    store = ReminderStore(tmp_path / "reminders.sqlite3")
+    clock = {"now": int(datetime.now().timestamp())}
+    reminder_id = store.add_reminder("REMIND", clock["now"] - 1, "Flaky")
+    outcomes = [False, True]
+
+    def publish_fn(message: str, title: str, rid: int) -> bool:
+        return outcomes.pop(0)
+
+    scheduler = ReminderScheduler(
+        store, publish_fn=publish_fn, now_fn=lambda: clock["now"], retry_backoff=60
+    )
+    scheduler.run_once()
+
+    queued = store.list_delivery_attempts("pending")
+    assert len(queued) == 1
+    # Equal jitter: between half and all of the base backoff
+    assert clock["now"] + 30 <= queued[0]["next_attempt_at"] <= clock["now"] + 60
+    assert store.get_health_stats()["retry_queue_depth"] == 1
+
+    scheduler.run_once()  # backoff not elapsed
+    assert outcomes == [True]
+
+    clock["now"] += 61
+    scheduler.run_once()
+    assert outcomes == []
+    assert store.list_delivery_attempts("delivered")[0]["attempts"] == 2
+    assert store.get_health_stats()["retry_queue_depth"] == 0
+    reminder = store.get_reminder(reminder_id)
+    assert any("success on retry" in e["details"] for e in reminder.audit_log)
+
+    scheduler.stop()
+    store.close()
+
+
+def test_scheduler_drops_retries_for_acknowledged_reminder(tmp_path):
+    """Retries stop once the reminder is no longer fired."""
+    store = ReminderStore(tmp_path / "reminders.sqlite3")
+    now_ts = int(datetime.now().timestamp())
+    reminder_id = store.add_reminder("REMIND", now_ts - 1, "Seen elsewhere")
+    attempts = []
+
+    def publish_fn(message: str, title: str, rid: int) -> bool:
+        attempts.append(rid)
+        return False
+
+    scheduler = ReminderScheduler(store, publish_fn=publish_fn, now_fn=lambda: now_ts, retry_backoff=0)
+    scheduler.process_due()
+    store.acknowledge(reminder_id)
+    scheduler.process_retries(wait=True)
+
+    assert attempts == [reminder_id]
+    assert store.list_delivery_attempts() == []
+
+    scheduler.stop()
     store.close()
 
 
@@ -591,9 +655,7 @@ def test_cancel_reminder_with_audit_logging(tmp_path):
     result = store.cancel_reminder(reminder_id, actor="user", details="User canceled via webui")
     assert result is True
 
-    # Get including canceled
-    reminders = store.list_reminders(include_canceled=True)
-    reminder = [r for r in reminders if r.id == reminder_id][0]
+    reminder = store.get_reminder(reminder_id)
     assert reminder.status == "canceled"
     assert reminder.canceled_at is not None
     assert len(reminder.audit_log) == 2  # created, canceled
@@ -1198,3 +1260,186 @@ def test_metadata_roundtrip(tmp_path):
     assert result is None
     
     store.close()
+
+
+def test_next_due_at_tracks_schedulable_reminders(tmp_path):
+    """next_due_at returns the earliest reminder the scheduler could claim."""
+    store = ReminderStore(tmp_path / "reminders.sqlite3")
+    assert store.next_due_at() is None
+
+    early = store.add_reminder("REMIND", 1000, "Early")
+    store.add_reminder("REMIND", 2000, "Late")
+    assert store.next_due_at() == 1000
+
+    store.cancel_reminder(early)
+    assert store.next_due_at() == 2000
+
+    store.close()
+
+
+def test_store_listener_reports_schedule_changes(tmp_path):
+    """add, snooze, cancel and status changes notify listeners."""
+    store = ReminderStore(tmp_path / "reminders.sqlite3")
+    events = []
+    store.add_listener(lambda event, rid: events.append((event, rid)))
+
+    rid = store.add_reminder("REMIND", 1000, "Test")
+    store.snooze(rid, 10)
+    store.update_status(rid, "acknowledged")
+    other = store.add_reminder("REMIND", 1000, "Other")
+    store.cancel_reminder(other)
+    store.cancel_reminder(other)  # already canceled: no event
+
+    assert events == [
+        ("added", rid), ("snoozed", rid), ("status", rid), ("added", other), ("canceled", other),
+    ]
+    store.close()
+
+
+def _wait_for(predicate, timeout: float = 3.0) -> bool:
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline:
+        if predicate():
+            return True
+        time.sleep(0.01)
+    return False
+
+
+def test_scheduler_is_woken_by_add_reminder(tmp_path):
+    """A reminder added through the store fires without waiting for a poll."""
+    store = ReminderStore(tmp_path / "reminders.sqlite3")
+    delivered = []
+
+    def publish_fn(message: str, title: str, rid: int) -> bool:
+        delivered.append((rid, time.monotonic()))
+        return True
+
+    scheduler = ReminderScheduler(store, publish_fn=publish_fn, interval_seconds=60)
+    scheduler.start()
+    try:
+        time.sleep(0.05)  # let the scheduler go idle
+        added = time.monotonic()
+        rid = store.add_reminder("REMIND", int(time.time()) - 1, "Now")
+        assert _wait_for(lambda: delivered)
+        assert delivered[0][0] == rid
+        assert delivered[0][1] - added < 1.0
+    finally:
+        scheduler.stop()
+        scheduler.join(2)
+    store.close()
+
+
+def test_scheduler_sleeps_until_due_at(tmp_path):
+    """A future reminder fires at its due time, not before."""
+    store = ReminderStore(tmp_path / "reminders.sqlite3")
+    delivered = []
+
+    def publish_fn(message: str, title: str, rid: int) -> bool:
+        delivered.append(time.time())
+        return True
+
+    due_at = int(time.time()) + 1
+    store.add_reminder("REMIND", due_at, "Soon")
+    scheduler = ReminderScheduler(store, publish_fn=publish_fn, interval_seconds=60)
+    scheduler.start()
+    try:
+        assert _wait_for(lambda: delivered, timeout=4.0)
+        assert due_at <= delivered[0] < due_at + 0.5
+    finally:
+        scheduler.stop()
+        scheduler.join(2)
+    store.close()
+
+
+def test_scheduler_sees_reminders_from_other_connections(tmp_path):
+    """Writes from another process are picked up through data_version."""
+    db_path = tmp_path / "reminders.sqlite3"
+    store = ReminderStore(db_path)
+    remote = ReminderStore(db_path)
+    delivered = []
+
+    def publish_fn(message: str, title: str, rid: int) -> bool:
+        delivered.append(rid)
+        return True
+
+    scheduler = ReminderScheduler(store, publish_fn=publish_fn, interval_seconds=0.05)
+    scheduler.start()
+    try:
+        time.sleep(0.05)
+        rid = remote.add_reminder("REMIND", int(time.time()) - 1, "Remote")
+        assert _wait_for(lambda: delivered)
+        assert delivered == [rid]
+    finally:
+        scheduler.stop()
+        scheduler.join(2)
+    remote.close()
+    store.close()
+
+
+def test_idle_scheduler_writes_heartbeat_on_its_own_cadence(tmp_path):
+    """An idle scheduler does not write to SQLite on every check."""
+    store = ReminderStore(tmp_path / "reminders.sqlite3")
+    writes = []
+    original = store.set_metadata
+
+    def counting_set_metadata(key, value):
+        writes.append(key)
+        original(key, value)
+
+    store.set_metadata = counting_set_metadata
+    scheduler = ReminderScheduler(
+        store, publish_fn=lambda *a: True, interval_seconds=0.02, heartbeat_seconds=60
+    )
+    scheduler.start()
+    time.sleep(0.3)
+    scheduler.stop()
+    scheduler.join(2)
+
+    assert not scheduler.is_alive()
+    assert writes == ["last_heartbeat"]
+    store.close()
+
+
+@pytest.mark.parametrize("use_returning", [True, False])
+def test_claim_due_reminders_order_and_exclusivity(tmp_path, monkeypatch, use_returning):
+    """Both claim paths return due reminders by due_at, then priority, once."""
+    import milton_orchestrator.reminders as reminders_module
+
+    if use_returning and not reminders_module._SQLITE_HAS_RETURNING:
+        pytest.skip("SQLite < 3.35 has no RETURNING")
+    monkeypatch.setattr(reminders_module, "_SQLITE_HAS_RETURNING", use_returning)
+
+    store = ReminderStore(tmp_path / "reminders.sqlite3")
+    late = store.add_reminder("REMIND", 200, "late")
+    early_low = store.add_reminder("REMIND", 100, "early low", priority="low")
+    early_med = store.add_reminder("REMIND", 100, "early med", priority="med")
+    store.add_reminder("REMIND", 900, "not due")
+
+    claimed = store.claim_due_reminders(now_ts=500)
+    assert [r.id for r in claimed] == [early_med, early_low, late]
+    assert all(r.status == "fired" and r.sent_at == 500 for r in claimed)
+    assert store.claim_due_reminders(now_ts=500) == []
+    store.close()
+
+
+def test_hot_queries_use_partial_indexes(tmp_path):
+    """Claim, next-due and health queries read the partial indexes, not the table."""
+    store = ReminderStore(tmp_path / "reminders.sqlite3")
+
+    def plan(sql: str) -> str:
+        return " ".join(row[3] for row in store._conn.execute("EXPLAIN QUERY PLAN " + sql))
+
+    claim_plan = plan(
+        """SELECT id FROM reminders
+           WHERE due_at <= 1 AND sent_at IS NULL AND canceled_at IS NULL AND status = 'scheduled'
+           ORDER BY due_at ASC, priority DESC LIMIT 100"""
+    )
+    assert "idx_reminders_pending" in claim_plan
+    assert "TEMP B-TREE" not in claim_plan
+    assert "idx_reminders_pending" in plan(
+        "SELECT COUNT(*) FROM reminders WHERE sent_at IS NULL AND canceled_at IS NULL"
+    )
+    assert "idx_reminders_errors" in plan(
+        "SELECT last_error FROM reminders WHERE last_error IS NOT NULL ORDER BY updated_at DESC LIMIT 1"
+    )
+    store.close()
@@ -4,6 +4,7 @@ from datetime import datetime
 from unittest.mock import Mock, patch
 import pytest
 import json
+import threading
 
 from milton_orchestrator.reminders import (
     Reminder,
@@ -295,6 +296,67 @@ def test_scheduler_with_legacy_publish_fn(tmp_path):
     store.close()
 
 
+def test_scheduler_delivers_claimed_reminders_concurrently(tmp_path):
+    """One slow delivery does not hold up the rest of the batch."""
+    import time
+
+    store = ReminderStore(tmp_path / "reminders.db")
+    now_ts = int(datetime.now().timestamp())
+    ids = [store.add_reminder("REMIND", now_ts - 1, f"Batch {i}") for i in range(4)]
+
+    def slow_send(reminder, channels, *, title, body):
+        time.sleep(0.2)
+        return [DeliveryResult(ok=True, provider="ntfy")]
+
+    router = Mock(spec=NotificationRouter)
+    router.send_all.side_effect = slow_send
+    scheduler = ReminderScheduler(store=store, notification_router=router, now_fn=lambda: now_ts)
+
+    started = time.monotonic()
+    scheduler.run_once()
+    elapsed = time.monotonic() - started
+    scheduler.stop()
+
+    assert router.send_all.call_count == 4
+    assert elapsed < 0.6
+    for rid in ids:
+        entries = store.get_reminder(rid).audit_log
+        assert any(e.get("action") == "delivery_attempt" for e in entries)
+
+    store.close()
+
+
+def test_scheduler_retries_only_failed_channels(tmp_path):
+    """Only the failed retryable channel is queued and resent."""
+    store = ReminderStore(tmp_path / "reminders.db")
+    now_ts = int(datetime.now().timestamp())
+    reminder_id = store.add_reminder(
+        kind="REMIND", due_at=now_ts - 1, message="Partial", channels=["ntfy", "voice", "desktop_popup"],
+    )
+
+    router = Mock(spec=NotificationRouter)
+    router.send_all.side_effect = [
+        [
+            DeliveryResult(ok=True, provider="ntfy"),
+            DeliveryResult(ok=False, provider="voice", error="timeout"),
+            DeliveryResult(ok=False, provider="desktop_popup", error="stub", metadata={"stub": True}),
+        ],
+        [DeliveryResult(ok=True, provider="voice")],
+    ]
+    scheduler = ReminderScheduler(
+        store=store, notification_router=router, now_fn=lambda: now_ts, retry_backoff=0,
+    )
+    scheduler.run_once()
+
+    assert router.send_all.call_count == 2
+    assert router.send_all.call_args_list[1][0][1] == ["voice"]
+    rows = store.list_delivery_attempts()
+    assert [(r["reminder_id"], r["channel"], r["state"]) for r in rows] == [(reminder_id, "voice", "delivered")]
+
+    scheduler.stop()
+    store.close()
+
+
 def test_append_audit_log(tmp_path):
     """Test appending audit log entries."""
     store = ReminderStore(tmp_path / "reminders.db")
@@ -350,3 +412,97 @@ def test_append_audit_log_bounds(tmp_path):
     assert len(reminder.audit_log) <= 101  # 100 + creation entry
     
     store.close()
+
+
+def test_audit_log_migrates_to_events_table(tmp_path):
+    """Existing JSON audit logs are moved into reminder_events on open."""
+    import sqlite3
+
+    db_path = tmp_path / "reminders.db"
+    store = ReminderStore(db_path)
+    reminder_id = store.add_reminder(kind="REMIND", due_at=1704067200, message="Legacy log")
+    store.close()
+
+    legacy = [
+        {"ts": 1704060000, "action": "created", "actor": "system", "details": "Reminder created via other"},
+        {"ts": 1704060100, "action": "delivery_attempt", "actor": "scheduler", "details": "ok",
+         "metadata": {"provider": "ntfy"}},
+    ]
+    conn = sqlite3.connect(db_path)
+    conn.execute("DELETE FROM reminder_events")
+    conn.execute("UPDATE reminders SET audit_log = ? WHERE id = ?", (json.dumps(legacy), reminder_id))
+    conn.commit()
+    conn.close()
+
+    store = ReminderStore(db_path)
+    assert list(store.iter_audit_log(reminder_id)) == legacy
+    store.close()
+
+    # The column is emptied, so reopening does not duplicate events
+    store = ReminderStore(db_path)
+    assert len(list(store.iter_audit_log(reminder_id))) == 2
+    store.close()
+
+
+def test_iter_audit_log_pages_lazily(tmp_path):
+    """iter_audit_log yields the full history in order, page by page."""
+    store = ReminderStore(tmp_path / "reminders.db")
+    now_ts = int(datetime.now().timestamp())
+    reminder_id = store.add_reminder(kind="REMIND", due_at=now_ts + 3600, message="History")
+    store.append_audit_log(reminder_id, [
+        {"ts": now_ts + i, "action": f"entry_{i}", "actor": "test", "details": ""} for i in range(1, 8)
+    ])
+
+    entries = store.iter_audit_log(reminder_id, page_size=3)
+    assert next(entries)["action"] == "created"
+    assert [e["action"] for e in entries] == [f"entry_{i}" for i in range(1, 8)]
+
+    recent = list(store.iter_audit_log(reminder_id, since=now_ts + 6, page_size=2))
+    assert [e["action"] for e in recent] == ["entry_6", "entry_7"]
+
+    # Bulk queries do not load history
+    assert store.list_reminders()[0].audit_log == []
+    store.close()
+
+
+def test_scheduler_writes_audit_as_each_delivery_completes(tmp_path):
+    """A delivered reminder's audit entries are stored while others are still in flight."""
+    store = ReminderStore(tmp_path / "reminders.db")
+    now_ts = int(datetime.now().timestamp())
+    ids = [store.add_reminder(kind="REMIND", due_at=now_ts - 1, message=f"B{i}") for i in range(3)]
+    slow_id = ids[0]
+    release = threading.Event()
+    fast_flushed = threading.Event()
+
+    def send_all(reminder, channels, title, body):
+        if reminder.id == slow_id:
+            release.wait(5)
+        return [DeliveryResult(ok=True, provider="ntfy")]
+
+    def watch_audit(events):
+        original_append(events)
+        flushed = {rid for rid, _ in events}
+        if flushed and slow_id not in flushed:
+            fast_flushed.set()
+
+    router = Mock(spec=NotificationRouter)
+    router.send_all.side_effect = send_all
+    scheduler = ReminderScheduler(store=store, notification_router=router, now_fn=lambda: now_ts)
+    original_append = store.append_audit_events
+
+    with patch.object(store, "append_audit_log", wraps=store.append_audit_log) as single, \
+            patch.object(store, "append_audit_events", side_effect=watch_audit) as batch:
+        worker = threading.Thread(target=scheduler.process_due)
+        worker.start()
+        assert fast_flushed.wait(5)
+        assert [e["action"] for e in store.get_reminder(slow_id).audit_log] == ["created"]
+        release.set()
+        worker.join(5)
+
+    assert single.call_count == 0
+    assert sorted(rid for call in batch.call_args_list for rid, _ in call[0][0]) == ids
+    for rid in ids:
+        assert [e["action"] for e in store.get_reminder(rid).audit_log] == ["created", "delivery_attempt"]
+
+    scheduler.stop()
+    store.close()
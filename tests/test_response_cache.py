@@ -0,0 +1,144 @@
+"""Tests for the gateway's semantic response cache."""
+
+from __future__ import annotations
+
+import asyncio
+
+from milton_gateway.response_cache import (
+    ResponseCache,
+    category_ttl,
+    context_fingerprint,
+    normalize_query,
+    replay_chunks,
+)
+
+SYSTEM_HASH = "abc123"
+
+
+def _messages(user_text: str, facts: str = "- **name**: Cole") -> list[dict]:
+    return [
+        {"role": "system", "content": f"You are Milton.\n{facts}"},
+        {"role": "user", "content": user_text},
+    ]
+
+
+def _cache(**kwargs) -> ResponseCache:
+    kwargs.setdefault("classify", lambda text: "explanation")
+    kwargs.setdefault("similarity_threshold", 0.9)
+    return ResponseCache(max_entries=kwargs.pop("max_entries", 8), **kwargs)
+
+
+def test_normalize_query_ignores_case_punctuation_and_spacing():
+    assert normalize_query("  What's   on my SCHEDULE? ") == "whats on my schedule"
+
+
+def test_fingerprint_covers_context_but_not_the_query():
+    assert context_fingerprint(_messages("a")) == context_fingerprint(_messages("b"))
+    assert context_fingerprint(_messages("a")) != context_fingerprint(_messages("a", facts="- **name**: Sam"))
+
+
+def test_exact_hit_after_normalization():
+    cache = _cache()
+    key = cache.make_key(SYSTEM_HASH, _messages("Explain prefix caching"), "Explain prefix caching")
+    assert cache.lookup(key) is None
+    cache.store(key, "It reuses the KV cache.")
+
+    again = cache.make_key(SYSTEM_HASH, _messages("explain prefix caching!"), "explain prefix caching!")
+    hit = cache.lookup(again)
+    assert hit is not None and hit.match == "exact"
+    assert hit.content == "It reuses the KV cache."
+
+
+def test_changed_context_or_system_prompt_misses():
+    cache = _cache()
+    key = cache.make_key(SYSTEM_HASH, _messages("Explain it"), "Explain it")
+    cache.store(key, "Answer")
+
+    assert cache.lookup(cache.make_key("other", _messages("Explain it"), "Explain it")) is None
+    new_facts = _messages("Explain it", facts="- **name**: Sam")
+    assert cache.lookup(cache.make_key(SYSTEM_HASH, new_facts, "Explain it")) is None
+
+
+def test_similar_query_hits_above_threshold():
+    vectors = {"how does caching work": [1.0, 0.0], "how does the cache work": [0.98, 0.2], "tell me a joke": [0.0, 1.0]}
+    cache = _cache()
+
+    def key_for(text):
+        return cache.make_key(SYSTEM_HASH, _messages(text), text)
+
+    cache.store(key_for("how does caching work"), "Cached answer", vectors["how does caching work"])
+    hit = cache.lookup(key_for("how does the cache work"), vectors["how does the cache work"])
+    assert hit is not None and hit.match == "similar" and hit.similarity >= 0.9
+    assert cache.lookup(key_for("tell me a joke"), vectors["tell me a joke"]) is None
+
+
+def test_zero_ttl_categories_are_never_cached(monkeypatch):
+    cache = _cache(classify=lambda text: "reminder")
+    key = cache.make_key(SYSTEM_HASH, _messages("remind me at 5"), "remind me at 5")
+    assert not key.cacheable
+    cache.store(key, "Reminder set")
+    assert cache.stats()["entries"] == 0
+
+    monkeypatch.setenv("MILTON_GATEWAY_RESPONSE_CACHE_TTL_REMINDER_S", "60")
+    assert category_ttl("reminder") == 60.0
+
+
+def test_expired_entries_miss(monkeypatch):
+    monkeypatch.setenv("MILTON_GATEWAY_RESPONSE_CACHE_TTL_EXPLANATION_S", "0.01")
+    cache = _cache()
+    key = cache.make_key(SYSTEM_HASH, _messages("Explain it"), "Explain it")
+    cache.store(key, "Answer")
+    asyncio.run(asyncio.sleep(0.02))
+    assert cache.lookup(key) is None
+
+
+def test_lru_eviction_and_fact_invalidation():
+    cache = _cache(max_entries=2)
+    keys = [cache.make_key(SYSTEM_HASH, _messages(q), q) for q in ("one", "two", "three")]
+    for key in keys:
+        cache.store(key, key.query)
+    assert cache.lookup(keys[0]) is None
+    assert cache.lookup(keys[2]).content == "three"
+
+    cache.on_memory_event("turn", object())
+    assert cache.stats()["entries"] == 2
+    cache.on_memory_event("fact", object())
+    assert cache.stats()["entries"] == 0
+    cache.store(keys[0], "one")
+    cache.on_memory_event("memory", object())
+    assert cache.stats()["entries"] == 0
+
+
+def test_exact_lookup_runs_before_embedding():
+    calls = []
+
+    async def embedder(text):
+        calls.append(text)
+        return [1.0, 0.0]
+
+    cache = _cache(embedder=embedder)
+    key = cache.make_key(SYSTEM_HASH, _messages("Explain it"), "Explain it")
+    assert cache.lookup_exact(key) is None
+    assert cache.stats()["misses"] == 0  # left for the similarity lookup to count
+    cache.store(key, "Answer", asyncio.run(cache.embed("Explain it")))
+    assert calls == ["Explain it"]
+
+    hit = cache.lookup_exact(cache.make_key(SYSTEM_HASH, _messages("explain it?"), "explain it?"))
+    assert hit is not None and hit.match == "exact"
+    assert calls == ["Explain it"]
+
+
+def test_embedding_failure_falls_back_to_exact_lookup():
+    async def broken(text):
+        raise RuntimeError("no model")
+
+    cache = _cache(embedder=broken)
+    assert asyncio.run(cache.embed("hello")) is None
+    assert asyncio.run(_cache(similarity_threshold=1.0).embed("hello")) is None
+
+
+def test_replay_chunks_reassemble_content():
+    content = "The quick brown fox jumps over the lazy dog.\n\nSecond paragraph here."
+    chunks = replay_chunks(content, max_chars=12)
+    assert len(chunks) > 1
+    assert "".join(chunks) == content
@@ -0,0 +1,189 @@
+"""Tests for tokenizer-accurate context budgeting."""
+
+from __future__ import annotations
+
+import asyncio
+from types import SimpleNamespace
+
+import pytest
+
+import milton_gateway.token_budget as token_budget
+from milton_gateway.token_budget import (
+    TokenCounter,
+    allocate_budget,
+    budget_priorities,
+    fit_items,
+    limits_from_models_response,
+)
+
+
+class _FakeTokenizer:
+    """One token per whitespace-separated word."""
+
+    def __init__(self):
+        self.calls = 0
+
+    def encode(self, text, add_special_tokens=False):
+        self.calls += 1
+        return list(range(len(text.split())))
+
+    def decode(self, ids):
+        return " ".join(f"w{i}" for i in ids)
+
+
+def _counter(tokenizer=None):
+    counter = TokenCounter("fake", cache_size=2)
+    counter._tokenizer = tokenizer
+    counter._loaded = True
+    return counter
+
+
+def test_counts_are_memoized_with_bounded_lru():
+    tokenizer = _FakeTokenizer()
+    counter = _counter(tokenizer)
+
+    assert counter.count("one two three") == 3
+    assert counter.count("one two three") == 3
+    assert tokenizer.calls == 1
+    assert counter.hits == 1
+
+    counter.count("a")
+    counter.count("b c")
+    assert len(counter._cache) == 2  # oldest entry evicted
+    assert counter.count("one two three") == 3
+    assert tokenizer.calls == 4
+
+
+def test_heuristic_fallback_and_truncate():
+    counter = _counter()
+    assert counter.backend == "heuristic"
+    assert counter.count("x" * 40) == 10
+    assert counter.truncate("x" * 40, 5) == "x" * 20
+    assert counter.count_messages([{"role": "user", "content": "x" * 8}]) == 2 + 4
+
+    tokenized = _counter(_FakeTokenizer())
+    assert tokenized.truncate("a b c d", 2) == "w0 w1"
+    assert tokenized.truncate("a b", 5) == "a b"
+
+
+def test_allocate_budget_follows_priorities():
+    requested = {"system": 500, "output": 1000, "history": 600, "facts": 200, "memory": 300}
+    budget = allocate_budget(2032, requested, priorities=budget_priorities(), min_output=256)
+
+    # 2000 usable: system 500, output 1000, history 500 left; facts/memory get nothing
+    assert budget.granted["system"] == 500
+    assert budget.output_tokens == 1000
+    assert budget.granted["history"] == 500
+    assert budget.granted["facts"] == 0
+    assert budget.trimmed() == ["history", "facts", "memory"]
+
+
+def test_output_reservation_survives_large_prompts():
+    requested = {"system": 5000, "output": 1024, "history": 0, "facts": 0, "memory": 0}
+    budget = allocate_budget(4096, requested, priorities=("system", "history", "facts", "memory", "output"), min_output=256)
+    assert budget.output_tokens == 256
+    assert budget.granted["system"] == 4096 - 32 - 256
+
+
+def test_budget_priorities_env(monkeypatch):
+    monkeypatch.setenv("MILTON_GATEWAY_BUDGET_PRIORITIES", "facts, system,bogus,facts")
+    assert budget_priorities() == ("facts", "system", "output", "history", "memory")
+
+
+def test_fit_items_keeps_newest_turns():
+    counter = _counter(_FakeTokenizer())
+    turns = [SimpleNamespace(content=c) for c in ("a b c", "d e", "f g")]
+    kept = fit_items(counter, turns, lambda t: t.content, 4, keep_newest=True)
+    assert [t.content for t in kept] == ["d e", "f g"]
+    kept = fit_items(counter, turns, lambda t: t.content, 4)
+    assert [t.content for t in kept] == ["a b c"]
+
+
+def test_limits_from_models_response():
+    data = {
+        "data": [
+            {"id": "other", "max_model_len": 4096},
+            {"id": "llama31-8b-instruct", "root": "meta-llama/Llama-3.1-8B-Instruct", "max_model_len": 32768},
+        ]
+    }
+    limits = limits_from_models_response(data, "llama31-8b-instruct")
+    assert limits.max_context == 32768
+    assert limits.tokenizer == "meta-llama/Llama-3.1-8B-Instruct"
+    assert limits_from_models_response({"data": [{"id": "x"}]}, "x") is None
+
+
+class _SlowModelsClient:
+    """LLM client whose /v1/models call hangs until released."""
+
+    base_url = "http://llm"
+    headers: dict = {}
+    model = "llama31-8b-instruct"
+
+    def __init__(self):
+        self.release = asyncio.Event()
+        self.calls = 0
+
+    async def get_client(self):
+        return self
+
+    async def get(self, url, headers=None, timeout=None):
+        self.calls += 1
+        await self.release.wait()
+        raise ConnectionError("unreachable")
+
+
+@pytest.mark.asyncio
+async def test_stale_model_limits_refresh_in_background(monkeypatch):
+    monkeypatch.delenv("MILTON_MODEL_MAX_CONTEXT", raising=False)
+    token_budget.reset_model_limits()
+    client = _SlowModelsClient()
+    client.release.set()
+    first = await token_budget.get_model_limits(client)
+    assert first.source == "default"
+
+    # Stale limits come back at once while the refetch waits on the endpoint
+    client.release.clear()
+    first.fetched_at -= token_budget._LIMITS_RETRY_SECONDS
+    assert await asyncio.wait_for(token_budget.get_model_limits(client), 0.5) is first
+    assert await asyncio.wait_for(token_budget.get_model_limits(client), 0.5) is first
+    await asyncio.sleep(0)
+    assert client.calls == 2
+
+    client.release.set()
+    await token_budget._limits_refresh
+    refreshed = await token_budget.get_model_limits(client)
+    assert refreshed is not first
+    token_budget.reset_model_limits()
+
+
+@pytest.mark.asyncio
+async def test_limits_refresh_installs_a_loaded_counter(monkeypatch):
+    monkeypatch.delenv("MILTON_TOKENIZER", raising=False)
+    loaded = []
+    monkeypatch.setattr(token_budget, "_load_tokenizer", lambda name: loaded.append(name) or _FakeTokenizer())
+    token_budget.reset_model_limits()
+    token_budget.reset_token_counter()
+    stale = await token_budget.warm_token_counter()
+
+    class _Client:
+        base_url = "http://llm"
+        headers: dict = {}
+        model = "llama31-8b-instruct"
+
+        async def get_client(self):
+            return self
+
+        async def get(self, url, headers=None, timeout=None):
+            return SimpleNamespace(
+                is_success=True,
+                json=lambda: {"data": [{"id": self.model, "root": "meta-llama/Llama-3.1-8B-Instruct", "max_model_len": 32768}]},
+            )
+
+    await token_budget.get_model_limits(_Client())
+    counter = token_budget.get_token_counter()
+    assert counter is not stale
+    assert counter.tokenizer_name == "meta-llama/Llama-3.1-8B-Instruct"
+    assert loaded[-1] == "meta-llama/Llama-3.1-8B-Instruct"  # loaded before it was installed
+    assert counter._loaded
+    token_budget.reset_model_limits()
+    token_budget.reset_token_counter()
@@ -0,0 +1,126 @@
+"""Tests for token streaming from NEXUS through the /ws/request WebSocket."""
+
+from __future__ import annotations
+
+import json
+import time
+from pathlib import Path
+import sys
+from unittest.mock import patch
+
+import pytest
+
+ROOT_DIR = Path(__file__).resolve().parents[1]
+sys.path.insert(0, str(ROOT_DIR))
+
+from agents.nexus import NEXUS, _iter_sse_deltas
+
+
+def _sse(content):
+    return "data: " + json.dumps({"choices": [{"delta": {"content": content}}]})
+
+
+def test_iter_sse_deltas_skips_noise_and_stops_at_done():
+    lines = [
+        ": keep-alive",
+        "",
+        "data: " + json.dumps({"choices": [{"delta": {"role": "assistant"}}]}),
+        _sse("Hel"),
+        "data: not-json",
+        _sse("lo"),
+        "data: [DONE]",
+        _sse("ignored"),
+    ]
+    assert list(_iter_sse_deltas(lines)) == ["Hel", "lo"]
+
+
+def test_call_llm_stream_mode_requests_sse(mock_llm):
+    agent = NEXUS.__new__(NEXUS)
+    agent.model_url = "http://llm"
+    agent.model_name = "test-model"
+    mock_llm.stream_lines = [_sse("a"), _sse("b"), "data: [DONE]"]
+
+    deltas = agent._call_llm("hi", system_prompt="sys", stream=True)
+    assert mock_llm.requests == []  # Lazy until iterated
+    assert list(deltas) == ["a", "b"]
+
+    payload = mock_llm.last_json
+    assert payload["stream"] is True
+    assert payload["messages"][0] == {"role": "system", "content": "sys"}
+
+
+class _RecordingWS:
+    def __init__(self):
+        self.messages = []
+
+    def send(self, data):
+        self.messages.append((time.perf_counter(), json.loads(data)))
+
+
+@pytest.fixture
+def server():
+    import scripts.start_api_server as server
+
+    with server._REQUESTS_LOCK:
+        server._REQUESTS.clear()
+    with server._PROCESSED_LOCK:
+        server._PROCESSED.clear()
+    yield server
+    with server._REQUESTS_LOCK:
+        server._REQUESTS.clear()
+    with server._PROCESSED_LOCK:
+        server._PROCESSED.clear()
+
+
+def test_websocket_forwards_deltas_as_they_arrive(server):
+    request_id = "req_stream"
+    with server._REQUESTS_LOCK:
+        server._REQUESTS[request_id] = {
+            "id": request_id,
+            "query": "Tell me a story",
+            "agent_assigned": "NEXUS",
+            "integration_target": None,
+            "routing_reasoning": "test",
+            "confidence": 0.99,
+            "status": "queued",
+            "started_at": None,
+            "use_web": None,
+            "goal_capture": None,
+        }
+
+    produced = []
+
+    def slow_deltas(agent_name, query, use_web=None):
+        for delta in ["Once ", "upon ", "a time."]:
+            time.sleep(0.05)
+            produced.append(time.perf_counter())
+            yield delta
+
+    stored = []
+
+    def store_memory(agent, query, response):
+        stored.append((time.perf_counter(), response))
+        return "vec-1"
+
+    ws = _RecordingWS()
+    handler = server.app.view_functions["stream_request"].__wrapped__
+    with (
+        patch.object(server, "_stream_agent", slow_deltas),
+        patch.object(server, "_store_memory", store_memory),
+    ):
+        handler(ws, request_id)
+
+    tokens = [(at, msg) for at, msg in ws.messages if msg["type"] == "token"]
+    assert [msg["content"] for _, msg in tokens] == ["Once ", "upon ", "a time."]
+    # The first token went out before the model produced the last delta
+    assert tokens[0][0] < produced[-1]
+    # Memory is written once, after streaming, with the full response
+    assert stored == [(stored[0][0], "Once upon a time.")]
+    assert stored[0][0] > tokens[-1][0]
+
+    complete = ws.messages[-1][1]
+    assert complete["type"] == "complete"
+    assert 0 < complete["ttft_ms"] < complete["duration_ms"]
+    assert complete["total_tokens"] == 4
+    assert server._REQUESTS[request_id]["status"] == "complete"
+    assert server._REQUESTS[request_id]["ttft_ms"] == complete["ttft_ms"]
@@ -128,21 +128,22 @@ class EvalMetrics:
             Coherence score (0.0-1.0)
         """
         try:
-            from memory.embeddings import embed_batch, cosine_similarity, is_available
+            from memory.embedding_service import embed_texts
+            from memory.embeddings import cosine_similarity, is_available
             
             if not is_available():
                 logger.warning("Embeddings not available, returning default score")
                 return 0.75  # Default reasonable score
             
             # Embed all responses
-            response_embeddings = embed_batch(responses, show_progress=False)
+            response_embeddings = embed_texts(responses)
             
             if not response_embeddings or None in response_embeddings:
                 return 0.75
             
             # If we have references, compute similarity
             if references and len(references) == len(responses):
-                ref_embeddings = embed_batch(references, show_progress=False)
+                ref_embeddings = embed_texts(references)
                 if ref_embeddings and None not in ref_embeddings:
                     similarities = [
                         cosine_similarity(resp, ref)